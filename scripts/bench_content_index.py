@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""Content Index Benchmark - Times ContentIndexer rebuilds.
+
+Generates a synthetic library of adventure manifests in a temporary
+directory, then times a full rebuild, a no-op rebuild and a rebuild after
+editing a handful of manifests, and finally times find() queries against
+the persisted search index (or SQLite database with --backend=sqlite).
+
+Usage:
+    python scripts/bench_content_index.py [--items N] [--workers N] [--backend NAME]
+"""
+
+import argparse
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from spellengine.content.backends import BACKENDS
+from spellengine.content.indexer import ContentIndexer
+
+MANIFEST = """id: {id}
+type: adventure
+title: "Synthetic Adventure {n}"
+version: "1.0.0"
+engine: ">=1.0.0"
+difficulty: {difficulty}
+duration_minutes: {duration}
+tags:
+  - hashcat
+  - {tag}
+hash_types:
+  - {hash_type}
+tools:
+  - hashcat
+author: bench
+description: "Generated adventure number {n} for index benchmarks."
+chapters: 3
+encounters: 24
+"""
+
+DIFFICULTIES = ("beginner", "intermediate", "advanced", "expert")
+TAGS = ("wordlist", "mask-attack", "rules", "hybrid", "dark-fantasy", "corporate")
+HASH_TYPES = ("md5", "sha1", "sha256", "ntlm")
+
+
+def write_manifest(root: Path, n: int, revision: int = 0) -> None:
+    """Write synthetic adventure n."""
+    item_id = f"synthetic_{n:05d}"
+    item_dir = root / "adventures" / item_id
+    item_dir.mkdir(parents=True, exist_ok=True)
+    (item_dir / "manifest.yaml").write_text(MANIFEST.format(
+        id=item_id,
+        n=n,
+        difficulty=DIFFICULTIES[n % len(DIFFICULTIES)],
+        duration=15 + (n * 7 + revision) % 120,
+        tag=TAGS[n % len(TAGS)],
+        hash_type=HASH_TYPES[n % len(HASH_TYPES)],
+    ))
+
+
+# find() filters timed against the backend
+QUERIES = [
+    {"tags": ["rules"]},
+    {"difficulty": "expert", "hash_types": ["md5", "ntlm"]},
+    {"max_duration": 30},
+    {"search": "number 4242"},
+    {"search": "generated", "tags": ["hybrid"], "max_duration": 60},
+]
+
+
+def timed(label: str, fn, repeat: int = 1) -> None:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    print(f"  {label:<28} {(time.perf_counter() - start) * 1000 / repeat:10.3f} ms")
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark content index rebuilds")
+    parser.add_argument("--items", type=int, default=5000)
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--backend", choices=sorted(BACKENDS), default="json")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        for n in range(args.items):
+            write_manifest(root, n)
+
+        print(f"Library: {args.items} manifests")
+        timed("full rebuild", lambda: ContentIndexer(root, backend=args.backend).rebuild(workers=args.workers))
+        timed("no-op rebuild", lambda: ContentIndexer(root, backend=args.backend).rebuild(workers=args.workers))
+        for n in range(0, args.items, max(1, args.items // 10)):
+            write_manifest(root, n, revision=1)
+        timed("rebuild after 10 edits", lambda: ContentIndexer(root, backend=args.backend).rebuild(workers=args.workers))
+
+        print()
+        indexer = ContentIndexer(root, backend=args.backend)
+        timed("first get()", lambda: indexer.get("synthetic_00000"))
+        for query in QUERIES:
+            label = ", ".join(f"{k}={v}" for k, v in query.items())
+            timed(label[:28], lambda: indexer.find(**query), repeat=100)
+        timed("stats()", indexer.stats, repeat=10)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+"""Grading Benchmark - Times the encounter grader.
+
+Grades every encounter of a campaign repeatedly, then grades synthetic
+encounters with growing intro text to show how per-encounter cost scales
+with text size. Finally compares per-encounter contextual grading against
+the batched grader on a synthetic library of thousands of encounters.
+
+Usage:
+    python scripts/bench_grading.py [campaign_yaml] [--rounds N]
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from spellengine.adventures import experience_grading
+from spellengine.adventures.experience_grading import (
+    grade_encounter,
+    grade_encounter_contextual,
+)
+from spellengine.adventures.grading_batch import ContextualGradeBatch, has_numpy
+from spellengine.adventures.loader import load_campaign
+
+DEFAULT_CAMPAIGN = (
+    project_root / "content" / "adventures" / "dread_citadel" / "campaign_source_built.yaml"
+)
+
+# Intro text sizes for the scaling sweep (characters)
+TEXT_SIZES = [100, 1_000, 10_000, 100_000]
+
+# Library sizes for the batched contextual sweep (encounters)
+LIBRARY_SIZES = [1_000, 5_000]
+
+
+def clear_feature_cache() -> None:
+    """Drop cached encounter features so every grade extracts them."""
+    cache_clear = getattr(experience_grading, "clear_feature_cache", None)
+    if cache_clear is not None:
+        cache_clear()
+
+
+def time_grades(encounters: list, rounds: int, cold: bool, grader=grade_encounter) -> float:
+    """Return the mean seconds per graded encounter."""
+    start = time.perf_counter()
+    for _ in range(rounds):
+        if cold:
+            clear_feature_cache()
+        previous = None
+        for i, encounter in enumerate(encounters):
+            grader(encounter, i, len(encounters), previous)
+            previous = encounter
+    return (time.perf_counter() - start) / (rounds * len(encounters))
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the encounter grader")
+    parser.add_argument("campaign", nargs="?", default=str(DEFAULT_CAMPAIGN))
+    parser.add_argument("--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    campaign = load_campaign(Path(args.campaign))
+    encounters = [enc for ch in campaign.chapters for enc in ch.encounters]
+
+    print(f"Campaign: {campaign.id} ({len(encounters)} encounters, {args.rounds} rounds)")
+    cold = time_grades(encounters, args.rounds, cold=True)
+    warm = time_grades(encounters, args.rounds, cold=False)
+    print(f"  cold features: {cold * 1e6:8.1f} us/encounter")
+    print(f"  warm features: {warm * 1e6:8.1f} us/encounter")
+    contextual = time_grades(encounters, args.rounds, cold=True, grader=grade_encounter_contextual)
+    print(f"  contextual:    {contextual * 1e6:8.1f} us/encounter")
+
+    print()
+    print("Scaling with intro text size (cold features):")
+    sample = encounters[0]
+    filler = "Lorem ipsum dolor sit amet, consectetur adipiscing elit. "
+    for size in TEXT_SIZES:
+        text = (filler * (size // len(filler) + 1))[:size]
+        encounter = sample.model_copy(update={"intro_text": text, "success_text": text})
+        rounds = max(1, args.rounds * 100 // size)
+        per = time_grades([encounter], rounds, cold=True)
+        print(f"  {size:>7} chars: {per * 1e6:10.1f} us/encounter")
+
+    print()
+    print(f"Library-wide contextual grading (numpy: {'yes' if has_numpy() else 'no'}):")
+    for size in LIBRARY_SIZES:
+        library = [
+            encounters[i % len(encounters)].model_copy(update={"id": f"enc_{i}"})
+            for i in range(size)
+        ]
+        grades = [grade_encounter(enc, i, size) for i, enc in enumerate(library)]
+
+        start = time.perf_counter()
+        for i, encounter in enumerate(library):
+            grade_encounter_contextual(encounter, i, size)
+        per_encounter = time.perf_counter() - start
+
+        start = time.perf_counter()
+        ContextualGradeBatch(library, grades).report()
+        batched = time.perf_counter() - start
+        print(f"  {size:>6} encounters: per-encounter {per_encounter * 1e3:8.1f} ms, "
+              f"batched scores + report {batched * 1e3:8.1f} ms")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""Import Benchmark - Times cold imports of the adventures package.
+
+Each sample runs in a fresh interpreter so nothing is cached in
+sys.modules. Also times first access of the lazily loaded datasets and
+lists the slowest modules from -X importtime.
+
+Usage:
+    python scripts/bench_import.py [--runs N] [--top N]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+# Add project root to path
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+# Import statements timed from a cold interpreter
+IMPORTS = [
+    "import spellengine.adventures",
+    "from spellengine.adventures import load_campaign",
+    "from spellengine.adventures import AdventureState",
+]
+
+# Datasets materialized on first access: (label, statement)
+DATASETS = [
+    ("ACHIEVEMENT_LIBRARY", "spellengine.adventures.ACHIEVEMENT_LIBRARY"),
+    ("DREAD_CITADEL_GRADES", "spellengine.adventures.DREAD_CITADEL_GRADES"),
+    ("designed hashes", "spellengine.adventures.get_all_hashes()"),
+]
+
+TIMER = """
+import time
+start = time.perf_counter()
+{statement}
+import spellengine.adventures
+mid = time.perf_counter()
+{access}
+end = time.perf_counter()
+print((mid - start) * 1000, (end - mid) * 1000)
+"""
+
+
+def sample(statement: str, access: str = "pass") -> tuple[float, float]:
+    """Run one cold import (and access) in a fresh interpreter, in ms."""
+    code = TIMER.format(statement=statement, access=access)
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=project_root,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stdout.split()
+    return float(out[0]), float(out[1])
+
+
+def slowest_modules(statement: str, top: int) -> list[tuple[int, str]]:
+    """Return the top modules by self time (us) from -X importtime."""
+    err = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=project_root,
+        capture_output=True,
+        text=True,
+        check=True,
+    ).stderr
+    rows = []
+    for line in err.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        rows.append((int(self_us), name.strip()))
+    return sorted(rows, reverse=True)[:top]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark package import time")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"Cold imports ({args.runs} runs, median / min):")
+    for statement in IMPORTS:
+        times = [sample(statement)[0] for _ in range(args.runs)]
+        print(f"  {statement:<50} {statistics.median(times):7.1f} / {min(times):7.1f} ms")
+
+    print()
+    print("First access, including its submodule imports (median):")
+    for label, access in DATASETS:
+        times = [sample("pass", access)[1] for _ in range(args.runs)]
+        print(f"  {label:<22} {statistics.median(times):7.1f} ms")
+
+    print()
+    print(f"Slowest modules for {IMPORTS[0]!r} (self time):")
+    for self_us, name in slowest_modules(IMPORTS[0], args.top):
+        print(f"  {self_us / 1000:7.1f} ms  {name}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
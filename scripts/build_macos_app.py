@@ -196,6 +196,8 @@ datas = [
     (str(project_root / "assets"), "assets"),
     # Lore files (if any)
     (str(project_root / "lore"), "lore"),
+    # Built-in datasets (achievement library, designed hashes, grades)
+    (str(project_root / "spellengine" / "adventures" / "data"), "spellengine/adventures/data"),
     # The spellengine package itself (for campaigns folder)
     (str(project_root / "spellengine" / "campaigns"), "spellengine/campaigns") if (project_root / "spellengine" / "campaigns").exists() else (str(project_root / "content"), "spellengine/campaigns"),
 ]
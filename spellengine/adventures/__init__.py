@@ -1,188 +1,155 @@
-"""PTHAdventures - Choose-your-own-adventure password cracking education."""
+"""PTHAdventures - Choose-your-own-adventure password cracking education.
 
-from spellengine.adventures.models import (
-    Campaign,
-    Chapter,
-    Choice,
-    DifficultyLevel,
-    Encounter,
-    EncounterType,
-    EncounterVariant,
-    GameOverOptions,
-    OutcomeType,
-    PlayerState,
-)
-from spellengine.adventures.state import AdventureState
-from spellengine.adventures.loader import load_campaign
-from spellengine.adventures.achievements import (
-    Achievement,
-    AchievementCategory,
-    AchievementManager,
-    AchievementRarity,
-    TriggerType,
-    UnlockedAchievement,
-    ACHIEVEMENT_LIBRARY,
-    create_achievement_manager,
-    format_achievement_notification,
-    get_achievement_by_id,
-    get_achievements_by_trigger,
-)
-from spellengine.adventures.hashlib_designed import (
-    DesignedHash,
-    HashCategory,
-    ALL_TIERS,
-    DREAD_CITADEL_HASH_MAP,
-    find_hash,
-    get_all_hashes,
-    get_campaign_hash,
-    get_hashes_by_category,
-    get_hashes_by_tier,
-    get_hashes_by_type,
-    get_library_stats,
-    iterate_by_tier,
-)
-from spellengine.adventures.experience_grading import (
-    # Enums
-    GradingDimension,
-    PacingRating,
-    EmotionalBeat,
-    SequenceRole,
-    # Score Models
-    DimensionScore,
-    EncounterGrade,
-    ChapterGrade,
-    CampaignGrade,
-    # Sequencing
-    SequencingPrinciple,
-    SEQUENCING_PRINCIPLES,
-    # Functions
-    grade_encounter,
-    grade_chapter,
-    grade_campaign,
-    generate_grade_report,
-    # Dread Citadel
-    DREAD_CITADEL_GRADES,
-    get_dread_citadel_grades,
-    create_dread_citadel_campaign_grade,
-    create_grading_manifest,
-)
-from spellengine.adventures.dice import (
-    DieType,
-    RollResult,
-    roll,
-    roll_expression,
-    advantage,
-    disadvantage,
-    animated_roll,
-    skill_check,
-    percentile_check,
-    random_encounter_check,
-    loot_roll,
-    dramatic_d20,
-    roll_stats,
-    coin_flip,
-    oracle,
-)
-from spellengine.adventures.assets import (
-    AssetLoader,
-    ArtStyle,
-    DEFAULT_ART_STYLE,
-)
-from spellengine.adventures.hash_index import (
-    CampaignHashIndex,
-    HashLookupResult,
-    create_hash_index,
-)
-from spellengine.adventures.export import (
-    CampaignExporter,
-    export_campaign_pdf,
-)
+Public names are exported lazily: the submodule defining a name is only
+imported the first time that name is accessed, so importing the package
+(or just the loader) does not pay for grading, dice, export and so on.
+"""
 
-__all__ = [
-    # Models
-    "Campaign",
-    "Chapter",
-    "Choice",
-    "DifficultyLevel",
-    "Encounter",
-    "EncounterType",
-    "EncounterVariant",
-    "GameOverOptions",
-    "OutcomeType",
-    "PlayerState",
-    # State
-    "AdventureState",
-    # Loader
-    "load_campaign",
-    # Achievements
-    "Achievement",
-    "AchievementCategory",
-    "AchievementManager",
-    "AchievementRarity",
-    "TriggerType",
-    "UnlockedAchievement",
-    "ACHIEVEMENT_LIBRARY",
-    "create_achievement_manager",
-    "format_achievement_notification",
-    "get_achievement_by_id",
-    "get_achievements_by_trigger",
-    # Designed Hash Library
-    "DesignedHash",
-    "HashCategory",
-    "ALL_TIERS",
-    "DREAD_CITADEL_HASH_MAP",
-    "find_hash",
-    "get_all_hashes",
-    "get_campaign_hash",
-    "get_hashes_by_category",
-    "get_hashes_by_tier",
-    "get_hashes_by_type",
-    "get_library_stats",
-    "iterate_by_tier",
-    # Experience Grading
-    "GradingDimension",
-    "PacingRating",
-    "EmotionalBeat",
-    "SequenceRole",
-    "DimensionScore",
-    "EncounterGrade",
-    "ChapterGrade",
-    "CampaignGrade",
-    "SequencingPrinciple",
-    "SEQUENCING_PRINCIPLES",
-    "grade_encounter",
-    "grade_chapter",
-    "grade_campaign",
-    "generate_grade_report",
-    "DREAD_CITADEL_GRADES",
-    "get_dread_citadel_grades",
-    "create_dread_citadel_campaign_grade",
-    "create_grading_manifest",
-    # Dice
-    "DieType",
-    "RollResult",
-    "roll",
-    "roll_expression",
-    "advantage",
-    "disadvantage",
-    "animated_roll",
-    "skill_check",
-    "percentile_check",
-    "random_encounter_check",
-    "loot_roll",
-    "dramatic_d20",
-    "roll_stats",
-    "coin_flip",
-    "oracle",
-    # Assets
-    "AssetLoader",
-    "ArtStyle",
-    "DEFAULT_ART_STYLE",
-    # Hash Index
-    "CampaignHashIndex",
-    "HashLookupResult",
-    "create_hash_index",
-    # PDF Export
-    "CampaignExporter",
-    "export_campaign_pdf",
-]
+import importlib
+from typing import Any
+
+# Submodule -> public names it exports
+_EXPORTS: dict[str, tuple[str, ...]] = {
+    "models": (
+        "Campaign",
+        "Chapter",
+        "Choice",
+        "DifficultyLevel",
+        "Encounter",
+        "EncounterType",
+        "EncounterVariant",
+        "GameOverOptions",
+        "OutcomeType",
+        "PlayerState",
+    ),
+    "state": (
+        "AdventureState",
+    ),
+    "graph": (
+        "CampaignGraph",
+        "compile_campaign_graph",
+    ),
+    "savefile": (
+        "SaveFormatError",
+        "decode_player_state",
+        "encode_player_state",
+    ),
+    "loader": (
+        "load_campaign",
+    ),
+    "achievements": (
+        "Achievement",
+        "AchievementCategory",
+        "AchievementManager",
+        "AchievementRarity",
+        "TriggerType",
+        "UnlockedAchievement",
+        "ACHIEVEMENT_LIBRARY",
+        "create_achievement_manager",
+        "format_achievement_notification",
+        "get_achievement_by_id",
+        "get_achievements_by_trigger",
+    ),
+    "backfill": (
+        "BackfillReport",
+        "BackfillResult",
+        "backfill_saves",
+    ),
+    "hashlib_designed": (
+        "DesignedHash",
+        "HashCategory",
+        "ALL_TIERS",
+        "DREAD_CITADEL_HASH_MAP",
+        "find_hash",
+        "get_all_hashes",
+        "get_campaign_hash",
+        "get_hashes_by_category",
+        "get_hashes_by_tier",
+        "get_hashes_by_type",
+        "get_library_stats",
+        "iterate_by_tier",
+    ),
+    "experience_grading": (
+        # Enums
+        "GradingDimension",
+        "PacingRating",
+        "EmotionalBeat",
+        "SequenceRole",
+        # Score Models
+        "DimensionScore",
+        "EncounterGrade",
+        "ChapterGrade",
+        "CampaignGrade",
+        # Sequencing
+        "SequencingPrinciple",
+        "SEQUENCING_PRINCIPLES",
+        # Functions
+        "grade_encounter",
+        "grade_chapter",
+        "grade_campaign",
+        "generate_grade_report",
+        "GradeCache",
+        # Dread Citadel
+        "DREAD_CITADEL_GRADES",
+        "get_dread_citadel_grades",
+        "create_dread_citadel_campaign_grade",
+        "create_grading_manifest",
+    ),
+    "grading_batch": (
+        "ContextualGradeBatch",
+        "grade_contextual_batch",
+    ),
+    "dice": (
+        "DieType",
+        "RollResult",
+        "roll",
+        "roll_expression",
+        "advantage",
+        "disadvantage",
+        "animated_roll",
+        "skill_check",
+        "percentile_check",
+        "random_encounter_check",
+        "loot_roll",
+        "dramatic_d20",
+        "roll_stats",
+        "coin_flip",
+        "oracle",
+    ),
+    "assets": (
+        "AssetLoader",
+        "ArtStyle",
+        "DEFAULT_ART_STYLE",
+    ),
+    "hash_index": (
+        "CampaignHashIndex",
+        "HashLookupResult",
+        "create_hash_index",
+    ),
+    "export": (
+        "CampaignExporter",
+        "export_campaign_pdf",
+    ),
+}
+
+# Public name -> submodule
+_EXPORT_MODULES: dict[str, str] = {
+    name: module for module, names in _EXPORTS.items() for name in names
+}
+
+__all__ = list(_EXPORT_MODULES)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORT_MODULES.get(name)
+    if module_name is None:
+        if name in _EXPORTS:
+            return importlib.import_module(f"{__name__}.{name}")
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f"{__name__}.{module_name}"), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,220 @@
+"""Declarative achievement packs for PTHAdventures.
+
+Campaigns ship extra achievements as YAML packs next to their content,
+using the same layout as the adventure itself:
+
+    content/adventures/<campaign_id>/achievements.yaml
+    content/adventures/<campaign_id>/achievements/*.yaml
+
+A pack looks like:
+
+    id: dread_citadel_achievements
+    type: achievement_pack
+    campaign: dread_citadel
+    version: "1.0.0"
+    achievements:
+      - id: lord_slayer
+        title: "Lord of the Flies... er, Hashes"
+        description: "Defeat the Citadel Lord"
+        category: crack_puns
+        trigger: crack_count
+        condition: "encounter_id == 'enc_citadel_lord'"
+
+Conditions are compiled into predicates once, when the pack is loaded.
+Compiled packs are cached by the digest of the pack file, so every
+AchievementManager created for the same campaign reuses them.
+"""
+
+import hashlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import yaml
+
+from spellengine.adventures.achievements import (
+    Achievement,
+    RulePredicate,
+    compile_condition,
+    condition_threshold,
+    get_achievement_library,
+)
+
+# Root of per-campaign content directories
+PACKS_ROOT = Path(__file__).parent.parent.parent / "content" / "adventures"
+PACK_FILE = "achievements.yaml"
+PACK_DIR = "achievements"
+PACK_TYPE = "achievement_pack"
+
+
+@dataclass(frozen=True)
+class AchievementPack:
+    """A loaded achievement pack with its conditions compiled."""
+
+    id: str
+    campaign: str | None
+    version: str
+    digest: str
+    achievements: tuple[Achievement, ...]
+    predicates: dict[str, RulePredicate] = field(default_factory=dict)
+
+
+# Pack file digest -> compiled pack
+_PACK_CACHE: dict[str, AchievementPack] = {}
+
+
+def _parse_achievement(data: dict[str, Any]) -> Achievement:
+    """Parse one achievement entry from a pack."""
+    entry = dict(data)
+    # Packs use the shorter "trigger"/"threshold" spellings
+    if "trigger" in entry:
+        entry["trigger_type"] = entry.pop("trigger")
+    if "threshold" in entry:
+        entry["trigger_value"] = entry.pop("threshold")
+    return Achievement.model_validate(entry)
+
+
+def compile_pack(data: dict[str, Any], digest: str, source: str = "<pack>") -> AchievementPack:
+    """Compile parsed pack data.
+
+    Args:
+        data: Parsed pack YAML
+        digest: Content digest of the pack file
+        source: Pack location (for error messages)
+
+    Returns:
+        AchievementPack with compiled predicates
+
+    Raises:
+        ValueError: If the pack or any condition is invalid
+    """
+    if not isinstance(data, dict):
+        raise ValueError(f"{source}: achievement pack must be a mapping")
+    if data.get("type", PACK_TYPE) != PACK_TYPE:
+        raise ValueError(f"{source}: not an achievement pack (type: {data.get('type')})")
+
+    achievements: list[Achievement] = []
+    predicates: dict[str, RulePredicate] = {}
+    for entry in data.get("achievements") or []:
+        try:
+            achievement = _parse_achievement(entry)
+        except Exception as e:
+            raise ValueError(f"{source}: invalid achievement {entry.get('id')!r}: {e}") from e
+
+        if achievement.condition:
+            # Plain "value >= N" conditions go to the threshold index instead
+            threshold = condition_threshold(achievement.condition, achievement.trigger_type)
+            if threshold is not None:
+                achievement = achievement.model_copy(
+                    update={"trigger_value": threshold, "condition": None}
+                )
+            else:
+                predicates[achievement.id] = compile_condition(achievement.condition)
+        achievements.append(achievement)
+
+    return AchievementPack(
+        id=data.get("id", Path(source).stem),
+        campaign=data.get("campaign"),
+        version=str(data.get("version", "1.0.0")),
+        digest=digest,
+        achievements=tuple(achievements),
+        predicates=predicates,
+    )
+
+
+def load_pack(path: Path | str) -> AchievementPack:
+    """Load an achievement pack, reusing the compiled form if unchanged.
+
+    Args:
+        path: Path to the pack YAML
+
+    Returns:
+        Compiled AchievementPack
+
+    Raises:
+        FileNotFoundError: If the pack doesn't exist
+        ValueError: If the pack is invalid
+    """
+    path = Path(path)
+    raw = path.read_bytes()
+    digest = hashlib.sha256(raw).hexdigest()
+
+    pack = _PACK_CACHE.get(digest)
+    if pack is None:
+        pack = compile_pack(yaml.safe_load(raw), digest, str(path))
+        _PACK_CACHE[digest] = pack
+    return pack
+
+
+def find_pack_files(campaign_id: str, packs_root: Path | None = None) -> list[Path]:
+    """Find the pack files shipped with a campaign.
+
+    Args:
+        campaign_id: Campaign to look up
+        packs_root: Directory of campaign content dirs (defaults to PACKS_ROOT)
+
+    Returns:
+        Pack file paths, single-file pack first
+    """
+    campaign_dir = (packs_root or PACKS_ROOT) / campaign_id
+    paths = []
+    single = campaign_dir / PACK_FILE
+    if single.is_file():
+        paths.append(single)
+    pack_dir = campaign_dir / PACK_DIR
+    if pack_dir.is_dir():
+        paths.extend(sorted(pack_dir.glob("*.yaml")))
+    return paths
+
+
+def load_campaign_packs(campaign_id: str, packs_root: Path | None = None) -> list[AchievementPack]:
+    """Load every achievement pack shipped with a campaign.
+
+    Packs that belong to a different campaign are skipped. Invalid packs
+    are reported and skipped so one broken pack can't block a session.
+
+    Args:
+        campaign_id: Active campaign
+        packs_root: Directory of campaign content dirs (defaults to PACKS_ROOT)
+
+    Returns:
+        List of compiled packs
+    """
+    packs = []
+    for path in find_pack_files(campaign_id, packs_root):
+        try:
+            pack = load_pack(path)
+        except (OSError, ValueError, yaml.YAMLError) as e:
+            print(f"Warning: Failed to load achievement pack {path}: {e}")
+            continue
+        if pack.campaign not in (None, campaign_id):
+            continue
+        packs.append(pack)
+    return packs
+
+
+def build_campaign_achievements(
+    campaign_id: str | None, packs_root: Path | None = None
+) -> tuple[list[Achievement], dict[str, RulePredicate]]:
+    """Assemble the achievement set for a campaign session.
+
+    Args:
+        campaign_id: Active campaign (None for the core library only)
+        packs_root: Directory of campaign content dirs (defaults to PACKS_ROOT)
+
+    Returns:
+        Tuple of (achievements in declaration order, compiled predicates)
+    """
+    achievements = list(get_achievement_library())
+    predicates: dict[str, RulePredicate] = {}
+    if campaign_id:
+        seen = {a.id for a in achievements}
+        for pack in load_campaign_packs(campaign_id, packs_root):
+            for achievement in pack.achievements:
+                if achievement.id in seen:
+                    continue
+                seen.add(achievement.id)
+                achievements.append(achievement)
+            predicates.update(pack.predicates)
+    return achievements, predicates
+
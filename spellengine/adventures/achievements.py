@@ -4,9 +4,14 @@ Tracks player accomplishments with password cracking puns and celebrates
 milestones with thematic achievements.
 """
 
+import ast
+import json
+from bisect import bisect_left, bisect_right
 from datetime import datetime, timezone
 from enum import Enum
-from typing import Callable
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable
 
 from pydantic import BaseModel, Field
 
@@ -74,6 +79,10 @@ class Achievement(BaseModel):
     )
     secret: bool = Field(False, description="Hidden until unlocked")
     points: int = Field(10, description="Achievement points")
+    condition: str | None = Field(
+        None,
+        description="Rule expression over the event (e.g. \"encounter_id == 'enc_gatekeeper'\")",
+    )
 
 
 class UnlockedAchievement(BaseModel):
@@ -89,615 +98,325 @@ class UnlockedAchievement(BaseModel):
 # Achievement Library - 50+ Pun-tastic Achievements
 # =============================================================================
 
-ACHIEVEMENT_LIBRARY: list[Achievement] = [
-    # =========================================================================
-    # HASH PUNS (MD5, SHA, bcrypt references)
-    # =========================================================================
-    Achievement(
-        id="md5_mayhem",
-        title="MD5 Mayhem",
-        description="Crack your first MD5 hash",
-        icon="hash",
-        category=AchievementCategory.HASH_PUNS,
-        rarity=AchievementRarity.COMMON,
-        trigger_type=TriggerType.FIRST_CRACK,
-        points=10,
-    ),
-    Achievement(
-        id="sha_la_la",
-        title="SHA La La",
-        description="Successfully complete a SHA-based encounter",
-        icon="lock",
-        category=AchievementCategory.HASH_PUNS,
-        rarity=AchievementRarity.COMMON,
-        trigger_type=TriggerType.CRACK_COUNT,
-        trigger_value=1,
-        points=10,
-    ),
-    Achievement(
-        id="bcrypt_keeper",
-        title="Bcrypt Keeper",
-        description="Master bcrypt hashes (complete 5 bcrypt encounters)",
-        icon="shield",
-        category=AchievementCategory.HASH_PUNS,
-        rarity=AchievementRarity.UNCOMMON,
-        trigger_type=TriggerType.CRACK_COUNT,
-        trigger_value=5,
-        points=25,
-    ),
-    Achievement(
-        id="hash_slinger",
-        title="Hash Slinger",
-        description="Crack 10 hashes of any type",
-        icon="fire",
-        category=AchievementCategory.HASH_PUNS,
-        rarity=AchievementRarity.COMMON,
-        trigger_type=TriggerType.CRACK_COUNT,
-        trigger_value=10,
-        points=15,
-    ),
-    Achievement(
-        id="algorithm_whisperer",
-        title="Algorithm Whisperer",
-        description="Crack 25 hashes",
-        icon="sparkles",
-        category=AchievementCategory.HASH_PUNS,
-        rarity=AchievementRarity.UNCOMMON,
-        trigger_type=TriggerType.CRACK_COUNT,
-        trigger_value=25,
-        points=30,
-    ),
-    Achievement(
-        id="digest_this",
-        title="Digest This!",
-        description="Crack 50 message digests",
-        icon="brain",
-        category=AchievementCategory.HASH_PUNS,
-        rarity=AchievementRarity.RARE,
-        trigger_type=TriggerType.CRACK_COUNT,
-        trigger_value=50,
-        points=50,
-    ),
-    Achievement(
-        id="one_way_street",
-        title="One-Way Street",
-        description="Prove that one-way functions aren't always one-way",
-        icon="arrow",
-        category=AchievementCategory.HASH_PUNS,
-        rarity=AchievementRarity.COMMON,
-        trigger_type=TriggerType.FIRST_CRACK,
-        points=10,
-    ),
-    Achievement(
-        id="collision_course",
-        title="Collision Course",
-        description="Crack 100 hashes",
-        icon="boom",
-        category=AchievementCategory.HASH_PUNS,
-        rarity=AchievementRarity.EPIC,
-        trigger_type=TriggerType.CRACK_COUNT,
-        trigger_value=100,
-        points=100,
-    ),
-    Achievement(
-        id="hash_brown",
-        title="Hash Brown",
-        description="Crack hashes before breakfast (before 9 AM)",
-        icon="egg",
-        category=AchievementCategory.HASH_PUNS,
-        rarity=AchievementRarity.RARE,
-        trigger_type=TriggerType.FIRST_CRACK,
-        secret=True,
-        points=25,
-    ),
-    Achievement(
-        id="length_extension",
-        title="Length Extension Attack",
-        description="Complete a chapter with extra encounters",
-        icon="ruler",
-        category=AchievementCategory.HASH_PUNS,
-        rarity=AchievementRarity.UNCOMMON,
-        trigger_type=TriggerType.CHAPTER_COMPLETE,
-        points=20,
-    ),
-    # =========================================================================
-    # CRACK PUNS (Broke, cracked, shattered)
-    # =========================================================================
-    Achievement(
-        id="crack_of_dawn",
-        title="Crack of Dawn",
-        description="Complete your first encounter",
-        icon="sunrise",
-        category=AchievementCategory.CRACK_PUNS,
-        rarity=AchievementRarity.COMMON,
-        trigger_type=TriggerType.FIRST_CRACK,
-        points=10,
-    ),
-    Achievement(
-        id="cracking_up",
-        title="Cracking Up",
-        description="Fail 5 times but keep going",
-        icon="laugh",
-        category=AchievementCategory.CRACK_PUNS,
-        rarity=AchievementRarity.COMMON,
-        trigger_type=TriggerType.DEATH_COUNT,
-        trigger_value=5,
-        points=15,
-    ),
-    Achievement(
-        id="broken_but_not_beaten",
-        title="Broken But Not Beaten",
-        description="Recover from 10 deaths",
-        icon="phoenix",
-        category=AchievementCategory.CRACK_PUNS,
-        rarity=AchievementRarity.UNCOMMON,
-        trigger_type=TriggerType.DEATH_COUNT,
-        trigger_value=10,
-        points=25,
-    ),
-    Achievement(
-        id="shattered_expectations",
-        title="Shattered Expectations",
-        description="Complete an encounter in under 30 seconds",
-        icon="lightning",
-        category=AchievementCategory.CRACK_PUNS,
-        rarity=AchievementRarity.UNCOMMON,
-        trigger_type=TriggerType.SPEED_CRACK,
-        trigger_value=30,
-        points=30,
-    ),
-    Achievement(
-        id="break_on_through",
-        title="Break On Through",
-        description="Complete your first chapter",
-        icon="door",
-        category=AchievementCategory.CRACK_PUNS,
-        rarity=AchievementRarity.COMMON,
-        trigger_type=TriggerType.CHAPTER_COMPLETE,
-        points=20,
-    ),
-    Achievement(
-        id="crack_master",
-        title="Crack Master",
-        description="Crack 500 hashes lifetime",
-        icon="crown",
-        category=AchievementCategory.CRACK_PUNS,
-        rarity=AchievementRarity.LEGENDARY,
-        trigger_type=TriggerType.CRACK_COUNT,
-        trigger_value=500,
-        points=200,
-    ),
-    Achievement(
-        id="smashing_success",
-        title="Smashing Success",
-        description="Complete an encounter under 10 seconds",
-        icon="hammer",
-        category=AchievementCategory.CRACK_PUNS,
-        rarity=AchievementRarity.RARE,
-        trigger_type=TriggerType.SPEED_CRACK,
-        trigger_value=10,
-        points=50,
-    ),
-    Achievement(
-        id="persistence_pays",
-        title="Persistence Pays Off",
-        description="Die 25 times total",
-        icon="tombstone",
-        category=AchievementCategory.CRACK_PUNS,
-        rarity=AchievementRarity.RARE,
-        trigger_type=TriggerType.DEATH_COUNT,
-        trigger_value=25,
-        points=40,
-    ),
-    Achievement(
-        id="unbreakable",
-        title="Unbreakable",
-        description="Complete a chapter without dying",
-        icon="diamond",
-        category=AchievementCategory.CRACK_PUNS,
-        rarity=AchievementRarity.RARE,
-        trigger_type=TriggerType.NO_DEATH_CHAPTER,
-        points=50,
-    ),
-    Achievement(
-        id="perfect_run",
-        title="Perfect Run",
-        description="Complete a campaign without dying",
-        icon="star",
-        category=AchievementCategory.CRACK_PUNS,
-        rarity=AchievementRarity.LEGENDARY,
-        trigger_type=TriggerType.NO_DEATH_CAMPAIGN,
-        points=250,
-    ),
-    # =========================================================================
-    # CRYPTO PUNS (Salt, pepper, rainbow)
-    # =========================================================================
-    Achievement(
-        id="worth_your_salt",
-        title="Worth Your Salt",
-        description="Complete an encounter involving salted hashes",
-        icon="salt",
-        category=AchievementCategory.CRYPTO_PUNS,
-        rarity=AchievementRarity.COMMON,
-        trigger_type=TriggerType.FIRST_CRACK,
-        points=15,
-    ),
-    Achievement(
-        id="pepper_spray",
-        title="Pepper Spray",
-        description="Deal with 5 peppered hash encounters",
-        icon="pepper",
-        category=AchievementCategory.CRYPTO_PUNS,
-        rarity=AchievementRarity.UNCOMMON,
-        trigger_type=TriggerType.CRACK_COUNT,
-        trigger_value=5,
-        points=25,
-    ),
-    Achievement(
-        id="rainbow_connection",
-        title="Rainbow Connection",
-        description="Learn about rainbow tables",
-        icon="rainbow",
-        category=AchievementCategory.CRYPTO_PUNS,
-        rarity=AchievementRarity.COMMON,
-        trigger_type=TriggerType.CHAPTER_COMPLETE,
-        points=15,
-    ),
-    Achievement(
-        id="taste_the_rainbow",
-        title="Taste the Rainbow",
-        description="Complete 10 encounters using rainbow table knowledge",
-        icon="candy",
-        category=AchievementCategory.CRYPTO_PUNS,
-        rarity=AchievementRarity.RARE,
-        trigger_type=TriggerType.CRACK_COUNT,
-        trigger_value=10,
-        points=40,
-    ),
-    Achievement(
-        id="seasoned_veteran",
-        title="Seasoned Veteran",
-        description="Master salts, peppers, and all the seasonings",
-        icon="chef",
-        category=AchievementCategory.CRYPTO_PUNS,
-        rarity=AchievementRarity.EPIC,
-        trigger_type=TriggerType.CRACK_COUNT,
-        trigger_value=50,
-        points=75,
-    ),
-    Achievement(
-        id="entropy_enjoyer",
-        title="Entropy Enjoyer",
-        description="Appreciate the chaos (earn 1000 XP)",
-        icon="dice",
-        category=AchievementCategory.CRYPTO_PUNS,
-        rarity=AchievementRarity.UNCOMMON,
-        trigger_type=TriggerType.XP_EARNED,
-        trigger_value=1000,
-        points=30,
-    ),
-    Achievement(
-        id="key_to_success",
-        title="Key to Success",
-        description="Complete 25 encounters",
-        icon="key",
-        category=AchievementCategory.CRYPTO_PUNS,
-        rarity=AchievementRarity.UNCOMMON,
-        trigger_type=TriggerType.CRACK_COUNT,
-        trigger_value=25,
-        points=35,
-    ),
-    Achievement(
-        id="nonce_sense",
-        title="Nonce Sense",
-        description="Complete encounters with perfect timing",
-        icon="clock",
-        category=AchievementCategory.CRYPTO_PUNS,
-        rarity=AchievementRarity.RARE,
-        trigger_type=TriggerType.SPEED_CRACK,
-        trigger_value=15,
-        points=45,
-    ),
-    Achievement(
-        id="plaintext_hero",
-        title="Plaintext Hero",
-        description="Reveal the truth behind 100 hashes",
-        icon="document",
-        category=AchievementCategory.CRYPTO_PUNS,
-        rarity=AchievementRarity.EPIC,
-        trigger_type=TriggerType.CRACK_COUNT,
-        trigger_value=100,
-        points=100,
-    ),
-    Achievement(
-        id="cipher_punk",
-        title="Cipher Punk",
-        description="Embrace the crypto underground",
-        icon="punk",
-        category=AchievementCategory.CRYPTO_PUNS,
-        rarity=AchievementRarity.RARE,
-        trigger_type=TriggerType.CAMPAIGN_COMPLETE,
-        points=50,
-    ),
-    # =========================================================================
-    # TOOL PUNS (Hashcat, John, masks)
-    # =========================================================================
-    Achievement(
-        id="cat_got_your_hash",
-        title="Cat Got Your Hash?",
-        description="Learn Hashcat basics",
-        icon="cat",
-        category=AchievementCategory.TOOL_PUNS,
-        rarity=AchievementRarity.COMMON,
-        trigger_type=TriggerType.FIRST_CRACK,
-        points=10,
-    ),
-    Achievement(
-        id="john_hancock",
-        title="John Hancock",
-        description="Sign your work with John the Ripper knowledge",
-        icon="pen",
-        category=AchievementCategory.TOOL_PUNS,
-        rarity=AchievementRarity.COMMON,
-        trigger_type=TriggerType.CHAPTER_COMPLETE,
-        points=15,
-    ),
-    Achievement(
-        id="mask_off",
-        title="Mask Off",
-        description="Master mask attacks",
-        icon="mask",
-        category=AchievementCategory.TOOL_PUNS,
-        rarity=AchievementRarity.UNCOMMON,
-        trigger_type=TriggerType.CRACK_COUNT,
-        trigger_value=10,
-        points=25,
-    ),
-    Achievement(
-        id="rule_breaker",
-        title="Rule Breaker",
-        description="Learn about rule-based attacks",
-        icon="gavel",
-        category=AchievementCategory.TOOL_PUNS,
-        rarity=AchievementRarity.COMMON,
-        trigger_type=TriggerType.FIRST_CRACK,
-        points=15,
-    ),
-    Achievement(
-        id="wordsmith",
-        title="Wordsmith",
-        description="Master wordlist attacks",
-        icon="book",
-        category=AchievementCategory.TOOL_PUNS,
-        rarity=AchievementRarity.UNCOMMON,
-        trigger_type=TriggerType.CRACK_COUNT,
-        trigger_value=15,
-        points=30,
-    ),
-    Achievement(
-        id="combo_breaker",
-        title="Combo Breaker",
-        description="Learn combination attacks",
-        icon="link",
-        category=AchievementCategory.TOOL_PUNS,
-        rarity=AchievementRarity.UNCOMMON,
-        trigger_type=TriggerType.CRACK_COUNT,
-        trigger_value=20,
-        points=35,
-    ),
-    Achievement(
-        id="brute_force_awakens",
-        title="Brute Force Awakens",
-        description="Experience the power of brute force",
-        icon="fist",
-        category=AchievementCategory.TOOL_PUNS,
-        rarity=AchievementRarity.COMMON,
-        trigger_type=TriggerType.FIRST_CRACK,
-        points=10,
-    ),
-    Achievement(
-        id="gpu_go_brrr",
-        title="GPU Go BRRR",
-        description="Learn about GPU acceleration",
-        icon="gpu",
-        category=AchievementCategory.TOOL_PUNS,
-        rarity=AchievementRarity.UNCOMMON,
-        trigger_type=TriggerType.CHAPTER_COMPLETE,
-        points=25,
-    ),
-    Achievement(
-        id="potfile_prophet",
-        title="Potfile Prophet",
-        description="Understand potfile management",
-        icon="pot",
-        category=AchievementCategory.TOOL_PUNS,
-        rarity=AchievementRarity.RARE,
-        trigger_type=TriggerType.CRACK_COUNT,
-        trigger_value=50,
-        points=40,
-    ),
-    Achievement(
-        id="session_master",
-        title="Session Master",
-        description="Learn about session management",
-        icon="folder",
-        category=AchievementCategory.TOOL_PUNS,
-        rarity=AchievementRarity.UNCOMMON,
-        trigger_type=TriggerType.CAMPAIGN_COMPLETE,
-        points=30,
-    ),
-    # =========================================================================
-    # PROGRESS PUNS (Levels, XP, grains of sand)
-    # =========================================================================
-    Achievement(
-        id="first_grain",
-        title="First Grain of Sand",
-        description="Earn your first XP",
-        icon="grain",
-        category=AchievementCategory.PROGRESS_PUNS,
-        rarity=AchievementRarity.COMMON,
-        trigger_type=TriggerType.XP_EARNED,
-        trigger_value=1,
-        points=5,
-    ),
-    Achievement(
-        id="handful_of_sand",
-        title="Handful of Sand",
-        description="Earn 100 grains of sand (XP)",
-        icon="hand",
-        category=AchievementCategory.PROGRESS_PUNS,
-        rarity=AchievementRarity.COMMON,
-        trigger_type=TriggerType.XP_EARNED,
-        trigger_value=100,
-        points=15,
-    ),
-    Achievement(
-        id="sand_castle",
-        title="Sand Castle Builder",
-        description="Earn 500 grains of sand",
-        icon="castle",
-        category=AchievementCategory.PROGRESS_PUNS,
-        rarity=AchievementRarity.UNCOMMON,
-        trigger_type=TriggerType.XP_EARNED,
-        trigger_value=500,
-        points=30,
-    ),
-    Achievement(
-        id="desert_wanderer",
-        title="Desert Wanderer",
-        description="Earn 2500 grains of sand",
-        icon="desert",
-        category=AchievementCategory.PROGRESS_PUNS,
-        rarity=AchievementRarity.RARE,
-        trigger_type=TriggerType.XP_EARNED,
-        trigger_value=2500,
-        points=50,
-    ),
-    Achievement(
-        id="sand_storm",
-        title="Sandstorm",
-        description="Earn 5000 grains of sand",
-        icon="storm",
-        category=AchievementCategory.PROGRESS_PUNS,
-        rarity=AchievementRarity.EPIC,
-        trigger_type=TriggerType.XP_EARNED,
-        trigger_value=5000,
-        points=100,
-    ),
-    Achievement(
-        id="beach_front_property",
-        title="Beachfront Property",
-        description="Earn 10000 grains of sand",
-        icon="beach",
-        category=AchievementCategory.PROGRESS_PUNS,
-        rarity=AchievementRarity.LEGENDARY,
-        trigger_type=TriggerType.XP_EARNED,
-        trigger_value=10000,
-        points=250,
-    ),
-    Achievement(
-        id="level_up",
-        title="Level Up!",
-        description="Complete your first campaign",
-        icon="up",
-        category=AchievementCategory.PROGRESS_PUNS,
-        rarity=AchievementRarity.UNCOMMON,
-        trigger_type=TriggerType.CAMPAIGN_COMPLETE,
-        points=50,
-    ),
-    Achievement(
-        id="chapter_champion",
-        title="Chapter Champion",
-        description="Complete 5 chapters",
-        icon="medal",
-        category=AchievementCategory.PROGRESS_PUNS,
-        rarity=AchievementRarity.UNCOMMON,
-        trigger_type=TriggerType.CHAPTER_COMPLETE,
-        trigger_value=5,
-        points=35,
-    ),
-    Achievement(
-        id="campaign_conqueror",
-        title="Campaign Conqueror",
-        description="Complete 3 campaigns",
-        icon="trophy",
-        category=AchievementCategory.PROGRESS_PUNS,
-        rarity=AchievementRarity.RARE,
-        trigger_type=TriggerType.CAMPAIGN_COMPLETE,
-        trigger_value=3,
-        points=75,
-    ),
-    Achievement(
-        id="the_completionist",
-        title="The Completionist",
-        description="Unlock all non-secret achievements in a category",
-        icon="check",
-        category=AchievementCategory.PROGRESS_PUNS,
-        rarity=AchievementRarity.EPIC,
-        trigger_type=TriggerType.UNLOCK_ALL_CATEGORY,
-        points=150,
-    ),
-    # =========================================================================
-    # SECRET ACHIEVEMENTS
-    # =========================================================================
-    Achievement(
-        id="rogue_scholar",
-        title="Rogue Scholar",
-        description="Complete a campaign in rogue mode (text-only)",
-        icon="scroll",
-        category=AchievementCategory.CRACK_PUNS,
-        rarity=AchievementRarity.LEGENDARY,
-        trigger_type=TriggerType.ROGUE_MODE_COMPLETE,
-        secret=True,
-        points=300,
-    ),
-    Achievement(
-        id="fork_master",
-        title="Fork Master",
-        description="Make all correct choices in a campaign",
-        icon="fork",
-        category=AchievementCategory.PROGRESS_PUNS,
-        rarity=AchievementRarity.EPIC,
-        trigger_type=TriggerType.ALL_CHOICES_CORRECT,
-        secret=True,
-        points=100,
-    ),
-    Achievement(
-        id="night_owl",
-        title="Night Owl",
-        description="Crack hashes after midnight",
-        icon="owl",
-        category=AchievementCategory.HASH_PUNS,
-        rarity=AchievementRarity.RARE,
-        trigger_type=TriggerType.FIRST_CRACK,
-        secret=True,
-        points=25,
-    ),
-    Achievement(
-        id="speed_demon",
-        title="Speed Demon",
-        description="Complete an encounter in under 5 seconds",
-        icon="demon",
-        category=AchievementCategory.CRACK_PUNS,
-        rarity=AchievementRarity.LEGENDARY,
-        trigger_type=TriggerType.SPEED_CRACK,
-        trigger_value=5,
-        secret=True,
-        points=100,
-    ),
-    Achievement(
-        id="phoenix_rising",
-        title="Phoenix Rising",
-        description="Die 50 times and keep going",
-        icon="fire",
-        category=AchievementCategory.CRACK_PUNS,
-        rarity=AchievementRarity.EPIC,
-        trigger_type=TriggerType.DEATH_COUNT,
-        trigger_value=50,
-        secret=True,
-        points=75,
-    ),
-]
+# The library ships as data and is only parsed on first access
+ACHIEVEMENT_LIBRARY_FILE = Path(__file__).parent / "data" / "achievement_library.json"
+
+
+@lru_cache(maxsize=1)
+def get_achievement_library() -> list[Achievement]:
+    """Get the built-in achievement library, loading it on first use."""
+    with open(ACHIEVEMENT_LIBRARY_FILE, encoding="utf-8") as f:
+        return [Achievement.model_validate(entry) for entry in json.load(f)]
+
+
+def __getattr__(name: str) -> Any:
+    # ACHIEVEMENT_LIBRARY stays importable as a module attribute
+    if name == "ACHIEVEMENT_LIBRARY":
+        return get_achievement_library()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# =============================================================================
+# Achievement Rule Engine
+# =============================================================================
+
+# Count-style triggers: unlock once the reported value reaches the threshold
+THRESHOLD_AT_LEAST = frozenset({
+    TriggerType.CRACK_COUNT,
+    TriggerType.DEATH_COUNT,
+    TriggerType.XP_EARNED,
+    TriggerType.CHAPTER_COMPLETE,
+    TriggerType.CAMPAIGN_COMPLETE,
+})
+
+# Count-style triggers: unlock once the reported value drops to the threshold
+THRESHOLD_AT_MOST = frozenset({
+    TriggerType.SPEED_CRACK,
+})
+
+# Triggers that unlock unconditionally when they fire
+ALWAYS_TRIGGERS = frozenset({
+    TriggerType.FIRST_CRACK,
+    TriggerType.FIRST_DEATH,
+})
+
+# Triggers whose achievements also unlock unconditionally when they carry no threshold
+ALWAYS_WITHOUT_VALUE = frozenset({
+    TriggerType.CHAPTER_COMPLETE,
+    TriggerType.CAMPAIGN_COMPLETE,
+})
+
+# Context-gated triggers: trigger -> predicate over the event context
+CONTEXT_PREDICATES: dict[TriggerType, Callable[[dict], bool]] = {
+    TriggerType.NO_DEATH_CHAPTER: lambda ctx: ctx.get("deaths_in_chapter", 1) == 0,
+    TriggerType.NO_DEATH_CAMPAIGN: lambda ctx: ctx.get("deaths_in_campaign", 1) == 0,
+    TriggerType.ROGUE_MODE_COMPLETE: lambda ctx: bool(ctx.get("rogue_mode", False)),
+    TriggerType.ALL_CHOICES_CORRECT: lambda ctx: bool(ctx.get("all_correct", False)),
+}
+
+
+# -----------------------------------------------------------------------------
+# Rule expressions
+# -----------------------------------------------------------------------------
+#
+# Achievement conditions are small Python-syntax expressions over the event:
+# ``value`` (the trigger value), ``campaign_id``, ``encounter_id`` and any
+# key passed in the trigger context, e.g.
+#
+#     encounter_id == 'enc_citadel_lord' and deaths_in_chapter == 0
+#
+# They are validated against a node whitelist and compiled once into plain
+# Python callables, so evaluating one costs a single function call.
+
+RulePredicate = Callable[[Any, dict], bool]
+
+_ALLOWED_RULE_NODES = (
+    ast.Expression, ast.BoolOp, ast.And, ast.Or, ast.UnaryOp, ast.Not, ast.USub,
+    ast.Compare, ast.Eq, ast.NotEq, ast.Lt, ast.LtE, ast.Gt, ast.GtE, ast.In, ast.NotIn,
+    ast.BinOp, ast.Add, ast.Sub, ast.Mult, ast.Mod, ast.FloorDiv,
+    ast.Name, ast.Load, ast.Constant, ast.Tuple, ast.List,
+)
+
+
+class _RuleNames(ast.NodeTransformer):
+    """Rewrite free names to lookups: value -> value, other -> ctx.get(name)."""
+
+    def visit_Name(self, node: ast.Name) -> ast.AST:
+        if node.id == "value":
+            return node
+        return ast.copy_location(
+            ast.Call(
+                func=ast.Attribute(value=ast.Name("ctx", ast.Load()), attr="get", ctx=ast.Load()),
+                args=[ast.Constant(node.id)],
+                keywords=[],
+            ),
+            node,
+        )
+
+
+def _parse_rule(expression: str) -> ast.Expression:
+    """Parse and validate a rule expression."""
+    try:
+        tree = ast.parse(expression.strip(), mode="eval")
+    except SyntaxError as e:
+        raise ValueError(f"Invalid achievement condition {expression!r}: {e.msg}") from e
+    for node in ast.walk(tree):
+        if not isinstance(node, _ALLOWED_RULE_NODES):
+            raise ValueError(
+                f"Unsupported syntax in achievement condition {expression!r}: "
+                f"{type(node).__name__}"
+            )
+    return tree
+
+
+@lru_cache(maxsize=None)
+def compile_condition(expression: str) -> RulePredicate:
+    """Compile a rule expression into a predicate callable.
+
+    Args:
+        expression: Condition source (see module notes above)
+
+    Returns:
+        Callable taking (value, ctx) and returning True when the rule holds.
+        Comparisons against missing values evaluate to False.
+
+    Raises:
+        ValueError: If the expression is invalid or uses unsupported syntax
+    """
+    tree = _parse_rule(expression)
+    body = _RuleNames().visit(tree).body
+    func = ast.Expression(
+        body=ast.Lambda(
+            args=ast.arguments(
+                posonlyargs=[],
+                args=[ast.arg("value"), ast.arg("ctx")],
+                kwonlyargs=[],
+                kw_defaults=[],
+                defaults=[],
+            ),
+            body=body,
+        )
+    )
+    ast.fix_missing_locations(func)
+    rule = eval(compile(func, f"<achievement {expression!r}>", "eval"), {"__builtins__": {}})
+
+    def predicate(value: Any, ctx: dict) -> bool:
+        try:
+            return bool(rule(value, ctx))
+        except TypeError:
+            # e.g. None >= 5 when the event carried no value
+            return False
+
+    return predicate
+
+
+def condition_threshold(expression: str, trigger_type: TriggerType) -> int | None:
+    """Extract a plain threshold from a condition, if it is one.
+
+    ``value >= N`` on an at-least trigger (or ``value <= N`` on an at-most
+    trigger) is equivalent to trigger_value=N and can use the sorted
+    threshold index instead of a predicate.
+
+    Returns:
+        The threshold, or None if the condition is anything more complex
+    """
+    tree = _parse_rule(expression)
+    node = tree.body
+    if not (
+        isinstance(node, ast.Compare)
+        and len(node.ops) == 1
+        and isinstance(node.left, ast.Name)
+        and node.left.id == "value"
+        and isinstance(node.comparators[0], ast.Constant)
+        and type(node.comparators[0].value) is int
+    ):
+        return None
+    op = node.ops[0]
+    if trigger_type in THRESHOLD_AT_LEAST and isinstance(op, ast.GtE):
+        return node.comparators[0].value
+    if trigger_type in THRESHOLD_AT_MOST and isinstance(op, ast.LtE):
+        return node.comparators[0].value
+    return None
+
+
+class _ThresholdTable:
+    """Achievements for one count-style trigger, sorted by threshold."""
+
+    def __init__(self, entries: list[tuple[int, int, str]], at_most: bool) -> None:
+        entries.sort()
+        self.thresholds = [t for t, _, _ in entries]
+        self.orders = [o for _, o, _ in entries]
+        self.ids = [a for _, _, a in entries]
+        self.at_most = at_most
+        # Entries below this index (or at/above it for at_most) are known unlocked
+        self.frontier = len(entries) if at_most else 0
+
+    def crossed(self, value: int) -> range:
+        """Index range of every entry whose threshold the value satisfies."""
+        if self.at_most:
+            return range(bisect_left(self.thresholds, value), self.frontier)
+        return range(self.frontier, bisect_right(self.thresholds, value))
+
+
+class AchievementRuleIndex:
+    """Achievements indexed by trigger type for per-event lookups.
+
+    Count-style triggers keep their thresholds in sorted arrays, so a
+    single bisect finds every achievement a new value crosses. Cost per
+    event is O(log n + newly unlocked) rather than a scan of the library.
+    """
+
+    def __init__(
+        self,
+        achievements: "dict[str, Achievement]",
+        predicates: dict[str, RulePredicate] | None = None,
+    ) -> None:
+        """Build the index.
+
+        Args:
+            achievements: Achievement ID -> Achievement, in declaration order
+            predicates: Precompiled condition predicates by achievement ID
+                (conditions without one are compiled here)
+        """
+        predicates = predicates or {}
+        self._order: dict[str, int] = {}
+        self._always: dict[TriggerType, list[str]] = {}
+        self._tables: dict[TriggerType, _ThresholdTable] = {}
+        self._predicates: dict[TriggerType, list[tuple[str, RulePredicate]]] = {}
+
+        threshold_entries: dict[TriggerType, list[tuple[int, int, str]]] = {}
+        for order, achievement in enumerate(achievements.values()):
+            self._order[achievement.id] = order
+            trigger = achievement.trigger_type
+            is_threshold = trigger in THRESHOLD_AT_LEAST or trigger in THRESHOLD_AT_MOST
+
+            if achievement.condition:
+                threshold = condition_threshold(achievement.condition, trigger)
+                if threshold is not None:
+                    threshold_entries.setdefault(trigger, []).append(
+                        (threshold, order, achievement.id)
+                    )
+                else:
+                    predicate = predicates.get(achievement.id) or compile_condition(
+                        achievement.condition
+                    )
+                    self._predicates.setdefault(trigger, []).append((achievement.id, predicate))
+            elif is_threshold and achievement.trigger_value is not None:
+                threshold_entries.setdefault(trigger, []).append(
+                    (int(achievement.trigger_value), order, achievement.id)
+                )
+            elif (
+                trigger in ALWAYS_TRIGGERS
+                or trigger in CONTEXT_PREDICATES
+                or trigger in ALWAYS_WITHOUT_VALUE
+            ):
+                self._always.setdefault(trigger, []).append(achievement.id)
+
+        for trigger, entries in threshold_entries.items():
+            self._tables[trigger] = _ThresholdTable(entries, trigger in THRESHOLD_AT_MOST)
+
+    def candidates(
+        self,
+        trigger_type: TriggerType,
+        value: int | str | None,
+        context: dict,
+        unlocked: set[str],
+        campaign_id: str | None = None,
+        encounter_id: str | None = None,
+    ) -> list[str]:
+        """Find locked achievements whose conditions an event satisfies.
+
+        Args:
+            trigger_type: The type of event that occurred
+            value: Value reported with the event
+            context: Additional event context
+            unlocked: IDs already unlocked (skipped)
+            campaign_id: Campaign context (visible to conditions)
+            encounter_id: Encounter context (visible to conditions)
+
+        Returns:
+            Achievement IDs to unlock, in declaration order
+        """
+        found: list[str] = []
+
+        gate = CONTEXT_PREDICATES.get(trigger_type)
+        gate_open = gate is None or gate(context)
+        if gate_open:
+            found.extend(a for a in self._always.get(trigger_type, ()) if a not in unlocked)
+
+        table = self._tables.get(trigger_type)
+        if table is not None and isinstance(value, int):
+            self._advance_frontier(table, unlocked)
+            ids = table.ids
+            found.extend(ids[i] for i in table.crossed(value) if ids[i] not in unlocked)
+
+        rules = self._predicates.get(trigger_type)
+        if rules and gate_open:
+            env = {"campaign_id": campaign_id, "encounter_id": encounter_id, **context}
+            found.extend(
+                aid for aid, predicate in rules
+                if aid not in unlocked and predicate(value, env)
+            )
+
+        if len(found) > 1:
+            found.sort(key=self._order.__getitem__)
+        return found
+
+    @staticmethod
+    def _advance_frontier(table: _ThresholdTable, unlocked: set[str]) -> None:
+        """Skip over leading entries that are already unlocked."""
+        ids = table.ids
+        if table.at_most:
+            while table.frontier > 0 and ids[table.frontier - 1] in unlocked:
+                table.frontier -= 1
+        else:
+            while table.frontier < len(ids) and ids[table.frontier] in unlocked:
+                table.frontier += 1
+
+    def reset(self) -> None:
+        """Forget frontier progress (after unlocked state is replaced)."""
+        for table in self._tables.values():
+            table.frontier = len(table.ids) if table.at_most else 0
 
 
 # =============================================================================
@@ -708,12 +427,24 @@ ACHIEVEMENT_LIBRARY: list[Achievement] = [
 class AchievementManager:
     """Manages achievement checking and unlocking."""
 
-    def __init__(self) -> None:
-        """Initialize the achievement manager."""
+    def __init__(
+        self,
+        achievements: list[Achievement] | None = None,
+        predicates: dict[str, RulePredicate] | None = None,
+    ) -> None:
+        """Initialize the achievement manager.
+
+        Args:
+            achievements: Achievements to track (defaults to ACHIEVEMENT_LIBRARY)
+            predicates: Precompiled condition predicates by achievement ID
+        """
         self._achievements: dict[str, Achievement] = {
-            a.id: a for a in ACHIEVEMENT_LIBRARY
+            a.id: a
+            for a in (get_achievement_library() if achievements is None else achievements)
         }
+        self._rules = AchievementRuleIndex(self._achievements, predicates)
         self._unlocked: list[UnlockedAchievement] = []
+        self._unlocked_ids: set[str] = set()
         self._stats: dict[str, int] = {
             "crack_count": 0,
             "death_count": 0,
@@ -735,7 +466,7 @@ class AchievementManager:
     @property
     def unlocked_ids(self) -> set[str]:
         """Get IDs of unlocked achievements."""
-        return {u.achievement_id for u in self._unlocked}
+        return set(self._unlocked_ids)
 
     def get_achievement(self, achievement_id: str) -> Achievement | None:
         """Get an achievement by ID."""
@@ -743,7 +474,7 @@ class AchievementManager:
 
     def is_unlocked(self, achievement_id: str) -> bool:
         """Check if an achievement is unlocked."""
-        return achievement_id in self.unlocked_ids
+        return achievement_id in self._unlocked_ids
 
     def get_by_category(self, category: AchievementCategory) -> list[Achievement]:
         """Get all achievements in a category."""
@@ -758,7 +489,7 @@ class AchievementManager:
         return [
             a
             for a in self._achievements.values()
-            if not a.secret or a.id in self.unlocked_ids
+            if not a.secret or a.id in self._unlocked_ids
         ]
 
     def unlock(
@@ -790,6 +521,7 @@ class AchievementManager:
             encounter_id=encounter_id,
         )
         self._unlocked.append(unlocked)
+        self._unlocked_ids.add(achievement_id)
         return unlocked
 
     def check_trigger(
@@ -813,80 +545,19 @@ class AchievementManager:
             List of newly unlocked achievements
         """
         newly_unlocked: list[UnlockedAchievement] = []
-        context = context or {}
-
-        for achievement in self._achievements.values():
-            if self.is_unlocked(achievement.id):
-                continue
-
-            if achievement.trigger_type != trigger_type:
-                continue
-
-            # Check if conditions are met
-            should_unlock = False
-
-            if trigger_type == TriggerType.FIRST_CRACK:
-                should_unlock = True
-
-            elif trigger_type == TriggerType.FIRST_DEATH:
-                should_unlock = True
-
-            elif trigger_type == TriggerType.CRACK_COUNT:
-                if achievement.trigger_value is not None:
-                    should_unlock = (
-                        isinstance(value, int)
-                        and value >= int(achievement.trigger_value)
-                    )
-
-            elif trigger_type == TriggerType.DEATH_COUNT:
-                if achievement.trigger_value is not None:
-                    should_unlock = (
-                        isinstance(value, int)
-                        and value >= int(achievement.trigger_value)
-                    )
-
-            elif trigger_type == TriggerType.XP_EARNED:
-                if achievement.trigger_value is not None:
-                    should_unlock = (
-                        isinstance(value, int)
-                        and value >= int(achievement.trigger_value)
-                    )
-
-            elif trigger_type == TriggerType.SPEED_CRACK:
-                if achievement.trigger_value is not None:
-                    should_unlock = (
-                        isinstance(value, int)
-                        and value <= int(achievement.trigger_value)
-                    )
-
-            elif trigger_type in (
-                TriggerType.CHAPTER_COMPLETE,
-                TriggerType.CAMPAIGN_COMPLETE,
-            ):
-                if achievement.trigger_value is not None:
-                    should_unlock = (
-                        isinstance(value, int)
-                        and value >= int(achievement.trigger_value)
-                    )
-                else:
-                    should_unlock = True
-
-            elif trigger_type == TriggerType.NO_DEATH_CHAPTER:
-                should_unlock = context.get("deaths_in_chapter", 1) == 0
-
-            elif trigger_type == TriggerType.NO_DEATH_CAMPAIGN:
-                should_unlock = context.get("deaths_in_campaign", 1) == 0
-
-            elif trigger_type == TriggerType.ROGUE_MODE_COMPLETE:
-                should_unlock = context.get("rogue_mode", False)
-
-            elif trigger_type == TriggerType.ALL_CHOICES_CORRECT:
-                should_unlock = context.get("all_correct", False)
+        candidates = self._rules.candidates(
+            trigger_type,
+            value,
+            context or {},
+            self._unlocked_ids,
+            campaign_id=campaign_id,
+            encounter_id=encounter_id,
+        )
 
-            if should_unlock:
-                unlocked = self.unlock(achievement.id, campaign_id, encounter_id)
-                if unlocked:
-                    newly_unlocked.append(unlocked)
+        for achievement_id in candidates:
+            unlocked = self.unlock(achievement_id, campaign_id, encounter_id)
+            if unlocked:
+                newly_unlocked.append(unlocked)
 
         return newly_unlocked
 
@@ -938,6 +609,8 @@ class AchievementManager:
             self._unlocked = [
                 UnlockedAchievement.model_validate(u) for u in data["unlocked"]
             ]
+            self._unlocked_ids = {u.achievement_id for u in self._unlocked}
+            self._rules.reset()
         if "stats" in data:
             self._stats.update(data["stats"])
 
@@ -947,14 +620,27 @@ class AchievementManager:
 # =============================================================================
 
 
-def create_achievement_manager() -> AchievementManager:
-    """Create a new achievement manager with the full library."""
-    return AchievementManager()
+def create_achievement_manager(campaign_id: str | None = None) -> AchievementManager:
+    """Create a new achievement manager with the full library.
+
+    Args:
+        campaign_id: Active campaign; its achievement packs are loaded too
+
+    Returns:
+        AchievementManager instance
+    """
+    if campaign_id is None:
+        return AchievementManager()
+
+    from spellengine.adventures.achievement_packs import build_campaign_achievements
+
+    achievements, predicates = build_campaign_achievements(campaign_id)
+    return AchievementManager(achievements, predicates)
 
 
 def get_achievement_by_id(achievement_id: str) -> Achievement | None:
     """Look up an achievement by ID from the library."""
-    for achievement in ACHIEVEMENT_LIBRARY:
+    for achievement in get_achievement_library():
         if achievement.id == achievement_id:
             return achievement
     return None
@@ -962,7 +648,7 @@ def get_achievement_by_id(achievement_id: str) -> Achievement | None:
 
 def get_achievements_by_trigger(trigger_type: TriggerType) -> list[Achievement]:
     """Get all achievements that can be triggered by a specific event."""
-    return [a for a in ACHIEVEMENT_LIBRARY if a.trigger_type == trigger_type]
+    return [a for a in get_achievement_library() if a.trigger_type == trigger_type]
 
 
 def format_achievement_notification(achievement: Achievement) -> str:
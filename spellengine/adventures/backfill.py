@@ -0,0 +1,396 @@
+"""Retroactive achievement evaluation for PTHAdventures.
+
+Achievements only unlock on live events, so players who finished content
+before an achievement shipped never receive it. This module replays saved
+progress through the achievement rules for many save files at once,
+reports what would unlock, and optionally writes the unlocks back.
+
+Saves carry no event journal, so events are reconstructed from progress:
+
+    first_crack / crack_count   one event per completed encounter, in order
+    xp_earned                   the lifetime XP total
+    first_death / death_count   one event per recorded death
+    chapter_complete            one event per chapter the player has left
+    campaign_complete           one event per completed difficulty
+    no_death_* / rogue / forks  only when the save proves the condition
+
+Encounter timings are not saved, so speed_crack achievements cannot be
+backfilled.
+
+Saves are processed in chunks by a process pool. Directories are walked
+with os.scandir without collecting or sorting their listings, paths are
+consumed lazily, and only a bounded number of chunks are in flight at a
+time, so arbitrarily long directory listings stream through in constant
+memory.
+"""
+
+import json
+import os
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from fnmatch import fnmatch
+from itertools import islice
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from spellengine.adventures.achievements import (
+    Achievement,
+    AchievementRuleIndex,
+    TriggerType,
+)
+from spellengine.adventures.graph import CampaignGraph, compile_campaign_graph
+from spellengine.adventures.models import PlayerState
+from spellengine.adventures.savefile import (
+    decode_player_state,
+    encode_player_state,
+    is_binary_save,
+)
+
+if TYPE_CHECKING:
+    from spellengine.adventures.models import Campaign
+
+
+# Save files picked up when a directory is given, preferred format first
+# (a legacy save is skipped when the same save exists in a preferred format)
+SAVE_PATTERNS = ("*_game.sav", "*_game.json")
+
+# Saves handed to a worker at a time
+DEFAULT_CHUNK_SIZE = 64
+
+
+# =============================================================================
+# Results
+# =============================================================================
+
+
+@dataclass
+class BackfillResult:
+    """Outcome of evaluating one save file."""
+
+    path: Path
+    player_name: str | None = None
+    unlocked: list[str] = field(default_factory=list)
+    applied: bool = False
+    error: str | None = None
+
+
+@dataclass
+class BackfillReport:
+    """Aggregate of a backfill run."""
+
+    saves: int = 0
+    changed: int = 0
+    applied: int = 0
+    errors: list[tuple[Path, str]] = field(default_factory=list)
+    unlocks: Counter = field(default_factory=Counter)
+
+    def add(self, result: BackfillResult) -> None:
+        """Fold one result into the report."""
+        self.saves += 1
+        if result.error:
+            self.errors.append((result.path, result.error))
+            return
+        if result.unlocked:
+            self.changed += 1
+            self.unlocks.update(result.unlocked)
+        if result.applied:
+            self.applied += 1
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert the report to a JSON-serializable dict."""
+        return {
+            "saves": self.saves,
+            "changed": self.changed,
+            "applied": self.applied,
+            "unlocks": dict(self.unlocks.most_common()),
+            "errors": [{"path": str(p), "error": e} for p, e in self.errors],
+        }
+
+
+# =============================================================================
+# Event Replay
+# =============================================================================
+
+
+@dataclass(frozen=True)
+class ReplayPlan:
+    """The parts of a campaign needed to replay saves.
+
+    Plain tuples and strings, so it pickles cheaply into worker processes.
+    """
+
+    campaign_id: str
+    layout: bytes
+    chapter_encounters: tuple[tuple[str, ...], ...]
+    wrong_choices: frozenset[tuple[str, str]]
+
+    @classmethod
+    def from_campaign(cls, campaign: "Campaign") -> "ReplayPlan":
+        """Build a replay plan from a loaded campaign."""
+        wrong = frozenset(
+            (enc.id, choice.id)
+            for chapter in campaign.chapters
+            for enc in chapter.encounters
+            for choice in enc.choices or ()
+            if not choice.is_correct
+        )
+        return cls(
+            campaign_id=campaign.id,
+            layout=compile_campaign_graph(campaign).to_layout(),
+            chapter_encounters=tuple(
+                tuple(enc.id for enc in ch.encounters) for ch in campaign.chapters
+            ),
+            wrong_choices=wrong,
+        )
+
+
+Event = tuple[TriggerType, int | None, str | None, dict]
+
+
+def replay_events(state: PlayerState, plan: ReplayPlan, graph: CampaignGraph) -> Iterator[Event]:
+    """Reconstruct achievement events from saved progress.
+
+    Args:
+        state: Saved player state
+        plan: Replay plan for the save's campaign
+        graph: Campaign graph for chapter ordinals
+
+    Yields:
+        (trigger, value, encounter_id, context) tuples in play order
+    """
+    completed = state.completed_encounters
+    last_encounter = completed[-1] if completed else None
+
+    for count, encounter_id in enumerate(completed, 1):
+        if count == 1:
+            yield TriggerType.FIRST_CRACK, None, encounter_id, {}
+        yield TriggerType.CRACK_COUNT, count, encounter_id, {}
+
+    if state.total_xp:
+        yield TriggerType.XP_EARNED, state.total_xp, last_encounter, {}
+
+    for count in range(1, state.deaths + 1):
+        if count == 1:
+            yield TriggerType.FIRST_DEATH, None, None, {}
+        yield TriggerType.DEATH_COUNT, count, None, {}
+
+    # Deaths aren't attributed to chapters, so "no death" needs a clean save
+    deathless = state.deaths == 0
+    difficulties = state.completed_difficulties.get(plan.campaign_id, [])
+    if difficulties:
+        chapters_done = graph.chapter_count
+    else:
+        chapters_done = graph.chapter_ordinal(state.chapter_id) or 0
+
+    for count, encounters in enumerate(plan.chapter_encounters[:chapters_done], 1):
+        chapter_last = next((e for e in reversed(encounters) if state.is_completed(e)), None)
+        yield TriggerType.CHAPTER_COMPLETE, count, chapter_last, {}
+        if deathless:
+            yield TriggerType.NO_DEATH_CHAPTER, None, chapter_last, {"deaths_in_chapter": 0}
+
+    for count in range(1, len(difficulties) + 1):
+        yield TriggerType.CAMPAIGN_COMPLETE, count, last_encounter, {}
+    if difficulties:
+        if deathless:
+            yield TriggerType.NO_DEATH_CAMPAIGN, None, last_encounter, {"deaths_in_campaign": 0}
+        if state.rogue_mode:
+            yield TriggerType.ROGUE_MODE_COMPLETE, None, last_encounter, {"rogue_mode": True}
+        if not any(item in plan.wrong_choices for item in state.choice_history.items()):
+            yield TriggerType.ALL_CHOICES_CORRECT, None, last_encounter, {"all_correct": True}
+
+
+def evaluate_state(
+    state: PlayerState,
+    plan: ReplayPlan,
+    graph: CampaignGraph,
+    rules: AchievementRuleIndex,
+) -> list[str]:
+    """Find achievements a saved state qualifies for but doesn't have.
+
+    Args:
+        state: Saved player state
+        plan: Replay plan for the save's campaign
+        graph: Campaign graph for chapter ordinals
+        rules: Achievement rule index (reset before use)
+
+    Returns:
+        Newly earned achievement IDs in unlock order
+    """
+    rules.reset()
+    unlocked = set(state.achievements)
+    earned: list[str] = []
+    for trigger, value, encounter_id, context in replay_events(state, plan, graph):
+        for achievement_id in rules.candidates(
+            trigger, value, context, unlocked,
+            campaign_id=plan.campaign_id, encounter_id=encounter_id,
+        ):
+            unlocked.add(achievement_id)
+            earned.append(achievement_id)
+    return earned
+
+
+# =============================================================================
+# Save File Processing
+# =============================================================================
+
+
+def _read_save(path: Path, graph: CampaignGraph) -> tuple[PlayerState, bool]:
+    """Read a save in either format. Returns (state, is_binary)."""
+    data = path.read_bytes()
+    if is_binary_save(data):
+        return decode_player_state(data, graph), True
+    return PlayerState.model_validate(json.loads(data)), False
+
+
+def _write_save(path: Path, state: PlayerState, graph: CampaignGraph, binary: bool) -> None:
+    """Atomically rewrite a save in its original format."""
+    if binary:
+        data = encode_player_state(state, graph)
+    else:
+        data = json.dumps(state.model_dump(mode="json"), indent=2).encode("utf-8")
+    tmp_path = path.with_name(path.name + ".tmp")
+    tmp_path.write_bytes(data)
+    tmp_path.replace(path)
+
+
+class _Evaluator:
+    """Per-process evaluation context (built once per worker)."""
+
+    def __init__(self, plan: ReplayPlan, achievements: list[Achievement]) -> None:
+        self.plan = plan
+        self.graph = CampaignGraph.from_layout(plan.layout)
+        self.rules = AchievementRuleIndex({a.id: a for a in achievements})
+
+    def run(self, path: Path, apply: bool) -> BackfillResult:
+        """Evaluate (and optionally update) one save file."""
+        result = BackfillResult(path=path)
+        try:
+            state, binary = _read_save(path, self.graph)
+            result.player_name = state.player_name
+            if state.campaign_id != self.plan.campaign_id:
+                result.error = f"save is for campaign {state.campaign_id!r}"
+                return result
+            result.unlocked = evaluate_state(state, self.plan, self.graph, self.rules)
+            if apply and result.unlocked:
+                state.achievements = state.achievements + result.unlocked
+                _write_save(path, state, self.graph, binary)
+                result.applied = True
+        except Exception as e:
+            # One unreadable save shouldn't stop a bulk run
+            result.error = f"{type(e).__name__}: {e}"
+        return result
+
+
+_worker: _Evaluator | None = None
+
+
+def _init_worker(plan: ReplayPlan, achievements: list[Achievement]) -> None:
+    """Process pool initializer: build the evaluator once per worker."""
+    global _worker
+    _worker = _Evaluator(plan, achievements)
+
+
+def _run_chunk(paths: list[Path], apply: bool) -> list[BackfillResult]:
+    """Evaluate a chunk of saves in a worker process."""
+    assert _worker is not None
+    return [_worker.run(path, apply) for path in paths]
+
+
+def find_save_files(paths: Iterable[Path | str]) -> Iterator[Path]:
+    """Expand files and directories into save file paths, lazily.
+
+    Directories are searched recursively, in directory order. When a
+    client migration left a legacy save next to its replacement (e.g.
+    x_game.json beside x_game.sav), only the preferred format is yielded.
+
+    Args:
+        paths: Save files, or directories searched recursively
+
+    Yields:
+        Save file paths
+    """
+    for path in map(Path, paths):
+        if path.is_dir():
+            yield from _walk_saves(path)
+        else:
+            yield path
+
+
+def _walk_saves(root: Path) -> Iterator[Path]:
+    """Stream the save files under a directory, one save per stem."""
+    pending = [root]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                    continue
+                for rank, pattern in enumerate(SAVE_PATTERNS):
+                    if fnmatch(entry.name, pattern):
+                        path = Path(entry.path)
+                        if not any(
+                            path.with_suffix(Path(preferred).suffix).exists()
+                            for preferred in SAVE_PATTERNS[:rank]
+                        ):
+                            yield path
+                        break
+
+
+def _chunks(items: Iterable[Path], size: int) -> Iterator[list[Path]]:
+    """Split an iterable into lists of at most size items."""
+    it = iter(items)
+    while chunk := list(islice(it, size)):
+        yield chunk
+
+
+def backfill_saves(
+    campaign: "Campaign",
+    save_paths: Iterable[Path | str],
+    achievements: list[Achievement] | None = None,
+    apply: bool = False,
+    workers: int | None = None,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+) -> Iterator[BackfillResult]:
+    """Evaluate achievements retroactively over many save files.
+
+    Args:
+        campaign: Campaign the saves belong to
+        save_paths: Save files or directories (consumed lazily)
+        achievements: Achievements to evaluate (defaults to the library plus
+            the campaign's achievement packs)
+        apply: Write newly earned achievements back into the saves
+        workers: Worker processes (defaults to the CPU count; 0 or 1 runs
+            in-process)
+        chunk_size: Saves handed to a worker at a time
+
+    Yields:
+        One BackfillResult per save, in input order
+    """
+    if achievements is None:
+        from spellengine.adventures.achievement_packs import build_campaign_achievements
+
+        achievements, _ = build_campaign_achievements(campaign.id)
+
+    plan = ReplayPlan.from_campaign(campaign)
+    paths = find_save_files(save_paths)
+    workers = (os.cpu_count() or 1) if workers is None else workers
+
+    if workers <= 1:
+        evaluator = _Evaluator(plan, achievements)
+        for path in paths:
+            yield evaluator.run(path, apply)
+        return
+
+    with ProcessPoolExecutor(
+        max_workers=workers, initializer=_init_worker, initargs=(plan, achievements)
+    ) as pool:
+        # Keep a bounded window of chunks in flight so input streams
+        pending: list[Future] = []
+        for chunk in _chunks(paths, chunk_size):
+            pending.append(pool.submit(_run_chunk, chunk, apply))
+            if len(pending) >= workers * 2:
+                yield from pending.pop(0).result()
+        for future in pending:
+            yield from future.result()
@@ -10,8 +10,16 @@ This module provides:
 - Analysis tools for campaign evaluation
 """
 
+import hashlib
+import json
+import os
+from collections import OrderedDict
+from collections.abc import Iterator
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
+from functools import lru_cache
+from pathlib import Path
 from typing import Any
 from pydantic import BaseModel, Field
 
@@ -442,6 +450,135 @@ SEQUENCING_PRINCIPLES = [
 ]
 
 
+# =============================================================================
+# FEATURE EXTRACTION
+# =============================================================================
+
+
+# Keyword groups read by the scorers (matched as substrings of lowercased text)
+HOOK_WORDS = ("secret", "mystery", "legend", "ancient", "challenge", "test")
+TEACH_WORDS = ("learn", "understand", "explain", "example", "remember", "note")
+NARRATIVE_WORDS = (
+    "cipher circle",
+    "apprentice",
+    "citadel",
+    "fortress",
+    "guardian",
+    "speaks",
+    "journey",
+)
+FANTASY_WORDS = ("ancient", "fortress", "guardian", "magic", "quest")
+FANTASY_FLAVOR_WORDS = ("ancient", "magic", "legend")
+CORPORATE_CLASH_WORDS = ("magic", "dragon", "fortress", "citadel")
+CORPORATE_REPLACE_WORDS = ("magic", "dragon", "citadel")
+BOSS_TITLE_WORDS = ("boss", "guardian")
+
+# Text cues for the emotional beat, checked in order
+BEAT_CUES: tuple[tuple[tuple[str, ...], EmotionalBeat], ...] = (
+    (("victory", "triumph", "success"), EmotionalBeat.TRIUMPH),
+    (("learn", "discover"), EmotionalBeat.REVELATION),
+    (("wonder", "ancient"), EmotionalBeat.WONDER),
+)
+
+# Keywords looked up per text (only what some scorer reads from that text)
+_INTRO_KEYWORDS = tuple(dict.fromkeys(
+    HOOK_WORDS + TEACH_WORDS + NARRATIVE_WORDS + FANTASY_WORDS + CORPORATE_CLASH_WORDS
+    + tuple(word for cues, _ in BEAT_CUES for word in cues)
+))
+_SUCCESS_KEYWORDS = TEACH_WORDS
+
+
+@dataclass(frozen=True, slots=True)
+class TextFeatures:
+    """Length and keyword hits for one block of text."""
+
+    length: int
+    keywords: frozenset[str]
+
+    def has_any(self, words: tuple[str, ...]) -> bool:
+        """Check whether any of the words occurs in the text."""
+        return not self.keywords.isdisjoint(words)
+
+
+@dataclass(frozen=True, slots=True)
+class EncounterFeatures:
+    """Text features of an encounter, extracted once and shared by all scorers."""
+
+    intro: TextFeatures
+    success: TextFeatures
+    title_keywords: frozenset[str]
+    beat_cue: EmotionalBeat | None
+    has_hint: bool
+
+    @property
+    def is_boss_title(self) -> bool:
+        """Title marks a boss or guardian fight."""
+        return bool(self.title_keywords)
+
+
+def _text_features(text: str, keywords: tuple[str, ...] = ()) -> TextFeatures:
+    """Lowercase a text once and collect its length and keyword hits.
+
+    Keywords match as substrings ("learn" in "learned"), as the scorers
+    always have, so each keyword is one scan of the lowered text. The
+    savings come from sharing and caching this pass, not from making a
+    cold pass cheaper.
+    """
+    lowered = text.lower()
+    return TextFeatures(
+        length=len(text),
+        keywords=frozenset(word for word in keywords if word in lowered),
+    )
+
+
+@lru_cache(maxsize=4096)
+def _extract_features(
+    title: str, intro_text: str, success_text: str, has_hint: bool
+) -> EncounterFeatures:
+    """Extract features from encounter text (cached by content)."""
+    intro = _text_features(intro_text, _INTRO_KEYWORDS)
+    lowered_title = title.lower()
+
+    beat_cue = None
+    for cues, beat in BEAT_CUES:
+        if intro.has_any(cues):
+            beat_cue = beat
+            break
+
+    return EncounterFeatures(
+        intro=intro,
+        success=_text_features(success_text, _SUCCESS_KEYWORDS),
+        title_keywords=frozenset(w for w in BOSS_TITLE_WORDS if w in lowered_title),
+        beat_cue=beat_cue,
+        has_hint=has_hint,
+    )
+
+
+def encounter_features(encounter: Encounter) -> EncounterFeatures:
+    """Get the text features of an encounter.
+
+    Features are cached by the encounter's text, so every scorer (and the
+    contextual grader) shares one extraction pass per encounter.
+
+    Args:
+        encounter: The encounter to analyze
+
+    Returns:
+        EncounterFeatures for the encounter
+    """
+    return _extract_features(
+        encounter.title,
+        encounter.intro_text,
+        encounter.success_text,
+        bool(encounter.hint),
+    )
+
+
+def clear_feature_cache() -> None:
+    """Drop all cached encounter features."""
+    _extract_features.cache_clear()
+
+
 # =============================================================================
 # GRADING FUNCTIONS
 # =============================================================================
@@ -469,46 +606,33 @@ def grade_encounter(
     Returns:
         EncounterGrade with heuristic scores
     """
+    features = encounter_features(encounter)
+    emotional_arc, emotional_beat = _score_emotional_arc(encounter, features)
+    pacing, pacing_rating = _score_pacing(encounter, previous_encounter)
+
     grade = EncounterGrade(
         encounter_id=encounter.id,
         encounter_title=encounter.title,
+        # Determine sequence role based on type and position
+        sequence_role=_determine_sequence_role(
+            encounter, position, total_encounters, features
+        ),
+        # Score engagement (based on intro text quality and encounter type)
+        engagement=_score_engagement(encounter, features),
+        # Score challenge balance (based on tier vs position)
+        challenge_balance=_score_challenge_balance(encounter, position, total_encounters),
+        learning_value=_score_learning_value(encounter, features),
+        emotional_arc=emotional_arc,
+        emotional_beat=emotional_beat,
+        pacing=pacing,
+        pacing_rating=pacing_rating,
+        agency=_score_agency(encounter),
+        narrative_integration=_score_narrative_integration(
+            encounter, chapter_context, features
+        ),
+        replay_value=_score_replay_value(encounter),
     )
 
-    # Determine sequence role based on type and position
-    grade.sequence_role = _determine_sequence_role(
-        encounter, position, total_encounters
-    )
-
-    # Score engagement (based on intro text quality and encounter type)
-    grade.engagement = _score_engagement(encounter)
-
-    # Score challenge balance (based on tier vs position)
-    grade.challenge_balance = _score_challenge_balance(
-        encounter, position, total_encounters
-    )
-
-    # Score learning value
-    grade.learning_value = _score_learning_value(encounter)
-
-    # Score emotional arc
-    grade.emotional_arc, grade.emotional_beat = _score_emotional_arc(encounter)
-
-    # Score pacing
-    grade.pacing, grade.pacing_rating = _score_pacing(
-        encounter, previous_encounter
-    )
-
-    # Score agency
-    grade.agency = _score_agency(encounter)
-
-    # Score narrative integration
-    grade.narrative_integration = _score_narrative_integration(
-        encounter, chapter_context
-    )
-
-    # Score replay value
-    grade.replay_value = _score_replay_value(encounter)
-
     # Generate analysis
     grade.strengths, grade.weaknesses, grade.suggestions = _analyze_encounter(
         encounter, grade
@@ -518,7 +642,7 @@ def grade_encounter(
 
 
 def _determine_sequence_role(
-    encounter: Encounter, position: int, total: int
+    encounter: Encounter, position: int, total: int, features: EncounterFeatures
 ) -> SequenceRole:
     """Determine the role of an encounter in the sequence."""
     # Early positions
@@ -549,7 +673,7 @@ def _determine_sequence_role(
         return SequenceRole.CHECKPOINT
 
     if encounter.encounter_type == EncounterType.TOUR:
-        if "learn" in encounter.intro_text.lower() or "explain" in encounter.intro_text.lower():
+        if features.intro.has_any(("learn", "explain")):
             return SequenceRole.TUTORIAL
         return SequenceRole.BREATHER
 
@@ -557,7 +681,7 @@ def _determine_sequence_role(
         return SequenceRole.CHALLENGE
 
     if encounter.tier >= 2:
-        if "guardian" in encounter.title.lower() or "boss" in encounter.title.lower():
+        if features.is_boss_title:
             return SequenceRole.BOSS
         return SequenceRole.CHALLENGE
 
@@ -567,19 +691,18 @@ def _determine_sequence_role(
     return SequenceRole.CHALLENGE
 
 
-def _score_engagement(encounter: Encounter) -> int:
+def _score_engagement(encounter: Encounter, features: EncounterFeatures) -> int:
     """Score engagement based on intro text and encounter design."""
     score = 3  # Base score
 
     # Long, descriptive intro text
-    if len(encounter.intro_text) > 400:
+    if features.intro.length > 400:
         score += 1
-    elif len(encounter.intro_text) < 100:
+    elif features.intro.length < 100:
         score -= 1
 
     # Has a clear hook/mystery
-    hook_words = ["secret", "mystery", "legend", "ancient", "challenge", "test"]
-    if any(word in encounter.intro_text.lower() for word in hook_words):
+    if features.intro.has_any(HOOK_WORDS):
         score += 1
 
     # Interactive encounter types are more engaging
@@ -618,7 +741,7 @@ def _score_challenge_balance(
         return 1
 
 
-def _score_learning_value(encounter: Encounter) -> int:
+def _score_learning_value(encounter: Encounter, features: EncounterFeatures) -> int:
     """Score how much the encounter teaches."""
     score = 3
 
@@ -627,44 +750,36 @@ def _score_learning_value(encounter: Encounter) -> int:
         score += 1
 
     # Explicit teaching in text
-    teach_words = ["learn", "understand", "explain", "example", "remember", "note"]
-    text = encounter.intro_text.lower() + encounter.success_text.lower()
-    if any(word in text for word in teach_words):
+    if features.intro.has_any(TEACH_WORDS) or features.success.has_any(TEACH_WORDS):
         score += 1
 
     # Has hint (provides guidance)
-    if encounter.hint:
+    if features.has_hint:
         score += 0.5
 
     # Has clear success text with explanation
-    if len(encounter.success_text) > 100:
+    if features.success.length > 100:
         score += 0.5
 
     return max(1, min(5, int(score)))
 
 
-def _score_emotional_arc(encounter: Encounter) -> tuple[int, EmotionalBeat]:
+def _score_emotional_arc(
+    encounter: Encounter, features: EncounterFeatures
+) -> tuple[int, EmotionalBeat]:
     """Score emotional variety and determine primary beat."""
     score = 3
     beat = EmotionalBeat.COMFORT
 
     # Determine emotional beat
-    text_lower = encounter.intro_text.lower()
-
     if encounter.encounter_type == EncounterType.GAMBIT:
         beat = EmotionalBeat.TENSION
         score = 4
-    elif "boss" in encounter.title.lower() or "guardian" in encounter.title.lower():
+    elif features.is_boss_title:
         beat = EmotionalBeat.DREAD
         score = 4
-    elif "victory" in text_lower or "triumph" in text_lower or "success" in text_lower:
-        beat = EmotionalBeat.TRIUMPH
-        score = 4
-    elif "learn" in text_lower or "discover" in text_lower:
-        beat = EmotionalBeat.REVELATION
-        score = 4
-    elif "wonder" in text_lower or "ancient" in text_lower:
-        beat = EmotionalBeat.WONDER
+    elif features.beat_cue is not None:
+        beat = features.beat_cue
         score = 4
     elif encounter.encounter_type == EncounterType.TOUR:
         if encounter.is_checkpoint:
@@ -747,30 +862,21 @@ def _score_agency(encounter: Encounter) -> int:
 
 
 def _score_narrative_integration(
-    encounter: Encounter, chapter_context: str
+    encounter: Encounter, chapter_context: str, features: EncounterFeatures
 ) -> int:
     """Score how well encounter fits narrative."""
     score = 3
 
     # Has substantial intro text
-    if len(encounter.intro_text) > 200:
+    if features.intro.length > 200:
         score += 1
 
     # Has success text that continues story
-    if len(encounter.success_text) > 50:
+    if features.success.length > 50:
         score += 0.5
 
     # References expected story elements
-    narrative_words = [
-        "cipher circle",
-        "apprentice",
-        "citadel",
-        "fortress",
-        "guardian",
-        "speaks",
-        "journey",
-    ]
-    if any(word in encounter.intro_text.lower() for word in narrative_words):
+    if features.intro.has_any(NARRATIVE_WORDS):
         score += 0.5
 
     return max(1, min(5, int(score)))
@@ -837,12 +943,15 @@ def _analyze_encounter(
     return strengths, weaknesses, suggestions
 
 
-def grade_chapter(chapter: Chapter, chapter_index: int = 0) -> ChapterGrade:
+def grade_chapter(
+    chapter: Chapter, chapter_index: int = 0, cache: "GradeCache | None" = None
+) -> ChapterGrade:
     """Grade an entire chapter.
 
     Args:
         chapter: The chapter to grade
         chapter_index: Position in campaign
+        cache: Optional encounter grade cache to read and fill
 
     Returns:
         ChapterGrade with all encounter grades and analysis
@@ -852,16 +961,25 @@ def grade_chapter(chapter: Chapter, chapter_index: int = 0) -> ChapterGrade:
         chapter_title=chapter.title,
     )
 
-    # Grade each encounter
+    # Grade each encounter (reusing cached grades where nothing changed)
     previous: Encounter | None = None
+    total = len(chapter.encounters)
     for i, encounter in enumerate(chapter.encounters):
-        enc_grade = grade_encounter(
-            encounter,
-            position=i,
-            total_encounters=len(chapter.encounters),
-            previous_encounter=previous,
-            chapter_context=chapter.description,
-        )
+        key = None
+        enc_grade = None
+        if cache is not None:
+            key = encounter_grade_key(encounter, i, total, previous, chapter.description)
+            enc_grade = cache.get(key)
+        if enc_grade is None:
+            enc_grade = grade_encounter(
+                encounter,
+                position=i,
+                total_encounters=total,
+                previous_encounter=previous,
+                chapter_context=chapter.description,
+            )
+            if cache is not None:
+                cache.put(key, enc_grade)
         grade.encounter_grades.append(enc_grade)
         previous = encounter
 
@@ -969,24 +1087,35 @@ def _suggest_reordering(
     return suggestions
 
 
-def grade_campaign(campaign: Campaign) -> CampaignGrade:
+def grade_campaign(
+    campaign: Campaign,
+    cache: "GradeCache | None" = None,
+    workers: int | None = None,
+) -> CampaignGrade:
     """Grade an entire campaign.
 
+    Encounters are graded incrementally: grades are cached by a digest of
+    the encounter and its sequence context, so only edited encounters (and
+    the ones whose position or predecessor changed) are re-graded.
+
     Args:
         campaign: The campaign to grade
+        cache: Encounter grade cache (defaults to a shared in-memory cache
+            holding the DEFAULT_GRADE_CACHE_SIZE most recent grades)
+        workers: Processes for grading stale chapters (None for the CPU
+            count). Small batches are always graded in-process.
 
     Returns:
         CampaignGrade with full analysis
     """
+    cache = _DEFAULT_GRADE_CACHE if cache is None else cache
     grade = CampaignGrade(
         campaign_id=campaign.id,
         campaign_title=campaign.title,
     )
 
     # Grade each chapter
-    for i, chapter in enumerate(campaign.chapters):
-        chapter_grade = grade_chapter(chapter, i)
-        grade.chapter_grades.append(chapter_grade)
+    grade.chapter_grades = _grade_chapters(campaign.chapters, cache, workers)
 
     # Generate campaign-level analysis
     grade.overall_analysis = _analyze_campaign(campaign, grade)
@@ -1097,6 +1226,216 @@ def _prioritize_improvements(grade: CampaignGrade) -> list[str]:
     return priorities
 
 
+# =============================================================================
+# INCREMENTAL GRADING
+# =============================================================================
+
+
+# Bump whenever a scorer changes so cached grades are discarded
+GRADER_VERSION = "1"
+
+# Stale encounters needed before chapters are graded in a process pool
+PARALLEL_GRADE_THRESHOLD = 2000
+
+
+def encounter_grade_key(
+    encounter: Encounter,
+    position: int,
+    total_encounters: int,
+    previous_encounter: Encounter | None,
+    chapter_context: str = "",
+) -> str:
+    """Compute the cache key for an encounter grade.
+
+    Covers everything grade_encounter() reads: the encounter's content, its
+    position in the chapter, the previous encounter's type and the chapter
+    context.
+
+    Args:
+        encounter: The encounter to grade
+        position: 0-indexed position in sequence
+        total_encounters: Total encounters in sequence
+        previous_encounter: The previous encounter, if any
+        chapter_context: Chapter context for narrative analysis
+
+    Returns:
+        Hex digest identifying this grading input
+    """
+    previous_type = previous_encounter.encounter_type.value if previous_encounter else ""
+    h = hashlib.blake2b(digest_size=16)
+    h.update(f"{GRADER_VERSION}\x00{position}/{total_encounters}\x00{previous_type}\x00".encode())
+    h.update(chapter_context.encode("utf-8"))
+    h.update(b"\x00")
+    h.update(encounter.model_dump_json().encode("utf-8"))
+    return h.hexdigest()
+
+
+def _copy_grade(grade: EncounterGrade) -> EncounterGrade:
+    """Copy a grade (scores are immutable, only the lists need copying)."""
+    return grade.model_copy(update={
+        "strengths": list(grade.strengths),
+        "weaknesses": list(grade.weaknesses),
+        "suggestions": list(grade.suggestions),
+    })
+
+
+class GradeCache:
+    """Encounter grades keyed by encounter_grade_key().
+
+    Optionally persisted as JSON so re-grading after an edit only touches
+    the changed encounters across runs. Cached grades are handed out as
+    copies, so callers may annotate them freely. With a maxsize, the least
+    recently used grades are evicted once the cache is full.
+    """
+
+    def __init__(self, path: Path | str | None = None, maxsize: int | None = None) -> None:
+        """Initialize the cache.
+
+        Args:
+            path: Optional JSON file to load from and save to
+            maxsize: Most grades to keep (None for unbounded)
+        """
+        self.path = Path(path) if path else None
+        self.maxsize = maxsize
+        self._grades: OrderedDict[str, EncounterGrade | dict] = OrderedDict()
+        self._used: set[str] = set()
+        self._dirty = False
+        self.hits = 0
+        self.misses = 0
+
+        if self.path and self.path.exists():
+            try:
+                data = json.loads(self.path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                data = {}
+            if data.get("grader_version") == GRADER_VERSION:
+                # Validated lazily on first use
+                self._grades.update(data.get("grades", {}))
+                self._evict()
+
+    def __len__(self) -> int:
+        return len(self._grades)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._grades
+
+    def get(self, key: str) -> EncounterGrade | None:
+        """Get a copy of a cached grade, or None on a miss."""
+        grade = self._grades.get(key)
+        if grade is None:
+            self.misses += 1
+            return None
+        if isinstance(grade, dict):
+            grade = EncounterGrade.model_validate(grade)
+            self._grades[key] = grade
+        self._grades.move_to_end(key)
+        self.hits += 1
+        self._used.add(key)
+        return _copy_grade(grade)
+
+    def put(self, key: str, grade: EncounterGrade) -> None:
+        """Store a grade."""
+        self._grades[key] = _copy_grade(grade)
+        self._grades.move_to_end(key)
+        self._used.add(key)
+        self._dirty = True
+        self._evict()
+
+    def _evict(self) -> None:
+        """Drop the least recently used grades beyond maxsize."""
+        if self.maxsize is None:
+            return
+        while len(self._grades) > self.maxsize:
+            key, _ = self._grades.popitem(last=False)
+            self._used.discard(key)
+            self._dirty = True
+
+    def save(self, prune: bool = True) -> None:
+        """Write the cache to its path, if it has one and changed.
+
+        Args:
+            prune: Drop entries not used since the cache was loaded
+        """
+        if not self.path:
+            return
+        if prune and len(self._used) < len(self._grades):
+            self._grades = OrderedDict(
+                (k, v) for k, v in self._grades.items() if k in self._used
+            )
+            self._dirty = True
+        if not self._dirty:
+            return
+
+        grades = {
+            key: g.model_dump(mode="json") if isinstance(g, EncounterGrade) else g
+            for key, g in self._grades.items()
+        }
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        tmp_path.write_text(
+            json.dumps({"grader_version": GRADER_VERSION, "grades": grades}),
+            encoding="utf-8",
+        )
+        tmp_path.replace(self.path)
+        self._dirty = False
+
+
+# Shared cache used when grade_campaign() isn't given one (bounded, so a
+# long-running process grading many campaigns doesn't grow without limit)
+DEFAULT_GRADE_CACHE_SIZE = 4096
+_DEFAULT_GRADE_CACHE = GradeCache(maxsize=DEFAULT_GRADE_CACHE_SIZE)
+
+
+def _chapter_grade_keys(chapter: Chapter) -> list[str]:
+    """Compute the grade keys for every encounter in a chapter."""
+    keys = []
+    previous: Encounter | None = None
+    total = len(chapter.encounters)
+    for i, encounter in enumerate(chapter.encounters):
+        keys.append(encounter_grade_key(encounter, i, total, previous, chapter.description))
+        previous = encounter
+    return keys
+
+
+def _grade_chapters(
+    chapters: list[Chapter], cache: GradeCache, workers: int | None
+) -> list[ChapterGrade]:
+    """Grade chapters, fanning stale ones out to a process pool.
+
+    Chapters are graded independently, so each stale chapter is one pool
+    task. Small batches are graded in-process, where pool start-up and
+    pickling would cost more than the grading itself.
+    """
+    workers = (os.cpu_count() or 1) if workers is None else workers
+    if workers <= 1 or len(chapters) < 2:
+        return [grade_chapter(ch, i, cache) for i, ch in enumerate(chapters)]
+
+    stale: dict[int, list[str]] = {}
+    for i, chapter in enumerate(chapters):
+        keys = _chapter_grade_keys(chapter)
+        if any(key not in cache for key in keys):
+            stale[i] = keys
+    stale_encounters = sum(len(keys) for keys in stale.values())
+    if len(stale) < 2 or stale_encounters < PARALLEL_GRADE_THRESHOLD:
+        return [grade_chapter(ch, i, cache) for i, ch in enumerate(chapters)]
+
+    grades: dict[int, ChapterGrade] = {}
+    with ProcessPoolExecutor(max_workers=min(workers, len(stale))) as pool:
+        indexes = list(stale)
+        results = pool.map(
+            grade_chapter, [chapters[i] for i in indexes], indexes, chunksize=4
+        )
+        for i, chapter_grade in zip(indexes, results):
+            for key, enc_grade in zip(stale[i], chapter_grade.encounter_grades):
+                cache.put(key, enc_grade)
+            grades[i] = chapter_grade
+
+    return [
+        grades[i] if i in grades else grade_chapter(ch, i, cache)
+        for i, ch in enumerate(chapters)
+    ]
+
+
 # =============================================================================
 # REPORT GENERATION
 # =============================================================================
@@ -1208,588 +1547,31 @@ def generate_grade_report(
 # =============================================================================
 
 # Pre-computed grades for the Dread Citadel campaign
-# These include manual review and refinement beyond heuristics
-
-DREAD_CITADEL_GRADES: dict[str, EncounterGrade] = {
-    # Chapter 1: The Outer Gates
-    "enc_the_approach": EncounterGrade(
-        encounter_id="enc_the_approach",
-        encounter_title="The Approach",
-        engagement=4,
-        challenge_balance=5,
-        learning_value=3,
-        emotional_arc=4,
-        pacing=4,
-        agency=2,
-        narrative_integration=5,
-        replay_value=2,
-        pacing_rating=PacingRating.SLOW,
-        emotional_beat=EmotionalBeat.WONDER,
-        sequence_role=SequenceRole.TUTORIAL,
-        strengths=["Excellent narrative hook", "Sets atmosphere perfectly"],
-        weaknesses=["Low agency - just click to continue"],
-        suggestions=["Consider adding a choice that personalizes the experience"],
-    ),
-    "enc_what_guards": EncounterGrade(
-        encounter_id="enc_what_guards",
-        encounter_title="What Guards These Gates?",
-        engagement=4,
-        challenge_balance=5,
-        learning_value=5,
-        emotional_arc=4,
-        pacing=4,
-        agency=2,
-        narrative_integration=5,
-        replay_value=3,
-        pacing_rating=PacingRating.SLOW,
-        emotional_beat=EmotionalBeat.REVELATION,
-        sequence_role=SequenceRole.TUTORIAL,
-        strengths=[
-            "Core hash concept explained clearly",
-            "Good analogy (magical seal)",
-        ],
-        weaknesses=["Pure exposition"],
-        suggestions=[],
-    ),
-    "enc_first_lock": EncounterGrade(
-        encounter_id="enc_first_lock",
-        encounter_title="The First Lock",
-        engagement=5,
-        challenge_balance=5,
-        learning_value=4,
-        emotional_arc=5,
-        pacing=5,
-        agency=4,
-        narrative_integration=5,
-        replay_value=3,
-        pacing_rating=PacingRating.BALANCED,
-        emotional_beat=EmotionalBeat.TRIUMPH,
-        sequence_role=SequenceRole.EARLY_WIN,
-        strengths=[
-            "Perfect first challenge",
-            "Almost everyone will succeed",
-            "Great 'aha!' moment",
-        ],
-        weaknesses=[],
-        suggestions=[],
-    ),
-    "enc_wordsmith_wisdom": EncounterGrade(
-        encounter_id="enc_wordsmith_wisdom",
-        encounter_title="The Wordsmith's Wisdom",
-        engagement=4,
-        challenge_balance=5,
-        learning_value=5,
-        emotional_arc=3,
-        pacing=3,
-        agency=2,
-        narrative_integration=4,
-        replay_value=2,
-        pacing_rating=PacingRating.SLOW,
-        emotional_beat=EmotionalBeat.REVELATION,
-        sequence_role=SequenceRole.TUTORIAL,
-        strengths=["Excellent wordlist explanation", "Real-world context"],
-        weaknesses=["Pacing slows after the exciting first crack"],
-        suggestions=["Move faster or combine with next encounter"],
-    ),
-    "enc_common_tongue": EncounterGrade(
-        encounter_id="enc_common_tongue",
-        encounter_title="The Common Tongue",
-        engagement=4,
-        challenge_balance=5,
-        learning_value=4,
-        emotional_arc=4,
-        pacing=4,
-        agency=4,
-        narrative_integration=4,
-        replay_value=3,
-        pacing_rating=PacingRating.FAST,
-        emotional_beat=EmotionalBeat.TRIUMPH,
-        sequence_role=SequenceRole.EARLY_WIN,
-        strengths=["Quick win reinforces confidence", "Good pattern recognition"],
-        weaknesses=[],
-        suggestions=[],
-    ),
-    "enc_servants_key": EncounterGrade(
-        encounter_id="enc_servants_key",
-        encounter_title="The Servant's Key",
-        engagement=4,
-        challenge_balance=4,
-        learning_value=4,
-        emotional_arc=3,
-        pacing=4,
-        agency=4,
-        narrative_integration=4,
-        replay_value=3,
-        pacing_rating=PacingRating.FAST,
-        emotional_beat=EmotionalBeat.TRIUMPH,
-        sequence_role=SequenceRole.ESCALATION,
-        strengths=["Slightly harder", "Good variety in password type"],
-        weaknesses=["Similar feel to previous"],
-        suggestions=["Add more narrative color"],
-    ),
-    "enc_inner_threshold": EncounterGrade(
-        encounter_id="enc_inner_threshold",
-        encounter_title="The Inner Threshold",
-        engagement=3,
-        challenge_balance=5,
-        learning_value=3,
-        emotional_arc=4,
-        pacing=5,
-        agency=2,
-        narrative_integration=4,
-        replay_value=2,
-        pacing_rating=PacingRating.SLOW,
-        emotional_beat=EmotionalBeat.RELEASE,
-        sequence_role=SequenceRole.CHECKPOINT,
-        strengths=["Perfect checkpoint placement", "Good recap"],
-        weaknesses=["Low engagement"],
-        suggestions=["Add optional lore or choice"],
-    ),
-    "enc_gatekeeper": EncounterGrade(
-        encounter_id="enc_gatekeeper",
-        encounter_title="The Gatekeeper's Challenge",
-        engagement=5,
-        challenge_balance=4,
-        learning_value=4,
-        emotional_arc=5,
-        pacing=4,
-        agency=4,
-        narrative_integration=5,
-        replay_value=3,
-        pacing_rating=PacingRating.BALANCED,
-        emotional_beat=EmotionalBeat.TENSION,
-        sequence_role=SequenceRole.BOSS,
-        strengths=["Great mini-boss", "Stakes feel real", "Failure text is good"],
-        weaknesses=[],
-        suggestions=[],
-    ),
-    "ch_the_crypts_start": EncounterGrade(
-        encounter_id="ch_the_crypts_start",
-        encounter_title="Descent Begins",
-        engagement=3,
-        challenge_balance=5,
-        learning_value=2,
-        emotional_arc=3,
-        pacing=3,
-        agency=1,
-        narrative_integration=4,
-        replay_value=1,
-        pacing_rating=PacingRating.SLOW,
-        emotional_beat=EmotionalBeat.COMFORT,
-        sequence_role=SequenceRole.TRANSITION,
-        strengths=["Clean chapter transition"],
-        weaknesses=["Just a door - low value"],
-        suggestions=["Consider merging into chapter outro"],
-    ),
-    # Chapter 2: The Crypts
-    "enc_descending": EncounterGrade(
-        encounter_id="enc_descending",
-        encounter_title="Descending",
-        engagement=4,
-        challenge_balance=5,
-        learning_value=3,
-        emotional_arc=4,
-        pacing=4,
-        agency=2,
-        narrative_integration=5,
-        replay_value=2,
-        pacing_rating=PacingRating.SLOW,
-        emotional_beat=EmotionalBeat.DREAD,
-        sequence_role=SequenceRole.TUTORIAL,
-        strengths=["Good atmosphere", "Foreshadows masks"],
-        weaknesses=["Another pure narrative"],
-        suggestions=[],
-    ),
-    "enc_pattern_weaver": EncounterGrade(
-        encounter_id="enc_pattern_weaver",
-        encounter_title="The Pattern Weaver",
-        engagement=4,
-        challenge_balance=5,
-        learning_value=5,
-        emotional_arc=4,
-        pacing=3,
-        agency=2,
-        narrative_integration=4,
-        replay_value=3,
-        pacing_rating=PacingRating.SLOW,
-        emotional_beat=EmotionalBeat.REVELATION,
-        sequence_role=SequenceRole.TUTORIAL,
-        strengths=["Excellent mask tutorial", "Clear examples"],
-        weaknesses=["Dense - might overwhelm"],
-        suggestions=["Break into interactive steps"],
-    ),
-    "enc_simple_patterns": EncounterGrade(
-        encounter_id="enc_simple_patterns",
-        encounter_title="Simple Patterns",
-        engagement=4,
-        challenge_balance=5,
-        learning_value=4,
-        emotional_arc=4,
-        pacing=4,
-        agency=4,
-        narrative_integration=4,
-        replay_value=3,
-        pacing_rating=PacingRating.BALANCED,
-        emotional_beat=EmotionalBeat.TRIUMPH,
-        sequence_role=SequenceRole.CHALLENGE,
-        strengths=["Perfect application of mask lesson", "Easy win"],
-        weaknesses=[],
-        suggestions=[],
-    ),
-    "enc_name_game": EncounterGrade(
-        encounter_id="enc_name_game",
-        encounter_title="The Name Game",
-        engagement=4,
-        challenge_balance=4,
-        learning_value=4,
-        emotional_arc=4,
-        pacing=4,
-        agency=4,
-        narrative_integration=4,
-        replay_value=3,
-        pacing_rating=PacingRating.BALANCED,
-        emotional_beat=EmotionalBeat.TRIUMPH,
-        sequence_role=SequenceRole.CHALLENGE,
-        strengths=["Good mask pattern example", "Real-world relevance"],
-        weaknesses=["Hint gives too much away"],
-        suggestions=["Make hint more subtle"],
-    ),
-    "enc_crossroads": EncounterGrade(
-        encounter_id="enc_crossroads",
-        encounter_title="The Crossroads",
-        engagement=5,
-        challenge_balance=5,
-        learning_value=3,
-        emotional_arc=5,
-        pacing=4,
-        agency=5,
-        narrative_integration=5,
-        replay_value=5,
-        pacing_rating=PacingRating.BALANCED,
-        emotional_beat=EmotionalBeat.WONDER,
-        sequence_role=SequenceRole.CHALLENGE,
-        strengths=["Excellent fork design", "Both paths valid", "High replay"],
-        weaknesses=[],
-        suggestions=[],
-    ),
-    "enc_ancient_scroll": EncounterGrade(
-        encounter_id="enc_ancient_scroll",
-        encounter_title="The Ancient Scroll",
-        engagement=4,
-        challenge_balance=4,
-        learning_value=4,
-        emotional_arc=4,
-        pacing=4,
-        agency=4,
-        narrative_integration=4,
-        replay_value=3,
-        pacing_rating=PacingRating.BALANCED,
-        emotional_beat=EmotionalBeat.TRIUMPH,
-        sequence_role=SequenceRole.CHALLENGE,
-        strengths=["Good wordlist path content"],
-        weaknesses=["Only seen by some players"],
-        suggestions=[],
-    ),
-    "enc_pattern_lock": EncounterGrade(
-        encounter_id="enc_pattern_lock",
-        encounter_title="The Pattern Lock",
-        engagement=4,
-        challenge_balance=4,
-        learning_value=4,
-        emotional_arc=4,
-        pacing=4,
-        agency=4,
-        narrative_integration=4,
-        replay_value=3,
-        pacing_rating=PacingRating.BALANCED,
-        emotional_beat=EmotionalBeat.TRIUMPH,
-        sequence_role=SequenceRole.CHALLENGE,
-        strengths=["Good mask path content"],
-        weaknesses=["Only seen by some players"],
-        suggestions=[],
-    ),
-    "enc_different_cipher": EncounterGrade(
-        encounter_id="enc_different_cipher",
-        encounter_title="A Different Cipher",
-        engagement=4,
-        challenge_balance=5,
-        learning_value=5,
-        emotional_arc=4,
-        pacing=4,
-        agency=2,
-        narrative_integration=4,
-        replay_value=2,
-        pacing_rating=PacingRating.SLOW,
-        emotional_beat=EmotionalBeat.REVELATION,
-        sequence_role=SequenceRole.TUTORIAL,
-        strengths=["Critical SHA1 introduction", "Clear comparison to MD5"],
-        weaknesses=["Another pure tutorial"],
-        suggestions=[],
-    ),
-    "enc_sha1_first_test": EncounterGrade(
-        encounter_id="enc_sha1_first_test",
-        encounter_title="SHA1's First Test",
-        engagement=4,
-        challenge_balance=5,
-        learning_value=4,
-        emotional_arc=4,
-        pacing=4,
-        agency=4,
-        narrative_integration=4,
-        replay_value=3,
-        pacing_rating=PacingRating.BALANCED,
-        emotional_beat=EmotionalBeat.TRIUMPH,
-        sequence_role=SequenceRole.CHALLENGE,
-        strengths=["Perfect SHA1 first application", "Easy transition"],
-        weaknesses=[],
-        suggestions=[],
-    ),
-    "enc_trapped_chest": EncounterGrade(
-        encounter_id="enc_trapped_chest",
-        encounter_title="The Trapped Chest",
-        engagement=5,
-        challenge_balance=5,
-        learning_value=3,
-        emotional_arc=5,
-        pacing=5,
-        agency=5,
-        narrative_integration=5,
-        replay_value=5,
-        pacing_rating=PacingRating.BALANCED,
-        emotional_beat=EmotionalBeat.TENSION,
-        sequence_role=SequenceRole.CHALLENGE,
-        strengths=["Excellent gambit design", "Meaningful risk/reward"],
-        weaknesses=[],
-        suggestions=[],
-    ),
-    "enc_safe_crack": EncounterGrade(
-        encounter_id="enc_safe_crack",
-        encounter_title="The Safe Choice",
-        engagement=3,
-        challenge_balance=5,
-        learning_value=3,
-        emotional_arc=3,
-        pacing=4,
-        agency=3,
-        narrative_integration=4,
-        replay_value=2,
-        pacing_rating=PacingRating.FAST,
-        emotional_beat=EmotionalBeat.COMFORT,
-        sequence_role=SequenceRole.CHALLENGE,
-        strengths=["Provides safe option"],
-        weaknesses=["Less exciting than risky path"],
-        suggestions=["Add small bonus for safe choice"],
-    ),
-    "enc_risky_crack": EncounterGrade(
-        encounter_id="enc_risky_crack",
-        encounter_title="The Bold Choice",
-        engagement=5,
-        challenge_balance=4,
-        learning_value=3,
-        emotional_arc=5,
-        pacing=4,
-        agency=4,
-        narrative_integration=4,
-        replay_value=4,
-        pacing_rating=PacingRating.BALANCED,
-        emotional_beat=EmotionalBeat.TENSION,
-        sequence_role=SequenceRole.CHALLENGE,
-        strengths=["High stakes", "Memorable moment", "X-Files reference"],
-        weaknesses=["Potentially frustrating if failed"],
-        suggestions=[],
-    ),
-    "enc_deep_archive": EncounterGrade(
-        encounter_id="enc_deep_archive",
-        encounter_title="The Deep Archive",
-        engagement=3,
-        challenge_balance=5,
-        learning_value=4,
-        emotional_arc=4,
-        pacing=5,
-        agency=2,
-        narrative_integration=4,
-        replay_value=2,
-        pacing_rating=PacingRating.SLOW,
-        emotional_beat=EmotionalBeat.RELEASE,
-        sequence_role=SequenceRole.CHECKPOINT,
-        strengths=["Perfect checkpoint placement", "Good summary of skills"],
-        weaknesses=["Low engagement"],
-        suggestions=[],
-    ),
-    "enc_crypt_guardian": EncounterGrade(
-        encounter_id="enc_crypt_guardian",
-        encounter_title="The Crypt Guardian",
-        engagement=5,
-        challenge_balance=5,
-        learning_value=4,
-        emotional_arc=5,
-        pacing=5,
-        agency=4,
-        narrative_integration=5,
-        replay_value=4,
-        pacing_rating=PacingRating.BALANCED,
-        emotional_beat=EmotionalBeat.TENSION,
-        sequence_role=SequenceRole.BOSS,
-        strengths=["Excellent chapter boss", "Ironic password", "Great setup"],
-        weaknesses=[],
-        suggestions=[],
-    ),
-    "ch_sanctum_start": EncounterGrade(
-        encounter_id="ch_sanctum_start",
-        encounter_title="The Ascent",
-        engagement=3,
-        challenge_balance=5,
-        learning_value=2,
-        emotional_arc=3,
-        pacing=3,
-        agency=1,
-        narrative_integration=4,
-        replay_value=1,
-        pacing_rating=PacingRating.SLOW,
-        emotional_beat=EmotionalBeat.COMFORT,
-        sequence_role=SequenceRole.TRANSITION,
-        strengths=["Clean transition"],
-        weaknesses=["Minimal content"],
-        suggestions=["Merge into chapter outro"],
-    ),
-    # Chapter 3: The Inner Sanctum
-    "enc_final_ascent": EncounterGrade(
-        encounter_id="enc_final_ascent",
-        encounter_title="The Final Ascent",
-        engagement=5,
-        challenge_balance=5,
-        learning_value=3,
-        emotional_arc=5,
-        pacing=4,
-        agency=2,
-        narrative_integration=5,
-        replay_value=2,
-        pacing_rating=PacingRating.SLOW,
-        emotional_beat=EmotionalBeat.DREAD,
-        sequence_role=SequenceRole.TUTORIAL,
-        strengths=["Builds anticipation", "Clear final exam setup"],
-        weaknesses=["Low agency"],
-        suggestions=[],
-    ),
-    "enc_left_hand": EncounterGrade(
-        encounter_id="enc_left_hand",
-        encounter_title="The Left Hand",
-        engagement=4,
-        challenge_balance=4,
-        learning_value=4,
-        emotional_arc=4,
-        pacing=4,
-        agency=4,
-        narrative_integration=5,
-        replay_value=3,
-        pacing_rating=PacingRating.BALANCED,
-        emotional_beat=EmotionalBeat.TENSION,
-        sequence_role=SequenceRole.CHALLENGE,
-        strengths=["Good mini-boss", "Tests wordlist thinking", "Misdirection"],
-        weaknesses=["Similar structure to Right Hand"],
-        suggestions=[],
-    ),
-    "enc_right_hand": EncounterGrade(
-        encounter_id="enc_right_hand",
-        encounter_title="The Right Hand",
-        engagement=4,
-        challenge_balance=4,
-        learning_value=4,
-        emotional_arc=4,
-        pacing=4,
-        agency=4,
-        narrative_integration=5,
-        replay_value=3,
-        pacing_rating=PacingRating.BALANCED,
-        emotional_beat=EmotionalBeat.TENSION,
-        sequence_role=SequenceRole.CHALLENGE,
-        strengths=["Good mini-boss", "Tests mask thinking"],
-        weaknesses=["Similar structure to Left Hand"],
-        suggestions=["Make more distinct from Left Hand"],
-    ),
-    "enc_lords_chamber": EncounterGrade(
-        encounter_id="enc_lords_chamber",
-        encounter_title="The Lord's Chamber",
-        engagement=5,
-        challenge_balance=5,
-        learning_value=3,
-        emotional_arc=5,
-        pacing=4,
-        agency=4,
-        narrative_integration=5,
-        replay_value=4,
-        pacing_rating=PacingRating.BALANCED,
-        emotional_beat=EmotionalBeat.DREAD,
-        sequence_role=SequenceRole.CHALLENGE,
-        strengths=["Perfect pre-boss moment", "Player chooses approach"],
-        weaknesses=["Fork doesn't change outcome"],
-        suggestions=["Consider making choice affect boss fight"],
-    ),
-    "enc_citadel_lord": EncounterGrade(
-        encounter_id="enc_citadel_lord",
-        encounter_title="The Citadel Lord",
-        engagement=5,
-        challenge_balance=5,
-        learning_value=5,
-        emotional_arc=5,
-        pacing=5,
-        agency=4,
-        narrative_integration=5,
-        replay_value=4,
-        pacing_rating=PacingRating.BALANCED,
-        emotional_beat=EmotionalBeat.TENSION,
-        sequence_role=SequenceRole.BOSS,
-        strengths=[
-            "Perfect final boss",
-            "Tests everything learned",
-            "Ironic password choice",
-            "Multiple hints for accessibility",
-        ],
-        weaknesses=[],
-        suggestions=[],
-    ),
-    "enc_victory": EncounterGrade(
-        encounter_id="enc_victory",
-        encounter_title="Victory",
-        engagement=4,
-        challenge_balance=5,
-        learning_value=4,
-        emotional_arc=5,
-        pacing=4,
-        agency=2,
-        narrative_integration=5,
-        replay_value=3,
-        pacing_rating=PacingRating.SLOW,
-        emotional_beat=EmotionalBeat.TRIUMPH,
-        sequence_role=SequenceRole.DENOUEMENT,
-        strengths=["Perfect celebration", "Good skill summary", "Sets up future"],
-        weaknesses=["Low agency"],
-        suggestions=[],
-    ),
-    "enc_beyond": EncounterGrade(
-        encounter_id="enc_beyond",
-        encounter_title="What Lies Beyond",
-        engagement=4,
-        challenge_balance=5,
-        learning_value=3,
-        emotional_arc=4,
-        pacing=4,
-        agency=2,
-        narrative_integration=5,
-        replay_value=2,
-        pacing_rating=PacingRating.SLOW,
-        emotional_beat=EmotionalBeat.WONDER,
-        sequence_role=SequenceRole.DENOUEMENT,
-        strengths=["Perfect ending", "Teases future content"],
-        weaknesses=["Could feel redundant after Victory"],
-        suggestions=["Consider merging with Victory"],
-    ),
-}
+# These include manual review and refinement beyond heuristics.
+# They ship as data and are only parsed on first access.
+DREAD_CITADEL_GRADES_FILE = Path(__file__).parent / "data" / "dread_citadel_grades.json"
+
+
+@lru_cache(maxsize=1)
+def _load_dread_citadel_grades() -> dict[str, EncounterGrade]:
+    """Parse the Dread Citadel grade data (once)."""
+    with open(DREAD_CITADEL_GRADES_FILE, encoding="utf-8") as f:
+        return {
+            encounter_id: EncounterGrade.model_validate(grade)
+            for encounter_id, grade in json.load(f).items()
+        }
+
+
+def __getattr__(name: str) -> Any:
+    # DREAD_CITADEL_GRADES stays importable as a module attribute
+    if name == "DREAD_CITADEL_GRADES":
+        return _load_dread_citadel_grades()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 def get_dread_citadel_grades() -> dict[str, EncounterGrade]:
     """Get pre-computed grades for the Dread Citadel campaign."""
-    return DREAD_CITADEL_GRADES.copy()
+    return _load_dread_citadel_grades().copy()
 
 
 def create_dread_citadel_campaign_grade() -> CampaignGrade:
@@ -1798,6 +1580,7 @@ def create_dread_citadel_campaign_grade() -> CampaignGrade:
     This uses the pre-computed encounter grades and adds
     campaign-level analysis.
     """
+    grades = _load_dread_citadel_grades()
     grade = CampaignGrade(
         campaign_id="dread_citadel",
         campaign_title="The Dread Citadel",
@@ -1808,15 +1591,15 @@ def create_dread_citadel_campaign_grade() -> CampaignGrade:
         chapter_id="ch_outer_gates",
         chapter_title="Chapter 1: The Outer Gates",
         encounter_grades=[
-            DREAD_CITADEL_GRADES["enc_the_approach"],
-            DREAD_CITADEL_GRADES["enc_what_guards"],
-            DREAD_CITADEL_GRADES["enc_first_lock"],
-            DREAD_CITADEL_GRADES["enc_wordsmith_wisdom"],
-            DREAD_CITADEL_GRADES["enc_common_tongue"],
-            DREAD_CITADEL_GRADES["enc_servants_key"],
-            DREAD_CITADEL_GRADES["enc_inner_threshold"],
-            DREAD_CITADEL_GRADES["enc_gatekeeper"],
-            DREAD_CITADEL_GRADES["ch_the_crypts_start"],
+            grades["enc_the_approach"],
+            grades["enc_what_guards"],
+            grades["enc_first_lock"],
+            grades["enc_wordsmith_wisdom"],
+            grades["enc_common_tongue"],
+            grades["enc_servants_key"],
+            grades["enc_inner_threshold"],
+            grades["enc_gatekeeper"],
+            grades["ch_the_crypts_start"],
         ],
         flow_analysis=(
             "Good: Opens with tutorial/early win | "
@@ -1837,21 +1620,21 @@ def create_dread_citadel_campaign_grade() -> CampaignGrade:
         chapter_id="ch_the_crypts",
         chapter_title="Chapter 2: The Crypts",
         encounter_grades=[
-            DREAD_CITADEL_GRADES["enc_descending"],
-            DREAD_CITADEL_GRADES["enc_pattern_weaver"],
-            DREAD_CITADEL_GRADES["enc_simple_patterns"],
-            DREAD_CITADEL_GRADES["enc_name_game"],
-            DREAD_CITADEL_GRADES["enc_crossroads"],
-            DREAD_CITADEL_GRADES["enc_ancient_scroll"],
-            DREAD_CITADEL_GRADES["enc_pattern_lock"],
-            DREAD_CITADEL_GRADES["enc_different_cipher"],
-            DREAD_CITADEL_GRADES["enc_sha1_first_test"],
-            DREAD_CITADEL_GRADES["enc_trapped_chest"],
-            DREAD_CITADEL_GRADES["enc_safe_crack"],
-            DREAD_CITADEL_GRADES["enc_risky_crack"],
-            DREAD_CITADEL_GRADES["enc_deep_archive"],
-            DREAD_CITADEL_GRADES["enc_crypt_guardian"],
-            DREAD_CITADEL_GRADES["ch_sanctum_start"],
+            grades["enc_descending"],
+            grades["enc_pattern_weaver"],
+            grades["enc_simple_patterns"],
+            grades["enc_name_game"],
+            grades["enc_crossroads"],
+            grades["enc_ancient_scroll"],
+            grades["enc_pattern_lock"],
+            grades["enc_different_cipher"],
+            grades["enc_sha1_first_test"],
+            grades["enc_trapped_chest"],
+            grades["enc_safe_crack"],
+            grades["enc_risky_crack"],
+            grades["enc_deep_archive"],
+            grades["enc_crypt_guardian"],
+            grades["ch_sanctum_start"],
         ],
         flow_analysis=(
             "Good: Opens with tutorial | "
@@ -1873,13 +1656,13 @@ def create_dread_citadel_campaign_grade() -> CampaignGrade:
         chapter_id="ch_inner_sanctum",
         chapter_title="Chapter 3: The Inner Sanctum",
         encounter_grades=[
-            DREAD_CITADEL_GRADES["enc_final_ascent"],
-            DREAD_CITADEL_GRADES["enc_left_hand"],
-            DREAD_CITADEL_GRADES["enc_right_hand"],
-            DREAD_CITADEL_GRADES["enc_lords_chamber"],
-            DREAD_CITADEL_GRADES["enc_citadel_lord"],
-            DREAD_CITADEL_GRADES["enc_victory"],
-            DREAD_CITADEL_GRADES["enc_beyond"],
+            grades["enc_final_ascent"],
+            grades["enc_left_hand"],
+            grades["enc_right_hand"],
+            grades["enc_lords_chamber"],
+            grades["enc_citadel_lord"],
+            grades["enc_victory"],
+            grades["enc_beyond"],
         ],
         flow_analysis=(
             "Good: Opens with anticipation-building | "
@@ -2065,6 +1848,16 @@ class ContextualEncounterGrade(BaseModel):
         return max(1.0, min(5.0, adjusted))
 
 
+# Explanation attached to each layer's modifiers
+LAYER_NOTES: dict[NarrativeLayer, str] = {
+    NarrativeLayer.FANTASY_RPG: "Fantasy narratives reward dramatic storytelling",
+    NarrativeLayer.CORPORATE_TRAINING: "Corporate contexts prefer clarity over drama",
+    NarrativeLayer.CTF_COMPETITION: "CTF rewards challenge over narrative",
+    NarrativeLayer.EDUCATIONAL_BEGINNER: "Beginner education rewards clear teaching and low barriers",
+    NarrativeLayer.EDUCATIONAL_ADVANCED: "Advanced education rewards challenge, assumes foundational knowledge",
+}
+
+
 def create_layer_modifiers_for_encounter(
     encounter: Encounter, base_grade: EncounterGrade
 ) -> list[LayerScoringModifier]:
@@ -2078,34 +1871,29 @@ def create_layer_modifiers_for_encounter(
         List of modifiers for each narrative layer
     """
     modifiers = []
+    intro = encounter_features(encounter).intro
 
     # Fantasy RPG layer - rewards narrative, dramatic stakes
     fantasy_mod = LayerScoringModifier(
         layer=NarrativeLayer.FANTASY_RPG,
-        engagement_mod=1 if len(encounter.intro_text) > 300 else 0,
-        narrative_mod=1 if any(
-            word in encounter.intro_text.lower()
-            for word in ["ancient", "fortress", "guardian", "magic", "quest"]
-        ) else 0,
+        engagement_mod=1 if intro.length > 300 else 0,
+        narrative_mod=1 if intro.has_any(FANTASY_WORDS) else 0,
         challenge_mod=0,
         learning_mod=-1 if encounter.encounter_type == EncounterType.TOUR else 0,
-        notes="Fantasy narratives reward dramatic storytelling",
+        notes=LAYER_NOTES[NarrativeLayer.FANTASY_RPG],
     )
     modifiers.append(fantasy_mod)
 
     # Corporate training layer - rewards clarity, professionalism
     corporate_mod = LayerScoringModifier(
         layer=NarrativeLayer.CORPORATE_TRAINING,
-        engagement_mod=-1 if any(
-            word in encounter.intro_text.lower()
-            for word in ["magic", "dragon", "fortress", "citadel"]
-        ) else 0,
+        engagement_mod=-1 if intro.has_any(CORPORATE_CLASH_WORDS) else 0,
         narrative_mod=-2 if base_grade.emotional_beat in (
             EmotionalBeat.DREAD, EmotionalBeat.TENSION
         ) else 0,
-        learning_mod=1 if "learn" in encounter.intro_text.lower() else 0,
+        learning_mod=1 if intro.has_any(("learn",)) else 0,
         challenge_mod=0,
-        notes="Corporate contexts prefer clarity over drama",
+        notes=LAYER_NOTES[NarrativeLayer.CORPORATE_TRAINING],
     )
     modifiers.append(corporate_mod)
 
@@ -2116,7 +1904,7 @@ def create_layer_modifiers_for_encounter(
         engagement_mod=-1 if encounter.encounter_type == EncounterType.TOUR else 1,
         learning_mod=-2 if encounter.encounter_type == EncounterType.TOUR else 0,
         narrative_mod=-1,  # CTF players care less about story
-        notes="CTF rewards challenge over narrative",
+        notes=LAYER_NOTES[NarrativeLayer.CTF_COMPETITION],
     )
     modifiers.append(ctf_mod)
 
@@ -2127,7 +1915,7 @@ def create_layer_modifiers_for_encounter(
         challenge_mod=-1 if encounter.tier >= 2 else 1 if encounter.tier == 0 else 0,
         engagement_mod=0,
         narrative_mod=0,
-        notes="Beginner education rewards clear teaching and low barriers",
+        notes=LAYER_NOTES[NarrativeLayer.EDUCATIONAL_BEGINNER],
     )
     modifiers.append(edu_begin_mod)
 
@@ -2138,7 +1926,7 @@ def create_layer_modifiers_for_encounter(
         challenge_mod=1 if encounter.tier >= 2 else -1 if encounter.tier == 0 else 0,
         engagement_mod=0,
         narrative_mod=0,
-        notes="Advanced education rewards challenge, assumes foundational knowledge",
+        notes=LAYER_NOTES[NarrativeLayer.EDUCATIONAL_ADVANCED],
     )
     modifiers.append(edu_adv_mod)
 
@@ -2219,18 +2007,19 @@ def _generate_adaptation_notes(
 ) -> dict[NarrativeLayer, list[str]]:
     """Generate notes on how to adapt an encounter for different layers."""
     notes: dict[NarrativeLayer, list[str]] = {}
+    intro = encounter_features(encounter).intro
 
     # Fantasy RPG adaptations
     fantasy_notes = []
     if base_grade.engagement < 4:
         fantasy_notes.append("Add more dramatic narrative hooks")
-    if not any(word in encounter.intro_text.lower() for word in ["ancient", "magic", "legend"]):
+    if not intro.has_any(FANTASY_FLAVOR_WORDS):
         fantasy_notes.append("Include fantasy flavor text")
     notes[NarrativeLayer.FANTASY_RPG] = fantasy_notes
 
     # Corporate adaptations
     corp_notes = []
-    if any(word in encounter.intro_text.lower() for word in ["magic", "dragon", "citadel"]):
+    if intro.has_any(CORPORATE_REPLACE_WORDS):
         corp_notes.append("Replace fantasy elements with professional context")
     if base_grade.learning_value < 4:
         corp_notes.append("Add clear learning objectives")
@@ -2371,7 +2160,9 @@ class FeedbackSummary(BaseModel):
 
     # Aggregated scores
     average_enjoyment: float | None = Field(None, description="Average enjoyment (1-5)")
+    enjoyment_variance: float | None = Field(None, description="Enjoyment variance")
     average_clarity: float | None = Field(None, description="Average clarity (1-5)")
+    clarity_variance: float | None = Field(None, description="Clarity variance")
     recommendation_rate: float | None = Field(
         None, description="Percentage who would recommend"
     )
@@ -2396,16 +2187,88 @@ class FeedbackSummary(BaseModel):
     review_reason: str | None = Field(None, description="Why flagged for review")
 
 
+class _RunningStat:
+    """Count, sum and Welford variance of a 1-5 rating, updated in O(1)."""
+
+    __slots__ = ("count", "total", "mean", "m2")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+
+    def add(self, value: int) -> None:
+        """Add one observation."""
+        self.count += 1
+        self.total += value
+        delta = value - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (value - self.mean)
+
+    @property
+    def average(self) -> float | None:
+        """Exact average (from the integer sum), or None if empty."""
+        return self.total / self.count if self.count else None
+
+    @property
+    def variance(self) -> float | None:
+        """Population variance, or None if empty."""
+        return self.m2 / self.count if self.count else None
+
+
+class _FeedbackAggregate:
+    """Running aggregates for one feedback target."""
+
+    __slots__ = ("count", "enjoyment", "clarity", "recommended", "recommend_count", "difficulty")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.enjoyment = _RunningStat()
+        self.clarity = _RunningStat()
+        self.recommended = 0
+        self.recommend_count = 0
+        self.difficulty: dict[str, int] = {}
+
+    def add(self, feedback: PlayerFeedback) -> None:
+        """Fold one submission into the aggregates."""
+        self.count += 1
+        if feedback.enjoyment is not None:
+            self.enjoyment.add(feedback.enjoyment)
+        if feedback.clarity is not None:
+            self.clarity.add(feedback.clarity)
+        if feedback.would_recommend is not None:
+            self.recommend_count += 1
+            if feedback.would_recommend:
+                self.recommended += 1
+        if feedback.difficulty:
+            key = feedback.difficulty.value
+            self.difficulty[key] = self.difficulty.get(key, 0) + 1
+
+
 class FeedbackCollector:
     """Collects and manages player feedback.
 
     Stores feedback per encounter + context (narrative layer) combination.
     Flags encounters for re-assessment when feedback drops.
+
+    Summaries are maintained from running per-target aggregates, so each
+    submission costs O(1) however much feedback has been collected. Raw
+    feedback is kept in memory, or appended to a JSON-lines log when a
+    log path is given.
     """
 
-    def __init__(self) -> None:
-        """Initialize the feedback collector."""
+    def __init__(self, log_path: Path | str | None = None) -> None:
+        """Initialize the feedback collector.
+
+        Args:
+            log_path: Optional JSON-lines file to append raw feedback to
+                instead of holding it in memory
+        """
+        self.log_path = Path(log_path) if log_path else None
         self._feedback: list[PlayerFeedback] = []
+        self._encounter_stats: dict[str, _FeedbackAggregate] = {}
+        self._chapter_stats: dict[str, _FeedbackAggregate] = {}
         self._summaries: dict[str, FeedbackSummary] = {}
         self._flagged_for_review: set[str] = set()
 
@@ -2414,56 +2277,96 @@ class FeedbackCollector:
         self._low_recommendation_threshold = 0.3  # 30%
         self._min_feedback_for_flag = 5
 
+        # Pick up aggregates, summaries and flags for feedback already in the log
+        if self.log_path and self.log_path.exists():
+            for feedback in self._iter_feedback():
+                self._aggregate(feedback)
+            self._rebuild_summaries()
+
     def submit_feedback(self, feedback: PlayerFeedback) -> None:
         """Submit player feedback.
 
         Args:
             feedback: The feedback to submit
         """
-        self._feedback.append(feedback)
-
-        # Update summary for target
-        target_id = feedback.encounter_id or feedback.chapter_id or feedback.campaign_id
-        self._update_summary(target_id, "encounter" if feedback.encounter_id else "chapter")
+        self._store(feedback)
+        self._aggregate(feedback)
+
+        # Update summaries for every target the submission counts towards
+        for target_id in (feedback.chapter_id, feedback.encounter_id):
+            if target_id:
+                self._refresh_summary(target_id)
+
+    def _store(self, feedback: PlayerFeedback) -> None:
+        """Keep a raw submission (in memory or in the log)."""
+        if self.log_path is None:
+            self._feedback.append(feedback)
+            return
+        self.log_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.log_path, "a", encoding="utf-8") as f:
+            f.write(feedback.model_dump_json() + "\n")
+
+    def _iter_feedback(self) -> Iterator[PlayerFeedback]:
+        """Iterate over every raw submission."""
+        if self.log_path is None:
+            yield from self._feedback
+            return
+        if not self.log_path.exists():
+            return
+        with open(self.log_path, encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    yield PlayerFeedback.model_validate_json(line)
+
+    def _aggregate(self, feedback: PlayerFeedback) -> None:
+        """Fold a submission into its encounter and chapter aggregates."""
+        if feedback.encounter_id:
+            stats = self._encounter_stats.get(feedback.encounter_id)
+            if stats is None:
+                stats = self._encounter_stats[feedback.encounter_id] = _FeedbackAggregate()
+            stats.add(feedback)
+        if feedback.chapter_id:
+            stats = self._chapter_stats.get(feedback.chapter_id)
+            if stats is None:
+                stats = self._chapter_stats[feedback.chapter_id] = _FeedbackAggregate()
+            stats.add(feedback)
+
+    def _rebuild_summaries(self) -> None:
+        """Recompute every summary and review flag from the aggregates."""
+        self._summaries = {}
+        self._flagged_for_review = set()
+        for target_id in dict.fromkeys([*self._chapter_stats, *self._encounter_stats]):
+            self._refresh_summary(target_id)
+
+    def _refresh_summary(self, target_id: str) -> None:
+        """Update a target's summary (encounter stats win if a chapter shares the id)."""
+        target_type = "encounter" if target_id in self._encounter_stats else "chapter"
+        self._update_summary(target_id, target_type)
 
     def _update_summary(self, target_id: str, target_type: str) -> None:
-        """Update the feedback summary for a target."""
-        # Filter feedback for this target
+        """Update the feedback summary for a target from its aggregates."""
         if target_type == "encounter":
-            relevant = [f for f in self._feedback if f.encounter_id == target_id]
+            stats = self._encounter_stats.get(target_id)
         else:
-            relevant = [f for f in self._feedback if f.chapter_id == target_id]
+            stats = self._chapter_stats.get(target_id)
 
-        if not relevant:
+        if stats is None:
             return
 
-        # Create or update summary
         summary = FeedbackSummary(
             target_id=target_id,
             target_type=target_type,
-            feedback_count=len(relevant),
+            feedback_count=stats.count,
+            average_enjoyment=stats.enjoyment.average,
+            enjoyment_variance=stats.enjoyment.variance,
+            average_clarity=stats.clarity.average,
+            clarity_variance=stats.clarity.variance,
+            recommendation_rate=(
+                stats.recommended / stats.recommend_count if stats.recommend_count else None
+            ),
+            difficulty_distribution=dict(stats.difficulty),
         )
 
-        # Calculate averages
-        enjoyments = [f.enjoyment for f in relevant if f.enjoyment is not None]
-        if enjoyments:
-            summary.average_enjoyment = sum(enjoyments) / len(enjoyments)
-
-        clarities = [f.clarity for f in relevant if f.clarity is not None]
-        if clarities:
-            summary.average_clarity = sum(clarities) / len(clarities)
-
-        recommendations = [f.would_recommend for f in relevant if f.would_recommend is not None]
-        if recommendations:
-            summary.recommendation_rate = sum(1 for r in recommendations if r) / len(recommendations)
-
-        # Difficulty distribution
-        for f in relevant:
-            if f.difficulty:
-                summary.difficulty_distribution[f.difficulty.value] = (
-                    summary.difficulty_distribution.get(f.difficulty.value, 0) + 1
-                )
-
         # Check for review flags
         self._check_review_flags(summary)
 
@@ -2471,6 +2374,7 @@ class FeedbackCollector:
 
     def _check_review_flags(self, summary: FeedbackSummary) -> None:
         """Check if summary should be flagged for review."""
+        self._flagged_for_review.discard(summary.target_id)
         if summary.feedback_count < self._min_feedback_for_flag:
             return
 
@@ -2518,7 +2422,7 @@ class FeedbackCollector:
             List of PlayerFeedback
         """
         return [
-            f for f in self._feedback
+            f for f in self._iter_feedback()
             if f.encounter_id == target_id or f.chapter_id == target_id
         ]
 
@@ -2561,9 +2465,9 @@ class FeedbackCollector:
             Dict with all feedback data
         """
         return {
-            "feedback": [f.model_dump() for f in self._feedback],
+            "feedback": [f.model_dump() for f in self._iter_feedback()],
             "summaries": {k: v.model_dump() for k, v in self._summaries.items()},
-            "flagged": list(self._flagged_for_review),
+            "flagged": sorted(self._flagged_for_review),
         }
 
     def import_state(self, data: dict) -> None:
@@ -2573,7 +2477,16 @@ class FeedbackCollector:
             data: Dict from export_state
         """
         if "feedback" in data:
-            self._feedback = [PlayerFeedback.model_validate(f) for f in data["feedback"]]
+            self._feedback = []
+            self._encounter_stats = {}
+            self._chapter_stats = {}
+            if self.log_path is not None:
+                self.log_path.unlink(missing_ok=True)
+            for item in data["feedback"]:
+                feedback = PlayerFeedback.model_validate(item)
+                self._store(feedback)
+                self._aggregate(feedback)
+            self._rebuild_summaries()
         if "summaries" in data:
             self._summaries = {
                 k: FeedbackSummary.model_validate(v) for k, v in data["summaries"].items()
@@ -2582,13 +2495,16 @@ class FeedbackCollector:
             self._flagged_for_review = set(data["flagged"])
 
 
-def create_feedback_collector() -> FeedbackCollector:
+def create_feedback_collector(log_path: Path | str | None = None) -> FeedbackCollector:
     """Create a new feedback collector instance.
 
+    Args:
+        log_path: Optional JSON-lines file for raw feedback
+
     Returns:
         FeedbackCollector
     """
-    return FeedbackCollector()
+    return FeedbackCollector(log_path)
 
 
 # =============================================================================
@@ -2604,7 +2520,7 @@ def create_dread_citadel_contextual_grades() -> dict[str, ContextualEncounterGra
     """
     contextual_grades: dict[str, ContextualEncounterGrade] = {}
 
-    for enc_id, base_grade in DREAD_CITADEL_GRADES.items():
+    for enc_id, base_grade in _load_dread_citadel_grades().items():
         # Create contextual grade with pre-computed layer scores
         contextual = ContextualEncounterGrade(
             encounter_id=enc_id,
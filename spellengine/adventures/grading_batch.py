@@ -0,0 +1,341 @@
+"""Batched contextual grading across narrative layers.
+
+grade_encounter_contextual() builds modifier and grade objects for every
+(encounter, layer) pair one at a time. For library-wide reports this module
+grades the base dimensions once per encounter, then computes the whole
+encounters x layers x dimensions score tensor in a single NumPy operation.
+ContextualEncounterGrade objects are only built when asked for.
+
+NumPy is optional (``pip install spellengine[grading]``). Without it the
+batch falls back to the per-encounter scoring in experience_grading, with
+the same results.
+"""
+
+from collections.abc import Iterable, Iterator
+from typing import TYPE_CHECKING
+
+from spellengine.adventures.experience_grading import (
+    CORPORATE_CLASH_WORDS,
+    FANTASY_WORDS,
+    LAYER_NOTES,
+    ContextualEncounterGrade,
+    EmotionalBeat,
+    EncounterGrade,
+    GradeCache,
+    LayerScoringModifier,
+    NarrativeLayer,
+    _generate_adaptation_notes,
+    create_layer_modifiers_for_encounter,
+    encounter_features,
+    grade_chapter,
+)
+from spellengine.adventures.models import EncounterType
+
+try:
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when numpy is absent
+    np = None
+
+if TYPE_CHECKING:
+    from spellengine.adventures.models import Campaign, Encounter
+
+
+# Layer axis order (matches NarrativeLayer declaration order)
+LAYERS: tuple[NarrativeLayer, ...] = tuple(NarrativeLayer)
+
+# Dimension axis order; the first four carry layer modifiers
+DIMENSIONS: tuple[str, ...] = (
+    "engagement",
+    "challenge_balance",
+    "learning_value",
+    "narrative_integration",
+    "emotional_arc",
+    "pacing",
+    "agency",
+    "replay_value",
+)
+MODIFIED_DIMENSIONS = 4
+
+# Letter grade cut-offs, lowest first (a score >= cut-off earns the next grade)
+GRADE_CUTOFFS = (1.5, 2.0, 2.5, 3.0, 3.5, 4.0, 4.5)
+GRADE_LETTERS = ("F", "D", "C", "C+", "B", "B+", "A", "A+")
+
+
+def has_numpy() -> bool:
+    """Check whether the vectorized path is available."""
+    return np is not None
+
+
+def _modifier_tensor(encounters: list["Encounter"], grades: list[EncounterGrade]):
+    """Build the (encounters, layers, modified dimensions) modifier array.
+
+    Mirrors create_layer_modifiers_for_encounter() column-wise.
+    """
+    # Feature columns as 0/1 integers so they can be negated and scaled
+    features = [encounter_features(e).intro for e in encounters]
+    long_intro = np.fromiter((f.length > 300 for f in features), np.int64, len(encounters))
+    fantasy = np.fromiter((f.has_any(FANTASY_WORDS) for f in features), np.int64, len(encounters))
+    clash = np.fromiter(
+        (f.has_any(CORPORATE_CLASH_WORDS) for f in features), np.int64, len(encounters)
+    )
+    learn = np.fromiter((f.has_any(("learn",)) for f in features), np.int64, len(encounters))
+    tour = np.fromiter(
+        (e.encounter_type == EncounterType.TOUR for e in encounters), np.int64, len(encounters)
+    )
+    hint = np.fromiter((bool(e.hint) for e in encounters), np.int64, len(encounters))
+    tier = np.fromiter((e.tier for e in encounters), np.int64, len(encounters))
+    dramatic = np.fromiter(
+        (g.emotional_beat in (EmotionalBeat.DREAD, EmotionalBeat.TENSION) for g in grades),
+        np.int64,
+        len(grades),
+    )
+
+    mods = np.zeros((len(encounters), len(LAYERS), MODIFIED_DIMENSIONS), dtype=np.int64)
+    eng, chal, lrn, narr = range(MODIFIED_DIMENSIONS)
+    fantasy_l, corp_l, ctf_l, begin_l, adv_l = (LAYERS.index(l) for l in (
+        NarrativeLayer.FANTASY_RPG,
+        NarrativeLayer.CORPORATE_TRAINING,
+        NarrativeLayer.CTF_COMPETITION,
+        NarrativeLayer.EDUCATIONAL_BEGINNER,
+        NarrativeLayer.EDUCATIONAL_ADVANCED,
+    ))
+
+    mods[:, fantasy_l, eng] = long_intro
+    mods[:, fantasy_l, narr] = fantasy
+    mods[:, fantasy_l, lrn] = -tour
+
+    mods[:, corp_l, eng] = -clash
+    mods[:, corp_l, narr] = -2 * dramatic
+    mods[:, corp_l, lrn] = learn
+
+    mods[:, ctf_l, chal] = np.where(tier <= 1, -1, np.where(tier >= 3, 1, 0))
+    mods[:, ctf_l, eng] = np.where(tour, -1, 1)
+    mods[:, ctf_l, lrn] = -2 * tour
+    mods[:, ctf_l, narr] = -1
+
+    mods[:, begin_l, lrn] = hint
+    mods[:, begin_l, chal] = np.where(tier >= 2, -1, np.where(tier == 0, 1, 0))
+
+    mods[:, adv_l, lrn] = np.where(tour, -1, 1)
+    mods[:, adv_l, chal] = np.where(tier >= 2, 1, np.where(tier == 0, -1, 0))
+
+    return mods
+
+
+class ContextualGradeBatch:
+    """Contextual grades for many encounters, held as arrays.
+
+    Attributes:
+        encounters: Graded encounters, in batch order
+        base_grades: Base EncounterGrade per encounter
+        scores: (encounters, layers) layer scores
+        tensor: (encounters, layers, dimensions) adjusted dimension scores
+            (None without NumPy)
+    """
+
+    def __init__(
+        self,
+        encounters: list["Encounter"],
+        base_grades: list[EncounterGrade],
+    ) -> None:
+        """Score a batch of already base-graded encounters.
+
+        Args:
+            encounters: Encounters to score
+            base_grades: Their base grades, in the same order
+        """
+        if len(encounters) != len(base_grades):
+            raise ValueError("encounters and base_grades must be the same length")
+        self.encounters = encounters
+        self.base_grades = base_grades
+        self._index = {e.id: i for i, e in enumerate(encounters)}
+
+        if np is not None and encounters:
+            base = np.array(
+                [[getattr(g, d) for d in DIMENSIONS] for g in base_grades], dtype=np.int64
+            )
+            self.modifiers = _modifier_tensor(encounters, base_grades)
+            # encounters x layers x dimensions in one broadcast
+            tensor = np.repeat(base[:, None, :], len(LAYERS), axis=1)
+            tensor[:, :, :MODIFIED_DIMENSIONS] += self.modifiers
+            self.tensor = tensor
+            self.scores = np.clip(tensor.sum(axis=2) / len(DIMENSIONS), 1.0, 5.0)
+            self._grade_index = np.searchsorted(GRADE_CUTOFFS, self.scores, side="right")
+            self._base_average = base.sum(axis=1) / len(DIMENSIONS)
+        else:
+            self.modifiers = None
+            self.tensor = None
+            self.scores = [self._fallback_scores(e, g) for e, g in zip(encounters, base_grades)]
+            self._grade_index = [
+                [sum(score >= cut for cut in GRADE_CUTOFFS) for score in row]
+                for row in self.scores
+            ]
+            self._base_average = [g.average_score for g in base_grades]
+
+    @staticmethod
+    def _fallback_scores(encounter: "Encounter", grade: EncounterGrade) -> list[float]:
+        """Score one encounter in every layer without NumPy."""
+        contextual = ContextualEncounterGrade(
+            encounter_id=encounter.id,
+            base_grade=grade,
+            layer_modifiers=create_layer_modifiers_for_encounter(encounter, grade),
+        )
+        return [contextual.get_layer_score(layer) for layer in LAYERS]
+
+    @classmethod
+    def from_campaigns(
+        cls, campaigns: Iterable["Campaign"], cache: GradeCache | None = None
+    ) -> "ContextualGradeBatch":
+        """Grade every encounter of one or more campaigns.
+
+        Args:
+            campaigns: Campaigns to grade
+            cache: Optional encounter grade cache for the base grades
+
+        Returns:
+            ContextualGradeBatch over all encounters in campaign order
+        """
+        encounters: list["Encounter"] = []
+        grades: list[EncounterGrade] = []
+        for campaign in campaigns:
+            for i, chapter in enumerate(campaign.chapters):
+                encounters.extend(chapter.encounters)
+                grades.extend(grade_chapter(chapter, i, cache).encounter_grades)
+        return cls(encounters, grades)
+
+    def __len__(self) -> int:
+        return len(self.encounters)
+
+    def layer_score(self, index: int, layer: NarrativeLayer) -> float:
+        """Get the score of one encounter in one layer."""
+        return float(self.scores[index][LAYERS.index(layer)])
+
+    def layer_grades(self, index: int) -> dict[NarrativeLayer, str]:
+        """Get the letter grade per layer for one encounter."""
+        return {
+            layer: GRADE_LETTERS[int(g)] for layer, g in zip(LAYERS, self._grade_index[index])
+        }
+
+    def best_fit_layer(self, index: int) -> NarrativeLayer:
+        """Layer with the highest score (first wins on ties)."""
+        row = list(self.scores[index])
+        return LAYERS[row.index(max(row))]
+
+    def worst_fit_layer(self, index: int) -> NarrativeLayer:
+        """Layer with the lowest score (first wins on ties)."""
+        row = list(self.scores[index])
+        return LAYERS[row.index(min(row))]
+
+    def grade(self, index_or_id: int | str) -> ContextualEncounterGrade:
+        """Materialize the ContextualEncounterGrade for one encounter.
+
+        Args:
+            index_or_id: Batch index or encounter ID
+
+        Returns:
+            The same grade grade_encounter_contextual() would produce
+        """
+        index = self._index[index_or_id] if isinstance(index_or_id, str) else index_or_id
+        encounter = self.encounters[index]
+        base = self.base_grades[index]
+
+        if self.modifiers is not None:
+            modifiers = [
+                LayerScoringModifier(
+                    layer=layer,
+                    engagement_mod=int(row[0]),
+                    challenge_mod=int(row[1]),
+                    learning_mod=int(row[2]),
+                    narrative_mod=int(row[3]),
+                    notes=LAYER_NOTES[layer],
+                )
+                for layer, row in zip(LAYERS, self.modifiers[index])
+            ]
+        else:
+            modifiers = create_layer_modifiers_for_encounter(encounter, base)
+
+        return ContextualEncounterGrade(
+            encounter_id=encounter.id,
+            encounter_title=encounter.title,
+            base_grade=base,
+            layer_grades=self.layer_grades(index),
+            layer_modifiers=modifiers,
+            best_fit_layer=self.best_fit_layer(index),
+            worst_fit_layer=self.worst_fit_layer(index),
+            adaptation_notes=_generate_adaptation_notes(encounter, base),
+        )
+
+    def __iter__(self) -> Iterator[ContextualEncounterGrade]:
+        """Materialize grades one at a time."""
+        for i in range(len(self.encounters)):
+            yield self.grade(i)
+
+    def _ranked(self) -> list[int]:
+        """Indexes sorted by base average score, best first (stable)."""
+        if np is not None and self.encounters:
+            return np.argsort(-self._base_average, kind="stable").tolist()
+        return sorted(
+            range(len(self.encounters)), key=lambda i: self._base_average[i], reverse=True
+        )
+
+    def report(self) -> str:
+        """Generate the cross-layer report without materializing grades.
+
+        Same layout as generate_contextual_grade_report().
+        """
+        lines = []
+        lines.append("=" * 80)
+        lines.append("CONTEXTUAL GRADING REPORT: Cross-Layer Analysis")
+        lines.append("=" * 80)
+        lines.append("")
+        lines.append("How encounters perform in different narrative contexts:")
+        lines.append("")
+
+        header = f"{'Encounter':<30} {'Fantasy':>8} {'Corp':>8} {'CTF':>8} {'EduBeg':>8} {'EduAdv':>8}"
+        lines.append(header)
+        lines.append("-" * 80)
+
+        ranked = self._ranked()
+        for i in ranked:
+            title = self.encounters[i].title
+            title = title[:28] + ".." if len(title) > 30 else title
+            letters = [GRADE_LETTERS[int(g)] for g in self._grade_index[i]]
+            lines.append(f"{title:<30} " + " ".join(f"{g:>8}" for g in letters))
+
+        lines.append("")
+        lines.append("-" * 80)
+        lines.append("")
+
+        best = [self.best_fit_layer(i) for i in ranked]
+        lines.append("BEST FITS BY LAYER:")
+        for layer in LAYERS:
+            names = [self.encounters[i].title for i, b in zip(ranked, best) if b == layer][:3]
+            if names:
+                lines.append(f"  {layer.value}: {', '.join(names)}")
+
+        lines.append("")
+        lines.append("ENCOUNTERS NEEDING ADAPTATION:")
+        for i in ranked:
+            worst = self.worst_fit_layer(i)
+            worst_grade = GRADE_LETTERS[int(self._grade_index[i][LAYERS.index(worst)])]
+            if worst_grade in ("C", "C+", "D", "F"):
+                lines.append(
+                    f"  {self.encounters[i].title}: Struggles in {worst.value} ({worst_grade})"
+                )
+
+        return "\n".join(lines)
+
+
+def grade_contextual_batch(
+    campaigns: Iterable["Campaign"], cache: GradeCache | None = None
+) -> ContextualGradeBatch:
+    """Grade every encounter of the given campaigns across all layers.
+
+    Args:
+        campaigns: Campaigns to grade
+        cache: Optional encounter grade cache for the base grades
+
+    Returns:
+        ContextualGradeBatch
+    """
+    return ContextualGradeBatch.from_campaigns(campaigns, cache)
@@ -0,0 +1,220 @@
+"""Compiled campaign graph for PTHAdventures.
+
+Flattens a loaded Campaign into ordinal-addressed tables so that runtime
+systems (save files, progress tracking) can refer to chapters, encounters
+and fork choices by small integers instead of repeating long ID strings.
+
+Ordinals follow campaign file order and are stable for a given campaign
+layout. The graph digest changes whenever that layout changes, which lets
+consumers detect ordinals that were produced against a different build.
+"""
+
+import hashlib
+import zlib
+from itertools import compress
+from typing import TYPE_CHECKING
+
+from spellengine.adventures.models import DifficultyLevel
+
+if TYPE_CHECKING:
+    from spellengine.adventures.models import Campaign
+
+
+# Fixed difficulty ordering - bit N of a difficulty bitset is DIFFICULTY_ORDER[N]
+DIFFICULTY_ORDER: tuple[DifficultyLevel, ...] = (
+    DifficultyLevel.NORMAL,
+    DifficultyLevel.HEROIC,
+    DifficultyLevel.MYTHIC,
+)
+
+# Fixed game mode ordering (matches the replay upgrade priority)
+GAME_MODE_ORDER: tuple[str, ...] = ("observer", "john", "hashcat", "full")
+
+
+class CampaignGraph:
+    """Ordinal-addressed view of a campaign's chapters and encounters.
+
+    Built once per loaded campaign. Lookups in both directions are O(1).
+    """
+
+    def __init__(
+        self,
+        campaign_id: str,
+        chapter_ids: tuple[str, ...],
+        encounter_ids: tuple[str, ...],
+        choice_ids: dict[int, tuple[str, ...]] | None = None,
+    ) -> None:
+        """Build a graph from ordinal tables.
+
+        Use compile_campaign_graph() to build one from a loaded Campaign.
+
+        Args:
+            campaign_id: ID of the compiled campaign
+            chapter_ids: Chapter IDs in ordinal order
+            encounter_ids: Encounter IDs in ordinal order
+            choice_ids: Fork encounter ordinal -> choice IDs in declaration order
+        """
+        self.campaign_id = campaign_id
+        self.chapter_ids = chapter_ids
+        self.encounter_ids = encounter_ids
+        self._choice_ids = choice_ids or {}
+
+        # ID -> ordinal lookups
+        self.chapter_index: dict[str, int] = {
+            cid: i for i, cid in enumerate(self.chapter_ids)
+        }
+        self.encounter_index: dict[str, int] = {
+            eid: i for i, eid in enumerate(self.encounter_ids)
+        }
+        self._layout_blob: bytes | None = None
+
+        self.digest = self._compute_digest()
+
+    @classmethod
+    def from_layout(cls, blob: bytes) -> "CampaignGraph":
+        """Rebuild a graph from the output of to_layout().
+
+        Raises:
+            ValueError: If the blob is not a valid layout
+        """
+        try:
+            text = zlib.decompress(blob).decode("utf-8")
+            campaign_id, chapters, encounters, forks = text.split("\x00")
+        except (zlib.error, UnicodeDecodeError, ValueError) as e:
+            raise ValueError(f"Invalid campaign layout: {e}") from e
+
+        choice_ids: dict[int, tuple[str, ...]] = {}
+        for line in forks.split("\n") if forks else []:
+            ordinal, _, choices = line.partition(":")
+            choice_ids[int(ordinal)] = tuple(choices.split("\t"))
+
+        return cls(
+            campaign_id,
+            tuple(chapters.split("\n")) if chapters else (),
+            tuple(encounters.split("\n")) if encounters else (),
+            choice_ids,
+        )
+
+    def to_layout(self) -> bytes:
+        """Serialize the ordinal tables as a compact, compressed blob.
+
+        Embedded in save files so ordinals can still be resolved after
+        the campaign layout changes. Computed once per graph.
+        """
+        if self._layout_blob is None:
+            forks = "\n".join(
+                f"{ordinal}:" + "\t".join(self._choice_ids[ordinal])
+                for ordinal in sorted(self._choice_ids)
+            )
+            text = "\x00".join([
+                self.campaign_id,
+                "\n".join(self.chapter_ids),
+                "\n".join(self.encounter_ids),
+                forks,
+            ])
+            self._layout_blob = zlib.compress(text.encode("utf-8"), 9)
+        return self._layout_blob
+
+    def _compute_digest(self) -> bytes:
+        """Compute an 8-byte fingerprint of the ordinal layout."""
+        h = hashlib.sha256()
+        h.update(self.campaign_id.encode("utf-8"))
+        for section in (self.chapter_ids, self.encounter_ids):
+            h.update(b"\x00")
+            h.update("\n".join(section).encode("utf-8"))
+        for ordinal in sorted(self._choice_ids):
+            h.update(f"\x00{ordinal}:".encode("utf-8"))
+            h.update("\n".join(self._choice_ids[ordinal]).encode("utf-8"))
+        return h.digest()[:8]
+
+    @property
+    def encounter_count(self) -> int:
+        """Number of encounters in the campaign."""
+        return len(self.encounter_ids)
+
+    @property
+    def chapter_count(self) -> int:
+        """Number of chapters in the campaign."""
+        return len(self.chapter_ids)
+
+    def encounter_ordinal(self, encounter_id: str) -> int | None:
+        """Get the ordinal for an encounter ID, or None if unknown."""
+        return self.encounter_index.get(encounter_id)
+
+    def chapter_ordinal(self, chapter_id: str) -> int | None:
+        """Get the ordinal for a chapter ID, or None if unknown."""
+        return self.chapter_index.get(chapter_id)
+
+    def choice_ordinal(self, encounter_id: str, choice_id: str) -> int | None:
+        """Get the index of a choice within its fork encounter, or None."""
+        ordinal = self.encounter_index.get(encounter_id)
+        if ordinal is None:
+            return None
+        choices = self._choice_ids.get(ordinal, ())
+        try:
+            return choices.index(choice_id)
+        except ValueError:
+            return None
+
+    def choices_for(self, encounter_ordinal: int | None) -> tuple[str, ...]:
+        """Get the choice IDs of a fork encounter (empty if not a fork)."""
+        if encounter_ordinal is None:
+            return ()
+        return self._choice_ids.get(encounter_ordinal, ())
+
+    def choice_id(self, encounter_ordinal: int, choice_ordinal: int) -> str | None:
+        """Get a choice ID from its fork and choice ordinals, or None."""
+        choices = self._choice_ids.get(encounter_ordinal, ())
+        if 0 <= choice_ordinal < len(choices):
+            return choices[choice_ordinal]
+        return None
+
+    def completion_bits(self, encounter_ids: "list[str] | set[str]") -> int:
+        """Pack encounter IDs into a completion bitset (unknown IDs ignored)."""
+        bits = 0
+        for eid in encounter_ids:
+            ordinal = self.encounter_index.get(eid)
+            if ordinal is not None:
+                bits |= 1 << ordinal
+        return bits
+
+    def completed_ids(self, bits: int) -> list[str]:
+        """Unpack a completion bitset into encounter IDs in campaign order."""
+        # bin() yields the bits most-significant first; reverse into ordinal order
+        flags = bin(bits)[:1:-1] if bits else ""
+        return list(compress(self.encounter_ids, map(int, flags)))
+
+
+def difficulty_bits(difficulties: list[str]) -> int:
+    """Pack difficulty names into a bitset over DIFFICULTY_ORDER."""
+    bits = 0
+    for i, level in enumerate(DIFFICULTY_ORDER):
+        if level.value in difficulties:
+            bits |= 1 << i
+    return bits
+
+
+def difficulties_from_bits(bits: int) -> list[str]:
+    """Unpack a difficulty bitset into difficulty names."""
+    return [level.value for i, level in enumerate(DIFFICULTY_ORDER) if bits & (1 << i)]
+
+
+def compile_campaign_graph(campaign: "Campaign") -> CampaignGraph:
+    """Compile the ordinal graph for a campaign.
+
+    Args:
+        campaign: Campaign to compile
+
+    Returns:
+        CampaignGraph instance
+    """
+    chapter_ids = tuple(ch.id for ch in campaign.chapters)
+    encounter_ids: list[str] = []
+    choice_ids: dict[int, tuple[str, ...]] = {}
+    for chapter in campaign.chapters:
+        for enc in chapter.encounters:
+            if enc.choices:
+                choice_ids[len(encounter_ids)] = tuple(c.id for c in enc.choices)
+            encounter_ids.append(enc.id)
+
+    return CampaignGraph(campaign.id, chapter_ids, tuple(encounter_ids), choice_ids)
@@ -139,3 +139,12 @@ class KeyspaceMeta(BaseModel):
         "training_corpus",
         description="Corpus the password was derived from"
     )
+    predicted_attack: str | None = Field(
+        None,
+        description="Fastest attack that cracks the password (build-time prediction)"
+    )
+    predicted_crack_seconds: int | None = Field(
+        None,
+        ge=1,
+        description="Predicted seconds to crack at the reference guess rate"
+    )
@@ -1,9 +1,12 @@
 """Campaign loader for PTHAdventures.
 
-Loads campaign definitions from YAML files.
+Loads campaign definitions from YAML files, or from the compiled JSON
+artifact the campaign builder writes next to a built campaign.
 Cross-platform path handling.
 """
 
+import hashlib
+import json
 from pathlib import Path
 from typing import Any
 
@@ -26,12 +29,80 @@ from spellengine.adventures.models import (
     EncounterVariant,
 )
 
+# Bumped whenever the compiled campaign artifact layout changes
+COMPILED_SCHEMA_VERSION = 1
+
+COMPILED_SUFFIX = ".compiled.json"
+
+
+def compiled_path_for(campaign_yaml: Path) -> Path:
+    """Compiled artifact location for a built campaign YAML."""
+    return campaign_yaml.with_name(campaign_yaml.stem + COMPILED_SUFFIX)
+
+
+def source_digest(data: bytes) -> str:
+    """Content digest a compiled artifact records for the YAML beside it.
+
+    Line endings are normalized, so a CRLF checkout still matches.
+    """
+    return hashlib.blake2b(data.replace(b"\r\n", b"\n"), digest_size=16).hexdigest()
+
+
+def read_compiled(path: Path) -> dict[str, Any]:
+    """Read a compiled campaign artifact.
+
+    Args:
+        path: Path to the .compiled.json artifact
+
+    Returns:
+        The artifact: schema_version, build_info, source_digest and campaign
+
+    Raises:
+        ValueError: If the file isn't an artifact of this schema version
+    """
+    try:
+        with open(path, encoding="utf-8") as f:
+            artifact = json.load(f)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid compiled campaign {path}: {e}") from None
+    if not isinstance(artifact, dict) or "campaign" not in artifact:
+        raise ValueError(f"Invalid compiled campaign {path}: no campaign")
+    if artifact.get("schema_version") != COMPILED_SCHEMA_VERSION:
+        raise ValueError(
+            f"Unsupported compiled campaign schema {artifact.get('schema_version')!r}: {path}"
+        )
+    return artifact
+
+
+def _load_compiled(path: Path, raw: bytes) -> dict[str, Any] | None:
+    """Campaign data from the artifact compiled from a YAML file, if it is current.
+
+    Args:
+        path: Campaign YAML
+        raw: Its contents (hashing them is far cheaper than parsing them)
+    """
+    artifact_path = compiled_path_for(path)
+    if not artifact_path.exists():
+        return None
+    try:
+        artifact = read_compiled(artifact_path)
+    except (OSError, ValueError):
+        return None
+    # Compiled from the YAML's contents; a YAML edited since is parsed instead
+    if artifact.get("source_digest") != source_digest(raw):
+        return None
+    return artifact["campaign"]
+
 
 def load_campaign(path: Path | str) -> Campaign:
     """Load a campaign from a YAML file.
 
+    A built campaign is read from its compiled artifact (see
+    compiled_path_for) while the artifact's digest matches the YAML's
+    contents; a path to the artifact itself is read directly.
+
     Args:
-        path: Path to campaign YAML file
+        path: Path to campaign YAML file (or compiled artifact)
 
     Returns:
         Loaded Campaign object
@@ -45,8 +116,13 @@ def load_campaign(path: Path | str) -> Campaign:
     if not path.exists():
         raise FileNotFoundError(f"Campaign not found: {path}")
 
-    with open(path, encoding="utf-8") as f:
-        data = yaml.safe_load(f)
+    if path.name.endswith(COMPILED_SUFFIX):
+        data = read_compiled(path)["campaign"]
+    else:
+        raw = path.read_bytes()
+        data = _load_compiled(path, raw)
+        if data is None:
+            data = yaml.safe_load(raw.decode("utf-8"))
 
     return _parse_campaign(data, path.parent)
 
@@ -147,6 +223,8 @@ def _parse_keyspace_meta(data: dict[str, Any]) -> KeyspaceMeta:
         tier=data.get("tier", 0),
         complexity=complexity,
         source=data.get("source", "training_corpus"),
+        predicted_attack=data.get("predicted_attack"),
+        predicted_crack_seconds=data.get("predicted_crack_seconds"),
     )
 
 
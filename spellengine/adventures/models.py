@@ -5,8 +5,9 @@ and player state tracking.
 """
 
 from enum import Enum
+from itertools import count
 from typing import Any
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
 
 from spellengine.adventures.keyspace import KeyspaceDefinition, KeyspaceMeta
 
@@ -269,8 +270,36 @@ class Campaign(BaseModel):
     outro_text: str = Field("", description="Campaign completion text")
 
 
+# Process-wide version source so versions stay unique even when a
+# PlayerState is replaced (e.g. on load)
+_STATE_VERSIONS = count(1)
+
+# PlayerState fields holding mutable containers (copied on write after a snapshot)
+_CONTAINER_FIELDS = frozenset({
+    "completed_encounters",
+    "encounter_modes",
+    "choice_history",
+    "achievements",
+    "chapter_hints_used",
+    "completed_difficulties",
+    "artifacts",
+})
+
+
+def _copy_container(value: Any) -> Any:
+    """Copy a PlayerState container one level deep (dict-of-list values included)."""
+    if isinstance(value, dict):
+        return {k: (list(v) if isinstance(v, list) else v) for k, v in value.items()}
+    return list(value)
+
+
 class PlayerState(BaseModel):
-    """Tracks player progress through an adventure."""
+    """Tracks player progress through an adventure.
+
+    Supports copy-on-write snapshots for readers on other threads: see
+    snapshot() and writable(). The live state, including taking snapshots,
+    belongs to one thread; only the snapshots are shared.
+    """
 
     # Identity
     player_name: str = Field("Adventurer", description="Player display name")
@@ -333,6 +362,127 @@ class PlayerState(BaseModel):
         description="campaign_id -> list of artifact IDs collected (e.g., skeleton_key_fragment_normal)"
     )
 
+    # Set-backed view of completed_encounters (rebuilt lazily, never serialized)
+    _completed_set: set[str] = PrivateAttr(default_factory=set)
+    _completed_source: tuple[int, int] = PrivateAttr((0, 0))
+
+    def _completed_view(self) -> set[str]:
+        """Get the membership set for completed_encounters.
+
+        The list is append-only in normal play, so the set only needs to
+        absorb the new tail. It is rebuilt if the list was replaced or shrunk.
+        """
+        source = self.completed_encounters
+        list_id, indexed = self._completed_source
+        if list_id != id(source) or indexed > len(source):
+            self._completed_set = set(source)
+        elif indexed < len(source):
+            self._completed_set.update(source[indexed:])
+        self._completed_source = (id(source), len(source))
+        return self._completed_set
+
+    # Copy-on-write snapshot bookkeeping
+    _version: int = PrivateAttr(default_factory=lambda: next(_STATE_VERSIONS))
+    _shared: set[str] = PrivateAttr(default_factory=set)
+    _snapshot: "PlayerState | None" = PrivateAttr(None)
+    _frozen: bool = PrivateAttr(False)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name.startswith("_"):
+            super().__setattr__(name, value)
+            return
+        if self._frozen:
+            raise TypeError("PlayerState snapshots are read-only")
+        super().__setattr__(name, value)
+        # The new value is owned by this state, not by any snapshot
+        self._shared.discard(name)
+        self._version = next(_STATE_VERSIONS)
+
+    @property
+    def version(self) -> int:
+        """Version counter, changed on every mutation.
+
+        Compare a snapshot's version with the live state's to detect staleness.
+        """
+        return self._version
+
+    @property
+    def is_snapshot(self) -> bool:
+        """True if this is a read-only snapshot."""
+        return self._frozen
+
+    def snapshot(self) -> "PlayerState":
+        """Get an immutable snapshot of the current state.
+
+        O(1) in the size of the progress data: the snapshot is a shallow
+        copy that shares every container with the live state, and the live
+        state copies a container before its next write (see writable()).
+        Repeated calls without intervening mutations return the same object.
+
+        Snapshots reject attribute assignment; their containers must be
+        treated as read-only. Call this on the thread that mutates the
+        state: it resets the copy-on-write bookkeeping, and a container
+        handed out by writable() is only safe until the next snapshot.
+
+        Returns:
+            Read-only PlayerState sharing structure with this one
+        """
+        if self._frozen:
+            return self
+        snap = self._snapshot
+        if snap is not None and snap._version == self._version:
+            return snap
+
+        snap = self.model_copy()
+        snap._shared = set()
+        snap._snapshot = None
+        snap._completed_set = set()
+        snap._completed_source = (0, 0)
+        snap._frozen = True
+
+        self._shared = set(_CONTAINER_FIELDS)
+        self._snapshot = snap
+        return snap
+
+    def writable(self, name: str) -> Any:
+        """Get a container field for in-place mutation.
+
+        Copies the container first if a snapshot still shares it, and
+        bumps the version. All in-place container writes should go
+        through here so snapshots never observe them.
+
+        Args:
+            name: Container field name (e.g. "encounter_modes")
+
+        Returns:
+            The container, owned exclusively by this state
+        """
+        if self._frozen:
+            raise TypeError("PlayerState snapshots are read-only")
+        if name not in _CONTAINER_FIELDS:
+            raise ValueError(f"Not a container field: {name}")
+        if name in self._shared:
+            setattr(self, name, _copy_container(getattr(self, name)))
+        else:
+            self._version = next(_STATE_VERSIONS)
+        return getattr(self, name)
+
+    def is_completed(self, encounter_id: str) -> bool:
+        """Check if an encounter has been completed (O(1))."""
+        return encounter_id in self._completed_view()
+
+    def mark_completed(self, encounter_id: str) -> bool:
+        """Record an encounter as completed.
+
+        Returns:
+            True if the encounter was newly completed
+        """
+        if encounter_id in self._completed_view():
+            return False
+        self.writable("completed_encounters").append(encounter_id)
+        self._completed_view()
+        return True
+
 
 class GameOverOptions(str, Enum):
     """Options presented on game over."""
@@ -0,0 +1,419 @@
+"""Compact binary save format for PTHAdventures.
+
+PlayerState saves reference chapters, encounters and fork choices by
+their ordinals in the compiled CampaignGraph instead of repeating the
+ID strings in every field:
+
+- completed encounters are a bitset over encounter ordinals
+- completed difficulties are a bitset over DIFFICULTY_ORDER per campaign
+- encounter modes are a dense byte array indexed by encounter ordinal
+- choice history and chapter hint counts are keyed by ordinals, with
+  choices stored as their index within the fork
+
+Layout (all integers are LEB128 varints, signed values zigzag-encoded):
+
+    magic (4) | version (1) | graph digest (8)
+    layout blob (len + bytes) | string table (count + strings) | fields
+
+The layout blob is the graph's compressed ordinal table. It is only read
+when the save was written against a different campaign layout, so a
+normal load never touches it. Values that fall outside the graph (IDs
+from an older build, custom modes) go through the string table, so no
+progress is dropped.
+
+The JSON form (PlayerState.model_dump) remains the export format.
+"""
+
+from spellengine.adventures.graph import (
+    DIFFICULTY_ORDER,
+    GAME_MODE_ORDER,
+    CampaignGraph,
+    difficulties_from_bits,
+    difficulty_bits,
+)
+from spellengine.adventures.models import DifficultyLevel, PlayerState
+
+SAVE_MAGIC = b"SPSV"
+SAVE_VERSION = 1
+
+_DIFFICULTY_VALUES = tuple(level.value for level in DIFFICULTY_ORDER)
+
+_FLAG_ROGUE = 1 << 0
+_FLAG_PROLOGUE = 1 << 1
+
+
+class SaveFormatError(ValueError):
+    """Raised when a binary save cannot be decoded."""
+
+
+def is_binary_save(data: bytes) -> bool:
+    """Check whether raw file contents are a binary save."""
+    return data[:4] == SAVE_MAGIC
+
+
+# =============================================================================
+# Encoding
+# =============================================================================
+
+
+class _Writer:
+    """Append-only varint writer with a deduplicating string table."""
+
+    def __init__(self) -> None:
+        self.buf = bytearray()
+        self.strings: list[str] = []
+        self._string_index: dict[str, int] = {}
+
+    def uint(self, value: int) -> None:
+        while value > 0x7F:
+            self.buf.append((value & 0x7F) | 0x80)
+            value >>= 7
+        self.buf.append(value)
+
+    def sint(self, value: int) -> None:
+        self.uint((value << 1) if value >= 0 else ((-value << 1) - 1))
+
+    def string_ref(self, value: str) -> int:
+        index = self._string_index.get(value)
+        if index is None:
+            index = len(self.strings)
+            self.strings.append(value)
+            self._string_index[value] = index
+        return index
+
+    def symbol(self, value: str | None, vocab: "dict[str, int]", vocab_len: int) -> None:
+        """Write a value as 0 (None), a vocab code, or a string table ref."""
+        if value is None:
+            self.uint(0)
+            return
+        code = vocab.get(value)
+        if code is None:
+            code = vocab_len + self.string_ref(value)
+        self.uint(code + 1)
+
+    def text(self, value: str | None) -> None:
+        """Write a free-form string through the string table."""
+        self.symbol(value, {}, 0)
+
+    def blob(self, raw: bytes) -> None:
+        self.uint(len(raw))
+        self.buf += raw
+
+    def bitset(self, bits: int) -> None:
+        self.blob(bits.to_bytes((bits.bit_length() + 7) // 8, "little"))
+
+    def text_list(self, values: list[str]) -> None:
+        """Write a list of strings as one NUL-separated UTF-8 blob."""
+        self.uint(len(values))
+        if values:
+            joined = "\x00".join(values)
+            if joined.count("\x00") != len(values) - 1:
+                raise SaveFormatError("Save strings cannot contain NUL characters")
+            self.blob(joined.encode("utf-8"))
+
+
+def encode_player_state(state: PlayerState, graph: CampaignGraph) -> bytes:
+    """Encode a PlayerState into the binary save format.
+
+    Args:
+        state: Player state to encode
+        graph: Compiled graph of the campaign being played
+
+    Returns:
+        Encoded save bytes
+    """
+    w = _Writer()
+    encounters = graph.encounter_index
+    chapters = graph.chapter_index
+    n_enc = graph.encounter_count
+    n_ch = graph.chapter_count
+    modes = {m: i for i, m in enumerate(GAME_MODE_ORDER)}
+    difficulties = {d: i for i, d in enumerate(_DIFFICULTY_VALUES)}
+
+    # Identity and position
+    w.text(state.player_name)
+    w.text(state.campaign_id)
+    w.symbol(state.chapter_id, chapters, n_ch)
+    w.symbol(state.encounter_id, encounters, n_enc)
+    w.symbol(state.difficulty.value, difficulties, len(_DIFFICULTY_VALUES))
+
+    # Completion bitset, plus any IDs the graph does not know about
+    w.bitset(graph.completion_bits(state.completed_encounters))
+    unknown = [eid for eid in state.completed_encounters if eid not in encounters]
+    w.uint(len(unknown))
+    for eid in unknown:
+        w.symbol(eid, encounters, n_enc)
+
+    # Encounter modes as a dense per-ordinal code array (0 = not played);
+    # entries the graph or mode table can't express spill into pairs
+    mode_codes = bytearray(n_enc)
+    spill = []
+    for eid, mode in state.encounter_modes.items():
+        ordinal = encounters.get(eid)
+        code = modes.get(mode)
+        if ordinal is None or code is None:
+            spill.append((eid, mode))
+        else:
+            mode_codes[ordinal] = code + 1
+    w.blob(bytes(mode_codes).rstrip(b"\x00"))
+    w.uint(len(spill))
+    for eid, mode in spill:
+        w.symbol(eid, encounters, n_enc)
+        w.symbol(mode, modes, len(modes))
+
+    w.symbol(state.last_checkpoint, encounters, n_enc)
+    w.symbol(state.last_fork, encounters, n_enc)
+
+    w.uint(len(state.choice_history))
+    for fork_id, choice_id in state.choice_history.items():
+        w.symbol(fork_id, encounters, n_enc)
+        choices = graph.choices_for(encounters.get(fork_id))
+        w.symbol(choice_id, {c: i for i, c in enumerate(choices)}, len(choices))
+
+    # Progress counters
+    for value in (
+        state.xp_earned,
+        state.total_xp,
+        state.deaths,
+        state.hints_used,
+        state.clean_solves,
+    ):
+        w.sint(value)
+
+    w.text_list(state.achievements)
+
+    w.uint(len(state.chapter_hints_used))
+    for chapter_id, count in state.chapter_hints_used.items():
+        w.symbol(chapter_id, chapters, n_ch)
+        w.sint(count)
+
+    # Session and mode
+    w.text(state.started_at)
+    w.text(state.last_played)
+    flags = (_FLAG_ROGUE if state.rogue_mode else 0) | (
+        _FLAG_PROLOGUE if state.prologue_complete else 0
+    )
+    w.uint(flags)
+    w.symbol(state.game_mode, modes, len(modes))
+
+    # Per-campaign difficulty completion bitsets
+    w.uint(len(state.completed_difficulties))
+    for campaign_id, completed in state.completed_difficulties.items():
+        w.text(campaign_id)
+        w.uint(difficulty_bits(completed))
+        extra = [d for d in completed if d not in difficulties]
+        w.uint(len(extra))
+        for d in extra:
+            w.text(d)
+
+    w.uint(len(state.artifacts))
+    for campaign_id, artifact_ids in state.artifacts.items():
+        w.text(campaign_id)
+        w.text_list(artifact_ids)
+
+    # Header + layout + string table + fields
+    out = _Writer()
+    out.buf += SAVE_MAGIC
+    out.buf.append(SAVE_VERSION)
+    out.buf += graph.digest
+    out.blob(graph.to_layout())
+    out.text_list(w.strings)
+    out.buf += w.buf
+    return bytes(out.buf)
+
+
+# =============================================================================
+# Decoding
+# =============================================================================
+
+
+class _Reader:
+    """Sequential varint reader matching _Writer."""
+
+    def __init__(self, data: bytes, pos: int = 0) -> None:
+        self.data = data
+        self.pos = pos
+        self.strings: list[str] = []
+
+    def uint(self) -> int:
+        result = 0
+        shift = 0
+        data = self.data
+        while True:
+            try:
+                byte = data[self.pos]
+            except IndexError:
+                raise SaveFormatError("Truncated save file") from None
+            self.pos += 1
+            result |= (byte & 0x7F) << shift
+            if byte < 0x80:
+                return result
+            shift += 7
+
+    def sint(self) -> int:
+        value = self.uint()
+        return (value >> 1) if not value & 1 else -((value + 1) >> 1)
+
+    def raw(self, length: int) -> bytes:
+        end = self.pos + length
+        if end > len(self.data):
+            raise SaveFormatError("Truncated save file")
+        chunk = self.data[self.pos:end]
+        self.pos = end
+        return chunk
+
+    def symbol(self, vocab: "tuple[str, ...]") -> str | None:
+        code = self.uint()
+        if code == 0:
+            return None
+        code -= 1
+        if code < len(vocab):
+            return vocab[code]
+        try:
+            return self.strings[code - len(vocab)]
+        except IndexError:
+            raise SaveFormatError(f"Invalid string reference: {code}") from None
+
+    def text(self) -> str | None:
+        return self.symbol(())
+
+    def blob(self) -> bytes:
+        return self.raw(self.uint())
+
+    def bitset(self) -> int:
+        return int.from_bytes(self.blob(), "little")
+
+    def text_list(self) -> list[str]:
+        count = self.uint()
+        if not count:
+            return []
+        try:
+            values = self.blob().decode("utf-8").split("\x00")
+        except UnicodeDecodeError as e:
+            raise SaveFormatError(f"Invalid string in save: {e}") from e
+        if len(values) != count:
+            raise SaveFormatError("Corrupt string list in save")
+        return values
+
+
+def decode_player_state(data: bytes, graph: CampaignGraph) -> PlayerState:
+    """Decode a binary save into a PlayerState.
+
+    Args:
+        data: Encoded save bytes
+        graph: Compiled graph of the campaign being played
+
+    Returns:
+        Decoded PlayerState
+
+    Raises:
+        SaveFormatError: If the data is not a valid binary save
+    """
+    if not is_binary_save(data):
+        raise SaveFormatError("Not a binary save file")
+    if len(data) < 13:
+        raise SaveFormatError("Truncated save file")
+    version = data[4]
+    if version != SAVE_VERSION:
+        raise SaveFormatError(f"Unsupported save version: {version}")
+
+    r = _Reader(data, 13)
+    layout = r.blob()
+    if data[5:13] != graph.digest:
+        # Saved against a different campaign layout - resolve ordinals
+        # with the layout the save was written against
+        try:
+            graph = CampaignGraph.from_layout(layout)
+        except ValueError as e:
+            raise SaveFormatError(str(e)) from e
+
+    r.strings = r.text_list()
+
+    encounters = graph.encounter_ids
+    chapters = graph.chapter_ids
+
+    player_name = r.text()
+    campaign_id = r.text()
+    chapter_id = r.symbol(chapters)
+    encounter_id = r.symbol(encounters)
+    difficulty = r.symbol(_DIFFICULTY_VALUES)
+
+    completed = graph.completed_ids(r.bitset())
+    completed.extend(r.symbol(encounters) for _ in range(r.uint()))
+
+    mode_codes = r.blob()
+    if len(mode_codes) > len(encounters) or max(mode_codes, default=0) > len(GAME_MODE_ORDER):
+        raise SaveFormatError("Corrupt encounter mode table")
+    encounter_modes = {
+        eid: GAME_MODE_ORDER[code - 1]
+        for eid, code in zip(encounters, mode_codes)
+        if code
+    }
+    for _ in range(r.uint()):
+        eid = r.symbol(encounters)
+        encounter_modes[eid] = r.symbol(GAME_MODE_ORDER)
+
+    last_checkpoint = r.symbol(encounters)
+    last_fork = r.symbol(encounters)
+
+    choice_history = {}
+    for _ in range(r.uint()):
+        fork_id = r.symbol(encounters)
+        choices = graph.choices_for(graph.encounter_ordinal(fork_id))
+        choice_history[fork_id] = r.symbol(choices)
+
+    xp_earned, total_xp, deaths, hints_used, clean_solves = (r.sint() for _ in range(5))
+
+    achievements = r.text_list()
+
+    chapter_hints_used = {}
+    for _ in range(r.uint()):
+        cid = r.symbol(chapters)
+        chapter_hints_used[cid] = r.sint()
+
+    started_at = r.text()
+    last_played = r.text()
+    flags = r.uint()
+    game_mode = r.symbol(GAME_MODE_ORDER)
+
+    completed_difficulties = {}
+    for _ in range(r.uint()):
+        cid = r.text()
+        levels = difficulties_from_bits(r.uint())
+        levels.extend(r.text() for _ in range(r.uint()))
+        completed_difficulties[cid] = levels
+
+    artifacts = {}
+    for _ in range(r.uint()):
+        cid = r.text()
+        artifacts[cid] = r.text_list()
+
+    if r.pos != len(data):
+        raise SaveFormatError("Trailing data in save file")
+
+    return PlayerState.model_construct(
+        player_name=player_name,
+        campaign_id=campaign_id,
+        chapter_id=chapter_id,
+        encounter_id=encounter_id,
+        difficulty=DifficultyLevel(difficulty),
+        completed_encounters=completed,
+        encounter_modes=encounter_modes,
+        last_checkpoint=last_checkpoint,
+        last_fork=last_fork,
+        choice_history=choice_history,
+        xp_earned=xp_earned,
+        total_xp=total_xp,
+        achievements=achievements,
+        deaths=deaths,
+        hints_used=hints_used,
+        clean_solves=clean_solves,
+        chapter_hints_used=chapter_hints_used,
+        started_at=started_at,
+        last_played=last_played,
+        rogue_mode=bool(flags & _FLAG_ROGUE),
+        game_mode=game_mode,
+        prologue_complete=bool(flags & _FLAG_PROLOGUE),
+        completed_difficulties=completed_difficulties,
+        artifacts=artifacts,
+    )
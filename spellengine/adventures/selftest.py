@@ -63,13 +63,23 @@ def find_campaign_path(campaign_id: str) -> Path | None:
     """Find campaign YAML file by ID.
 
     Searches in standard locations:
+    - the indexed adventure whose manifest has this ID
     - content/adventures/{campaign_id}/campaign.yaml
     - spellengine/campaigns/{campaign_id}/campaign.yaml
     """
+    from spellengine.content.indexer import ContentIndexer
+
     # Get project root (where content/ lives)
     module_path = Path(__file__).parent
     project_root = module_path.parent.parent
 
+    # Manifests come from the indexer's parsed manifest cache
+    indexer = ContentIndexer(project_root / "content")
+    for item_dir, manifest in indexer.manifests("adventures"):
+        path = item_dir / "campaign.yaml"
+        if manifest.get("id") == campaign_id and path.exists():
+            return path
+
     search_paths = [
         project_root / "content" / "adventures" / campaign_id / "campaign.yaml",
         module_path / "campaigns" / campaign_id / "campaign.yaml",
@@ -8,6 +8,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Callable
 import json
+import threading
 
 from spellengine.adventures.models import (
     Campaign,
@@ -24,6 +25,12 @@ from spellengine.adventures.achievements import (
     UnlockedAchievement,
     create_achievement_manager,
 )
+from spellengine.adventures.graph import CampaignGraph, compile_campaign_graph
+from spellengine.adventures.savefile import (
+    decode_player_state,
+    encode_player_state,
+    is_binary_save,
+)
 
 # Event types for profile hooks
 EVENT_ENCOUNTER_STARTED = "encounter_started"
@@ -58,7 +65,9 @@ class AdventureState:
         Args:
             campaign: The campaign being played
             player_name: Display name for the player
-            save_path: Optional path to save/load state
+            save_path: Optional path to save/load state. A ".json" suffix
+                saves in the JSON export format, anything else uses the
+                compact binary format.
             achievement_manager: Optional achievement manager (created if not provided)
             event_callbacks: Optional dict of event_type -> callback function
                 for profile hooks. Callbacks receive event data dict.
@@ -67,7 +76,7 @@ class AdventureState:
         """
         self.campaign = campaign
         self.save_path = save_path
-        self.achievement_manager = achievement_manager or create_achievement_manager()
+        self.achievement_manager = achievement_manager or create_achievement_manager(campaign.id)
         self.event_callbacks = event_callbacks or {}
         self.difficulty = difficulty
         self.game_mode = game_mode
@@ -85,6 +94,11 @@ class AdventureState:
         for chapter in campaign.chapters:
             for enc in chapter.encounters:
                 self._encounters[enc.id] = enc
+        self.graph: CampaignGraph = compile_campaign_graph(campaign)
+
+        # Serializes save writers; tracks the newest version on disk
+        self._save_lock = threading.Lock()
+        self._saved_version: int = 0
 
         # Initialize player state
         first_chapter = self._chapters[campaign.first_chapter]
@@ -208,7 +222,7 @@ class AdventureState:
         if config["per_chapter"] > 0:
             chapter_id = self.state.chapter_id
             current = self.state.chapter_hints_used.get(chapter_id, 0)
-            self.state.chapter_hints_used[chapter_id] = current + 1
+            self.state.writable("chapter_hints_used")[chapter_id] = current + 1
             return 0
 
         # MYTHIC: Deduct XP
@@ -275,7 +289,7 @@ class AdventureState:
         last_encounter = last_chapter.encounters[-1]
         return (
             self.state.encounter_id == last_encounter.id
-            and last_encounter.id in self.state.completed_encounters
+            and self.state.is_completed(last_encounter.id)
         )
 
     def record_outcome(self, outcome: OutcomeType) -> dict:
@@ -337,8 +351,7 @@ class AdventureState:
         is_first_crack = len(self.state.completed_encounters) == 0
         previous_mode = self.state.encounter_modes.get(encounter.id)
 
-        if encounter.id not in self.state.completed_encounters:
-            self.state.completed_encounters.append(encounter.id)
+        self.state.mark_completed(encounter.id)
 
         # Track the mode - only update if upgrading (observer -> real mode)
         # This allows replaying for better rewards
@@ -347,7 +360,7 @@ class AdventureState:
         previous_priority = mode_priority.get(previous_mode, -1)
 
         if current_priority > previous_priority:
-            self.state.encounter_modes[encounter.id] = self.game_mode
+            self.state.writable("encounter_modes")[encounter.id] = self.game_mode
 
         # Emit success event for profile hooks
         self._emit_event(EVENT_ENCOUNTER_SUCCESS, {
@@ -514,10 +527,10 @@ class AdventureState:
             # Track difficulty completion for unlock system
             campaign_id = self.campaign.id
             difficulty_name = self.difficulty.value
-            if campaign_id not in self.state.completed_difficulties:
-                self.state.completed_difficulties[campaign_id] = []
-            if difficulty_name not in self.state.completed_difficulties[campaign_id]:
-                self.state.completed_difficulties[campaign_id].append(difficulty_name)
+            completed = self.state.completed_difficulties.get(campaign_id, [])
+            if difficulty_name not in completed:
+                completed_difficulties = self.state.writable("completed_difficulties")
+                completed_difficulties.setdefault(campaign_id, []).append(difficulty_name)
 
             # Emit campaign completion event
             self._emit_event(EVENT_CAMPAIGN_COMPLETED, {
@@ -553,7 +566,7 @@ class AdventureState:
 
         # Record the fork and choice
         self.state.last_fork = encounter.id
-        self.state.choice_history[encounter.id] = choice_id
+        self.state.writable("choice_history")[encounter.id] = choice_id
 
         # Emit choice event for profile hooks
         self._emit_event(EVENT_CHOICE_MADE, {
@@ -624,54 +637,141 @@ class AdventureState:
             "message": f"Restarting {chapter.title}...",
         }
 
-    def save(self) -> None:
-        """Save current state to disk."""
+    def snapshot(self) -> PlayerState:
+        """Get an immutable, structurally shared snapshot of the player state.
+
+        Must be called on the thread that owns the state, since taking a
+        snapshot updates the live state's copy-on-write bookkeeping. The
+        snapshot itself is safe to hand to other threads (crack workers,
+        telemetry, save writers). O(1); compare its version with
+        state_version to check whether it is stale.
+        """
+        return self.state.snapshot()
+
+    @property
+    def state_version(self) -> int:
+        """Version of the live player state (changes on every mutation)."""
+        return self.state.version
+
+    def save(self, snapshot: PlayerState | None = None) -> None:
+        """Save current state to disk.
+
+        Uses the compact binary format unless save_path ends in ".json".
+        With a snapshot, safe to call from any thread; a snapshot older
+        than the one already on disk is skipped. Without one, the snapshot
+        is taken now, so the call must come from the thread that owns the
+        state (see snapshot()).
+
+        Args:
+            snapshot: State snapshot to write (taken now if not provided)
+        """
         if not self.save_path:
             return
 
-        self.save_path.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.save_path, "w") as f:
-            json.dump(self.state.model_dump(), f, indent=2)
+        snapshot = snapshot or self.snapshot()
+        with self._save_lock:
+            if snapshot.version < self._saved_version:
+                return
+
+            if self.save_path.suffix == ".json":
+                self._write_json(self.save_path, snapshot)
+            else:
+                self.save_path.parent.mkdir(parents=True, exist_ok=True)
+                data = encode_player_state(snapshot, self.graph)
+                tmp_path = self.save_path.with_name(self.save_path.name + ".tmp")
+                tmp_path.write_bytes(data)
+                tmp_path.replace(self.save_path)
+            self._saved_version = snapshot.version
+
+    def save_in_background(self) -> threading.Thread | None:
+        """Snapshot the state now and write it from a background thread.
+
+        Keeps save I/O off the frame loop. Call it from the thread that
+        owns the state; only the write happens on the background thread.
+
+        Returns:
+            The writer thread, or None if there is no save path
+        """
+        if not self.save_path:
+            return None
+
+        thread = threading.Thread(target=self.save, args=(self.snapshot(),), daemon=True)
+        thread.start()
+        return thread
+
+    def export_json(self, path: Path) -> None:
+        """Export current state as human-readable JSON.
+
+        Args:
+            path: Destination file path
+        """
+        self._write_json(path, self.snapshot())
+
+    @staticmethod
+    def _write_json(path: Path, state: PlayerState) -> None:
+        """Write a player state as indented JSON."""
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, "w") as f:
+            json.dump(state.model_dump(mode="json"), f, indent=2)
 
     @classmethod
-    def load(cls, campaign: Campaign, save_path: Path) -> "AdventureState":
+    def load(
+        cls, campaign: Campaign, save_path: Path, legacy_path: Path | None = None
+    ) -> "AdventureState":
         """Load state from disk.
 
+        Binary and JSON saves are both accepted, detected by content.
+
         Args:
             campaign: The campaign being played
-            save_path: Path to saved state
+            save_path: Path to saved state (also where future saves go)
+            legacy_path: Optional older save to read if save_path is missing
 
         Returns:
             AdventureState with loaded progress
+
+        Raises:
+            SaveFormatError: If a binary save is corrupt
         """
         instance = cls(campaign, save_path=save_path)
 
-        if save_path.exists():
-            with open(save_path) as f:
-                data = json.load(f)
-                instance.state = PlayerState.model_validate(data)
+        source = save_path
+        if not source.exists() and legacy_path is not None:
+            source = legacy_path
+
+        if source.exists():
+            data = source.read_bytes()
+            if is_binary_save(data):
+                instance.state = decode_player_state(data, instance.graph)
+            else:
+                instance.state = PlayerState.model_validate(json.loads(data))
 
         return instance
 
-    def get_progress_summary(self) -> dict:
+    def get_progress_summary(self, snapshot: PlayerState | None = None) -> dict:
         """Get a summary of current progress.
 
+        Args:
+            snapshot: Optional state snapshot to summarize instead of the
+                live state (lets the summary be built off-thread)
+
         Returns:
             Dict with progress stats
         """
-        total_encounters = sum(len(ch.encounters) for ch in self.campaign.chapters)
-        completed = len(self.state.completed_encounters)
+        state = snapshot or self.state
+        total_encounters = self.graph.encounter_count
+        completed = len(state.completed_encounters)
 
         return {
             "campaign": self.campaign.title,
-            "chapter": self.current_chapter.title,
-            "encounter": self.current_encounter.title,
+            "chapter": self._chapters[state.chapter_id].title,
+            "encounter": self._encounters[state.encounter_id].title,
             "progress": f"{completed}/{total_encounters}",
             "progress_pct": round(100 * completed / total_encounters) if total_encounters else 0,
-            "xp_earned": self.state.xp_earned,
-            "total_xp": self.state.total_xp,
-            "deaths": self.state.deaths,
-            "achievements": len(self.state.achievements),
+            "xp_earned": state.xp_earned,
+            "total_xp": state.total_xp,
+            "deaths": state.deaths,
+            "achievements": len(state.achievements),
             "achievement_points": self.achievement_manager.get_total_points(),
             "game_mode": self.game_mode,
         }
@@ -727,6 +827,12 @@ class AdventureState:
         delta = datetime.now(timezone.utc) - self._encounter_start_time
         return int(delta.total_seconds())
 
+    def _record_achievements(self, newly_unlocked: list[UnlockedAchievement]) -> None:
+        """Add newly unlocked achievements to the player state list."""
+        for u in newly_unlocked:
+            if u.achievement_id not in self.state.achievements:
+                self.state.writable("achievements").append(u.achievement_id)
+
     def _check_success_achievements(
         self, encounter: Encounter, is_first_crack: bool
     ) -> list[UnlockedAchievement]:
@@ -772,10 +878,7 @@ class AdventureState:
             )
             newly_unlocked.extend(unlocked)
 
-        # Update player state achievements list
-        for u in newly_unlocked:
-            if u.achievement_id not in self.state.achievements:
-                self.state.achievements.append(u.achievement_id)
+        self._record_achievements(newly_unlocked)
 
         return newly_unlocked
 
@@ -801,10 +904,7 @@ class AdventureState:
         )
         newly_unlocked.extend(unlocked)
 
-        # Update player state achievements list
-        for u in newly_unlocked:
-            if u.achievement_id not in self.state.achievements:
-                self.state.achievements.append(u.achievement_id)
+        self._record_achievements(newly_unlocked)
 
         return newly_unlocked
 
@@ -831,10 +931,7 @@ class AdventureState:
             )
             newly_unlocked.extend(unlocked)
 
-        # Update player state achievements list
-        for u in newly_unlocked:
-            if u.achievement_id not in self.state.achievements:
-                self.state.achievements.append(u.achievement_id)
+        self._record_achievements(newly_unlocked)
 
         return newly_unlocked
 
@@ -882,10 +979,7 @@ class AdventureState:
             )
             newly_unlocked.extend(unlocked)
 
-        # Update player state achievements list
-        for u in newly_unlocked:
-            if u.achievement_id not in self.state.achievements:
-                self.state.achievements.append(u.achievement_id)
+        self._record_achievements(newly_unlocked)
 
         return newly_unlocked
 
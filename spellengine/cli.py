@@ -4,6 +4,7 @@ SpellEngine CLI - Educational adventures for password security
 Usage:
     spellengine play [CAMPAIGN] [OPTIONS]
     spellengine list
+    spellengine backfill CAMPAIGN [SAVES...] [--apply]
     spellengine --version
     spellengine --help
 
@@ -263,28 +264,23 @@ def display_tool_check() -> tuple[str, dict]:
 
 
 def get_campaigns() -> list[dict]:
-    """Find all available campaigns."""
+    """Find all available campaigns.
+
+    Manifests come from the content indexer's parsed manifest cache, so
+    only manifests changed since the last index rebuild are read.
+    """
+    from spellengine.content.indexer import ContentIndexer
+
     campaigns = []
-    adventures_dir = CONTENT_ROOT / "adventures"
-
-    if not adventures_dir.exists():
-        return campaigns
-
-    for campaign_dir in adventures_dir.iterdir():
-        if campaign_dir.is_dir():
-            manifest = campaign_dir / "manifest.yaml"
-            if manifest.exists():
-                import yaml
-                with open(manifest) as f:
-                    data = yaml.safe_load(f)
-                    campaigns.append({
-                        "id": data.get("id", campaign_dir.name),
-                        "title": data.get("title", campaign_dir.name),
-                        "difficulty": data.get("difficulty", "unknown"),
-                        "duration": data.get("duration_minutes", "?"),
-                        "description": data.get("description", ""),
-                        "path": campaign_dir,
-                    })
+    for campaign_dir, data in ContentIndexer(CONTENT_ROOT).manifests("adventures"):
+        campaigns.append({
+            "id": data.get("id", campaign_dir.name),
+            "title": data.get("title", campaign_dir.name),
+            "difficulty": data.get("difficulty", "unknown"),
+            "duration": data.get("duration_minutes", "?"),
+            "description": data.get("description", ""),
+            "path": campaign_dir,
+        })
 
     return campaigns
 
@@ -433,6 +429,49 @@ def cmd_selftest(args: argparse.Namespace) -> int:
     return 0 if all_passed else 1
 
 
+def cmd_backfill(args: argparse.Namespace) -> int:
+    """Evaluate new achievements retroactively over existing saves."""
+    from spellengine.adventures.backfill import BackfillReport, backfill_saves
+    from spellengine.adventures.loader import load_campaign
+
+    campaigns = get_campaigns()
+    campaign = next((c for c in campaigns if c["id"] == args.campaign), None)
+    if not campaign:
+        print(f"Campaign not found: {args.campaign}")
+        return 1
+
+    campaign_file = campaign["path"] / "campaign.yaml"
+    if not campaign_file.exists():
+        print(f"Campaign file not found: {campaign_file}")
+        return 1
+    loaded_campaign = load_campaign(campaign_file)
+
+    save_paths = args.saves or [Path.home() / ".patternforge" / "saves"]
+    report = BackfillReport()
+    for result in backfill_saves(
+        loaded_campaign, save_paths, apply=args.apply, workers=args.workers
+    ):
+        report.add(result)
+        if args.verbose and (result.unlocked or result.error):
+            detail = result.error or ", ".join(result.unlocked)
+            print(f"  {result.path}: {detail}")
+
+    if args.json:
+        print(json.dumps(report.to_dict(), indent=2))
+        return 0 if not report.errors else 1
+
+    verb = "Unlocked" if args.apply else "Would unlock"
+    print(f"Scanned {report.saves} saves, {report.changed} with new achievements")
+    for achievement_id, count in report.unlocks.most_common():
+        print(f"  {verb} {achievement_id}: {count}")
+    if args.apply:
+        print(f"Updated {report.applied} saves")
+    for path, error in report.errors:
+        print(f"  [ERROR] {path}: {error}")
+
+    return 0 if not report.errors else 1
+
+
 def cmd_play(args: argparse.Namespace) -> int:
     """Play a campaign."""
     campaign_id = args.campaign
@@ -635,6 +674,44 @@ def main(argv: list[str] | None = None) -> int:
     )
     export_parser.set_defaults(func=cmd_export)
 
+    # backfill command
+    backfill_parser = subparsers.add_parser(
+        "backfill",
+        help="Award new achievements retroactively from existing saves",
+    )
+    backfill_parser.add_argument(
+        "campaign",
+        help="Campaign ID the saves belong to (e.g., dread_citadel)",
+    )
+    backfill_parser.add_argument(
+        "saves",
+        nargs="*",
+        type=Path,
+        help="Save files or directories (default: ~/.patternforge/saves)",
+    )
+    backfill_parser.add_argument(
+        "--apply",
+        action="store_true",
+        help="Write unlocked achievements back into the saves",
+    )
+    backfill_parser.add_argument(
+        "--workers", "-w",
+        type=int,
+        default=None,
+        help="Worker processes (default: CPU count)",
+    )
+    backfill_parser.add_argument(
+        "--json",
+        action="store_true",
+        help="Print the report as JSON",
+    )
+    backfill_parser.add_argument(
+        "--verbose", "-v",
+        action="store_true",
+        help="List each save that changes",
+    )
+    backfill_parser.set_defaults(func=cmd_backfill)
+
     # Parse args
     args = parser.parse_args(argv)
 
@@ -4,6 +4,15 @@ SpellEngine Content Management
 PROPRIETARY - All Rights Reserved
 """
 
+from .backends import IndexBackend, JsonBackend, SqliteBackend
 from .indexer import ContentIndexer, rebuild_index, validate_content, find_content
 
-__all__ = ["ContentIndexer", "rebuild_index", "validate_content", "find_content"]
+__all__ = [
+    "ContentIndexer",
+    "IndexBackend",
+    "JsonBackend",
+    "SqliteBackend",
+    "rebuild_index",
+    "validate_content",
+    "find_content",
+]
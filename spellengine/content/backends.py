@@ -0,0 +1,541 @@
+"""
+Content Index Storage Backends for SpellEngine
+
+Where ContentIndexer keeps the index and how it answers queries:
+
+- JsonBackend: index.json loaded whole, queried through the in-memory
+  SearchIndex. The default, and the right choice for small installs.
+- SqliteBackend: index.sqlite, with indexed columns for the discovery
+  fields and an FTS5 (trigram) table over title, description and tags.
+  find(), get() and stats() run as SQL, so queries never load the
+  whole library into memory.
+
+PROPRIETARY - All Rights Reserved
+"""
+
+from __future__ import annotations
+
+import json
+import sqlite3
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any
+
+from .search import SEARCH_INDEX_FILE, SearchIndex, index_digest, searchable_text
+
+INDEX_FILE = "index.json"
+SQLITE_INDEX_FILE = "index.sqlite"
+CONTENT_TYPES = ("adventures", "trainings")
+
+# Multi-valued entry fields stored one row per value
+VALUE_FIELDS = ("tags", "hash_types", "tools")
+
+# Bumped whenever the SQLite schema changes; older files are rebuilt
+SQLITE_SCHEMA_VERSION = 2
+
+
+def empty_index() -> dict[str, Any]:
+    """Return empty index structure."""
+    return {
+        "version": "1.0.0",
+        "generated": None,
+        "schema_version": "1.0.0",
+        "adventures": [],
+        "trainings": [],
+        # Item path -> manifest {"mtime_ns", "size", "digest"}
+        "manifests": {},
+    }
+
+
+def empty_stats() -> dict[str, Any]:
+    """Return empty statistics structure."""
+    return {
+        "total": 0,
+        "by_type": {content_type: 0 for content_type in CONTENT_TYPES},
+        "by_difficulty": {},
+        "by_tag": {},
+        "by_hash_type": {},
+    }
+
+
+class IndexBackend(ABC):
+    """Storage and queries for the content index.
+
+    Attributes:
+        path: File the index is stored in
+    """
+
+    path: Path
+
+    @abstractmethod
+    def exists(self) -> bool:
+        """Whether an index has been saved."""
+
+    @abstractmethod
+    def load(self) -> dict[str, Any]:
+        """Read the whole index (empty structure if none is saved)."""
+
+    @abstractmethod
+    def save(self, index: dict[str, Any]) -> None:
+        """Replace the stored index."""
+
+    @abstractmethod
+    def find(
+        self,
+        content_type: str | None = None,
+        difficulty: str | None = None,
+        tags: list[str] | None = None,
+        hash_types: list[str] | None = None,
+        max_duration: int | None = None,
+        search: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Find entries matching every given filter, in index order.
+
+        Args:
+            content_type: Section name ("adventures" or "trainings")
+            difficulty: Exact difficulty
+            tags: Entries must have all of these tags
+            hash_types: Entries must have at least one of these hash types
+            max_duration: Longest duration in minutes (untimed entries match)
+            search: Case-insensitive substring of title, description or tags
+        """
+
+    @abstractmethod
+    def get(self, content_id: str) -> dict[str, Any] | None:
+        """Look up an entry by ID."""
+
+    @abstractmethod
+    def stats(self) -> dict[str, Any]:
+        """Counts by type, difficulty, tag and hash type."""
+
+
+# =============================================================================
+# JSON
+# =============================================================================
+
+
+class JsonBackend(IndexBackend):
+    """index.json plus the persisted SearchIndex built from it."""
+
+    def __init__(self, content_root: Path):
+        self.content_root = Path(content_root)
+        self.path = self.content_root / INDEX_FILE
+        self.search_path = self.content_root / SEARCH_INDEX_FILE
+        self._index: dict[str, Any] | None = None
+        self._index_digest: str | None = None
+        self._search: SearchIndex | None = None
+
+    def exists(self) -> bool:
+        return self.path.exists()
+
+    @property
+    def index(self) -> dict[str, Any]:
+        """Lazy-load index from disk."""
+        if self._index is None:
+            self._index = self.load()
+        return self._index
+
+    def load(self) -> dict[str, Any]:
+        if self.path.exists():
+            with open(self.path, "rb") as f:
+                data = f.read()
+            self._index_digest = index_digest(data)
+            return json.loads(data)
+        self._index_digest = None
+        return empty_index()
+
+    def save(self, index: dict[str, Any]) -> None:
+        """Save index to disk (atomically) along with its search index."""
+        data = json.dumps(index, indent=2).encode("utf-8")
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        tmp_path.write_bytes(data)
+        tmp_path.replace(self.path)
+        self._index = index
+        self._index_digest = index_digest(data)
+        self._search = SearchIndex.from_index(index, CONTENT_TYPES)
+        self._save_search_index(self._search)
+
+    @property
+    def search_index(self) -> SearchIndex:
+        """Query structures for the loaded index, built or loaded once."""
+        if self._search is None:
+            index = self.index
+            search = None
+            if self._index_digest is not None:
+                search = SearchIndex.load(
+                    self.search_path, index, self._index_digest, CONTENT_TYPES
+                )
+            if search is None:
+                search = SearchIndex.from_index(index, CONTENT_TYPES)
+                if self._index_digest is not None:
+                    self._save_search_index(search)
+            self._search = search
+        return self._search
+
+    def _save_search_index(self, search: SearchIndex) -> None:
+        """Persist query structures next to index.json (best effort)."""
+        try:
+            search.save(self.search_path, self._index_digest)
+        except OSError:
+            pass
+
+    def find(
+        self,
+        content_type: str | None = None,
+        difficulty: str | None = None,
+        tags: list[str] | None = None,
+        hash_types: list[str] | None = None,
+        max_duration: int | None = None,
+        search: str | None = None,
+    ) -> list[dict[str, Any]]:
+        return self.search_index.find(
+            content_type, difficulty, tags, hash_types, max_duration, search
+        )
+
+    def get(self, content_id: str) -> dict[str, Any] | None:
+        return self.search_index.get(content_id)
+
+    def stats(self) -> dict[str, Any]:
+        stats = empty_stats()
+
+        for content_type in CONTENT_TYPES:
+            items = self.index.get(content_type, [])
+            count = len(items)
+            stats["by_type"][content_type] = count
+            stats["total"] += count
+
+            for item in items:
+                # Difficulty
+                diff = item.get("difficulty", "unknown")
+                stats["by_difficulty"][diff] = stats["by_difficulty"].get(diff, 0) + 1
+
+                # Tags
+                for tag in item.get("tags", []):
+                    stats["by_tag"][tag] = stats["by_tag"].get(tag, 0) + 1
+
+                # Hash types
+                for ht in item.get("hash_types", []):
+                    stats["by_hash_type"][ht] = stats["by_hash_type"].get(ht, 0) + 1
+
+        return stats
+
+
+# =============================================================================
+# SQLite
+# =============================================================================
+
+SQLITE_SCHEMA = """
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE items (
+    pos INTEGER PRIMARY KEY,
+    section TEXT NOT NULL,
+    id TEXT,
+    path TEXT NOT NULL,
+    difficulty,
+    duration_minutes INTEGER,
+    entry TEXT NOT NULL
+);
+CREATE INDEX items_id ON items (id);
+CREATE INDEX items_section ON items (section);
+CREATE INDEX items_difficulty ON items (difficulty);
+CREATE INDEX items_duration ON items (duration_minutes);
+CREATE TABLE item_values (field TEXT NOT NULL, value TEXT NOT NULL, pos INTEGER NOT NULL);
+CREATE INDEX item_values_lookup ON item_values (field, value, pos);
+CREATE TABLE manifests (
+    path TEXT PRIMARY KEY,
+    mtime_ns INTEGER,
+    size INTEGER,
+    digest TEXT,
+    issues TEXT
+);
+"""
+
+# Full-text table; trigram tokens make MATCH a substring search
+SQLITE_FTS_SCHEMA = (
+    "CREATE VIRTUAL TABLE items_text USING fts5(title, description, tags, tokenize='trigram')"
+)
+
+# Same columns without FTS5 (SQLite older than 3.34 or built without it)
+SQLITE_PLAIN_TEXT_SCHEMA = (
+    "CREATE TABLE items_text (rowid INTEGER PRIMARY KEY, title TEXT, description TEXT, tags TEXT)"
+)
+
+# Index-level keys kept in the meta table
+META_KEYS = ("version", "generated", "schema_version")
+
+
+def _like_pattern(text: str) -> str:
+    """LIKE pattern matching text anywhere (escape character is backslash)."""
+    escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+class SqliteBackend(IndexBackend):
+    """index.sqlite, queried with SQL.
+
+    The connection is opened on first use. Entries are stored as JSON
+    alongside the columns queries filter on, so a query only decodes the
+    rows it returns.
+
+    Substring search uses the FTS5 trigram index for queries of three or
+    more characters and confirms each hit against the same text the JSON
+    backend searches. A match must fall within one of title, description
+    or tags.
+    """
+
+    def __init__(self, content_root: Path):
+        self.content_root = Path(content_root)
+        self.path = self.content_root / SQLITE_INDEX_FILE
+        self._conn: sqlite3.Connection | None = None
+        self._fts: bool | None = None
+
+    def exists(self) -> bool:
+        return self.path.exists() and self._connection() is not None
+
+    def _connection(self) -> sqlite3.Connection | None:
+        """Open the database on first use (None if there is no current one)."""
+        if self._conn is None and self.path.exists():
+            conn = sqlite3.connect(self.path)
+            if conn.execute("PRAGMA user_version").fetchone()[0] != SQLITE_SCHEMA_VERSION:
+                conn.close()
+                return None
+            self._conn = conn
+            self._fts = self._meta(conn).get("fts") == "1"
+        return self._conn
+
+    def close(self) -> None:
+        """Close the connection (reopened on next use)."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    @staticmethod
+    def _meta(conn: sqlite3.Connection) -> dict[str, Any]:
+        return dict(conn.execute("SELECT key, value FROM meta"))
+
+    # -------------------------------------------------------------------------
+    # Storage
+    # -------------------------------------------------------------------------
+
+    def load(self) -> dict[str, Any]:
+        index = empty_index()
+        conn = self._connection()
+        if conn is None:
+            return index
+
+        meta = self._meta(conn)
+        for key in META_KEYS:
+            if key in meta:
+                index[key] = json.loads(meta[key])
+        for section, entry in conn.execute("SELECT section, entry FROM items ORDER BY pos"):
+            index[section].append(json.loads(entry))
+        index["manifests"] = {}
+        for path, mtime_ns, size, digest, issues in conn.execute(
+            "SELECT path, mtime_ns, size, digest, issues FROM manifests ORDER BY rowid"
+        ):
+            record = {"mtime_ns": mtime_ns, "size": size, "digest": digest}
+            if issues is not None:
+                record["issues"] = json.loads(issues)
+            index["manifests"][path] = record
+        return index
+
+    def save(self, index: dict[str, Any]) -> None:
+        """Rewrite every table in one transaction."""
+        conn = self._connection()
+        if conn is None:
+            # Missing or written by an older schema
+            self.path.unlink(missing_ok=True)
+            conn = sqlite3.connect(self.path)
+            self._fts = self._create_schema(conn)
+            self._conn = conn
+        with conn:
+            for table in ("meta", "items", "item_values", "manifests", "items_text"):
+                conn.execute(f"DELETE FROM {table}")
+            self._insert(conn, index)
+
+    @staticmethod
+    def _create_schema(conn: sqlite3.Connection) -> bool:
+        """Create tables in a new database.
+
+        Returns:
+            Whether the text table is an FTS5 index
+        """
+        for statement in SQLITE_SCHEMA.split(";"):
+            if statement.strip():
+                conn.execute(statement)
+        try:
+            conn.execute(SQLITE_FTS_SCHEMA)
+            fts = True
+        except sqlite3.OperationalError:
+            conn.execute(SQLITE_PLAIN_TEXT_SCHEMA)
+            fts = False
+        conn.execute(f"PRAGMA user_version = {SQLITE_SCHEMA_VERSION}")
+        conn.commit()
+        return fts
+
+    def _insert(self, conn: sqlite3.Connection, index: dict[str, Any]) -> None:
+        """Insert every row of index."""
+        conn.execute("INSERT INTO meta VALUES ('fts', ?)", ("1" if self._fts else "0",))
+        conn.executemany(
+            "INSERT INTO meta VALUES (?, ?)",
+            [(key, json.dumps(index.get(key))) for key in META_KEYS],
+        )
+
+        items, values, texts = [], [], []
+        pos = 0
+        for section in CONTENT_TYPES:
+            for entry in index.get(section, []):
+                items.append((
+                    pos,
+                    section,
+                    entry.get("id"),
+                    entry["path"],
+                    entry.get("difficulty"),
+                    entry.get("duration_minutes"),
+                    json.dumps(entry),
+                ))
+                for field in VALUE_FIELDS:
+                    field_values = entry.get(field)
+                    if field_values is None:
+                        continue
+                    if not isinstance(field_values, list):
+                        field_values = [field_values]
+                    values.extend((field, str(value), pos) for value in field_values)
+                texts.append((
+                    pos,
+                    entry.get("title") or "",
+                    entry.get("description") or "",
+                    " ".join(entry.get("tags") or []),
+                ))
+                pos += 1
+
+        conn.executemany("INSERT INTO items VALUES (?, ?, ?, ?, ?, ?, ?)", items)
+        conn.executemany("INSERT INTO item_values VALUES (?, ?, ?)", values)
+        conn.executemany(
+            "INSERT INTO items_text (rowid, title, description, tags) VALUES (?, ?, ?, ?)",
+            texts,
+        )
+        conn.executemany(
+            "INSERT INTO manifests VALUES (?, ?, ?, ?, ?)",
+            [
+                (
+                    path,
+                    m.get("mtime_ns"),
+                    m.get("size"),
+                    m.get("digest"),
+                    json.dumps(m["issues"]) if "issues" in m else None,
+                )
+                for path, m in index.get("manifests", {}).items()
+            ],
+        )
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def find(
+        self,
+        content_type: str | None = None,
+        difficulty: str | None = None,
+        tags: list[str] | None = None,
+        hash_types: list[str] | None = None,
+        max_duration: int | None = None,
+        search: str | None = None,
+    ) -> list[dict[str, Any]]:
+        conn = self._connection()
+        if conn is None:
+            return []
+
+        where: list[str] = []
+        params: list[Any] = []
+        if content_type:
+            where.append("section = ?")
+            params.append(content_type)
+        if difficulty:
+            where.append("difficulty = ?")
+            params.append(difficulty)
+        for tag in tags or []:
+            where.append(
+                "pos IN (SELECT pos FROM item_values WHERE field = 'tags' AND value = ?)"
+            )
+            params.append(tag)
+        if hash_types:
+            marks = ", ".join("?" * len(hash_types))
+            where.append(
+                "pos IN (SELECT pos FROM item_values"
+                f" WHERE field = 'hash_types' AND value IN ({marks}))"
+            )
+            params.extend(hash_types)
+        if max_duration:
+            where.append(
+                "(duration_minutes IS NULL OR duration_minutes = 0 OR duration_minutes <= ?)"
+            )
+            params.append(max_duration)
+        if search:
+            search = search.lower()
+            if self._fts and len(search) >= 3:
+                where.append("pos IN (SELECT rowid FROM items_text WHERE items_text MATCH ?)")
+                params.append('"' + search.replace('"', '""') + '"')
+            else:
+                where.append(
+                    "pos IN (SELECT rowid FROM items_text WHERE title LIKE ? ESCAPE '\\'"
+                    " OR description LIKE ? ESCAPE '\\' OR tags LIKE ? ESCAPE '\\')"
+                )
+                params.extend([_like_pattern(search)] * 3)
+
+        sql = "SELECT entry FROM items"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        sql += " ORDER BY pos"
+
+        results = [json.loads(entry) for (entry,) in conn.execute(sql, params)]
+        if search:
+            # FTS and LIKE fold case differently from str.lower(); confirm
+            results = [item for item in results if search in searchable_text(item)]
+        return results
+
+    def get(self, content_id: str) -> dict[str, Any] | None:
+        conn = self._connection()
+        if conn is None:
+            return None
+        row = conn.execute(
+            "SELECT entry FROM items WHERE id = ? ORDER BY pos LIMIT 1", (content_id,)
+        ).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def stats(self) -> dict[str, Any]:
+        stats = empty_stats()
+        conn = self._connection()
+        if conn is None:
+            return stats
+
+        for section, count in conn.execute("SELECT section, COUNT(*) FROM items GROUP BY section"):
+            stats["by_type"][section] = count
+            stats["total"] += count
+        stats["by_difficulty"] = dict(
+            conn.execute("SELECT difficulty, COUNT(*) FROM items GROUP BY difficulty")
+        )
+        for field, key in (("tags", "by_tag"), ("hash_types", "by_hash_type")):
+            stats[key] = dict(conn.execute(
+                "SELECT value, COUNT(*) FROM item_values WHERE field = ? GROUP BY value",
+                (field,),
+            ))
+        return stats
+
+
+# Backend name -> class, for ContentIndexer(backend="...") and the CLI
+BACKENDS: dict[str, type[IndexBackend]] = {
+    "json": JsonBackend,
+    "sqlite": SqliteBackend,
+}
+
+
+def open_backend(name: str, content_root: Path) -> IndexBackend:
+    """Create the named backend for a content root."""
+    try:
+        backend = BACKENDS[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown index backend: {name!r} (expected one of: {', '.join(BACKENDS)})"
+        ) from None
+    return backend(content_root)
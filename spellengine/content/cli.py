@@ -6,6 +6,8 @@ Usage:
     python -m spellengine.content.cli validate
     python -m spellengine.content.cli find --tag=hashcat --difficulty=beginner
     python -m spellengine.content.cli stats
+    python -m spellengine.content.cli --backend=sqlite rebuild
+    python -m spellengine.content.cli grade -o grades.csv --binary grades.segt
 
 PROPRIETARY - All Rights Reserved
 """
@@ -17,13 +19,20 @@ import json
 import sys
 from pathlib import Path
 
-from .indexer import ContentIndexer
+from .backends import BACKENDS
+from .grading import (
+    BinaryGradeWriter,
+    CsvGradeWriter,
+    grade_library,
+    indexed_adventures,
+)
+from .indexer import DEFAULT_BACKEND, ContentIndexer
 
 
 def cmd_rebuild(args: argparse.Namespace) -> int:
     """Rebuild the content index."""
-    indexer = ContentIndexer(args.content_root)
-    index = indexer.rebuild()
+    indexer = ContentIndexer(args.content_root, backend=args.backend)
+    index = indexer.rebuild(workers=args.workers)
 
     adventures = len(index.get("adventures", []))
     trainings = len(index.get("trainings", []))
@@ -36,7 +45,7 @@ def cmd_rebuild(args: argparse.Namespace) -> int:
 
 def cmd_validate(args: argparse.Namespace) -> int:
     """Validate all content manifests."""
-    indexer = ContentIndexer(args.content_root)
+    indexer = ContentIndexer(args.content_root, backend=args.backend)
     issues = indexer.validate()
 
     if not issues:
@@ -63,7 +72,7 @@ def cmd_validate(args: argparse.Namespace) -> int:
 
 def cmd_find(args: argparse.Namespace) -> int:
     """Find content matching filters."""
-    indexer = ContentIndexer(args.content_root)
+    indexer = ContentIndexer(args.content_root, backend=args.backend)
 
     filters = {}
     if args.type:
@@ -106,7 +115,7 @@ def cmd_find(args: argparse.Namespace) -> int:
 
 def cmd_stats(args: argparse.Namespace) -> int:
     """Show content statistics."""
-    indexer = ContentIndexer(args.content_root)
+    indexer = ContentIndexer(args.content_root, backend=args.backend)
     stats = indexer.stats()
 
     print(f"Total content items: {stats['total']}")
@@ -139,7 +148,7 @@ def cmd_stats(args: argparse.Namespace) -> int:
 
 def cmd_get(args: argparse.Namespace) -> int:
     """Get details for a specific content item."""
-    indexer = ContentIndexer(args.content_root)
+    indexer = ContentIndexer(args.content_root, backend=args.backend)
     item = indexer.get(args.id)
 
     if not item:
@@ -168,6 +177,45 @@ def cmd_get(args: argparse.Namespace) -> int:
     return 0
 
 
+def cmd_grade(args: argparse.Namespace) -> int:
+    """Grade every indexed adventure into a per-encounter, per-dimension table."""
+    indexer = ContentIndexer(args.content_root, backend=args.backend)
+    items = indexer.find(content_type="adventures")
+    if args.id:
+        items = [item for item in items if item["id"] in args.id]
+    adventures = indexed_adventures(items, indexer.content_root)
+
+    csv_file = open(args.output, "w", newline="") if args.output != "-" else sys.stdout
+    binary_file = open(args.binary, "wb") if args.binary else None
+    writers: list = [CsvGradeWriter(csv_file)]
+    if binary_file:
+        writers.append(BinaryGradeWriter(binary_file))
+
+    graded = encounters = failed = 0
+    try:
+        for scores in grade_library(adventures, workers=args.workers):
+            if scores.error:
+                failed += 1
+                print(f"ERROR [{scores.adventure_id}]: {scores.error}", file=sys.stderr)
+                continue
+            for writer in writers:
+                writer.write(scores)
+            graded += 1
+            encounters += len(scores.encounter_ids)
+    finally:
+        if csv_file is not sys.stdout:
+            csv_file.close()
+        if binary_file:
+            binary_file.close()
+
+    print(
+        f"Graded {graded} adventure(s), {encounters} encounters"
+        + (f", {failed} failed" if failed else ""),
+        file=sys.stderr,
+    )
+    return 1 if failed else 0
+
+
 def main(argv: list[str] | None = None) -> int:
     """Main CLI entry point."""
     parser = argparse.ArgumentParser(
@@ -179,11 +227,20 @@ def main(argv: list[str] | None = None) -> int:
         type=Path,
         help="Content root directory (default: auto-detect)",
     )
+    parser.add_argument(
+        "--backend",
+        choices=sorted(BACKENDS),
+        default=DEFAULT_BACKEND,
+        help=f"Index storage backend (default: {DEFAULT_BACKEND})",
+    )
 
     subparsers = parser.add_subparsers(dest="command", required=True)
 
     # rebuild
     p_rebuild = subparsers.add_parser("rebuild", help="Rebuild content index")
+    p_rebuild.add_argument(
+        "-j", "--workers", type=int, help="Worker processes (default: CPU count)"
+    )
     p_rebuild.set_defaults(func=cmd_rebuild)
 
     # validate
@@ -213,6 +270,18 @@ def main(argv: list[str] | None = None) -> int:
     p_get.add_argument("--json", action="store_true")
     p_get.set_defaults(func=cmd_get)
 
+    # grade
+    p_grade = subparsers.add_parser("grade", help="Grade all indexed adventures")
+    p_grade.add_argument(
+        "-o", "--output", default="-", help="CSV output file (default: stdout)"
+    )
+    p_grade.add_argument("--binary", type=Path, help="Also write a compact binary table")
+    p_grade.add_argument("--id", action="append", help="Only grade these adventure IDs")
+    p_grade.add_argument(
+        "-j", "--workers", type=int, help="Worker processes (default: CPU count)"
+    )
+    p_grade.set_defaults(func=cmd_grade)
+
     args = parser.parse_args(argv)
     return args.func(args)
 
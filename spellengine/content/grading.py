@@ -0,0 +1,278 @@
+"""
+Library-wide Grading for SpellEngine
+
+Grades every indexed adventure with the experience grader and writes the
+results as a long-format table: one row per encounter and dimension.
+
+    adventure_id, chapter_id, encounter_id, position, dimension, score
+
+Adventures are graded in worker processes. Each worker reduces its grades
+to a compact AdventureScores block (IDs plus one byte per score) before
+returning, and blocks are written as they arrive, so neither the grade
+objects nor the whole table are ever held in memory.
+
+The optional binary form stores the same table as a sequence of columnar
+blocks (LEB128 varints, like the binary save format):
+
+    magic (4) | version (1) | dimension count | dimension names
+    per adventure: adventure id | encounter count | chapter ids |
+                   chapter index column | encounter id column |
+                   one score byte column per dimension
+
+PROPRIETARY - All Rights Reserved
+"""
+
+from __future__ import annotations
+
+import csv
+import os
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, BinaryIO, TextIO
+
+from spellengine.adventures.experience_grading import GradingDimension, grade_chapter
+from spellengine.adventures.loader import load_campaign
+
+GRADE_COLUMNS = ("adventure_id", "chapter_id", "encounter_id", "position", "dimension", "score")
+DIMENSIONS = tuple(d.value for d in GradingDimension)
+CAMPAIGN_FILE = "campaign.yaml"
+
+GRADE_TABLE_MAGIC = b"SEGT"
+GRADE_TABLE_VERSION = 1
+
+
+class GradeTableError(ValueError):
+    """Raised when a binary grade table cannot be decoded."""
+
+
+# =============================================================================
+# Grading
+# =============================================================================
+
+
+@dataclass
+class AdventureScores:
+    """Dimension scores for every encounter of one adventure.
+
+    Attributes:
+        adventure_id: Indexed content ID
+        chapter_ids: Chapter IDs in campaign order
+        chapters: Chapter index per encounter
+        encounter_ids: Encounter IDs in campaign order
+        scores: One bytes column per dimension (DIMENSIONS order)
+        error: Why the adventure could not be graded, if it couldn't
+    """
+
+    adventure_id: str
+    chapter_ids: list[str] = field(default_factory=list)
+    chapters: list[int] = field(default_factory=list)
+    encounter_ids: list[str] = field(default_factory=list)
+    scores: list[bytes] = field(default_factory=list)
+    error: str | None = None
+
+    def rows(self) -> Iterator[tuple[str, str, str, int, str, int]]:
+        """Yield table rows, encounter-major."""
+        for i, encounter_id in enumerate(self.encounter_ids):
+            chapter_id = self.chapter_ids[self.chapters[i]]
+            for dimension, column in zip(DIMENSIONS, self.scores):
+                yield self.adventure_id, chapter_id, encounter_id, i, dimension, column[i]
+
+
+def grade_adventure(adventure_id: str, campaign_path: Path) -> AdventureScores:
+    """Grade one adventure and reduce the grades to score columns.
+
+    Args:
+        adventure_id: Indexed content ID
+        campaign_path: Path to the adventure's campaign file
+
+    Returns:
+        AdventureScores (with error set if loading or grading failed)
+    """
+    result = AdventureScores(adventure_id)
+    try:
+        campaign = load_campaign(campaign_path)
+        columns = [bytearray() for _ in DIMENSIONS]
+        for chapter_index, chapter in enumerate(campaign.chapters):
+            result.chapter_ids.append(chapter.id)
+            for grade in grade_chapter(chapter, chapter_index).encounter_grades:
+                result.chapters.append(chapter_index)
+                result.encounter_ids.append(grade.encounter_id)
+                for column, dimension in zip(columns, DIMENSIONS):
+                    column.append(getattr(grade, dimension))
+        result.scores = [bytes(c) for c in columns]
+    except Exception as e:
+        # One broken adventure shouldn't stop a library run
+        result.error = f"{type(e).__name__}: {e}"
+    return result
+
+
+def _grade_entry(args: tuple[str, Path]) -> AdventureScores:
+    """Process pool entry point."""
+    return grade_adventure(*args)
+
+
+def indexed_adventures(
+    items: Iterable[dict[str, Any]], content_root: Path
+) -> Iterator[tuple[str, Path]]:
+    """Resolve index entries to (adventure_id, campaign_path) pairs."""
+    for item in items:
+        yield item["id"], content_root / item["path"] / CAMPAIGN_FILE
+
+
+def grade_library(
+    adventures: Iterable[tuple[str, Path]],
+    workers: int | None = None,
+) -> Iterator[AdventureScores]:
+    """Grade many adventures in parallel, yielding results in input order.
+
+    Args:
+        adventures: (adventure_id, campaign_path) pairs (consumed lazily)
+        workers: Worker processes (defaults to the CPU count; 0 or 1 runs
+            in-process)
+
+    Yields:
+        One AdventureScores per adventure
+    """
+    workers = (os.cpu_count() or 1) if workers is None else workers
+
+    if workers <= 1:
+        for adventure in adventures:
+            yield _grade_entry(adventure)
+        return
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        # Keep a bounded window in flight so results stream in order
+        pending: list[Future] = []
+        for adventure in adventures:
+            pending.append(pool.submit(_grade_entry, adventure))
+            if len(pending) >= workers * 2:
+                yield pending.pop(0).result()
+        for future in pending:
+            yield future.result()
+
+
+# =============================================================================
+# Output
+# =============================================================================
+
+
+class CsvGradeWriter:
+    """Writes grade tables as CSV."""
+
+    def __init__(self, stream: TextIO) -> None:
+        self._writer = csv.writer(stream, lineterminator="\n")
+        self._writer.writerow(GRADE_COLUMNS)
+
+    def write(self, scores: AdventureScores) -> None:
+        """Append one adventure's rows."""
+        self._writer.writerows(scores.rows())
+
+
+def _uint(buf: bytearray, value: int) -> None:
+    while value > 0x7F:
+        buf.append((value & 0x7F) | 0x80)
+        value >>= 7
+    buf.append(value)
+
+
+def _string(buf: bytearray, value: str) -> None:
+    data = value.encode("utf-8")
+    _uint(buf, len(data))
+    buf += data
+
+
+class BinaryGradeWriter:
+    """Writes grade tables in the compact columnar binary form."""
+
+    def __init__(self, stream: BinaryIO) -> None:
+        self._stream = stream
+        header = bytearray(GRADE_TABLE_MAGIC)
+        header.append(GRADE_TABLE_VERSION)
+        _uint(header, len(DIMENSIONS))
+        for dimension in DIMENSIONS:
+            _string(header, dimension)
+        stream.write(header)
+
+    def write(self, scores: AdventureScores) -> None:
+        """Append one adventure's block."""
+        buf = bytearray()
+        _string(buf, scores.adventure_id)
+        _uint(buf, len(scores.encounter_ids))
+        _uint(buf, len(scores.chapter_ids))
+        for chapter_id in scores.chapter_ids:
+            _string(buf, chapter_id)
+        for chapter in scores.chapters:
+            _uint(buf, chapter)
+        for encounter_id in scores.encounter_ids:
+            _string(buf, encounter_id)
+        for column in scores.scores:
+            buf += column
+        self._stream.write(buf)
+
+
+class _Reader:
+    """Sequential varint reader over a byte buffer."""
+
+    def __init__(self, data: bytes) -> None:
+        self.data = data
+        self.pos = 0
+
+    def uint(self) -> int:
+        result = shift = 0
+        while True:
+            if self.pos >= len(self.data):
+                raise GradeTableError("Truncated grade table")
+            byte = self.data[self.pos]
+            self.pos += 1
+            result |= (byte & 0x7F) << shift
+            if not byte & 0x80:
+                return result
+            shift += 7
+
+    def bytes(self, size: int) -> bytes:
+        if self.pos + size > len(self.data):
+            raise GradeTableError("Truncated grade table")
+        value = self.data[self.pos:self.pos + size]
+        self.pos += size
+        return value
+
+    def string(self) -> str:
+        return self.bytes(self.uint()).decode("utf-8")
+
+
+def read_grade_table(data: bytes) -> Iterator[AdventureScores]:
+    """Decode a binary grade table.
+
+    Args:
+        data: Contents of a file written by BinaryGradeWriter
+
+    Yields:
+        One AdventureScores per adventure block
+
+    Raises:
+        GradeTableError: If the data is not a supported grade table
+    """
+    if data[:4] != GRADE_TABLE_MAGIC:
+        raise GradeTableError("Not a grade table")
+    if data[4:5] != bytes([GRADE_TABLE_VERSION]):
+        raise GradeTableError(f"Unsupported grade table version: {data[4:5]!r}")
+
+    reader = _Reader(data)
+    reader.pos = 5
+    dimensions = tuple(reader.string() for _ in range(reader.uint()))
+    if dimensions != DIMENSIONS:
+        raise GradeTableError(f"Unexpected dimensions: {', '.join(dimensions)}")
+
+    while reader.pos < len(data):
+        adventure_id = reader.string()
+        count = reader.uint()
+        chapter_ids = [reader.string() for _ in range(reader.uint())]
+        yield AdventureScores(
+            adventure_id=adventure_id,
+            chapter_ids=chapter_ids,
+            chapters=[reader.uint() for _ in range(count)],
+            encounter_ids=[reader.string() for _ in range(count)],
+            scores=[reader.bytes(count) for _ in dimensions],
+        )
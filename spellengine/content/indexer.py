@@ -4,94 +4,339 @@ Content Indexer for SpellEngine
 Manages discovery and indexing of adventures and trainings at scale.
 Flat structure + queryable index for thousands of content items.
 
+The index records each manifest's mtime, size, digest and validation
+issues, so a rebuild only re-parses manifests that changed (parsing them
+in a process pool when there are many) and reuses every other entry
+as-is. Parsing, schema validation and indexing happen in that one pass;
+validate() reads the issues it recorded, and the parsed manifests are
+kept in a digest-keyed cache for consumers that need more than the
+index entry.
+
+Storage and queries go through a backend (see backends.py): index.json
+by default, or SQLite for large libraries.
+
 PROPRIETARY - All Rights Reserved
 """
 
 from __future__ import annotations
 
-import json
+import hashlib
+import os
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timezone
+from itertools import repeat
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+from .backends import CONTENT_TYPES, IndexBackend, empty_index, open_backend
+from .manifests import (
+    MANIFEST_CACHE_FILE,
+    ManifestCache,
+    compile_schema,
+    normalize_manifest,
+    schema_path,
+)
 
 # Default content root relative to project
 CONTENT_ROOT = Path(__file__).parent.parent.parent / "content"
-INDEX_FILE = "index.json"
 MANIFEST_FILE = "manifest.yaml"
-CONTENT_TYPES = ("adventures", "trainings")
+DEFAULT_BACKEND = "json"
+
+# Fields reported (as info) when missing
+RECOMMENDED_FIELDS = ("difficulty", "duration_minutes", "tags", "description")
+
+# Stale manifests needed before a rebuild parses them in a process pool
+PARALLEL_PARSE_THRESHOLD = 64
+
+
+def _manifest_digest(data: bytes) -> str:
+    """Content digest recorded for change detection."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def _manifest_issues(manifest: dict[str, Any], item_name: str, schema: str) -> list[dict[str, Any]]:
+    """Validate a parsed manifest against the schema and conventions."""
+    validator = compile_schema(schema)
+    issues = [
+        {
+            "item": item_name,
+            "severity": "error" if field in validator.required else "warning",
+            "message": message,
+        }
+        for field, message in validator.validate(manifest)
+    ]
+
+    # ID should match directory name
+    if "id" in manifest and manifest["id"] != item_name:
+        issues.append(
+            {
+                "item": item_name,
+                "severity": "warning",
+                "message": f"ID '{manifest.get('id')}' doesn't match directory name",
+            }
+        )
+
+    # Recommended fields
+    for field in RECOMMENDED_FIELDS:
+        if field not in manifest:
+            issues.append(
+                {
+                    "item": item_name,
+                    "severity": "info",
+                    "message": f"Missing recommended field: {field}",
+                }
+            )
+
+    return issues
+
+
+def _parse_manifest(
+    path: str, schema: str
+) -> tuple[dict[str, Any] | None, str, str | None, list[dict[str, Any]]]:
+    """Read, parse and validate one manifest (runs in worker processes).
+
+    Args:
+        path: Manifest file
+        schema: Schema file to validate against
+
+    Returns:
+        Tuple of (manifest or None, digest, error message or None, issues)
+    """
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError as e:
+        return None, "", str(e), []
+    digest = _manifest_digest(data)
+    try:
+        manifest = yaml.safe_load(data)
+    except yaml.YAMLError as e:
+        return None, digest, f"Invalid YAML: {e}", []
+    if not isinstance(manifest, dict):
+        return None, digest, "Manifest is not a mapping", []
+    manifest = normalize_manifest(manifest)
+    item_name = os.path.basename(os.path.dirname(path))
+    return manifest, digest, None, _manifest_issues(manifest, item_name, schema)
 
 
 class ContentIndexer:
-    """Indexes and queries SpellEngine content."""
+    """Indexes and queries SpellEngine content.
+
+    Args:
+        content_root: Content directory (default: the bundled content)
+        backend: Backend name ("json" or "sqlite") or an IndexBackend
+    """
 
-    def __init__(self, content_root: Path | None = None):
+    def __init__(
+        self,
+        content_root: Path | None = None,
+        backend: str | IndexBackend = DEFAULT_BACKEND,
+    ):
         self.content_root = Path(content_root) if content_root else CONTENT_ROOT
-        self.index_path = self.content_root / INDEX_FILE
+        if isinstance(backend, str):
+            backend = open_backend(backend, self.content_root)
+        self.backend = backend
+        self.index_path = backend.path
+        self.schema_path = schema_path(self.content_root)
+        self.manifest_cache = ManifestCache(self.content_root / MANIFEST_CACHE_FILE)
         self._index: dict[str, Any] | None = None
+        # Validation issues from the last rebuild pass
+        self.issues: list[dict[str, Any]] = []
 
     @property
     def index(self) -> dict[str, Any]:
-        """Lazy-load index from disk."""
+        """Lazy-load the whole index from the backend."""
         if self._index is None:
-            self._index = self._load_index()
+            self._index = self.backend.load()
         return self._index
 
-    def _load_index(self) -> dict[str, Any]:
-        """Load existing index or return empty structure."""
-        if self.index_path.exists():
-            with open(self.index_path) as f:
-                return json.load(f)
-        return self._empty_index()
-
     def _empty_index(self) -> dict[str, Any]:
         """Return empty index structure."""
-        return {
-            "version": "1.0.0",
-            "generated": None,
-            "schema_version": "1.0.0",
-            "adventures": [],
-            "trainings": [],
-        }
-
-    def rebuild(self) -> dict[str, Any]:
-        """Rebuild index from all manifest files."""
-        index = self._empty_index()
-        index["generated"] = datetime.now(timezone.utc).isoformat()
-
-        for content_type in CONTENT_TYPES:
-            type_dir = self.content_root / content_type
-            if not type_dir.exists():
+        return empty_index()
+
+    def _scan_manifests(
+        self, content_types: tuple[str, ...] = CONTENT_TYPES
+    ) -> tuple[dict[str, list[tuple[str, os.stat_result]]], list[str]]:
+        """Find every manifest of some content types, in directory name order.
+
+        Returns:
+            Tuple of (content type -> list of (item path, manifest stat),
+            item paths without a manifest), where item path is relative to
+            the content root (the entry's "path" field)
+        """
+        # Plain os.path here: pathlib dominates a no-op rebuild otherwise
+        root = str(self.content_root)
+        found: dict[str, list[tuple[str, os.stat_result]]] = {}
+        missing: list[str] = []
+        for content_type in content_types:
+            type_dir = os.path.join(root, content_type)
+            items = found[content_type] = []
+            if not os.path.isdir(type_dir):
                 continue
-
-            items = []
-            for item_dir in sorted(type_dir.iterdir()):
-                if not item_dir.is_dir():
+            with os.scandir(type_dir) as entries:
+                names = sorted(e.name for e in entries if e.is_dir())
+            for name in names:
+                try:
+                    stat = os.stat(os.path.join(type_dir, name, MANIFEST_FILE))
+                except FileNotFoundError:
+                    missing.append(os.path.join(content_type, name))
                     continue
+                items.append((os.path.join(content_type, name), stat))
+        return found, missing
+
+    def rebuild(self, workers: int | None = None, save: bool = True) -> dict[str, Any]:
+        """Rebuild index from all manifest files.
+
+        Only new or changed manifests are parsed (and validated); entries
+        for unchanged manifests are carried over and deleted ones are
+        dropped. The index file is left untouched when nothing changed.
+        Validation issues for every item end up in self.issues.
+
+        Args:
+            workers: Worker processes for parsing stale manifests (defaults
+                to the CPU count; 0 or 1 parses in-process)
+            save: Write the index and manifest cache (False refreshes them
+                in memory only)
+
+        Returns:
+            The rebuilt index
+        """
+        previous = self.backend.load()
+        old_manifests: dict[str, dict[str, Any]] = previous.get("manifests", {})
+        old_entries = {
+            entry["path"]: entry
+            for content_type in CONTENT_TYPES
+            for entry in previous.get(content_type, [])
+        }
 
-                manifest_path = item_dir / MANIFEST_FILE
-                if not manifest_path.exists():
+        found, missing = self._scan_manifests()
+        manifests: dict[str, dict[str, Any]] = {}
+        entries: dict[str, dict[str, Any]] = {}
+        stale: list[str] = []
+
+        for items in found.values():
+            for path, stat in items:
+                old = old_manifests.get(path)
+                if (
+                    old is not None
+                    and path in old_entries
+                    and "issues" in old
+                    and old["mtime_ns"] == stat.st_mtime_ns
+                    and old["size"] == stat.st_size
+                ):
+                    manifests[path] = old
+                    entries[path] = old_entries[path]
                     continue
+                manifests[path] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size}
+                stale.append(path)
+
+        parsed = self._parse_manifests(
+            [self.content_root / path / MANIFEST_FILE for path in stale], workers
+        )
+        failed: dict[str, str] = {}
+        for path, (manifest, digest, error, issues) in zip(stale, parsed, strict=True):
+            old = old_manifests.get(path)
+            manifests[path]["digest"] = digest
+            manifests[path]["issues"] = issues
+            if manifest is not None:
+                self.manifest_cache.put(digest, manifest)
+            if old is not None and path in old_entries and old.get("digest") == digest:
+                # Touched but not edited
+                entries[path] = old_entries[path]
+                continue
+            try:
+                if error is not None:
+                    raise ValueError(error)
+                entries[path] = self._manifest_to_index_entry(manifest, self.content_root / path)
+            except Exception as e:
+                # Leave it unrecorded so the next rebuild retries it
+                del manifests[path]
+                failed[path] = str(e)
+                print(f"Warning: Failed to index {Path(path).name}: {e}")
+
+        self.issues = [
+            {"item": Path(path).name, "severity": "error", "message": "Missing manifest.yaml"}
+            for path in missing
+        ]
+        for items in found.values():
+            for path, _ in items:
+                if path in failed:
+                    self.issues.append(
+                        {"item": Path(path).name, "severity": "error", "message": failed[path]}
+                    )
+                elif path in manifests:
+                    self.issues.extend(manifests[path]["issues"])
 
-                try:
-                    manifest = self._load_manifest(manifest_path)
-                    items.append(self._manifest_to_index_entry(manifest, item_dir))
-                except Exception as e:
-                    print(f"Warning: Failed to index {item_dir.name}: {e}")
-
-            index[content_type] = items
+        index = self._empty_index()
+        for content_type, items in found.items():
+            index[content_type] = [entries[path] for path, _ in items if path in entries]
+        index["manifests"] = manifests
 
-        # Save index
-        self._save_index(index)
+        unchanged = manifests == old_manifests and all(
+            index[content_type] == previous.get(content_type, []) for content_type in CONTENT_TYPES
+        )
         self._index = index
+        if unchanged and self.backend.exists():
+            index["generated"] = previous.get("generated")
+        else:
+            index["generated"] = datetime.now(timezone.utc).isoformat()
+            if save:
+                self.backend.save(index)
+        if save and (stale or manifests.keys() != old_manifests.keys()):
+            self.manifest_cache.retain({m["digest"] for m in manifests.values()})
+            self.manifest_cache.save()
         return index
 
-    def _load_manifest(self, path: Path) -> dict[str, Any]:
-        """Load and parse a manifest file."""
-        with open(path) as f:
-            return yaml.safe_load(f)
+    def _parse_manifests(
+        self, paths: list[Path], workers: int | None = None
+    ) -> list[tuple[dict[str, Any] | None, str, str | None, list[dict[str, Any]]]]:
+        """Parse and validate manifests, in a process pool when there are many."""
+        workers = (os.cpu_count() or 1) if workers is None else workers
+        args = [str(path) for path in paths]
+        schema = str(self.schema_path)
+        if workers <= 1 or len(args) < PARALLEL_PARSE_THRESHOLD:
+            return [_parse_manifest(path, schema) for path in args]
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunksize = max(1, len(args) // (workers * 4))
+            return list(pool.map(_parse_manifest, args, repeat(schema), chunksize=chunksize))
+
+    def manifests(self, content_type: str = "adventures") -> list[tuple[Path, dict[str, Any]]]:
+        """Parsed manifests of one content type, in index order.
+
+        Only that content type's directory is scanned. A manifest whose
+        file matches its index record (mtime and size, or else content
+        digest) is served from the digest-keyed cache; only the rest are
+        parsed. Nothing is written, so this is safe on a read-only install.
+
+        Returns:
+            List of (item directory, parsed manifest)
+        """
+        records: dict[str, dict[str, Any]] = self.index.get("manifests", {})
+        found, _ = self._scan_manifests((content_type,))
+        results = []
+        for path, stat in found[content_type]:
+            item_dir = self.content_root / path
+            manifest_path = str(item_dir / MANIFEST_FILE)
+            record = records.get(path, {})
+            manifest = None
+            if record.get("mtime_ns") == stat.st_mtime_ns and record.get("size") == stat.st_size:
+                manifest = self.manifest_cache.get(record.get("digest", ""))
+            if manifest is None:
+                # Copied or checked out files keep their contents but not their mtimes
+                try:
+                    with open(manifest_path, "rb") as f:
+                        manifest = self.manifest_cache.get(_manifest_digest(f.read()))
+                except OSError:
+                    continue
+            if manifest is None:
+                manifest, digest, _, _ = _parse_manifest(manifest_path, str(self.schema_path))
+                if manifest is None:
+                    continue
+                self.manifest_cache.put(digest, manifest)
+            results.append((item_dir, manifest))
+        return results
 
     def _manifest_to_index_entry(
         self, manifest: dict[str, Any], item_dir: Path
@@ -128,11 +373,6 @@ class ContentIndexer:
 
         return entry
 
-    def _save_index(self, index: dict[str, Any]) -> None:
-        """Save index to disk."""
-        with open(self.index_path, "w") as f:
-            json.dump(index, f, indent=2)
-
     def find(
         self,
         content_type: str | None = None,
@@ -142,196 +382,34 @@ class ContentIndexer:
         max_duration: int | None = None,
         search: str | None = None,
     ) -> list[dict[str, Any]]:
-        """Find content matching filters."""
-        results = []
-
-        # Determine which types to search
-        types_to_search = [content_type] if content_type else list(CONTENT_TYPES)
+        """Find content matching filters.
 
-        for ctype in types_to_search:
-            items = self.index.get(ctype, [])
-            for item in items:
-                if self._matches_filters(
-                    item, difficulty, tags, hash_types, max_duration, search
-                ):
-                    results.append(item)
-
-        return results
-
-    def _matches_filters(
-        self,
-        item: dict[str, Any],
-        difficulty: str | None,
-        tags: list[str] | None,
-        hash_types: list[str] | None,
-        max_duration: int | None,
-        search: str | None,
-    ) -> bool:
-        """Check if item matches all provided filters."""
-        if difficulty and item.get("difficulty") != difficulty:
-            return False
-
-        if tags:
-            item_tags = set(item.get("tags", []))
-            if not all(tag in item_tags for tag in tags):
-                return False
-
-        if hash_types:
-            item_hashes = set(item.get("hash_types", []))
-            if not any(ht in item_hashes for ht in hash_types):
-                return False
-
-        if max_duration:
-            item_duration = item.get("duration_minutes")
-            if item_duration and item_duration > max_duration:
-                return False
-
-        if search:
-            search_lower = search.lower()
-            searchable = (
-                item.get("title", "").lower()
-                + " "
-                + item.get("description", "").lower()
-                + " "
-                + " ".join(item.get("tags", []))
-            )
-            if search_lower not in searchable:
-                return False
-
-        return True
+        content_type accepts either the section name ("adventures") or the
+        entry type ("adventure").
+        """
+        if content_type and content_type not in CONTENT_TYPES:
+            content_type = f"{content_type}s"
+        return self.backend.find(
+            content_type, difficulty, tags, hash_types, max_duration, search
+        )
 
     def get(self, content_id: str) -> dict[str, Any] | None:
         """Get a specific content item by ID."""
-        for content_type in CONTENT_TYPES:
-            for item in self.index.get(content_type, []):
-                if item.get("id") == content_id:
-                    return item
-        return None
-
-    def validate(self) -> list[dict[str, Any]]:
-        """Validate all content manifests. Returns list of issues."""
-        issues = []
-
-        for content_type in CONTENT_TYPES:
-            type_dir = self.content_root / content_type
-            if not type_dir.exists():
-                continue
-
-            for item_dir in type_dir.iterdir():
-                if not item_dir.is_dir():
-                    continue
-
-                manifest_path = item_dir / MANIFEST_FILE
-                item_issues = self._validate_manifest(item_dir, manifest_path)
-                issues.extend(item_issues)
-
-        return issues
-
-    def _validate_manifest(
-        self, item_dir: Path, manifest_path: Path
-    ) -> list[dict[str, Any]]:
-        """Validate a single manifest file."""
-        issues = []
-        item_name = item_dir.name
-
-        if not manifest_path.exists():
-            issues.append(
-                {
-                    "item": item_name,
-                    "severity": "error",
-                    "message": "Missing manifest.yaml",
-                }
-            )
-            return issues
-
-        try:
-            manifest = self._load_manifest(manifest_path)
-        except Exception as e:
-            issues.append(
-                {
-                    "item": item_name,
-                    "severity": "error",
-                    "message": f"Invalid YAML: {e}",
-                }
-            )
-            return issues
-
-        # Required fields
-        required = ["id", "type", "title", "version", "engine"]
-        for field in required:
-            if field not in manifest:
-                issues.append(
-                    {
-                        "item": item_name,
-                        "severity": "error",
-                        "message": f"Missing required field: {field}",
-                    }
-                )
-
-        # Type validation
-        if manifest.get("type") not in ("adventure", "training"):
-            issues.append(
-                {
-                    "item": item_name,
-                    "severity": "error",
-                    "message": f"Invalid type: {manifest.get('type')}",
-                }
-            )
-
-        # ID should match directory name
-        if manifest.get("id") != item_name:
-            issues.append(
-                {
-                    "item": item_name,
-                    "severity": "warning",
-                    "message": f"ID '{manifest.get('id')}' doesn't match directory name",
-                }
-            )
+        return self.backend.get(content_id)
 
-        # Recommended fields
-        recommended = ["difficulty", "duration_minutes", "tags", "description"]
-        for field in recommended:
-            if field not in manifest:
-                issues.append(
-                    {
-                        "item": item_name,
-                        "severity": "info",
-                        "message": f"Missing recommended field: {field}",
-                    }
-                )
+    def validate(self, workers: int | None = None) -> list[dict[str, Any]]:
+        """Validate all content manifests. Returns list of issues.
 
-        return issues
+        Runs the rebuild pass in memory (nothing is written), so only
+        manifests that changed since the last saved rebuild are parsed; the
+        rest report the issues recorded in the index.
+        """
+        self.rebuild(workers, save=False)
+        return list(self.issues)
 
     def stats(self) -> dict[str, Any]:
         """Return statistics about indexed content."""
-        stats = {
-            "total": 0,
-            "by_type": {},
-            "by_difficulty": {},
-            "by_tag": {},
-            "by_hash_type": {},
-        }
-
-        for content_type in CONTENT_TYPES:
-            items = self.index.get(content_type, [])
-            count = len(items)
-            stats["by_type"][content_type] = count
-            stats["total"] += count
-
-            for item in items:
-                # Difficulty
-                diff = item.get("difficulty", "unknown")
-                stats["by_difficulty"][diff] = stats["by_difficulty"].get(diff, 0) + 1
-
-                # Tags
-                for tag in item.get("tags", []):
-                    stats["by_tag"][tag] = stats["by_tag"].get(tag, 0) + 1
-
-                # Hash types
-                for ht in item.get("hash_types", []):
-                    stats["by_hash_type"][ht] = stats["by_hash_type"].get(ht, 0) + 1
-
-        return stats
+        return self.backend.stats()
 
 
 # Convenience functions
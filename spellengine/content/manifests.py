@@ -0,0 +1,239 @@
+"""
+Manifest Schema Validation and Parsed Manifest Cache for SpellEngine
+
+content/schema/manifest.yaml documents every manifest field as
+`field: type  # comment`. compile_schema() turns it into a
+ManifestValidator once per schema file (and per worker process), so
+validating a manifest is a handful of isinstance checks.
+
+Schema types:
+- string, integer, float
+- a | b | c: one of the listed values
+- [type]: a list of type
+- a nested mapping: checked field by field
+
+Fields in the "# Required fields" section are required.
+
+ManifestCache keeps parsed manifests keyed by the digest of the manifest
+file, so consumers that need the full manifest (not just its index
+entry) never re-read YAML for a file the indexer has already parsed.
+
+PROPRIETARY - All Rights Reserved
+"""
+
+from __future__ import annotations
+
+import json
+import re
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable
+
+import yaml
+
+# Schema shipped with the bundled content, used when a content root has none
+SCHEMA_FILE = Path(__file__).parent.parent.parent / "content" / "schema" / "manifest.yaml"
+MANIFEST_CACHE_FILE = "manifest_cache.json"
+MANIFEST_CACHE_VERSION = 1
+
+# Top-level `field:` line in the schema file
+_FIELD_LINE = re.compile(r"^([A-Za-z_][\w-]*):")
+
+# Checker: (field name, value) -> problem message or None
+Checker = Callable[[str, Any], "str | None"]
+
+
+def normalize_manifest(manifest: Any) -> Any:
+    """Round-trip through JSON so cached and freshly parsed manifests match.
+
+    YAML dates and other non-JSON scalars become strings.
+    """
+    return json.loads(json.dumps(manifest, default=str))
+
+
+# =============================================================================
+# Schema
+# =============================================================================
+
+
+def _type_checker(spec: Any) -> tuple[Checker, str]:
+    """Compile one schema type into a checker and a description."""
+    if isinstance(spec, dict):
+        fields = {name: _type_checker(sub)[0] for name, sub in spec.items()}
+
+        def check_mapping(name: str, value: Any) -> str | None:
+            if not isinstance(value, dict):
+                return f"Field '{name}' should be a mapping, got {type(value).__name__}"
+            for key, checker in fields.items():
+                if key in value:
+                    problem = checker(f"{name}.{key}", value[key])
+                    if problem:
+                        return problem
+            return None
+
+        return check_mapping, "mapping"
+
+    if isinstance(spec, list):
+        item_checker, item_desc = _type_checker(spec[0] if spec else None)
+
+        def check_list(name: str, value: Any) -> str | None:
+            if not isinstance(value, list):
+                return f"Field '{name}' should be a list, got {type(value).__name__}"
+            for item in value:
+                problem = item_checker(name, item)
+                if problem:
+                    return problem
+            return None
+
+        return check_list, f"[{item_desc}]"
+
+    if isinstance(spec, str) and "|" in spec:
+        choices = tuple(choice.strip() for choice in spec.split("|"))
+
+        def check_choice(name: str, value: Any) -> str | None:
+            if value not in choices:
+                return f"Invalid {name}: {value}"
+            return None
+
+        return check_choice, " | ".join(choices)
+
+    expected = {
+        "string": (str,),
+        "integer": (int,),
+        "float": (int, float),
+    }.get(spec)
+    if expected is None:
+        return (lambda name, value: None), "any"
+
+    def check_type(name: str, value: Any) -> str | None:
+        if isinstance(value, bool) or not isinstance(value, expected):
+            return f"Field '{name}' should be {spec}, got {type(value).__name__}"
+        return None
+
+    return check_type, spec
+
+
+class ManifestValidator:
+    """Manifest checks compiled from the schema file.
+
+    Attributes:
+        required: Fields every manifest must have
+        fields: Field name -> compiled checker
+    """
+
+    def __init__(self, fields: dict[str, Any], required: tuple[str, ...]):
+        self.required = required
+        self.fields: dict[str, Checker] = {
+            name: _type_checker(spec)[0] for name, spec in fields.items()
+        }
+
+    @classmethod
+    def from_text(cls, text: str) -> "ManifestValidator":
+        """Compile a schema document."""
+        fields = yaml.safe_load(text) or {}
+        required: list[str] = []
+        section = ""
+        previous_blank = True
+        for line in text.splitlines():
+            if line.startswith("#") and previous_blank:
+                section = line.lstrip("#").strip()
+            match = _FIELD_LINE.match(line)
+            if match and section.lower().startswith("required"):
+                required.append(match.group(1))
+            previous_blank = not line.strip()
+        return cls(fields, tuple(required))
+
+    def validate(self, manifest: dict[str, Any]) -> list[tuple[str, str]]:
+        """Check a parsed manifest.
+
+        Returns:
+            List of (field, message) problems; unknown fields are allowed
+        """
+        problems = [
+            (field, f"Missing required field: {field}")
+            for field in self.required
+            if field not in manifest
+        ]
+        for field, checker in self.fields.items():
+            if field in manifest:
+                problem = checker(field, manifest[field])
+                if problem:
+                    problems.append((field, problem))
+        return problems
+
+
+@lru_cache(maxsize=None)
+def compile_schema(path: str) -> ManifestValidator:
+    """Compile a schema file (once per path per process)."""
+    with open(path) as f:
+        return ManifestValidator.from_text(f.read())
+
+
+def schema_path(content_root: Path) -> Path:
+    """Schema for a content root, falling back to the bundled schema."""
+    path = Path(content_root) / "schema" / "manifest.yaml"
+    return path if path.exists() else SCHEMA_FILE
+
+
+# =============================================================================
+# Parsed manifest cache
+# =============================================================================
+
+
+class ManifestCache:
+    """Parsed manifests keyed by manifest file digest.
+
+    Persisted next to the index (best effort) so later processes reuse it.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._manifests: dict[str, dict[str, Any]] | None = None
+        self._dirty = False
+
+    @property
+    def manifests(self) -> dict[str, dict[str, Any]]:
+        """Lazy-load the cache file."""
+        if self._manifests is None:
+            self._manifests = {}
+            try:
+                with open(self.path) as f:
+                    data = json.load(f)
+                if data.get("version") == MANIFEST_CACHE_VERSION:
+                    self._manifests = data["manifests"]
+            except (OSError, ValueError, KeyError):
+                pass
+        return self._manifests
+
+    def get(self, digest: str) -> dict[str, Any] | None:
+        """Cached manifest for a digest."""
+        return self.manifests.get(digest)
+
+    def put(self, digest: str, manifest: dict[str, Any]) -> None:
+        """Cache a parsed manifest."""
+        if self.manifests.get(digest) != manifest:
+            self.manifests[digest] = manifest
+            self._dirty = True
+
+    def retain(self, digests: set[str]) -> None:
+        """Drop manifests whose files no longer exist."""
+        for digest in [d for d in self.manifests if d not in digests]:
+            del self.manifests[digest]
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache if it changed (atomically, best effort)."""
+        if not self._dirty:
+            return
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        try:
+            with open(tmp_path, "w") as f:
+                json.dump(
+                    {"version": MANIFEST_CACHE_VERSION, "manifests": self.manifests},
+                    f,
+                    separators=(",", ":"),
+                )
+            tmp_path.replace(self.path)
+        except OSError:
+            return
+        self._dirty = False
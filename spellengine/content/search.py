@@ -0,0 +1,246 @@
+"""
+Content Search Index for SpellEngine
+
+In-memory query structures over the content index, so find() and get()
+cost set intersections instead of a scan of every item:
+
+- id -> position map
+- posting lists for difficulty, tags, hash_types and tools
+- a trigram index over the searchable text for substring search
+- durations sorted for max_duration range queries
+
+The structures are built once from index.json and persisted next to it
+(search_index.json), keyed by the digest of the index file they were
+built from.
+
+PROPRIETARY - All Rights Reserved
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from bisect import bisect_right
+from pathlib import Path
+from typing import Any
+
+SEARCH_INDEX_FILE = "search_index.json"
+SEARCH_INDEX_VERSION = 1
+
+# Entry fields with posting lists
+POSTING_FIELDS = ("difficulty", "tags", "hash_types", "tools")
+
+
+def index_digest(data: bytes) -> str:
+    """Digest of index.json contents, used to match a persisted search index."""
+    return hashlib.blake2b(data, digest_size=16).hexdigest()
+
+
+def searchable_text(item: dict[str, Any]) -> str:
+    """Text matched by substring search (title, description and tags)."""
+    return (
+        (item.get("title") or "").lower()
+        + " "
+        + (item.get("description") or "").lower()
+        + " "
+        + " ".join(item.get("tags") or [])
+    )
+
+
+def trigrams(text: str) -> set[str]:
+    """All distinct 3-character substrings of text."""
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class SearchIndex:
+    """Query structures over a list of index entries.
+
+    Attributes:
+        items: Entries in index order (all content types)
+        sections: Content type -> (start, end) range within items
+    """
+
+    def __init__(
+        self,
+        items: list[dict[str, Any]],
+        sections: dict[str, tuple[int, int]],
+        postings: dict[str, dict[str, list[int]]] | None = None,
+        grams: dict[str, list[int]] | None = None,
+        durations: list[tuple[int, int]] | None = None,
+    ) -> None:
+        self.items = items
+        self.sections = sections
+        self.ids: dict[str, int] = {}
+        for i, item in enumerate(items):
+            self.ids.setdefault(item.get("id"), i)
+        self._texts = [searchable_text(item) for item in items]
+
+        if postings is None or grams is None or durations is None:
+            postings, grams, durations = self._build(items, self._texts)
+        self.postings = postings
+        self.grams = grams
+        # (duration, position) sorted; items without a duration always match
+        self.durations = durations
+        self._duration_keys = [d for d, _ in durations]
+        timed = {i for _, i in durations}
+        self._untimed = {i for i in range(len(items)) if i not in timed}
+
+    @staticmethod
+    def _build(
+        items: list[dict[str, Any]], texts: list[str]
+    ) -> tuple[dict[str, dict[str, list[int]]], dict[str, list[int]], list[tuple[int, int]]]:
+        """Build posting lists, trigram lists and the duration array."""
+        postings: dict[str, dict[str, list[int]]] = {name: {} for name in POSTING_FIELDS}
+        grams: dict[str, list[int]] = {}
+        durations: list[tuple[int, int]] = []
+
+        for i, item in enumerate(items):
+            for name in POSTING_FIELDS:
+                values = item.get(name)
+                if values is None:
+                    continue
+                if not isinstance(values, list):
+                    values = [values]
+                for value in dict.fromkeys(values):
+                    postings[name].setdefault(str(value), []).append(i)
+            for gram in trigrams(texts[i]):
+                grams.setdefault(gram, []).append(i)
+            if item.get("duration_minutes"):
+                durations.append((item["duration_minutes"], i))
+
+        durations.sort()
+        return postings, grams, durations
+
+    @classmethod
+    def from_index(cls, index: dict[str, Any], content_types: tuple[str, ...]) -> "SearchIndex":
+        """Build a search index from a loaded index.json."""
+        items: list[dict[str, Any]] = []
+        sections: dict[str, tuple[int, int]] = {}
+        for content_type in content_types:
+            start = len(items)
+            items.extend(index.get(content_type, []))
+            sections[content_type] = (start, len(items))
+        return cls(items, sections)
+
+    # -------------------------------------------------------------------------
+    # Persistence
+    # -------------------------------------------------------------------------
+
+    def to_dict(self, source: str) -> dict[str, Any]:
+        """Serialize the query structures (not the entries themselves)."""
+        return {
+            "version": SEARCH_INDEX_VERSION,
+            "source": source,
+            "sections": {k: list(v) for k, v in self.sections.items()},
+            "postings": self.postings,
+            "trigrams": self.grams,
+            "durations": [list(d) for d in self.durations],
+        }
+
+    def save(self, path: Path, source: str) -> None:
+        """Write the query structures next to index.json (atomically)."""
+        tmp_path = path.with_name(path.name + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(self.to_dict(source), f, separators=(",", ":"))
+        tmp_path.replace(path)
+
+    @classmethod
+    def load(
+        cls,
+        path: Path,
+        index: dict[str, Any],
+        source: str,
+        content_types: tuple[str, ...],
+    ) -> "SearchIndex | None":
+        """Load persisted query structures if they match the index.
+
+        Args:
+            path: Persisted search index file
+            index: The loaded index.json
+            source: Digest of the index.json the structures must match
+            content_types: Section order
+
+        Returns:
+            SearchIndex, or None if missing, stale or unreadable
+        """
+        try:
+            with open(path) as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if data.get("version") != SEARCH_INDEX_VERSION or data.get("source") != source:
+            return None
+
+        items: list[dict[str, Any]] = []
+        for content_type in content_types:
+            items.extend(index.get(content_type, []))
+        return cls(
+            items,
+            {k: tuple(v) for k, v in data["sections"].items()},
+            postings=data["postings"],
+            grams=data["trigrams"],
+            durations=[tuple(d) for d in data["durations"]],
+        )
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
+
+    def get(self, content_id: str) -> dict[str, Any] | None:
+        """Look up an entry by ID."""
+        i = self.ids.get(content_id)
+        return None if i is None else self.items[i]
+
+    def _substring(self, query: str, candidates: set[int] | None) -> set[int]:
+        """Positions whose searchable text contains query."""
+        if len(query) >= 3:
+            lists = sorted((self.grams.get(g, []) for g in trigrams(query)), key=len)
+            matches = set(lists[0])
+            for posting in lists[1:]:
+                matches.intersection_update(posting)
+                if not matches:
+                    break
+            if candidates is not None:
+                matches &= candidates
+        else:
+            matches = set(range(len(self.items))) if candidates is None else candidates
+        # Trigrams only narrow the candidates; confirm the full substring
+        return {i for i in matches if query in self._texts[i]}
+
+    def find(
+        self,
+        content_type: str | None = None,
+        difficulty: str | None = None,
+        tags: list[str] | None = None,
+        hash_types: list[str] | None = None,
+        max_duration: int | None = None,
+        search: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """Find entries matching every given filter, in index order."""
+        candidates: set[int] | None = None
+
+        def narrow(positions) -> None:
+            nonlocal candidates
+            candidates = set(positions) if candidates is None else candidates & set(positions)
+
+        if content_type:
+            start, end = self.sections.get(content_type, (0, 0))
+            narrow(range(start, end))
+        if difficulty:
+            narrow(self.postings["difficulty"].get(difficulty, []))
+        if tags:
+            for tag in tags:
+                narrow(self.postings["tags"].get(tag, []))
+        if hash_types:
+            narrow(
+                i for ht in hash_types for i in self.postings["hash_types"].get(ht, [])
+            )
+        if max_duration:
+            within = self.durations[:bisect_right(self._duration_keys, max_duration)]
+            narrow([i for _, i in within] + list(self._untimed))
+        if search:
+            candidates = self._substring(search.lower(), candidates)
+
+        if candidates is None:
+            return list(self.items)
+        return [self.items[i] for i in sorted(candidates)]
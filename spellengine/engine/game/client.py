@@ -101,11 +101,16 @@ class GameClient:
     @property
     def save_path(self) -> Path:
         """Get the save file path for this campaign."""
+        return self.save_dir / f"{self.campaign.id}_game.sav"
+
+    @property
+    def legacy_save_path(self) -> Path:
+        """Get the pre-binary JSON save path (read once, then migrated)."""
         return self.save_dir / f"{self.campaign.id}_game.json"
 
     def has_save(self) -> bool:
         """Check if a save file exists."""
-        return self.save_path.exists()
+        return self.save_path.exists() or self.legacy_save_path.exists()
 
     def _init_test_session(self) -> None:
         """Initialize a test session for tracking crack commands."""
@@ -326,8 +331,10 @@ class GameClient:
 
         self.save_dir.mkdir(parents=True, exist_ok=True)
 
-        if resume and self.save_path.exists():
-            self.adventure_state = AdventureState.load(self.campaign, self.save_path)
+        if resume and self.has_save():
+            self.adventure_state = AdventureState.load(
+                self.campaign, self.save_path, legacy_path=self.legacy_save_path
+            )
             # If difficulty provided, update it (for resuming at different difficulty)
             if difficulty:
                 self.adventure_state.difficulty = difficulty
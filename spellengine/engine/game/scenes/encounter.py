@@ -1249,14 +1249,14 @@ class EncounterScene(Scene):
             self.feedback_message = f"+{result.get('xp_awarded', 0)} XP"
             self.feedback_color = Colors.SUCCESS
             self.feedback_timer = 1.0
-            self.client.adventure_state.save()
+            self.client.adventure_state.save_in_background()
             self.enter()
 
         elif action == "chapter_complete":
             # Chapter transition music disabled (too intrusive)
             self.feedback_message = f"Chapter Complete! {result.get('message', '')}"
             self.feedback_color = Colors.SUCCESS
-            self.client.adventure_state.save()
+            self.client.adventure_state.save_in_background()
             self.enter()
 
         elif action == "complete":
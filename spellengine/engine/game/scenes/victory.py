@@ -187,12 +187,10 @@ class VictoryScene(Scene):
             centered=True,
         )
 
-        # Clean up save file on victory
-        if (
-            self.client.adventure_state.save_path
-            and self.client.adventure_state.save_path.exists()
-        ):
-            self.client.adventure_state.save_path.unlink()
+        # Clean up save files on victory
+        for path in (self.client.adventure_state.save_path, self.client.legacy_save_path):
+            if path and path.exists():
+                path.unlink()
 
     def _populate_stats(self) -> None:
         """Populate the stats panel with final stats."""
@@ -302,13 +300,9 @@ class VictoryScene(Scene):
 
         fragment_id = fragment_info["id"]
 
-        # Initialize artifacts dict for this campaign if needed
-        if campaign_id not in state.artifacts:
-            state.artifacts[campaign_id] = []
-
         # Award fragment if not already owned
-        if fragment_id not in state.artifacts[campaign_id]:
-            state.artifacts[campaign_id].append(fragment_id)
+        if fragment_id not in state.artifacts.get(campaign_id, []):
+            state.writable("artifacts").setdefault(campaign_id, []).append(fragment_id)
             self._awarded_fragment = fragment_info
 
             # Play artifact sound
@@ -327,7 +321,7 @@ class VictoryScene(Scene):
             # Add the complete artifact achievement
             complete_artifact = artifact_config.get("complete_artifact", {})
             if complete_artifact.get("id") and complete_artifact["id"] not in state.achievements:
-                state.achievements.append(complete_artifact["id"])
+                state.writable("achievements").append(complete_artifact["id"])
 
             # Play special celebration sound
             if self.client.audio:
@@ -36,6 +36,10 @@ def main() -> int:
     import spellengine.cli as cli_module
     cli_module.CONTENT_ROOT = get_resource_path("content")
 
+    # Campaign achievement packs live alongside the bundled content
+    from spellengine.adventures import achievement_packs as packs_module
+    packs_module.PACKS_ROOT = get_resource_path("content") / "adventures"
+
     # Also patch the assets module
     from spellengine.adventures import assets as assets_module
     assets_module.ASSETS_DIR = get_resource_path("assets")
@@ -4,6 +4,25 @@ Builds campaigns by resolving keyspace definitions to concrete
 passwords and hashes. This is a build-time tool that transforms
 source YAML (with keyspaces) into deployable YAML (with hashes).
 
+Chapters are generated independently (in a process pool for large
+campaigns) and merged in campaign order; a password picked by an earlier
+chapter is replaced in the later one, so the result doesn't depend on
+the worker count.
+
+Builds are deterministic: each resolved keyspace draws with a seed
+derived from the campaign id, its encounter id, the keyspace itself and
+the build seed. A build manifest next to the output records every
+resolved keyspace, so a rebuild only re-resolves keyspaces whose
+definition, corpus or seed changed.
+
+Every resolved password gets a crack-time prediction (see
+keyspace_calculator) in its keyspace_meta, and the build fails if a
+password is outside its tier's time window.
+
+Next to the YAML (kept for review), a build writes a compiled JSON
+artifact (<output>.compiled.json) that load_campaign() reads instead of
+parsing the YAML.
+
 Usage:
     python -m spellengine.tools.campaign_builder \\
         --source campaign_source.yaml \\
@@ -12,10 +31,15 @@ Usage:
 """
 
 import argparse
+import hashlib
+import json
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
+from itertools import repeat
 from pathlib import Path
-from typing import Any
+from typing import Any, NamedTuple
 
 import yaml
 
@@ -26,7 +50,21 @@ from spellengine.adventures.keyspace import (
     KeyspaceDefinition,
     KeyspaceMeta,
 )
-from spellengine.tools.password_generator import KeyspacePasswordGenerator
+from spellengine.adventures.loader import (
+    COMPILED_SCHEMA_VERSION,
+    compiled_path_for,
+    source_digest,
+)
+from spellengine.tools.keyspace_calculator import KeyspaceCalculator, check_tier
+from spellengine.tools.model_cache import MODEL_CACHE_DIR, ModelCache, corpus_digest
+from spellengine.tools.packed_corpus import open_corpus
+from spellengine.tools.password_generator import KeyspacePasswordGenerator, generation_group
+
+# Bumped whenever the build manifest layout changes
+BUILD_MANIFEST_VERSION = 1
+
+# Pending keyspaces needed before a build generates chapters in a process pool
+PARALLEL_BUILD_THRESHOLD = 64
 
 
 def parse_keyspace(data: dict[str, Any]) -> KeyspaceDefinition:
@@ -69,6 +107,36 @@ def parse_keyspace(data: dict[str, Any]) -> KeyspaceDefinition:
     )
 
 
+def keyspace_result(
+    keyspace: KeyspaceDefinition,
+    password: str,
+    hash_value: str,
+    hash_type: str = "md5",
+) -> dict[str, Any]:
+    """Encounter fields for a password resolved from a keyspace.
+
+    Args:
+        keyspace: The keyspace the password was generated for
+        password: The generated password
+        hash_value: Hash of the password
+        hash_type: Hash algorithm used
+
+    Returns:
+        Dictionary with hash, solution, and keyspace_meta
+    """
+    return {
+        "hash": hash_value,
+        "hash_type": hash_type,
+        "solution": password,
+        "keyspace_meta": {
+            "discovery_method": keyspace.discovery_method.value,
+            "tier": keyspace.tier,
+            "complexity": keyspace.complexity.value,
+            "source": keyspace.source,
+        },
+    }
+
+
 def resolve_keyspace(
     keyspace_data: dict[str, Any],
     generator: KeyspacePasswordGenerator,
@@ -101,42 +169,428 @@ def resolve_keyspace(
                 used_passwords.add(password)
             break
 
-    return {
-        "hash": hash_value,
-        "hash_type": hash_type,
-        "solution": password,
-        "keyspace_meta": {
-            "discovery_method": meta.discovery_method.value,
-            "tier": meta.tier,
-            "complexity": meta.complexity.value,
-            "source": meta.source,
-        },
+    return keyspace_result(keyspace, password, hash_value, hash_type)
+
+
+def keyspace_digest(keyspace_data: dict[str, Any]) -> str:
+    """Digest of a keyspace definition as written in the source."""
+    identity = json.dumps(keyspace_data, sort_keys=True, default=str)
+    return hashlib.blake2b(identity.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def site_seed(campaign_id: str, site_id: str, digest: str, build_seed: int = 0) -> int:
+    """Generation seed for one keyspace site.
+
+    Args:
+        campaign_id: Campaign id
+        site_id: Encounter id (or "encounter:variant")
+        digest: keyspace_digest() of the site's keyspace
+        build_seed: Campaign-wide seed (change it to reroll every password)
+
+    Returns:
+        64-bit seed
+    """
+    identity = f"{campaign_id}\0{site_id}\0{digest}\0{build_seed}".encode("utf-8")
+    return int.from_bytes(hashlib.blake2b(identity, digest_size=8).digest(), "big")
+
+
+class BuildManifest:
+    """Inputs and outputs of every keyspace resolved by a build.
+
+    Entries are keyed by site id and hold the keyspace digest, hash type
+    and seed the password was generated with, plus the solution and
+    hash. Together with the corpus digest this is enough to tell whether
+    a keyspace needs resolving again.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self.campaign_id: str | None = None
+        self.corpus_digest: str | None = None
+        self.seed: int | None = None
+        self.entries: dict[str, dict[str, Any]] = {}
+
+    def load(self) -> "BuildManifest":
+        """Read the manifest (a missing or unreadable file leaves it empty)."""
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("version") == BUILD_MANIFEST_VERSION:
+                self.campaign_id = data["campaign_id"]
+                self.corpus_digest = data["corpus_digest"]
+                self.seed = data["seed"]
+                self.entries = data["entries"]
+        except (OSError, ValueError, KeyError):
+            pass
+        return self
+
+    def save(self) -> None:
+        """Write the manifest atomically."""
+        tmp_path = self.path.with_name(self.path.name + ".tmp")
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "version": BUILD_MANIFEST_VERSION,
+                    "campaign_id": self.campaign_id,
+                    "corpus_digest": self.corpus_digest,
+                    "seed": self.seed,
+                    "entries": self.entries,
+                },
+                f,
+                indent=2,
+                sort_keys=True,
+            )
+            f.write("\n")
+        tmp_path.replace(self.path)
+
+
+def manifest_path_for(output_yaml: Path) -> Path:
+    """Default build manifest location for a built campaign."""
+    return output_yaml.with_name(output_yaml.stem + ".manifest.json")
+
+
+def compile_campaign(
+    campaign_data: dict[str, Any],
+    build_info: dict[str, Any],
+    yaml_text: str,
+) -> str:
+    """Serialize the compiled JSON artifact of a built campaign.
+
+    YAML dates and other non-JSON scalars become strings (as in
+    content.manifests.normalize_manifest).
+
+    Args:
+        campaign_data: Resolved campaign (its _build_info is stored as build_info)
+        build_info: Build metadata
+        yaml_text: Built YAML the artifact stands in for; its digest lets
+            the loader tell whether the artifact still matches it
+
+    Returns:
+        The artifact's JSON text
+    """
+    artifact = {
+        "schema_version": COMPILED_SCHEMA_VERSION,
+        "build_info": build_info,
+        "source_digest": source_digest(yaml_text.encode("utf-8")),
+        "campaign": {key: value for key, value in campaign_data.items() if key != "_build_info"},
     }
+    return json.dumps(artifact, ensure_ascii=False, separators=(",", ":"), default=str)
+
+
+def write_text_atomic(path: Path, text: str) -> None:
+    """Write a UTF-8 file via a temporary file, byte for byte (no newline translation)."""
+    tmp_path = path.with_name(path.name + ".tmp")
+    with open(tmp_path, "w", encoding="utf-8", newline="") as f:
+        f.write(text)
+    tmp_path.replace(path)
+
+
+def compile_built_campaign(built_yaml: Path) -> Path:
+    """Write the compiled artifact for an existing built campaign (no rebuild).
+
+    Returns:
+        The artifact's path
+    """
+    yaml_text = built_yaml.read_bytes().decode("utf-8")
+    campaign_data = yaml.safe_load(yaml_text)
+    path = compiled_path_for(built_yaml)
+    build_info = campaign_data.get("_build_info", {})
+    write_text_atomic(path, compile_campaign(campaign_data, build_info, yaml_text))
+    return path
+
+
+class KeyspaceSite(NamedTuple):
+    """A keyspace waiting to be resolved into an encounter or variant."""
+
+    target: dict[str, Any]
+    keyspace: KeyspaceDefinition
+    hash_type: str
+    site_id: str
+    digest: str
+    seed: int
+    chapter: int
+    variant: str | None
+
+
+# Per-process generator for chapter workers (set by _init_worker)
+_worker_generator: KeyspacePasswordGenerator | None = None
+
+
+def _init_worker(corpus_path: str, model_cache_dir: str | None, use_patternforge: bool) -> None:
+    """Load the corpus once per worker process."""
+    global _worker_generator
+    _worker_generator = KeyspacePasswordGenerator(
+        Path(corpus_path),
+        use_patternforge=use_patternforge,
+        model_cache=ModelCache(model_cache_dir) if model_cache_dir else None,
+    )
+
+
+def _generate_chapter(
+    keyspaces: list[KeyspaceDefinition], seeds: list[int], used: frozenset[str]
+) -> list[str]:
+    """Generate one chapter's passwords in a worker process."""
+    return _worker_generator.generate_batch(keyspaces, set(used), seeds)
+
+
+class KeyspaceBatch:
+    """Keyspace definitions collected from a campaign, resolved together.
+
+    Building an encounter with a batch defers its keyspaces: the encounter
+    (or variant) dict is recorded and filled in by resolve(), which
+    generates every password in one KeyspacePasswordGenerator.generate_batch
+    call, so each (strategy, length) group costs one generation run.
+
+    Each site gets a seed from site_seed(), and reuse() fills sites whose
+    keyspace and seed match a previous build's manifest without
+    generating anything.
+
+    Sites remember which chapter they came from (see begin_chapter());
+    resolve() generates chapters independently and then merges them.
+    """
+
+    def __init__(self, campaign_id: str = "", seed: int = 0) -> None:
+        self.campaign_id = campaign_id
+        self.seed = seed
+        # Sites still to resolve, in campaign order
+        self.sites: list[KeyspaceSite] = []
+        # Manifest entries for every site, resolved or reused
+        self.records: dict[str, dict[str, Any]] = {}
+        # Sites filled so far (resolved or reused), in fill order
+        self.resolved: list[KeyspaceSite] = []
+        self.reused = 0
+        self.replaced = 0
+        self.chapter = 0
+        self._site_ids: set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self.sites)
+
+    def begin_chapter(self) -> None:
+        """Attribute sites added from now on to the next chapter."""
+        self.chapter += 1
+
+    def add(
+        self,
+        target: dict[str, Any],
+        keyspace_data: dict[str, Any],
+        hash_type: str,
+        encounter_id: str = "encounter",
+        variant: str | None = None,
+    ) -> None:
+        """Record a keyspace to resolve into target.
+
+        The site id is the encounter id, or "encounter:variant" for a
+        variant. Repeated site ids get a "#n" suffix so every site stays
+        distinct.
+        """
+        site_id = encounter_id if variant is None else f"{encounter_id}:{variant}"
+        unique_id = site_id
+        n = 1
+        while unique_id in self._site_ids:
+            n += 1
+            unique_id = f"{site_id}#{n}"
+        self._site_ids.add(unique_id)
+
+        digest = keyspace_digest(keyspace_data)
+        self.sites.append(KeyspaceSite(
+            target=target,
+            keyspace=parse_keyspace(keyspace_data),
+            hash_type=hash_type,
+            site_id=unique_id,
+            digest=digest,
+            seed=site_seed(self.campaign_id, unique_id, digest, self.seed),
+            chapter=self.chapter,
+            variant=variant,
+        ))
+
+    @property
+    def groups(self) -> set[tuple]:
+        """Distinct generation groups (one generation run each)."""
+        return {generation_group(site.keyspace) for site in self.sites}
+
+    def _fill(self, site: "KeyspaceSite", password: str, hash_value: str) -> None:
+        site.target.update(keyspace_result(site.keyspace, password, hash_value, site.hash_type))
+        self.records[site.site_id] = {
+            "keyspace_digest": site.digest,
+            "hash_type": site.hash_type,
+            "seed": site.seed,
+            "solution": password,
+            "hash": hash_value,
+        }
+        self.resolved.append(site)
+
+    def reuse(self, manifest: BuildManifest, used_passwords: set[str]) -> None:
+        """Fill sites that a previous build resolved with the same inputs.
+
+        A site is reused when its keyspace digest, hash type and seed match
+        the manifest entry and its solution isn't already taken. The
+        caller checks that the manifest was built from the same corpus.
+        """
+        pending = []
+        for site in self.sites:
+            entry = manifest.entries.get(site.site_id)
+            if (
+                entry is not None
+                and entry.get("keyspace_digest") == site.digest
+                and entry.get("hash_type") == site.hash_type
+                and entry.get("seed") == site.seed
+                and entry.get("solution") not in used_passwords
+            ):
+                used_passwords.add(entry["solution"])
+                self._fill(site, entry["solution"], entry["hash"])
+                self.reused += 1
+            else:
+                pending.append(site)
+        self.sites = pending
+
+    def resolve(
+        self,
+        generator: KeyspacePasswordGenerator,
+        used_passwords: set[str],
+        workers: int | None = 1,
+    ) -> None:
+        """Generate every pending password and fill in the recorded targets.
+
+        Each chapter is generated on its own, avoiding only the passwords
+        taken before resolve() was called. The merge then walks the sites
+        in campaign order: the first site to pick a password keeps it, and
+        later sites that picked it get a replacement in one more batch.
+
+        Args:
+            generator: Password generator (hashes every password and
+                generates replacements)
+            used_passwords: Passwords to avoid; each chosen password is added
+            workers: Worker processes for chapter generation (None for the
+                CPU count; 0 or 1 generates in-process)
+        """
+        chapters: dict[int, list[KeyspaceSite]] = {}
+        for site in self.sites:
+            chapters.setdefault(site.chapter, []).append(site)
+        keyspaces = [[site.keyspace for site in sites] for sites in chapters.values()]
+        seeds = [[site.seed for site in sites] for sites in chapters.values()]
+        used = frozenset(used_passwords)
+
+        workers = (os.cpu_count() or 1) if workers is None else workers
+        workers = min(workers, len(chapters))
+        if workers <= 1 or len(self.sites) < PARALLEL_BUILD_THRESHOLD:
+            results = [
+                generator.generate_batch(chapter_keyspaces, set(used), chapter_seeds)
+                for chapter_keyspaces, chapter_seeds in zip(keyspaces, seeds)
+            ]
+        else:
+            # Analyze (or load) the model once so workers load it from the cache
+            if generator.use_patternforge and generator.model_cache is not None:
+                generator._get_patternforge_model()
+            model_cache_dir = (
+                str(generator.model_cache.directory) if generator.model_cache else None
+            )
+            with ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(str(generator.corpus_path), model_cache_dir, generator.use_patternforge),
+            ) as pool:
+                results = list(pool.map(_generate_chapter, keyspaces, seeds, repeat(used)))
+
+        # Merge in campaign order; later duplicates lose their password
+        losers = []
+        for sites, passwords in zip(chapters.values(), results):
+            for site, password in zip(sites, passwords):
+                if password in used_passwords:
+                    losers.append(site)
+                else:
+                    used_passwords.add(password)
+                    self._fill(site, password, generator.generate_hash(password, site.hash_type))
+
+        if losers:
+            replacements = generator.generate_batch(
+                [site.keyspace for site in losers],
+                used_passwords,
+                seeds=[site.seed for site in losers],
+            )
+            for site, password in zip(losers, replacements):
+                self._fill(site, password, generator.generate_hash(password, site.hash_type))
+            self.replaced += len(losers)
+
+        self.sites.clear()
+
+
+def apply_crack_estimates(
+    sites: list[KeyspaceSite],
+    calculator: KeyspaceCalculator,
+) -> list[str]:
+    """Predict crack times for resolved sites and check them against their tiers.
+
+    The prediction goes into each site's keyspace_meta (predicted_attack,
+    predicted_crack_seconds). Gameplay fields such as expected_time (the
+    RACE countdown) are left to the source.
+
+    Args:
+        sites: Resolved keyspace sites
+        calculator: Calculator over the build corpus
+
+    Returns:
+        One message per site whose prediction is outside its tier's window
+    """
+    estimates = calculator.estimate_all(
+        [(site.target["solution"], site.keyspace, site.hash_type) for site in sites]
+    )
+    violations = []
+    for site, estimate in zip(sites, estimates):
+        meta = site.target.setdefault("keyspace_meta", {})
+        meta["predicted_attack"] = estimate.attack
+        meta["predicted_crack_seconds"] = estimate.whole_seconds
+        problem = check_tier(estimate, site.keyspace.tier)
+        if problem:
+            violations.append(f"{site.site_id}: {estimate.attack} attack {problem}")
+    return violations
+
+
+def _resolve_into(
+    target: dict[str, Any],
+    keyspace_data: dict[str, Any],
+    hash_type: str,
+    generator: KeyspacePasswordGenerator | None,
+    used_passwords: set[str],
+    batch: KeyspaceBatch | None,
+    encounter_id: str,
+    variant: str | None = None,
+) -> None:
+    """Resolve a keyspace now, or defer it to the batch."""
+    if batch is not None:
+        batch.add(target, keyspace_data, hash_type, encounter_id, variant)
+    else:
+        target.update(resolve_keyspace(keyspace_data, generator, hash_type, used_passwords))
 
 
 def build_encounter(
     encounter_data: dict[str, Any],
-    generator: KeyspacePasswordGenerator,
+    generator: KeyspacePasswordGenerator | None,
     used_passwords: set[str],
+    batch: KeyspaceBatch | None = None,
 ) -> dict[str, Any]:
     """Build a single encounter, resolving keyspace if present.
 
     Args:
         encounter_data: Encounter dictionary from source YAML
-        generator: Password generator instance
+        generator: Password generator instance (unused with a batch)
         used_passwords: Set of already-used passwords to avoid duplicates
+        batch: Defer keyspaces to this batch instead of resolving them now
 
     Returns:
         Built encounter dictionary with resolved keyspace
     """
     result = encounter_data.copy()
+    encounter_id = str(result.get("id", "encounter"))
 
     # Resolve encounter-level keyspace
     if "keyspace" in result:
         keyspace_data = result.pop("keyspace")
         hash_type = result.get("hash_type", "md5")
-        resolved = resolve_keyspace(keyspace_data, generator, hash_type, used_passwords)
-        result.update(resolved)
+        _resolve_into(
+            result, keyspace_data, hash_type, generator, used_passwords, batch, encounter_id
+        )
 
     # Resolve variant keyspaces
     if "variants" in result:
@@ -151,8 +605,10 @@ def build_encounter(
                     "hash_type",
                     result.get("hash_type", "md5")
                 )
-                resolved = resolve_keyspace(keyspace_data, generator, hash_type, used_passwords)
-                variant.update(resolved)
+                _resolve_into(
+                    variant, keyspace_data, hash_type, generator, used_passwords, batch,
+                    encounter_id, diff_name,
+                )
 
             new_variants[diff_name] = variant
 
@@ -163,24 +619,28 @@ def build_encounter(
 
 def build_chapter(
     chapter_data: dict[str, Any],
-    generator: KeyspacePasswordGenerator,
+    generator: KeyspacePasswordGenerator | None,
     used_passwords: set[str],
+    batch: KeyspaceBatch | None = None,
 ) -> dict[str, Any]:
     """Build a chapter, resolving all encounter keyspaces.
 
     Args:
         chapter_data: Chapter dictionary from source YAML
-        generator: Password generator instance
+        generator: Password generator instance (unused with a batch)
         used_passwords: Set of already-used passwords to avoid duplicates
+        batch: Defer keyspaces to this batch instead of resolving them now
 
     Returns:
         Built chapter dictionary
     """
     result = chapter_data.copy()
+    if batch is not None:
+        batch.begin_chapter()
 
     if "encounters" in result:
         result["encounters"] = [
-            build_encounter(enc, generator, used_passwords)
+            build_encounter(enc, generator, used_passwords, batch)
             for enc in result["encounters"]
         ]
 
@@ -192,6 +652,13 @@ def build_campaign(
     output_yaml: Path,
     corpus_path: Path,
     verbose: bool = False,
+    model_cache: ModelCache | None = None,
+    rebuild_model: bool = False,
+    seed: int = 0,
+    manifest_path: Path | None = None,
+    full_rebuild: bool = False,
+    workers: int | None = None,
+    check_crack_times: bool = True,
 ) -> dict[str, Any]:
     """Build a campaign with resolved passwords.
 
@@ -200,6 +667,18 @@ def build_campaign(
         output_yaml: Path to write resolved campaign YAML
         corpus_path: Path to training corpus
         verbose: Print progress messages
+        model_cache: Cache for the SCARAB model bundle
+        rebuild_model: Re-analyze the corpus even if a cached model exists
+        seed: Build seed mixed into every keyspace's generation seed
+        manifest_path: Build manifest (default: next to output_yaml)
+        full_rebuild: Re-resolve every keyspace instead of reusing the manifest
+        workers: Worker processes for generating chapters (None for the CPU
+            count; 0 or 1 builds in-process)
+        check_crack_times: Predict crack times into keyspace_meta and
+            fail when a password falls outside its tier's time window
+
+    Raises:
+        ValueError: If a predicted crack time is outside its tier's window
 
     Returns:
         Build statistics dictionary
@@ -210,11 +689,7 @@ def build_campaign(
     # Load source YAML
     with open(source_yaml, encoding="utf-8") as f:
         campaign_data = yaml.safe_load(f)
-
-    # Initialize password generator
-    if verbose:
-        print(f"Loading corpus: {corpus_path}")
-    generator = KeyspacePasswordGenerator(corpus_path)
+    campaign_id = str(campaign_data.get("id", source_yaml.stem))
 
     # Statistics
     stats = {
@@ -244,6 +719,9 @@ def build_campaign(
     if verbose and used_passwords:
         print(f"  Pre-seeded {len(used_passwords)} hardcoded passwords")
 
+    # Collect every keyspace first, then resolve them in one batch
+    # (encounters only record their keyspaces, so no generator is needed yet)
+    batch = KeyspaceBatch(campaign_id, seed)
     built_chapters = []
     for chapter_data in campaign_data.get("chapters", []):
         # Count encounters
@@ -256,36 +734,92 @@ def build_campaign(
                     if "keyspace" in variant:
                         stats["variants_with_keyspace"] += 1
 
-        built_chapter = build_chapter(chapter_data, generator, used_passwords)
+        built_chapter = build_chapter(chapter_data, None, used_passwords, batch)
         built_chapters.append(built_chapter)
 
+    # Reuse keyspaces resolved by the previous build with the same inputs
+    manifest = BuildManifest(manifest_path or manifest_path_for(output_yaml))
+    digest = corpus_digest(corpus_path)
+    if not full_rebuild:
+        manifest.load()
+        if manifest.campaign_id == campaign_id and manifest.corpus_digest == digest:
+            batch.reuse(manifest, used_passwords)
+
+    stats["keyspaces_reused"] = batch.reused
+    stats["keyspaces_resolved"] = len(batch)
+    stats["keyspace_groups"] = len(batch.groups)
+    if verbose and batch.reused:
+        print(f"  Reused {batch.reused} keyspaces from {manifest.path}")
+
+    if batch:
+        # Initialize password generator
+        if verbose:
+            print(f"Loading corpus: {corpus_path}")
+        generator = KeyspacePasswordGenerator(
+            corpus_path, model_cache=model_cache, rebuild_model=rebuild_model
+        )
+        if verbose:
+            print(f"  Resolving {len(batch)} keyspaces in {stats['keyspace_groups']} groups")
+        batch.resolve(generator, used_passwords, workers)
+    stats["keyspaces_replaced"] = batch.replaced
+
+    if check_crack_times:
+        calculator = KeyspaceCalculator(open_corpus(corpus_path))
+        violations = apply_crack_estimates(batch.resolved, calculator)
+        if violations:
+            raise ValueError(
+                "Passwords outside their tier's crack-time window:\n  "
+                + "\n  ".join(violations)
+            )
+
     campaign_data["chapters"] = built_chapters
 
     # Add build metadata
-    campaign_data["_build_info"] = {
+    build_info = {
         "built_at": stats["build_time"],
         "corpus": str(corpus_path.name),
+        "seed": seed,
         "builder_version": "1.0.0",
     }
+    campaign_data["_build_info"] = build_info
 
     # Write output YAML
     if verbose:
         print(f"Writing output: {output_yaml}")
 
+    yaml_text = (
+        "# Built Campaign - Generated by SpellEngine Campaign Builder\n"
+        f"# Built at: {stats['build_time']}\n"
+        f"# Source: {source_yaml.name}\n"
+        "# DO NOT EDIT - Regenerate from source instead\n\n"
+        + yaml.dump(campaign_data, default_flow_style=False, allow_unicode=True, sort_keys=False)
+    )
+
+    # The YAML is for review; the game loads the compiled artifact. Both
+    # are serialized before either is written, so a failure leaves no
+    # half-written build behind.
+    compiled_path = compiled_path_for(output_yaml)
+    compiled_text = compile_campaign(campaign_data, build_info, yaml_text)
+
     output_yaml.parent.mkdir(parents=True, exist_ok=True)
-    with open(output_yaml, "w", encoding="utf-8") as f:
-        # Add header comment
-        f.write("# Built Campaign - Generated by SpellEngine Campaign Builder\n")
-        f.write(f"# Built at: {stats['build_time']}\n")
-        f.write(f"# Source: {source_yaml.name}\n")
-        f.write("# DO NOT EDIT - Regenerate from source instead\n\n")
-        yaml.dump(campaign_data, f, default_flow_style=False, allow_unicode=True, sort_keys=False)
+    write_text_atomic(output_yaml, yaml_text)
+    if verbose:
+        print(f"Writing compiled artifact: {compiled_path}")
+    write_text_atomic(compiled_path, compiled_text)
+
+    # Record what was resolved for the next incremental build
+    manifest.campaign_id = campaign_id
+    manifest.corpus_digest = digest
+    manifest.seed = seed
+    manifest.entries = batch.records
+    manifest.save()
 
     if verbose:
         print(f"\nBuild complete!")
         print(f"  Total encounters: {stats['encounters_total']}")
         print(f"  Keyspace encounters: {stats['encounters_with_keyspace']}")
         print(f"  Keyspace variants: {stats['variants_with_keyspace']}")
+        print(f"  Keyspaces resolved: {stats['keyspaces_resolved']}")
 
     return stats
 
@@ -357,13 +891,26 @@ Examples:
   python -m spellengine.tools.campaign_builder \\
       --source campaign_source.yaml \\
       --validate
+
+  # Write the compiled artifact for a built campaign (no rebuild)
+  python -m spellengine.tools.campaign_builder \\
+      --compile content/adventures/dread_citadel/campaign.yaml
+
+  # Re-analyze the corpus instead of loading the cached SCARAB model
+  python -m spellengine.tools.campaign_builder \\
+      --source campaign_source.yaml \\
+      --rebuild-model
+
+  # Reroll every password with a new seed
+  python -m spellengine.tools.campaign_builder \\
+      --source campaign_source.yaml \\
+      --seed 7
         """,
     )
 
     parser.add_argument(
         "--source",
         type=Path,
-        required=True,
         help="Source YAML file with keyspace definitions",
     )
     parser.add_argument(
@@ -377,6 +924,54 @@ Examples:
         default=Path("content/corpus/training_corpus.txt"),
         help="Path to training corpus",
     )
+    parser.add_argument(
+        "--model-cache",
+        type=Path,
+        default=MODEL_CACHE_DIR,
+        help=f"SCARAB model cache directory (default: {MODEL_CACHE_DIR})",
+    )
+    parser.add_argument(
+        "--no-model-cache",
+        action="store_true",
+        help="Analyze the corpus without reading or writing the model cache",
+    )
+    parser.add_argument(
+        "--rebuild-model",
+        action="store_true",
+        help="Re-analyze the corpus and replace the cached model",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=0,
+        help="Build seed; the same seed and inputs give the same passwords (default: 0)",
+    )
+    parser.add_argument(
+        "--manifest",
+        type=Path,
+        help="Build manifest path (default: output with .manifest.json suffix)",
+    )
+    parser.add_argument(
+        "--full-rebuild",
+        action="store_true",
+        help="Re-resolve every keyspace instead of reusing the build manifest",
+    )
+    parser.add_argument(
+        "-j", "--workers",
+        type=int,
+        help="Worker processes for generating chapters (default: CPU count)",
+    )
+    parser.add_argument(
+        "--no-crack-check",
+        action="store_true",
+        help="Skip crack-time prediction and the tier window check",
+    )
+    parser.add_argument(
+        "--compile",
+        type=Path,
+        metavar="BUILT_YAML",
+        help="Write the compiled artifact for an existing built campaign and exit",
+    )
     parser.add_argument(
         "--validate",
         action="store_true",
@@ -390,6 +985,16 @@ Examples:
 
     args = parser.parse_args()
 
+    # Compile an existing built campaign
+    if args.compile:
+        if not args.compile.exists():
+            print(f"Error: Built campaign not found: {args.compile}")
+            return 1
+        print(f"Wrote {compile_built_campaign(args.compile)}")
+        return 0
+    if args.source is None:
+        parser.error("--source is required")
+
     # Validate source
     if args.validate:
         print(f"Validating: {args.source}")
@@ -425,6 +1030,13 @@ Examples:
             output_yaml=output,
             corpus_path=args.corpus,
             verbose=args.verbose,
+            model_cache=None if args.no_model_cache else ModelCache(args.model_cache),
+            rebuild_model=args.rebuild_model,
+            seed=args.seed,
+            manifest_path=args.manifest,
+            full_rebuild=args.full_rebuild,
+            workers=args.workers,
+            check_crack_times=not args.no_crack_check,
         )
         return 0
     except Exception as e:
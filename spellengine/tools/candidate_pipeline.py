@@ -0,0 +1,129 @@
+"""Lazy candidate pipeline for keyspace password generation.
+
+Each stage takes an iterable of candidates and yields the ones that pass,
+so a pipeline never holds more than the candidates it has accepted:
+
+    source -> length -> mask -> tokens -> chars -> dedupe -> sample
+
+sample_candidates() stops pulling from the pipeline once it has seen a
+window of accepted candidates and reservoir-samples from that window, so
+memory stays proportional to the requested count however large the
+source is. Start the source at a random position (rotated()) so the
+window isn't always the head of the corpus.
+"""
+
+import random
+import re
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import islice
+
+from spellengine.adventures.keyspace import KeyspaceDefinition
+from spellengine.tools.corpus_index import compile_mask, compile_tokens
+
+
+def rotated(entries: Sequence[str], rng: random.Random = random) -> Iterator[str]:
+    """Every entry once, starting at a random position and wrapping around."""
+    n = len(entries)
+    if not n:
+        return
+    start = rng.randrange(n)
+    for i in range(start, start + n):
+        yield entries[i % n]
+
+
+def filter_length(candidates: Iterable[str], min_length: int, max_length: int) -> Iterator[str]:
+    """Candidates within a length range."""
+    return (c for c in candidates if min_length <= len(c) <= max_length)
+
+
+def filter_mask(candidates: Iterable[str], mask: str | None) -> Iterator[str]:
+    """Candidates matching a hashcat mask (all of them without one)."""
+    if not mask:
+        return iter(candidates)
+    matcher = compile_mask(mask)
+    return (c for c in candidates if matcher.fullmatch(c))
+
+
+def filter_tokens(candidates: Iterable[str], tokens: list[str] | None) -> Iterator[str]:
+    """Candidates with a token structure (all of them without one)."""
+    if not tokens:
+        return iter(candidates)
+    matcher = compile_tokens(tuple(tokens))
+    return (c for c in candidates if matcher.fullmatch(c))
+
+
+def filter_pattern(candidates: Iterable[str], pattern: re.Pattern) -> Iterator[str]:
+    """Candidates containing a match of pattern (anchor it to match whole candidates)."""
+    return (c for c in candidates if pattern.search(c))
+
+
+def filter_chars(
+    candidates: Iterable[str],
+    required_chars: str | None = None,
+    banned_chars: str | None = None,
+    banned_patterns: list[str] | None = None,
+) -> Iterator[str]:
+    """Candidates with every required char and no banned char or substring."""
+    required = set(required_chars or "")
+    banned = set(banned_chars or "")
+    patterns = banned_patterns or []
+    for candidate in candidates:
+        chars = set(candidate)
+        if required - chars or banned & chars:
+            continue
+        if any(pattern in candidate for pattern in patterns):
+            continue
+        yield candidate
+
+
+def dedupe(candidates: Iterable[str]) -> Iterator[str]:
+    """Candidates without repeats, first occurrence kept."""
+    seen = set()
+    for candidate in candidates:
+        if candidate not in seen:
+            seen.add(candidate)
+            yield candidate
+
+
+def keyspace_pipeline(source: Iterable[str], keyspace: KeyspaceDefinition) -> Iterator[str]:
+    """Chain every keyspace constraint over a candidate source."""
+    candidates = filter_length(source, keyspace.min_length, keyspace.max_length)
+    candidates = filter_mask(candidates, keyspace.mask)
+    candidates = filter_tokens(candidates, keyspace.tokens)
+    candidates = filter_chars(
+        candidates, keyspace.required_chars, keyspace.banned_chars, keyspace.banned_patterns
+    )
+    return dedupe(candidates)
+
+
+def reservoir_sample(
+    candidates: Iterable[str],
+    count: int,
+    rng: random.Random = random,
+) -> list[str]:
+    """Uniform sample of up to count candidates in one pass (Algorithm R)."""
+    sample: list[str] = []
+    for seen, candidate in enumerate(candidates):
+        if seen < count:
+            sample.append(candidate)
+        else:
+            j = rng.randrange(seen + 1)
+            if j < count:
+                sample[j] = candidate
+    return sample
+
+
+def sample_candidates(
+    candidates: Iterable[str],
+    count: int,
+    window: int,
+    rng: random.Random = random,
+) -> list[str]:
+    """Sample count candidates from the first window accepted ones.
+
+    Pulls at most window candidates, so the pipeline behind it stops as
+    soon as the window is full. The sample comes back shuffled.
+    """
+    sample = reservoir_sample(islice(candidates, max(count, window)), count, rng)
+    rng.shuffle(sample)
+    return sample
@@ -0,0 +1,211 @@
+"""Structure-bucketed index over a password corpus.
+
+Keyspace queries ask for corpus entries of some length range, hashcat
+mask and token structure. Rather than filtering the whole corpus with a
+fresh regex per entry, CorpusIndex buckets every entry once by:
+
+- length
+- mask signature, e.g. "Summer2024" -> ?u?l?l?l?l?l?d?d?d?d
+- token run structure, e.g. "Summer2024" -> WORD+DIGIT
+
+A query looks up its bucket and only confirms candidates inside it.
+Masks and token structures compile to regexes once (lru_cache), so ad
+hoc filtering of generated candidates is cheap too.
+"""
+
+import re
+from collections.abc import Sequence
+from functools import lru_cache
+from pathlib import Path
+
+# Characters matched by ?s and the SYMBOL token
+SYMBOL_CHARS = "!@#$%^&*()_+-=[]{}|;':\",./<>?\\`~"
+_SYMBOL_CLASS = "[" + re.escape(SYMBOL_CHARS) + "]"
+
+# Mask placeholder -> regex
+MASK_CLASSES = {
+    "l": "[a-z]",
+    "u": "[A-Z]",
+    "d": "[0-9]",
+    "s": _SYMBOL_CLASS,
+    "a": ".",
+}
+
+# Token name -> regex
+TOKEN_PATTERNS = {
+    "WORD": r"[a-zA-Z]+",
+    "DIGIT": r"\d+",
+    "YEAR": r"(19|20)\d{2}",
+    "SYMBOL": _SYMBOL_CLASS + "+",
+}
+
+# Token name -> character run it spans (YEAR is a digit run)
+TOKEN_RUNS = {"WORD": "WORD", "DIGIT": "DIGIT", "YEAR": "DIGIT", "SYMBOL": "SYMBOL"}
+
+_RUN_PATTERN = re.compile(
+    rf"(?P<WORD>[a-zA-Z]+)|(?P<DIGIT>\d+)|(?P<SYMBOL>{_SYMBOL_CLASS}+)|(?P<OTHER>.)",
+    re.DOTALL,
+)
+
+
+def read_corpus(path: Path) -> list[str]:
+    """Entries of a corpus file, skipping comments and empty lines."""
+    entries = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if line and not line.startswith("#"):
+                entries.append(line)
+    return entries
+
+
+def parse_mask(mask: str) -> list[str]:
+    """Split a hashcat mask into one token per position.
+
+    Placeholders come back as "?l", "?u", ...; anything else (including an
+    unknown placeholder like "?x", which matches "x") as a literal.
+    """
+    positions = []
+    i = 0
+    while i < len(mask):
+        if mask[i] == "?" and i + 1 < len(mask):
+            char_class = mask[i + 1]
+            positions.append("?" + char_class if char_class in MASK_CLASSES else char_class)
+            i += 2
+        else:
+            positions.append(mask[i])
+            i += 1
+    return positions
+
+
+@lru_cache(maxsize=1024)
+def compile_mask(mask: str) -> re.Pattern:
+    """Regex matching exactly the passwords a mask accepts."""
+    parts = [
+        MASK_CLASSES[position[1]] if len(position) == 2 else re.escape(position)
+        for position in parse_mask(mask)
+    ]
+    return re.compile("".join(parts))
+
+
+@lru_cache(maxsize=1024)
+def compile_tokens(tokens: tuple[str, ...]) -> re.Pattern:
+    """Regex matching passwords with a token structure.
+
+    Known tokens (WORD, DIGIT, YEAR, SYMBOL; any case) match their class,
+    anything else matches literally.
+    """
+    return re.compile(
+        "".join(TOKEN_PATTERNS.get(token.upper(), re.escape(token)) for token in tokens)
+    )
+
+
+def mask_signature(password: str) -> str | None:
+    """The ?l/?u/?d/?s mask describing password, or None if it has other chars."""
+    signature = []
+    for char in password:
+        if "a" <= char <= "z":
+            signature.append("?l")
+        elif "A" <= char <= "Z":
+            signature.append("?u")
+        elif "0" <= char <= "9":
+            signature.append("?d")
+        elif char in SYMBOL_CHARS:
+            signature.append("?s")
+        else:
+            return None
+    return "".join(signature)
+
+
+def token_structure(password: str) -> tuple[str, ...]:
+    """Character runs of password, e.g. ("WORD", "DIGIT")."""
+    return tuple(match.lastgroup for match in _RUN_PATTERN.finditer(password))
+
+
+class CorpusIndex:
+    """Corpus entries bucketed by length, mask signature and token structure.
+
+    Buckets hold corpus positions in ascending order, so every query
+    returns entries in corpus order.
+    """
+
+    def __init__(self, entries: Sequence[str]) -> None:
+        self.entries = entries
+        self.by_length: dict[int, Sequence[int]] = {}
+        self.by_mask: dict[str, Sequence[int]] = {}
+        self.by_structure: dict[tuple[str, ...], Sequence[int]] = {}
+
+        for i, entry in enumerate(entries):
+            self.by_length.setdefault(len(entry), []).append(i)
+            signature = mask_signature(entry)
+            if signature is not None:
+                self.by_mask.setdefault(signature, []).append(i)
+            self.by_structure.setdefault(token_structure(entry), []).append(i)
+
+        self._token_matches: dict[tuple[str, ...], frozenset[str]] = {}
+
+    @classmethod
+    def from_buckets(
+        cls,
+        entries: Sequence[str],
+        by_length: dict[int, Sequence[int]],
+        by_mask: dict[str, Sequence[int]],
+        by_structure: dict[tuple[str, ...], Sequence[int]],
+    ) -> "CorpusIndex":
+        """Index over prebuilt buckets (e.g. a packed corpus's tables)."""
+        index = cls.__new__(cls)
+        index.entries = entries
+        index.by_length = by_length
+        index.by_mask = by_mask
+        index.by_structure = by_structure
+        index._token_matches = {}
+        return index
+
+    def _length_positions(self, min_length: int, max_length: int) -> list[int]:
+        """Positions of entries within a length range, in corpus order."""
+        positions = [
+            i
+            for length, bucket in self.by_length.items()
+            if min_length <= length <= max_length
+            for i in bucket
+        ]
+        positions.sort()
+        return positions
+
+    def _mask_positions(self, mask: str) -> list[int]:
+        """Positions of entries matching a mask, in corpus order."""
+        positions = parse_mask(mask)
+        if all(p in ("?l", "?u", "?d", "?s") for p in positions):
+            return self.by_mask.get("".join(positions), [])
+        # ?a or literals: confirm within the length bucket
+        matcher = compile_mask(mask)
+        return [
+            i for i in self.by_length.get(len(positions), [])
+            if matcher.fullmatch(self.entries[i])
+        ]
+
+    def query(self, min_length: int, max_length: int, mask: str | None = None) -> list[str]:
+        """Entries within a length range (and matching mask), in corpus order."""
+        if not mask:
+            return [self.entries[i] for i in self._length_positions(min_length, max_length)]
+        return [
+            self.entries[i]
+            for i in self._mask_positions(mask)
+            if min_length <= len(self.entries[i]) <= max_length
+        ]
+
+    def token_matches(self, tokens: list[str]) -> frozenset[str]:
+        """Corpus entries with a token structure."""
+        key = tuple(tokens)
+        if key not in self._token_matches:
+            matcher = compile_tokens(key)
+            runs = [TOKEN_RUNS.get(token.upper()) for token in key]
+            if None in runs or any(a == b for a, b in zip(runs, runs[1:])):
+                # Literals or adjacent tokens of one class don't map to runs
+                candidates = range(len(self.entries))
+            else:
+                candidates = self.by_structure.get(tuple(runs), [])
+            self._token_matches[key] = frozenset(
+                self.entries[i] for i in candidates if matcher.fullmatch(self.entries[i])
+            )
+        return self._token_matches[key]
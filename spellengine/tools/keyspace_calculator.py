@@ -0,0 +1,203 @@
+"""Keyspace sizing and crack-time prediction for built passwords.
+
+A keyspace definition says how hard an encounter is meant to be (tier),
+but nothing in the definition guarantees the generated password is
+actually crackable in a sensible time. KeyspaceCalculator sizes the attacks that would find
+a password:
+
+- wordlist: the training corpus as a wordlist
+- rules: the corpus with a small rule set (case, leet, short affixes)
+- hybrid: corpus words (leeted/cased by rules if needed) plus a mask on
+  the digit/symbol prefix and suffix (hashcat -a 6/-a 7)
+- mask: the keyspace mask, or the password's own ?l/?u/?d/?s signature
+
+Mask sizes are exact; wordlist, rules and hybrid sizes count every guess
+the attack makes. A size converts to seconds with a guess rate per hash
+type, and the prediction is checked against the tier's time window.
+"""
+
+import re
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+from spellengine.adventures.keyspace import KeyspaceDefinition
+from spellengine.tools.corpus_index import SYMBOL_CHARS, compile_mask, parse_mask
+
+# Candidates per hashcat mask placeholder (hashcat's ?s includes space)
+MASK_CHARSET_SIZES = {
+    "l": 26,
+    "u": 26,
+    "d": 10,
+    "s": 33,
+    "a": 95,
+}
+
+# Guesses per second on the reference rig (hashcat, mid-range GPU)
+HASH_GUESS_RATES = {
+    "md5": 2.0e9,
+    "sha1": 7.0e8,
+    "sha256": 3.0e8,
+    "sha512": 1.0e8,
+}
+
+# Rules in the reference rule set (best64-sized)
+RULE_SET_SIZE = 64
+
+# Longest prefix + suffix the rule set appends or prepends
+MAX_RULE_AFFIX = 2
+
+# Inclusive (min, max) predicted crack time in seconds per tier
+TIER_TIME_WINDOWS = {
+    0: (0, 60),
+    1: (0, 5 * 60),
+    2: (0, 30 * 60),
+    3: (0, 2 * 3600),
+    4: (0, 8 * 3600),
+    5: (0, 24 * 3600),
+    6: (0, 7 * 24 * 3600),
+}
+
+# Leet substitutions undone before looking up a rule base word
+_UNLEET = str.maketrans({"@": "a", "4": "a", "3": "e", "1": "i", "!": "i", "0": "o",
+                         "$": "s", "5": "s", "7": "t"})
+
+# Leading and trailing digit/symbol runs around a base word
+_AFFIXES = re.compile(r"^([^a-zA-Z]*)(.*?)([^a-zA-Z]*)$", re.DOTALL)
+
+
+def mask_keyspace(mask: str) -> int:
+    """Exact number of candidates a hashcat mask generates."""
+    size = 1
+    for position in parse_mask(mask):
+        if len(position) == 2:
+            size *= MASK_CHARSET_SIZES[position[1]]
+    return size
+
+
+def password_mask(password: str) -> str:
+    """Smallest ?l/?u/?d/?s mask covering password (?a for anything else)."""
+    placeholders = []
+    for char in password:
+        if "a" <= char <= "z":
+            placeholders.append("?l")
+        elif "A" <= char <= "Z":
+            placeholders.append("?u")
+        elif "0" <= char <= "9":
+            placeholders.append("?d")
+        elif char in SYMBOL_CHARS:
+            placeholders.append("?s")
+        else:
+            placeholders.append("?a")
+    return "".join(placeholders)
+
+
+def guess_rate(hash_type: str) -> float:
+    """Reference guesses per second for a hash type."""
+    try:
+        return HASH_GUESS_RATES[hash_type]
+    except KeyError:
+        raise ValueError(f"Unsupported hash type: {hash_type}") from None
+
+
+@dataclass(frozen=True)
+class CrackEstimate:
+    """Predicted cost of cracking one password."""
+
+    attack: str  # wordlist, rules, hybrid or mask
+    keyspace: int  # Guesses the attack makes
+    seconds: float  # Time to exhaust the attack at the reference rate
+
+    @property
+    def whole_seconds(self) -> int:
+        """Whole seconds, at least 1 (KeyspaceMeta.predicted_crack_seconds)."""
+        return max(1, round(self.seconds))
+
+
+class KeyspaceCalculator:
+    """Sizes the attacks that crack a password drawn from a corpus."""
+
+    def __init__(self, corpus: Sequence[str]) -> None:
+        """Initialize the calculator.
+
+        Args:
+            corpus: Training corpus entries (the players' wordlist)
+        """
+        self.wordlist = set(corpus)
+        self.wordlist_size = len(corpus)
+        self.base_words = {entry.lower() for entry in corpus if entry.isalpha()}
+
+    def attacks(self, password: str, keyspace: KeyspaceDefinition) -> dict[str, int]:
+        """Size of every attack that would find password.
+
+        Returns:
+            Attack name -> guesses, for the attacks that cover it
+        """
+        sizes = {}
+        if password in self.wordlist:
+            sizes["wordlist"] = self.wordlist_size
+
+        # Word-based attacks: a corpus word, possibly cased or leeted by a
+        # rule, with a digit/symbol prefix and suffix
+        prefix, base, suffix = _AFFIXES.match(password).groups()
+        if base in self.wordlist:
+            word_guesses = self.wordlist_size
+        elif base.translate(_UNLEET).lower() in self.base_words:
+            word_guesses = self.wordlist_size * RULE_SET_SIZE
+        else:
+            word_guesses = None
+
+        if word_guesses is not None:
+            affix = prefix + suffix
+            if len(affix) <= MAX_RULE_AFFIX:
+                sizes["rules"] = self.wordlist_size * RULE_SET_SIZE
+            if affix:
+                sizes["hybrid"] = word_guesses * mask_keyspace(password_mask(affix))
+
+        mask = keyspace.mask
+        if not mask or not compile_mask(mask).fullmatch(password):
+            mask = password_mask(password)
+        sizes["mask"] = mask_keyspace(mask)
+        return sizes
+
+    def estimate(
+        self,
+        password: str,
+        keyspace: KeyspaceDefinition,
+        hash_type: str = "md5",
+    ) -> CrackEstimate:
+        """Predict how long cracking a password takes.
+
+        Uses the fastest attack that finds the password. The discovery
+        method a keyspace teaches isn't binding: a player who recognizes
+        a wordlist entry won't run the 40-hour mask the hint describes.
+
+        Args:
+            password: Generated password
+            keyspace: Keyspace it was generated for
+            hash_type: Hash algorithm it is stored with
+
+        Returns:
+            The predicted attack, its size and its run time
+        """
+        rate = guess_rate(hash_type)
+        sizes = self.attacks(password, keyspace)
+        attack = min(sizes, key=sizes.get)
+        return CrackEstimate(attack, sizes[attack], sizes[attack] / rate)
+
+    def estimate_all(
+        self,
+        sites: list[tuple[str, KeyspaceDefinition, str]],
+    ) -> list[CrackEstimate]:
+        """Estimate many (password, keyspace, hash type) sites at once."""
+        return [self.estimate(password, keyspace, hash_type)
+                for password, keyspace, hash_type in sites]
+
+
+def check_tier(estimate: CrackEstimate, tier: int) -> str | None:
+    """Explain why an estimate falls outside its tier's window (None if it fits)."""
+    low, high = TIER_TIME_WINDOWS[tier]
+    if estimate.seconds < low:
+        return f"cracks in {estimate.seconds:.3g}s, tier {tier} needs at least {low}s"
+    if estimate.seconds > high:
+        return f"takes {estimate.seconds:.3g}s to crack, tier {tier} allows at most {high}s"
+    return None
@@ -0,0 +1,113 @@
+"""On-disk cache for PatternForge SCARAB model bundles.
+
+Analyzing the training corpus with SCARAB is the slowest step of a
+campaign build, and its result only depends on the corpus contents and
+the analyzer parameters. Bundles are pickled into a cache directory
+under a key derived from both (plus the PatternForge version), so later
+builds load the model instead of re-analyzing. The local PCFG grammar
+(see pcfg) is cached the same way under its own kind.
+
+The cache directory is per-user; only load bundles you wrote yourself.
+"""
+
+import hashlib
+import json
+import pickle
+from importlib import metadata
+from pathlib import Path
+from typing import Any
+
+# Default cache location
+MODEL_CACHE_DIR = Path.home() / ".spellengine" / "models"
+
+# Bumped whenever the cache file layout changes
+MODEL_CACHE_VERSION = 1
+
+
+def corpus_digest(corpus_path: Path) -> str:
+    """Digest of a corpus file's contents."""
+    digest = hashlib.blake2b(digest_size=16)
+    with open(corpus_path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _patternforge_version() -> str:
+    try:
+        return metadata.version("patternforge")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+
+def model_cache_key(corpus_path: Path, params: dict[str, Any]) -> str:
+    """Cache key for a model built from a corpus with analyzer params.
+
+    Args:
+        corpus_path: Training corpus file
+        params: SCARABAnalyzer keyword arguments
+
+    Returns:
+        Hex key (changes with the corpus contents, params or PatternForge version)
+    """
+    identity = json.dumps(
+        {
+            "cache_version": MODEL_CACHE_VERSION,
+            "corpus": corpus_digest(corpus_path),
+            "params": params,
+            "patternforge": _patternforge_version(),
+        },
+        sort_keys=True,
+    )
+    return hashlib.blake2b(identity.encode("utf-8"), digest_size=16).hexdigest()
+
+
+class ModelCache:
+    """Directory of pickled model bundles keyed by model_cache_key()."""
+
+    def __init__(self, directory: Path | str = MODEL_CACHE_DIR, kind: str = "scarab") -> None:
+        """Initialize the cache.
+
+        Args:
+            directory: Where bundles are stored (created on first save)
+            kind: Model kind, the file name prefix of its bundles
+        """
+        self.directory = Path(directory)
+        self.kind = kind
+
+    def path_for(self, key: str) -> Path:
+        """File holding the bundle for a key."""
+        return self.directory / f"{self.kind}-{key}.pickle"
+
+    def load(self, key: str) -> Any | None:
+        """Load a cached bundle.
+
+        Returns:
+            The bundle, or None if missing or unreadable
+        """
+        try:
+            with open(self.path_for(key), "rb") as f:
+                return pickle.load(f)
+        except FileNotFoundError:
+            return None
+        except Exception:
+            # Truncated file or a bundle from an incompatible PatternForge
+            return None
+
+    def save(self, key: str, bundle: Any) -> bool:
+        """Store a bundle (atomically, best effort).
+
+        Returns:
+            Whether the bundle was written
+        """
+        path = self.path_for(key)
+        tmp_path = path.with_name(path.name + ".tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            with open(tmp_path, "wb") as f:
+                pickle.dump(bundle, f, protocol=pickle.HIGHEST_PROTOCOL)
+            tmp_path.replace(path)
+        except (OSError, pickle.PicklingError, TypeError, AttributeError):
+            tmp_path.unlink(missing_ok=True)
+            return False
+        return True
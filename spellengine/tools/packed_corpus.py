@@ -0,0 +1,454 @@
+"""Memory-mapped binary corpus format.
+
+Reading training_corpus.txt into a list of str costs every process its
+own copy of the corpus (plus its CorpusIndex buckets). A packed corpus
+(.spc) stores the same entries in one file that is memory-mapped
+read-only, so the builder's worker processes share one copy in the page
+cache:
+
+    magic (8 bytes) | directory length (u32) | JSON directory | padding to 8
+    offsets   u64[count + 1]  entry i is blob[offsets[i]:offsets[i + 1]]
+    positions u32[...]        bucket tables (corpus positions, ascending)
+    per bucket kind (length, mask signature, token structure), padded to 8:
+        starts   u64[keys + 1]  bucket k is positions[starts[k]:starts[k + 1]]
+        key ends u32[keys]      key k is key blob[ends[k - 1]:ends[k]]
+        key blob                UTF-8 keys, sorted, back to back
+    blob                      UTF-8 entries, back to back
+
+The small JSON directory records the entry count, the section locations
+(relative to the end of the padded directory), the key count of each
+bucket kind and the size and mtime of the text file it was built from.
+Bucket keys are binary-searched in the mapped file on lookup, so opening
+a corpus costs no per-key heap however many distinct masks it has.
+Integers are little-endian.
+
+Convert a wordlist with:
+
+    python -m spellengine.tools.packed_corpus content/corpus/training_corpus.txt
+
+which writes training_corpus.spc next to it. open_corpus() picks that
+file up automatically while it is newer than the text it came from.
+"""
+
+import argparse
+import json
+import mmap
+import shutil
+import struct
+import sys
+import tempfile
+from array import array
+from collections.abc import Callable, Iterator, Mapping, Sequence
+from pathlib import Path
+from typing import Any
+
+from spellengine.tools.corpus_index import (
+    CorpusIndex,
+    mask_signature,
+    read_corpus,
+    token_structure,
+)
+
+MAGIC = b"SPCORPUS"
+PACKED_CORPUS_VERSION = 2
+PACKED_SUFFIX = ".spc"
+
+# Bucket kinds stored in a packed corpus
+BUCKET_KINDS = ("length", "mask", "structure")
+
+_NATIVE_LITTLE = sys.byteorder == "little"
+
+
+def is_packed(path: Path) -> bool:
+    """Whether a file is a packed corpus."""
+    try:
+        with open(path, "rb") as f:
+            return f.read(len(MAGIC)) == MAGIC
+    except OSError:
+        return False
+
+
+def packed_path_for(text_path: Path) -> Path:
+    """Where convert() writes the packed form of a text corpus by default."""
+    return Path(text_path).with_suffix(PACKED_SUFFIX)
+
+
+def _source_stamp(path: Path) -> dict[str, Any]:
+    stat = path.stat()
+    return {"name": path.name, "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def _bucket_key(kind: str, entry: str) -> str | None:
+    """Directory key of the bucket an entry belongs to (None for none)."""
+    if kind == "length":
+        return str(len(entry))
+    if kind == "mask":
+        return mask_signature(entry)
+    return "+".join(token_structure(entry))
+
+
+def _decode(line: bytes) -> str:
+    """Decode a wordlist line (UTF-8, or Latin-1 as rockyou-style lists often are)."""
+    try:
+        return line.decode("utf-8")
+    except UnicodeDecodeError:
+        return line.decode("latin-1")
+
+
+def _aligned(n: int, alignment: int = 8) -> int:
+    return (n + alignment - 1) // alignment * alignment
+
+
+def _int_array(typecode: str, data: memoryview) -> Sequence[int]:
+    """Zero-copy view of little-endian integers (a swapped copy on big-endian hosts)."""
+    if _NATIVE_LITTLE:
+        return data.cast(typecode)
+    values = array(typecode)
+    values.frombytes(data)
+    values.byteswap()
+    return values
+
+
+def _to_little(values: array) -> bytes:
+    if not _NATIVE_LITTLE:
+        values = array(values.typecode, values)
+        values.byteswap()
+    return values.tobytes()
+
+
+def convert(
+    source: Path,
+    output: Path | None = None,
+    buckets: bool = True,
+    skip_comments: bool = True,
+) -> Path:
+    """Pack a text wordlist (one entry per line).
+
+    Streams the source, so only the offsets and bucket tables are held in
+    memory (about 12 bytes per entry with buckets).
+
+    Args:
+        source: Text wordlist
+        output: Packed file (default: source with a .spc suffix)
+        buckets: Store length, mask and token structure bucket tables
+        skip_comments: Skip lines starting with "#" like read_corpus()
+            (turn off for raw wordlists such as rockyou)
+
+    Returns:
+        The packed file's path
+    """
+    source = Path(source)
+    output = Path(output) if output is not None else packed_path_for(source)
+    offsets = array("Q", [0])
+    tables: dict[str, dict[str, array]] = {kind: {} for kind in BUCKET_KINDS} if buckets else {}
+
+    with tempfile.TemporaryFile(dir=output.parent) as blob:
+        with open(source, "rb") as f:
+            for raw in f:
+                raw = raw.strip()
+                if not raw or (skip_comments and raw.startswith(b"#")):
+                    continue
+                entry = _decode(raw)
+                data = entry.encode("utf-8")
+                position = len(offsets) - 1
+                blob.write(data)
+                offsets.append(offsets[-1] + len(data))
+                for kind, table in tables.items():
+                    key = _bucket_key(kind, entry)
+                    if key is not None:
+                        table.setdefault(key, array("I")).append(position)
+
+        count = len(offsets) - 1
+        if count >= 2 ** 32:
+            raise ValueError(f"Too many entries to pack: {count}")
+
+        # Lay out the bucket tables back to back in one positions array, with
+        # a sorted key table per kind
+        positions = array("I")
+        key_tables: dict[str, bytes] = {}
+        for kind, table in tables.items():
+            starts = array("Q", [len(positions)])
+            ends = array("I")
+            keys = bytearray()
+            for key in sorted(table):
+                positions.extend(table[key])
+                starts.append(len(positions))
+                keys += key.encode("utf-8")
+                ends.append(len(keys))
+            key_tables[kind] = _to_little(starts) + _to_little(ends) + bytes(keys)
+
+        # Sections are located relative to the (aligned) end of the directory
+        layout = {"offsets": 0, "positions": offsets.itemsize * len(offsets)}
+        at = _aligned(layout["positions"] + positions.itemsize * len(positions))
+        for kind, data in key_tables.items():
+            layout[kind] = at
+            at = _aligned(at + len(data))
+        layout["blob"] = at
+        header = json.dumps(
+            {
+                "version": PACKED_CORPUS_VERSION,
+                "count": count,
+                "positions": len(positions),
+                "source": _source_stamp(source),
+                "sections": layout,
+                "buckets": {kind: len(table) for kind, table in tables.items()},
+            },
+            separators=(",", ":"),
+        ).encode("utf-8")
+        data_start = _aligned(len(MAGIC) + 4 + len(header))
+
+        tmp_path = output.with_name(output.name + ".tmp")
+        try:
+            with open(tmp_path, "wb") as out:
+                out.write(MAGIC)
+                out.write(struct.pack("<I", len(header)))
+                out.write(header)
+                out.write(b"\0" * (data_start - out.tell()))
+                out.write(_to_little(offsets))
+                out.write(_to_little(positions))
+                for kind, data in key_tables.items():
+                    out.write(b"\0" * (data_start + layout[kind] - out.tell()))
+                    out.write(data)
+                out.write(b"\0" * (data_start + layout["blob"] - out.tell()))
+                blob.seek(0)
+                shutil.copyfileobj(blob, out, 1 << 20)
+            tmp_path.replace(output)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+    return output
+
+
+class BucketTable(Mapping):
+    """Lazy key -> corpus positions view of one bucket kind in a packed corpus.
+
+    Keys are binary-searched in the mapped key table on each lookup and
+    buckets are slices of the mapped positions table, so nothing per key
+    is held in memory.
+    """
+
+    def __init__(
+        self,
+        view: memoryview,
+        at: int,
+        keys: int,
+        positions: Sequence[int],
+        encode: Callable[[Any], str] = str,
+        decode: Callable[[str], Any] = str,
+    ) -> None:
+        """Map a key table.
+
+        Args:
+            view: The mapped file
+            at: Absolute offset of the key table
+            keys: Number of keys
+            positions: The corpus's positions table
+            encode: Maps a lookup key to its stored string
+            decode: Maps a stored string back to a key
+        """
+        self._keys = keys
+        self._starts = _int_array("Q", view[at:at + 8 * (keys + 1)])
+        ends_at = at + 8 * (keys + 1)
+        self._ends = _int_array("I", view[ends_at:ends_at + 4 * keys])
+        self._blob = view[ends_at + 4 * keys:]
+        self._positions = positions
+        self._encode = encode
+        self._decode = decode
+
+    def _key(self, k: int) -> bytes:
+        start = self._ends[k - 1] if k else 0
+        return bytes(self._blob[start:self._ends[k]])
+
+    def _find(self, key: bytes) -> int:
+        lo, hi = 0, self._keys
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._key(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo if lo < self._keys and self._key(lo) == key else -1
+
+    def __getitem__(self, key: Any) -> Sequence[int]:
+        try:
+            k = self._find(self._encode(key).encode("utf-8"))
+        except (TypeError, ValueError):
+            k = -1
+        if k < 0:
+            raise KeyError(key)
+        return self._positions[self._starts[k]:self._starts[k + 1]]
+
+    def __iter__(self) -> Iterator[Any]:
+        for k in range(self._keys):
+            yield self._decode(self._key(k).decode("utf-8"))
+
+    def __len__(self) -> int:
+        return self._keys
+
+
+class PackedCorpus(Sequence):
+    """Read-only, memory-mapped view of a packed corpus.
+
+    Behaves like the list read_corpus() returns: len(), indexing and
+    iteration yield str entries, decoded on access.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Map a packed corpus.
+
+        Raises:
+            ValueError: If the file isn't a packed corpus this version reads
+        """
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if self._mmap[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"Not a packed corpus: {self.path}")
+        (header_length,) = struct.unpack_from("<I", self._mmap, len(MAGIC))
+        header_start = len(MAGIC) + 4
+        self.directory = json.loads(self._mmap[header_start:header_start + header_length])
+        if self.directory.get("version") != PACKED_CORPUS_VERSION:
+            raise ValueError(f"Unsupported packed corpus version: {self.path}")
+
+        self._count = self.directory["count"]
+        data_start = _aligned(header_start + header_length)
+        sections = {name: data_start + at for name, at in self.directory["sections"].items()}
+        view = memoryview(self._mmap)
+        self._offsets = _int_array(
+            "Q", view[sections["offsets"]:sections["offsets"] + 8 * (self._count + 1)]
+        )
+        self._positions = _int_array(
+            "I",
+            view[sections["positions"]:sections["positions"] + 4 * self.directory["positions"]],
+        )
+        self._blob = sections["blob"]
+        self._sections = sections
+        self._view = view
+
+    @property
+    def source(self) -> dict[str, Any]:
+        """Name, size and mtime of the text corpus this was packed from."""
+        return self.directory["source"]
+
+    @property
+    def has_buckets(self) -> bool:
+        """Whether bucket tables were stored."""
+        return bool(self.directory["buckets"])
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(self._count))]
+        if i < 0:
+            i += self._count
+        if not 0 <= i < self._count:
+            raise IndexError("packed corpus index out of range")
+        start = self._blob + self._offsets[i]
+        end = self._blob + self._offsets[i + 1]
+        return str(self._mmap[start:end], "utf-8")
+
+    def __iter__(self) -> Iterator[str]:
+        for i in range(self._count):
+            yield self[i]
+
+    def buckets(
+        self,
+        kind: str,
+        encode: Callable[[Any], str] = str,
+        decode: Callable[[str], Any] = str,
+    ) -> Mapping[Any, Sequence[int]]:
+        """Bucket tables of one kind: key -> ascending corpus positions.
+
+        Args:
+            kind: One of BUCKET_KINDS
+            encode: Maps a lookup key to its stored string
+            decode: Maps a stored string back to a key
+
+        Returns:
+            Lazy view of the mapped key table (empty without buckets)
+        """
+        if kind not in self.directory["buckets"]:
+            return {}
+        return BucketTable(
+            self._view, self._sections[kind], self.directory["buckets"][kind],
+            self._positions, encode, decode,
+        )
+
+    def index(self) -> CorpusIndex:
+        """CorpusIndex over the stored bucket tables (built in memory without them)."""
+        if not self.has_buckets:
+            return CorpusIndex(self)
+        return CorpusIndex.from_buckets(
+            self,
+            by_length=self.buckets("length", str, int),
+            by_mask=self.buckets("mask"),
+            by_structure=self.buckets("structure", "+".join, lambda key: tuple(key.split("+"))),
+        )
+
+
+def open_corpus(path: Path) -> Sequence[str]:
+    """Corpus entries from a text or packed corpus.
+
+    A text corpus is served from its packed sibling (see packed_path_for)
+    when that was built from the text file as it is now; otherwise the
+    text is read into a list.
+    """
+    path = Path(path)
+    if is_packed(path):
+        return PackedCorpus(path)
+    packed = packed_path_for(path)
+    if packed.exists() and is_packed(packed):
+        try:
+            corpus = PackedCorpus(packed)
+        except ValueError:
+            pass
+        else:
+            stamp = _source_stamp(path)
+            if all(corpus.source.get(field) == stamp[field] for field in ("size", "mtime_ns")):
+                return corpus
+    return read_corpus(path)
+
+
+def index_corpus(corpus: Sequence[str]) -> CorpusIndex:
+    """CorpusIndex for a corpus from open_corpus()."""
+    if isinstance(corpus, PackedCorpus):
+        return corpus.index()
+    return CorpusIndex(corpus)
+
+
+def main() -> int:
+    """CLI entry point for the corpus converter."""
+    parser = argparse.ArgumentParser(description="Pack a wordlist into a memory-mapped corpus")
+    parser.add_argument("source", type=Path, help="Text wordlist, one entry per line")
+    parser.add_argument(
+        "-o", "--output", type=Path, help="Packed corpus path (default: source with .spc suffix)"
+    )
+    parser.add_argument(
+        "--no-buckets", action="store_true", help="Skip the length/mask/structure bucket tables"
+    )
+    parser.add_argument(
+        "--keep-comments",
+        action="store_true",
+        help="Keep lines starting with '#' (raw wordlists like rockyou)",
+    )
+    args = parser.parse_args()
+
+    if not args.source.exists():
+        print(f"Error: Wordlist not found: {args.source}")
+        return 1
+
+    output = convert(
+        args.source,
+        args.output,
+        buckets=not args.no_buckets,
+        skip_comments=not args.keep_comments,
+    )
+    corpus = PackedCorpus(output)
+    print(f"Packed {len(corpus):,} entries into {output} ({output.stat().st_size:,} bytes)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
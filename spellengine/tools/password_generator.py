@@ -9,6 +9,8 @@ import hashlib
 import random
 import re
 import tempfile
+from collections import Counter
+from collections.abc import Sequence
 from pathlib import Path
 from typing import Literal
 
@@ -19,6 +21,76 @@ from spellengine.adventures.keyspace import (
     KeyspaceDefinition,
     KeyspaceMeta,
 )
+from spellengine.tools.candidate_pipeline import (
+    filter_chars,
+    filter_pattern,
+    keyspace_pipeline,
+    reservoir_sample,
+    rotated,
+    sample_candidates,
+)
+from spellengine.tools.corpus_index import compile_mask, compile_tokens
+from spellengine.tools.model_cache import ModelCache, model_cache_key
+from spellengine.tools.packed_corpus import index_corpus, is_packed, open_corpus
+from spellengine.tools.pcfg import Grammar, load_grammar
+
+# SCARABAnalyzer parameters (part of the model cache key)
+SCARAB_PARAMS = {
+    "mask_limit": 500,
+    "min_mask_count": 1,
+    "enable_tokens": True,
+    "enable_grammar": False,  # Grammar not needed for basic generation
+}
+
+# Keyspace strategy -> EntropySmith strategy
+STRATEGY_MAP = {
+    GenerationStrategy.MUTATIONS: "mutations",
+    GenerationStrategy.GRAMMAR: "grammar",
+    GenerationStrategy.SAMPLING: "sampling",
+    GenerationStrategy.HYBRID: "hybrid",
+}
+
+# Candidates generated per requested password (most are filtered out)
+CANDIDATES_PER_PASSWORD = 10
+
+# Complexity preferences for built-in generation
+SIMPLE_PATTERN = re.compile(r"^([a-z]+|[A-Z]+|\d+)$")
+COMPOUND_PATTERN = re.compile(r"^[A-Za-z]+\d+$|^[A-Z][a-z]+\d+$")
+TRANSFORM_PATTERN = re.compile(r"[@$!#%^&*_\-]|[0-9].*[a-zA-Z].*[0-9]")
+
+# Candidates each complexity level prefers (others are used if none match)
+COMPLEXITY_PATTERNS = {
+    ComplexityLevel.SIMPLE: SIMPLE_PATTERN,
+    ComplexityLevel.COMPOUND: COMPOUND_PATTERN,
+    ComplexityLevel.TRANSFORMED: TRANSFORM_PATTERN,
+}
+
+
+def generation_group(keyspace: KeyspaceDefinition) -> tuple[GenerationStrategy, int, int]:
+    """Keyspaces with the same group share one generation run."""
+    return keyspace.strategy, keyspace.min_length, keyspace.max_length
+
+
+def _pick_unused(candidates: list[str], used: set[str], rng: random.Random) -> str | None:
+    """Pick a random candidate not in used (None if all are used)."""
+    if not candidates:
+        return None
+    start = rng.randrange(len(candidates))
+    for offset in range(len(candidates)):
+        candidate = candidates[(start + offset) % len(candidates)]
+        if candidate not in used:
+            return candidate
+    return None
+
+
+def _filter_signature(keyspace: KeyspaceDefinition) -> tuple:
+    """Keyspaces with the same signature accept exactly the same candidates."""
+    return (
+        *generation_group(keyspace),
+        keyspace.mask,
+        tuple(keyspace.tokens or ()),
+        keyspace.complexity,
+    )
 
 
 class KeyspacePasswordGenerator:
@@ -33,79 +105,105 @@ class KeyspacePasswordGenerator:
         self,
         corpus_path: Path,
         use_patternforge: bool = True,
+        model_cache: ModelCache | None = None,
+        rebuild_model: bool = False,
     ) -> None:
         """Initialize the password generator.
 
         Args:
-            corpus_path: Path to the training corpus file
-            use_patternforge: Whether to use PatternForge engines (if available)
+            corpus_path: Path to the training corpus file (text, or packed;
+                a current packed sibling of a text corpus is used instead)
+            use_patternforge: Whether to use PatternForge engines (if available;
+                SCARAB reads text, so a packed corpus_path disables them)
+            model_cache: Cache for the SCARAB model bundle (None analyzes
+                the corpus in every process)
+            rebuild_model: Re-analyze the corpus even if a cached model exists
         """
         self.corpus_path = Path(corpus_path)
-        self.use_patternforge = use_patternforge
+        self.use_patternforge = use_patternforge and not is_packed(self.corpus_path)
+        self.model_cache = model_cache
+        self.rebuild_model = rebuild_model
 
-        # Load corpus into memory for fast access
-        self._corpus: list[str] = []
-        self._words: list[str] = []
+        # Load corpus (memory-mapped when packed) for fast access
+        self._corpus: Sequence[str] = []
+        self._word_list: list[str] | None = None
         self._load_corpus()
 
         # PatternForge integration (lazy loaded)
         self._model_bundle = None
         self._generator = None
 
+        # Local PCFG for GRAMMAR keyspaces without PatternForge (lazy loaded)
+        self._grammar: Grammar | None = None
+
     def _load_corpus(self) -> None:
         """Load the training corpus from file."""
         if not self.corpus_path.exists():
             raise FileNotFoundError(f"Corpus not found: {self.corpus_path}")
 
-        with open(self.corpus_path, encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                # Skip comments and empty lines
-                if not line or line.startswith("#"):
-                    continue
-                self._corpus.append(line)
+        self._corpus = open_corpus(self.corpus_path)
+
+        # Bucket entries once for keyspace queries (read from a packed corpus)
+        self.corpus_index = index_corpus(self._corpus)
 
-        # Extract pure word entries (no digits, no symbols)
-        word_pattern = re.compile(r"^[a-zA-Z]+$")
-        self._words = [w for w in self._corpus if word_pattern.match(w)]
+    @property
+    def _words(self) -> list[str]:
+        """Pure word entries (no digits, no symbols), collected on first use."""
+        if self._word_list is None:
+            self._word_list = [
+                self._corpus[i] for i in self.corpus_index.by_structure.get(("WORD",), [])
+            ]
+        return self._word_list
 
     def _get_patternforge_model(self):
-        """Lazily initialize PatternForge model bundle."""
+        """Lazily initialize PatternForge model bundle.
+
+        Loaded from the model cache when one is configured and holds a
+        bundle for this corpus and SCARAB_PARAMS; otherwise analyzed and
+        stored there.
+        """
         if self._model_bundle is not None:
             return self._model_bundle
 
         try:
             from patternforge.engines.scarab import SCARABAnalyzer
-
-            analyzer = SCARABAnalyzer(
-                mask_limit=500,
-                min_mask_count=1,
-                enable_tokens=True,
-                enable_grammar=False,  # Grammar not needed for basic generation
-            )
-
-            self._model_bundle = analyzer.analyze(
-                corpus_id="training_corpus",
-                model_id="spellengine_model",
-                corpus_path=self.corpus_path,
-                name="SpellEngine Training Model",
-            )
-
-            return self._model_bundle
         except ImportError:
             # PatternForge not available, will use fallback
             return None
 
+        key = None
+        if self.model_cache is not None:
+            key = model_cache_key(self.corpus_path, SCARAB_PARAMS)
+            if not self.rebuild_model:
+                self._model_bundle = self.model_cache.load(key)
+                if self._model_bundle is not None:
+                    return self._model_bundle
+
+        analyzer = SCARABAnalyzer(**SCARAB_PARAMS)
+
+        self._model_bundle = analyzer.analyze(
+            corpus_id="training_corpus",
+            model_id="spellengine_model",
+            corpus_path=self.corpus_path,
+            name="SpellEngine Training Model",
+        )
+
+        if key is not None:
+            self.model_cache.save(key, self._model_bundle)
+        return self._model_bundle
+
     def generate_for_keyspace(
         self,
         keyspace: KeyspaceDefinition,
         count: int = 1,
+        rng: random.Random = random,
     ) -> list[str]:
         """Generate password(s) matching keyspace constraints.
 
         Args:
             keyspace: Keyspace definition with constraints
             count: Number of passwords to generate
+            rng: Random source (pass a seeded random.Random for repeatable output)
 
         Returns:
             List of generated passwords
@@ -114,11 +212,15 @@ class KeyspacePasswordGenerator:
 
         # Try PatternForge if available and enabled
         if self.use_patternforge:
-            candidates = self._generate_with_patternforge(keyspace, count)
+            candidates = self._generate_with_patternforge(keyspace, count, rng)
+
+        # Grammar keyspaces expand the local PCFG when PatternForge gave nothing
+        if not candidates and keyspace.strategy == GenerationStrategy.GRAMMAR:
+            candidates = self._generate_with_grammar(keyspace, count, rng)
 
         # Fallback to built-in generation
         if not candidates:
-            candidates = self._generate_fallback(keyspace, count)
+            candidates = self._generate_fallback(keyspace, count, rng)
 
         return candidates[:count]
 
@@ -126,8 +228,71 @@ class KeyspacePasswordGenerator:
         self,
         keyspace: KeyspaceDefinition,
         count: int,
+        rng: random.Random = random,
     ) -> list[str]:
         """Generate using PatternForge EntropySmith engine."""
+        candidates = self._run_entropysmith(
+            *generation_group(keyspace), budget=count * CANDIDATES_PER_PASSWORD
+        )
+        candidates = self._filter_candidates(candidates, keyspace)
+
+        # Sample for variety (don't always return top candidates); an
+        # empty result triggers the fallback
+        return reservoir_sample(candidates, count, rng)
+
+    def _generate_with_grammar(
+        self,
+        keyspace: KeyspaceDefinition,
+        count: int,
+        rng: random.Random = random,
+    ) -> list[str]:
+        """Generate from the most probable guesses of the local PCFG."""
+        candidates = self._run_grammar(
+            keyspace.min_length, keyspace.max_length, count * CANDIDATES_PER_PASSWORD,
+            keyspace.mask,
+        )
+        candidates = self._filter_candidates(candidates, keyspace)
+        return reservoir_sample(candidates, count, rng)
+
+    def _get_grammar(self) -> Grammar:
+        """Lazily train the local PCFG (or load it from the model cache)."""
+        if self._grammar is None:
+            cache = None
+            if self.model_cache is not None:
+                cache = ModelCache(self.model_cache.directory, kind="pcfg")
+            self._grammar = load_grammar(
+                self.corpus_path, self._corpus, cache, rebuild=self.rebuild_model
+            )
+        return self._grammar
+
+    def _run_grammar(
+        self,
+        min_length: int,
+        max_length: int,
+        budget: int,
+        mask: str | None = None,
+    ) -> list[str]:
+        """The budget most probable local PCFG guesses within a length range (and mask)."""
+        return self._get_grammar().generate(budget, min_length, max_length, mask)
+
+    def _run_entropysmith(
+        self,
+        strategy: GenerationStrategy,
+        min_length: int,
+        max_length: int,
+        budget: int,
+    ) -> list[str]:
+        """Run EntropySmith once and return its candidates.
+
+        Args:
+            strategy: Keyspace generation strategy
+            min_length: Shortest candidate kept
+            max_length: Longest candidate generated
+            budget: Candidates to generate
+
+        Returns:
+            Candidates (empty if PatternForge is unavailable or fails)
+        """
         try:
             from patternforge.engines.entropysmith import EntropySmithGenerator
             from patternforge.models.artifacts import ConstraintParams
@@ -136,31 +301,23 @@ class KeyspacePasswordGenerator:
             if model is None:
                 return []
 
-            # Map keyspace strategy to EntropySmith strategy
-            strategy_map = {
-                GenerationStrategy.MUTATIONS: "mutations",
-                GenerationStrategy.GRAMMAR: "grammar",
-                GenerationStrategy.SAMPLING: "sampling",
-                GenerationStrategy.HYBRID: "hybrid",
-            }
-
             # Set up constraints
             constraints = ConstraintParams(
-                min_length=keyspace.min_length,
-                max_length=keyspace.max_length,
+                min_length=min_length,
+                max_length=max_length,
             )
 
             # Create generator
             generator = EntropySmithGenerator(
-                budget=count * 10,  # Generate extra for filtering
-                strategy=strategy_map.get(keyspace.strategy, "mutations"),
+                budget=budget,
+                strategy=STRATEGY_MAP.get(strategy, "mutations"),
                 deduplicate=True,
                 constraints=constraints,
             )
 
             # Generate candidates
             with tempfile.TemporaryDirectory() as tmpdir:
-                artifacts = generator.generate(
+                generator.generate(
                     model=model,
                     run_id="keyspace_gen",
                     output_dir=Path(tmpdir),
@@ -172,94 +329,170 @@ class KeyspacePasswordGenerator:
                 if candidates_file.exists():
                     raw_lines = candidates_file.read_text().strip().split("\n")
                     # Filter out comments, empty lines, and invalid entries
-                    candidates = [
+                    return [
                         line for line in raw_lines
-                        if line and not line.startswith("#") and len(line) >= keyspace.min_length
+                        if line and not line.startswith("#") and len(line) >= min_length
                     ]
 
-                    # Filter by mask if specified
-                    if keyspace.mask:
-                        candidates = [c for c in candidates if self._matches_mask(c, keyspace.mask)]
-
-                    # Filter by token structure if specified
-                    if keyspace.tokens:
-                        token_filtered = self._filter_by_tokens(candidates, keyspace.tokens)
-                        if token_filtered:
-                            candidates = token_filtered
-
-                    # If still no candidates after filtering, return empty to trigger fallback
-                    if candidates:
-                        # Shuffle to add variety (don't always return top candidates)
-                        random.shuffle(candidates)
-                        return candidates[:count]
-
         except (ImportError, Exception):
             # PatternForge not available or error
             pass
 
         return []
 
+    def _filter_candidates(
+        self,
+        candidates: list[str],
+        keyspace: KeyspaceDefinition,
+    ) -> list[str]:
+        """Keep generated candidates that satisfy a keyspace's mask, tokens and chars."""
+        # Filter by mask if specified
+        if keyspace.mask:
+            matcher = compile_mask(keyspace.mask)
+            candidates = [c for c in candidates if matcher.fullmatch(c)]
+
+        # Filter by token structure if specified
+        if keyspace.tokens:
+            token_filtered = self._filter_by_tokens(candidates, keyspace.tokens)
+            if token_filtered:
+                candidates = token_filtered
+
+        return list(filter_chars(
+            candidates, keyspace.required_chars, keyspace.banned_chars, keyspace.banned_patterns
+        ))
+
+    def generate_batch(
+        self,
+        keyspaces: list[KeyspaceDefinition],
+        used_passwords: set[str] | None = None,
+        seeds: list[int] | None = None,
+    ) -> list[str]:
+        """Generate one password per keyspace from shared candidate pools.
+
+        Keyspaces are grouped by (strategy, min_length, max_length) and each
+        group gets a single generation run with a budget for the whole
+        group. When PatternForge gives nothing, GRAMMAR groups expand the
+        local PCFG once per mask instead, so masked keyspaces get grammar
+        guesses that fit. Keyspaces then draw from their pool, falling back to
+        built-in generation (also computed once per distinct keyspace) when
+        the pool has nothing that fits.
+
+        With seeds, each keyspace picks with its own random.Random, so the
+        result only depends on the candidates and the passwords already
+        used, not on the other keyspaces in the batch.
+
+        Args:
+            keyspaces: Keyspace definitions, one password each
+            used_passwords: Passwords to avoid; each chosen password is added
+            seeds: Optional per-keyspace seeds
+
+        Returns:
+            Passwords, in keyspace order
+        """
+        used = used_passwords if used_passwords is not None else set()
+
+        # One generation run per group
+        group_sizes = Counter(generation_group(k) for k in keyspaces)
+        pools: dict[tuple, list[str]] = {}
+        if self.use_patternforge:
+            for group, size in group_sizes.items():
+                pools[group] = self._run_entropysmith(
+                    *group, budget=size * CANDIDATES_PER_PASSWORD
+                )
+        grammar_sizes = Counter(
+            (generation_group(k), k.mask) for k in keyspaces
+            if k.strategy == GenerationStrategy.GRAMMAR and not pools.get(generation_group(k))
+        )
+        for (group, mask), size in grammar_sizes.items():
+            _, min_length, max_length = group
+            pools[(group, mask)] = self._run_grammar(
+                min_length, max_length, size * CANDIDATES_PER_PASSWORD, mask
+            )
+
+        # Candidates per filter signature, computed once
+        filtered: dict[tuple, list[str]] = {}
+        fallback: dict[tuple, list[str]] = {}
+
+        passwords = []
+        for n, keyspace in enumerate(keyspaces):
+            rng = random.Random(seeds[n]) if seeds is not None else random
+            signature = _filter_signature(keyspace)
+            if signature not in filtered:
+                group = generation_group(keyspace)
+                pool = pools.get((group, keyspace.mask)) or pools.get(group, [])
+                filtered[signature] = self._filter_candidates(pool, keyspace)
+            password = _pick_unused(filtered[signature], used, rng)
+
+            if password is None:
+                if signature not in fallback:
+                    fallback[signature] = self._fallback_candidates(keyspace)
+                password = _pick_unused(fallback[signature], used, rng)
+
+            if password is None:
+                synthetic = self._generate_synthetic(keyspace, CANDIDATES_PER_PASSWORD, rng)
+                password = _pick_unused(synthetic, used, rng)
+                if password is None:
+                    # Everything that fits is taken; allow a duplicate
+                    if not synthetic:
+                        raise ValueError("Failed to generate password for keyspace")
+                    password = synthetic[0]
+
+            used.add(password)
+            passwords.append(password)
+
+        return passwords
+
     def _generate_fallback(
         self,
         keyspace: KeyspaceDefinition,
         count: int,
+        rng: random.Random = random,
     ) -> list[str]:
         """Generate passwords using built-in logic (no PatternForge).
 
         This fallback ensures the system works even without PatternForge,
-        while still respecting keyspace constraints.
+        while still respecting keyspace constraints. The corpus streams
+        through the lazy candidate pipeline from a random position, which
+        stops after count * CANDIDATES_PER_PASSWORD accepted candidates;
+        candidates matching the keyspace's complexity are preferred.
         """
-        candidates: list[str] = []
-
-        # Filter corpus by length constraints
-        valid_passwords = [
-            p for p in self._corpus
-            if keyspace.min_length <= len(p) <= keyspace.max_length
-        ]
-
-        # Filter by mask if specified
-        if keyspace.mask:
-            valid_passwords = [
-                p for p in valid_passwords
-                if self._matches_mask(p, keyspace.mask)
-            ]
-
-        # Filter by complexity
-        if keyspace.complexity == ComplexityLevel.SIMPLE:
-            # Simple: prefer single words or pure digits
-            simple_pattern = re.compile(r"^([a-z]+|[A-Z]+|\d+)$")
-            simple_candidates = [p for p in valid_passwords if simple_pattern.match(p)]
-            if simple_candidates:
-                valid_passwords = simple_candidates
-
-        elif keyspace.complexity == ComplexityLevel.COMPOUND:
-            # Compound: word+digit or capitalized patterns
-            compound_pattern = re.compile(r"^[A-Za-z]+\d+$|^[A-Z][a-z]+\d+$")
-            compound_candidates = [p for p in valid_passwords if compound_pattern.match(p)]
-            if compound_candidates:
-                valid_passwords = compound_candidates
-
-        elif keyspace.complexity == ComplexityLevel.TRANSFORMED:
-            # Transformed: leet speak or special characters
-            transform_pattern = re.compile(r"[@$!#%^&*_\-]|[0-9].*[a-zA-Z].*[0-9]")
-            transform_candidates = [p for p in valid_passwords if transform_pattern.search(p)]
-            if transform_candidates:
-                valid_passwords = transform_candidates
+        window = count * CANDIDATES_PER_PASSWORD
+        preferred = COMPLEXITY_PATTERNS.get(keyspace.complexity)
+        for pattern in (preferred, None):
+            candidates = keyspace_pipeline(rotated(self._corpus, rng), keyspace)
+            if pattern is not None:
+                candidates = filter_pattern(candidates, pattern)
+            sample = sample_candidates(candidates, count, window, rng)
+            if sample:
+                return sample
+
+        # Generate synthetic passwords if no matches
+        return self._generate_synthetic(keyspace, count, rng)
+
+    def _fallback_candidates(self, keyspace: KeyspaceDefinition) -> list[str]:
+        """Corpus entries that satisfy a keyspace, in corpus order.
+
+        Entries matching the keyspace's complexity are preferred: if any
+        exist, only they are returned.
+        """
+        # Length and mask buckets from the corpus index
+        candidates = self.corpus_index.query(
+            keyspace.min_length, keyspace.max_length, keyspace.mask
+        )
 
         # Apply token filters if specified
         if keyspace.tokens:
-            valid_passwords = self._filter_by_tokens(valid_passwords, keyspace.tokens)
-
-        # If we have valid passwords, sample from them
-        if valid_passwords:
-            if count >= len(valid_passwords):
-                candidates = valid_passwords[:]
-            else:
-                candidates = random.sample(valid_passwords, count)
-        else:
-            # Generate synthetic passwords if no matches
-            candidates = self._generate_synthetic(keyspace, count)
+            token_matches = self.corpus_index.token_matches(keyspace.tokens)
+            candidates = [p for p in candidates if p in token_matches]
+
+        candidates = list(filter_chars(
+            candidates, keyspace.required_chars, keyspace.banned_chars, keyspace.banned_patterns
+        ))
 
+        # Filter by complexity
+        preferred = COMPLEXITY_PATTERNS.get(keyspace.complexity)
+        if preferred is not None:
+            return list(filter_pattern(candidates, preferred)) or candidates
         return candidates
 
     def _matches_mask(self, password: str, mask: str) -> bool:
@@ -273,35 +506,7 @@ class KeyspacePasswordGenerator:
         - ?a = any printable
         - Literal characters match themselves
         """
-        if len(password) != len(mask) // 2 and "?" in mask:
-            # Mask with placeholders has different length semantics
-            pass
-
-        # Parse mask into regex pattern
-        pattern_parts = []
-        i = 0
-        while i < len(mask):
-            if mask[i] == "?" and i + 1 < len(mask):
-                char_class = mask[i + 1]
-                if char_class == "l":
-                    pattern_parts.append("[a-z]")
-                elif char_class == "u":
-                    pattern_parts.append("[A-Z]")
-                elif char_class == "d":
-                    pattern_parts.append("[0-9]")
-                elif char_class == "s":
-                    pattern_parts.append(r"[!@#$%^&*()_+\-=\[\]{}|;':\",./<>?\\`~]")
-                elif char_class == "a":
-                    pattern_parts.append(".")
-                else:
-                    pattern_parts.append(re.escape(char_class))
-                i += 2
-            else:
-                pattern_parts.append(re.escape(mask[i]))
-                i += 1
-
-        pattern = "^" + "".join(pattern_parts) + "$"
-        return bool(re.match(pattern, password))
+        return compile_mask(mask).fullmatch(password) is not None
 
     def _filter_by_tokens(
         self,
@@ -316,37 +521,18 @@ class KeyspacePasswordGenerator:
         - YEAR: 4-digit year (1900-2100)
         - SYMBOL: special characters
         """
-        result = []
-        for password in passwords:
-            if self._has_token_structure(password, tokens):
-                result.append(password)
-        return result
+        matcher = compile_tokens(tuple(tokens))
+        return [password for password in passwords if matcher.fullmatch(password)]
 
     def _has_token_structure(self, password: str, tokens: list[str]) -> bool:
         """Check if password has the specified token structure."""
-        # Build a regex pattern from tokens
-        patterns = {
-            "WORD": r"[a-zA-Z]+",
-            "DIGIT": r"\d+",
-            "YEAR": r"(19|20)\d{2}",
-            "SYMBOL": r"[!@#$%^&*()_+\-=\[\]{}|;':\",./<>?\\`~]+",
-        }
-
-        pattern_str = "^"
-        for token in tokens:
-            if token.upper() in patterns:
-                pattern_str += patterns[token.upper()]
-            else:
-                # Literal token
-                pattern_str += re.escape(token)
-        pattern_str += "$"
-
-        return bool(re.match(pattern_str, password))
+        return compile_tokens(tuple(tokens)).fullmatch(password) is not None
 
     def _generate_synthetic(
         self,
         keyspace: KeyspaceDefinition,
         count: int,
+        rng: random.Random = random,
     ) -> list[str]:
         """Generate synthetic passwords when corpus doesn't have matches."""
         candidates = []
@@ -366,7 +552,7 @@ class KeyspacePasswordGenerator:
                          "ranger", "ninja", "samurai", "legend", "storm"]
 
         # Shuffle to ensure variety
-        random.shuffle(base_words)
+        rng.shuffle(base_words)
 
         # Common years for year-based patterns
         years = ["2024", "2023", "2022", "2021", "2020", "1999", "1998", "1997"]
@@ -374,7 +560,7 @@ class KeyspacePasswordGenerator:
         symbols = ["!", "@", "#", "_", "-"]
 
         for _ in range(count):
-            word = random.choice(base_words)
+            word = rng.choice(base_words)
 
             if keyspace.complexity == ComplexityLevel.SIMPLE:
                 candidates.append(word.lower())
@@ -383,9 +569,9 @@ class KeyspacePasswordGenerator:
                 # Check if tokens hint at YEAR vs DIGIT
                 tokens = keyspace.tokens or []
                 if "YEAR" in [t.upper() for t in tokens]:
-                    suffix = random.choice(years)
+                    suffix = rng.choice(years)
                 else:
-                    suffix = random.choice(digits)
+                    suffix = rng.choice(digits)
                 # Capitalize the word
                 candidates.append(word.capitalize() + suffix)
 
@@ -396,7 +582,7 @@ class KeyspacePasswordGenerator:
                 # Apply at least one transformation
                 applied = False
                 for c in word:
-                    if c.lower() in leet_map and (not applied or random.random() > 0.5):
+                    if c.lower() in leet_map and (not applied or rng.random() > 0.5):
                         transformed += leet_map[c.lower()]
                         applied = True
                     else:
@@ -412,17 +598,17 @@ class KeyspacePasswordGenerator:
                 has_year = "YEAR" in [t.upper() for t in tokens]
 
                 if has_symbol and has_year:
-                    symbol = random.choice(symbols)
-                    year = random.choice(years)
+                    symbol = rng.choice(symbols)
+                    year = rng.choice(years)
                     transformed = transformed + symbol + year
                 elif has_symbol:
-                    suffix = random.choice(["!", "@1", "#123", "_99", "!2024"])
+                    suffix = rng.choice(["!", "@1", "#123", "_99", "!2024"])
                     transformed = transformed + suffix
                 elif has_year:
-                    year = random.choice(years)
+                    year = rng.choice(years)
                     transformed = transformed + year + "!"
                 else:
-                    suffix = random.choice(["!", "123!", "_2024", "@1"])
+                    suffix = rng.choice(["!", "123!", "_2024", "@1"])
                     transformed = transformed + suffix
 
                 candidates.append(transformed)
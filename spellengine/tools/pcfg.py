@@ -0,0 +1,373 @@
+"""Local PCFG grammar engine.
+
+GenerationStrategy.GRAMMAR asks for passwords expanded from a
+probabilistic context-free grammar (Weir et al., "Password Cracking
+Using Probabilistic Context-Free Grammars"). PatternForge provides one,
+but builds without it fell back to plain corpus sampling. This module
+trains the grammar locally:
+
+- a base structure is a password's letter/digit/other runs with their
+  lengths, e.g. "Summer2024!" -> L6 D4 S1
+- each run is a slot with learned terminals: digit and other runs their
+  strings ("2024", "!"), letter runs a lowercase word ("summer") plus a
+  capitalization mask ("ULLLLL")
+
+P(guess) = P(structure) * product of P(terminal) over its slots.
+
+Grammar.guesses() yields guesses lazily in non-increasing probability
+order, using the "next" function with pivots: a priority queue holds
+one node per structure at first, and popping a node pushes the children
+that advance one slot at or after its pivot, so every guess is reached
+exactly once. Length and mask constraints prune structures and
+terminals before expansion.
+
+Trained grammars are cached with the SCARAB bundles (see model_cache).
+The module doubles as a local probability-ordered attack:
+
+    python -m spellengine.tools.pcfg content/corpus/training_corpus.txt -n 100000 | hashcat ...
+    python -m spellengine.tools.pcfg content/corpus/training_corpus.txt --hash <md5>
+"""
+
+import argparse
+import hashlib
+import heapq
+import json
+import os
+import re
+import sys
+from collections import Counter, defaultdict
+from collections.abc import Iterable, Iterator, Sequence
+from itertools import islice
+from math import prod
+from pathlib import Path
+
+from spellengine.tools.corpus_index import MASK_CLASSES, parse_mask
+from spellengine.tools.model_cache import MODEL_CACHE_DIR, ModelCache, corpus_digest
+from spellengine.tools.packed_corpus import open_corpus
+
+# Bumped whenever training or the grammar layout changes
+GRAMMAR_VERSION = 1
+
+# Runs a password splits into: letters, digits and everything else
+_SEGMENT = re.compile(r"(?P<L>[a-zA-Z]+)|(?P<D>[0-9]+)|(?P<S>[^a-zA-Z0-9]+)")
+
+
+def segments(password: str) -> list[tuple[str, str]]:
+    """Runs of password as (label, run), e.g. "abc12" -> [("L3", "abc"), ("D2", "12")]."""
+    return [
+        (f"{match.lastgroup}{len(match.group())}", match.group())
+        for match in _SEGMENT.finditer(password)
+    ]
+
+
+def case_mask(word: str) -> str:
+    """Capitalization mask of a letter run, e.g. "Summer" -> "ULLLLL"."""
+    return "".join("U" if char.isupper() else "L" for char in word)
+
+
+def apply_case(word: str, mask: str) -> str:
+    """Capitalize a lowercase word by a case mask."""
+    return "".join(char.upper() if m == "U" else char for char, m in zip(word, mask))
+
+
+def _slots(structure: tuple[str, ...]) -> list[str]:
+    """Slots a structure expands: a letter run is a word slot and a case slot."""
+    slots = []
+    for label in structure:
+        slots.append(label)
+        if label[0] == "L":
+            slots.append("C" + label[1:])
+    return slots
+
+
+def _structure_length(structure: tuple[str, ...]) -> int:
+    return sum(int(label[1:]) for label in structure)
+
+
+def _slot_patterns(structure: tuple[str, ...], mask: str) -> list[re.Pattern]:
+    """Per-slot regexes the terminals must match for guesses to fit mask."""
+    positions = parse_mask(mask)
+    patterns = []
+    offset = 0
+    for label in structure:
+        length = int(label[1:])
+        span = positions[offset:offset + length]
+        offset += length
+        chars = "".join(
+            MASK_CLASSES[position[1]] if len(position) == 2 else re.escape(position)
+            for position in span
+        )
+        if label[0] != "L":
+            patterns.append(re.compile(chars))
+            continue
+        # Words are lowercase; the case slot carries what ?u/?l pin down
+        patterns.append(re.compile(chars, re.IGNORECASE))
+        cases = []
+        for position in span:
+            if position in ("?u", "?l"):
+                cases.append(position[1].upper())
+            elif position == "?a":
+                cases.append("[UL]")
+            elif position.isalpha():
+                cases.append("U" if position.isupper() else "L")
+            else:
+                cases.append("(?!)")
+        patterns.append(re.compile("".join(cases)))
+    return patterns
+
+
+class Grammar:
+    """Probabilistic context-free grammar over password structures.
+
+    Attributes:
+        structures: (base structure, probability), most probable first
+        terminals: Slot (e.g. "L6", "C6", "D4") -> (terminal, probability),
+            most probable first
+    """
+
+    def __init__(
+        self,
+        structures: list[tuple[tuple[str, ...], float]],
+        terminals: dict[str, list[tuple[str, float]]],
+    ) -> None:
+        self.structures = structures
+        self.terminals = terminals
+
+    @classmethod
+    def train(cls, corpus: Iterable[str]) -> "Grammar":
+        """Learn structure and terminal probabilities from corpus entries."""
+        structure_counts: Counter[tuple[str, ...]] = Counter()
+        terminal_counts: defaultdict[str, Counter[str]] = defaultdict(Counter)
+        for entry in corpus:
+            runs = segments(entry)
+            if not runs:
+                continue
+            structure_counts[tuple(label for label, _ in runs)] += 1
+            for label, run in runs:
+                if label[0] == "L":
+                    terminal_counts[label][run.lower()] += 1
+                    terminal_counts["C" + label[1:]][case_mask(run)] += 1
+                else:
+                    terminal_counts[label][run] += 1
+
+        return cls(
+            _probabilities(structure_counts),
+            {slot: _probabilities(counts) for slot, counts in terminal_counts.items()},
+        )
+
+    def probability(self, password: str) -> float:
+        """Probability the grammar assigns to password (0.0 if it can't produce it)."""
+        runs = segments(password)
+        structure = dict(self.structures).get(tuple(label for label, _ in runs), 0.0)
+        terminals = []
+        for label, run in runs:
+            if label[0] == "L":
+                terminals += [(label, run.lower()), ("C" + label[1:], case_mask(run))]
+            else:
+                terminals.append((label, run))
+        return structure * prod(
+            dict(self.terminals.get(slot, [])).get(terminal, 0.0) for slot, terminal in terminals
+        )
+
+    def guesses(
+        self,
+        min_length: int = 1,
+        max_length: int | None = None,
+        mask: str | None = None,
+    ) -> Iterator[tuple[str, float]]:
+        """Every guess the grammar produces, most probable first.
+
+        Args:
+            min_length: Shortest guess
+            max_length: Longest guess (None for no limit)
+            mask: Hashcat mask guesses must match
+
+        Yields:
+            (guess, probability), probabilities non-increasing
+        """
+        mask_length = len(parse_mask(mask)) if mask else None
+        expansions = []
+        for structure, probability in self.structures:
+            length = _structure_length(structure)
+            if length < min_length or (max_length is not None and length > max_length):
+                continue
+            if mask_length is not None and length != mask_length:
+                continue
+            slots = [self.terminals[slot] for slot in _slots(structure)]
+            if mask:
+                patterns = _slot_patterns(structure, mask)
+                slots = [
+                    [(t, p) for t, p in terminals if pattern.fullmatch(t)]
+                    for terminals, pattern in zip(slots, patterns)
+                ]
+                if not all(slots):
+                    continue
+            expansions.append((structure, probability, slots))
+
+        def node(n: int, indices: tuple[int, ...], pivot: int) -> tuple:
+            _, probability, slots = expansions[n]
+            p = probability * prod(slot[i][1] for slot, i in zip(slots, indices))
+            return (-p, n, indices, pivot)
+
+        queue = [node(n, (0,) * len(slots), 0) for n, (_, _, slots) in enumerate(expansions)]
+        heapq.heapify(queue)
+        while queue:
+            neg_p, n, indices, pivot = heapq.heappop(queue)
+            structure, _, slots = expansions[n]
+            yield _render(structure, [slot[i][0] for slot, i in zip(slots, indices)]), -neg_p
+            for i in range(pivot, len(indices)):
+                if indices[i] + 1 < len(slots[i]):
+                    child = indices[:i] + (indices[i] + 1,) + indices[i + 1:]
+                    heapq.heappush(queue, node(n, child, i))
+
+    def generate(
+        self,
+        count: int,
+        min_length: int = 1,
+        max_length: int | None = None,
+        mask: str | None = None,
+    ) -> list[str]:
+        """The count most probable guesses (see guesses())."""
+        return [guess for guess, _ in islice(self.guesses(min_length, max_length, mask), count)]
+
+
+def _probabilities(counts: Counter) -> list[tuple]:
+    """(item, probability) from counts, most probable first (ties in item order)."""
+    total = sum(counts.values())
+    return sorted(
+        ((item, n / total) for item, n in counts.items()),
+        key=lambda pair: (-pair[1], pair[0]),
+    )
+
+
+def _render(structure: tuple[str, ...], terminals: list[str]) -> str:
+    parts = []
+    terminals_iter = iter(terminals)
+    for label in structure:
+        terminal = next(terminals_iter)
+        if label[0] == "L":
+            terminal = apply_case(terminal, next(terminals_iter))
+        parts.append(terminal)
+    return "".join(parts)
+
+
+def grammar_cache_key(corpus_path: Path) -> str:
+    """Cache key for the grammar trained on a corpus (changes with its contents)."""
+    identity = json.dumps(
+        {"grammar_version": GRAMMAR_VERSION, "corpus": corpus_digest(corpus_path)},
+        sort_keys=True,
+    )
+    return hashlib.blake2b(identity.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def load_grammar(
+    corpus_path: Path,
+    corpus: Sequence[str] | None = None,
+    cache: ModelCache | None = None,
+    rebuild: bool = False,
+) -> Grammar:
+    """Grammar for a corpus, from the cache when one is configured.
+
+    Args:
+        corpus_path: Training corpus (text or packed)
+        corpus: Its entries if already loaded (read with open_corpus otherwise)
+        cache: Cache of trained grammars (None trains every time)
+        rebuild: Retrain even if a cached grammar exists
+
+    Returns:
+        The trained grammar
+    """
+    key = None
+    if cache is not None:
+        key = grammar_cache_key(corpus_path)
+        if not rebuild:
+            grammar = cache.load(key)
+            if isinstance(grammar, Grammar):
+                return grammar
+
+    grammar = Grammar.train(corpus if corpus is not None else open_corpus(corpus_path))
+    if key is not None:
+        cache.save(key, grammar)
+    return grammar
+
+
+def attack(
+    grammar: Grammar,
+    hash_value: str,
+    hash_type: str = "md5",
+    max_guesses: int | None = None,
+) -> tuple[str, int] | None:
+    """Crack an unsalted hash by trying guesses in probability order.
+
+    Args:
+        grammar: Trained grammar
+        hash_value: Hex digest to crack
+        hash_type: hashlib algorithm name
+        max_guesses: Give up after this many guesses (None to exhaust the grammar)
+
+    Returns:
+        (password, guess number) or None if not found
+    """
+    target = hash_value.lower()
+    guesses = islice(grammar.guesses(), max_guesses)
+    for number, (guess, _) in enumerate(guesses, start=1):
+        if hashlib.new(hash_type, guess.encode("utf-8")).hexdigest() == target:
+            return guess, number
+    return None
+
+
+def main() -> int:
+    """CLI entry point: print guesses in probability order, or crack a hash."""
+    parser = argparse.ArgumentParser(
+        description="Probability-ordered password guesses from a PCFG trained on a corpus"
+    )
+    parser.add_argument("corpus", type=Path, help="Training corpus (text or packed)")
+    parser.add_argument("-n", "--count", type=int, help="Guesses to print or try (default: all)")
+    parser.add_argument("--min-length", type=int, default=1, help="Shortest guess")
+    parser.add_argument("--max-length", type=int, help="Longest guess")
+    parser.add_argument("--mask", help="Hashcat mask guesses must match")
+    parser.add_argument("--hash", dest="hash_value", help="Crack this hash instead of printing")
+    parser.add_argument("--hash-type", default="md5", help="Hash algorithm (default: md5)")
+    parser.add_argument(
+        "--model-cache",
+        type=Path,
+        default=MODEL_CACHE_DIR,
+        help=f"Grammar cache directory (default: {MODEL_CACHE_DIR})",
+    )
+    parser.add_argument(
+        "--no-model-cache", action="store_true", help="Train without reading or writing the cache"
+    )
+    parser.add_argument("--rebuild", action="store_true", help="Retrain and replace the cache")
+    args = parser.parse_args()
+
+    if not args.corpus.exists():
+        print(f"Error: Corpus not found: {args.corpus}", file=sys.stderr)
+        return 1
+
+    cache = None if args.no_model_cache else ModelCache(args.model_cache, kind="pcfg")
+    grammar = load_grammar(args.corpus, cache=cache, rebuild=args.rebuild)
+
+    if args.hash_value:
+        if args.hash_type not in hashlib.algorithms_available:
+            print(f"Error: Unsupported hash type: {args.hash_type}", file=sys.stderr)
+            return 1
+        found = attack(grammar, args.hash_value, args.hash_type, args.count)
+        if found is None:
+            print("Not found")
+            return 1
+        password, number = found
+        print(f"Cracked: {password} (guess {number:,})")
+        return 0
+
+    guesses = grammar.guesses(args.min_length, args.max_length, args.mask)
+    try:
+        for guess, _ in islice(guesses, args.count):
+            print(guess)
+    except BrokenPipeError:
+        # Consumer (hashcat, head) stopped reading; don't fail flushing at exit
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -29,6 +29,8 @@ datas = [
     (str(PROJECT_ROOT / 'assets' / 'audio'), 'assets/audio'),
     # Lore files (if needed by game)
     (str(PROJECT_ROOT / 'lore'), 'lore'),
+    # Built-in datasets (achievement library, designed hashes, grades)
+    (str(PROJECT_ROOT / 'spellengine' / 'adventures' / 'data'), 'spellengine/adventures/data'),
 ]
 
 # Filter out non-existent paths
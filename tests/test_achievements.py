@@ -0,0 +1,213 @@
+"""Achievement rule engine tests.
+
+Run with: pytest tests/test_achievements.py -v
+"""
+
+import pytest
+
+from spellengine.adventures.achievement_packs import (
+    build_campaign_achievements,
+    compile_pack,
+    load_pack,
+)
+from spellengine.adventures.achievements import (
+    ACHIEVEMENT_LIBRARY,
+    Achievement,
+    AchievementCategory,
+    AchievementManager,
+    TriggerType,
+    compile_condition,
+    create_achievement_manager,
+)
+
+
+def make_achievement(achievement_id: str, trigger: TriggerType, value: int | None = None) -> Achievement:
+    """Build a minimal achievement for tests."""
+    return Achievement(
+        id=achievement_id,
+        title=achievement_id,
+        description="test",
+        category=AchievementCategory.PROGRESS_PUNS,
+        trigger_type=trigger,
+        trigger_value=value,
+    )
+
+
+class TestThresholdTriggers:
+    """Test count-style triggers."""
+
+    def test_crack_count_unlocks_everything_crossed(self):
+        manager = AchievementManager([
+            make_achievement("c10", TriggerType.CRACK_COUNT, 10),
+            make_achievement("c1", TriggerType.CRACK_COUNT, 1),
+            make_achievement("c5", TriggerType.CRACK_COUNT, 5),
+        ])
+        unlocked = manager.check_trigger(TriggerType.CRACK_COUNT, value=5)
+        # Declaration order, not threshold order
+        assert [u.achievement_id for u in unlocked] == ["c1", "c5"]
+        assert manager.check_trigger(TriggerType.CRACK_COUNT, value=5) == []
+        assert [u.achievement_id for u in manager.check_trigger(TriggerType.CRACK_COUNT, value=12)] == ["c10"]
+
+    def test_speed_crack_is_at_most(self):
+        manager = AchievementManager([
+            make_achievement("fast", TriggerType.SPEED_CRACK, 10),
+            make_achievement("quick", TriggerType.SPEED_CRACK, 30),
+        ])
+        assert [u.achievement_id for u in manager.check_trigger(TriggerType.SPEED_CRACK, value=20)] == ["quick"]
+        assert [u.achievement_id for u in manager.check_trigger(TriggerType.SPEED_CRACK, value=5)] == ["fast"]
+
+    def test_non_int_value_never_unlocks_thresholds(self):
+        manager = AchievementManager([make_achievement("c1", TriggerType.CRACK_COUNT, 1)])
+        assert manager.check_trigger(TriggerType.CRACK_COUNT, value=None) == []
+        assert manager.check_trigger(TriggerType.CRACK_COUNT, value="3") == []
+
+    def test_chapter_complete_without_value_always_unlocks(self):
+        manager = AchievementManager([
+            make_achievement("any", TriggerType.CHAPTER_COMPLETE),
+            make_achievement("three", TriggerType.CHAPTER_COMPLETE, 3),
+        ])
+        assert [u.achievement_id for u in manager.check_trigger(TriggerType.CHAPTER_COMPLETE, value=1)] == ["any"]
+
+
+class TestContextTriggers:
+    """Test context-gated and unconditional triggers."""
+
+    def test_context_predicate(self):
+        manager = AchievementManager([make_achievement("flawless", TriggerType.NO_DEATH_CHAPTER)])
+        assert manager.check_trigger(TriggerType.NO_DEATH_CHAPTER, context={}) == []
+        unlocked = manager.check_trigger(TriggerType.NO_DEATH_CHAPTER, context={"deaths_in_chapter": 0})
+        assert [u.achievement_id for u in unlocked] == ["flawless"]
+
+    def test_first_crack(self):
+        manager = AchievementManager()
+        unlocked = manager.check_trigger(TriggerType.FIRST_CRACK)
+        expected = [a.id for a in ACHIEVEMENT_LIBRARY if a.trigger_type == TriggerType.FIRST_CRACK]
+        assert [u.achievement_id for u in unlocked] == expected
+
+
+class TestUnlockedSet:
+    """Test the maintained unlocked set."""
+
+    def test_import_state_rebuilds_unlocked(self):
+        manager = AchievementManager([
+            make_achievement("c1", TriggerType.CRACK_COUNT, 1),
+            make_achievement("c2", TriggerType.CRACK_COUNT, 2),
+        ])
+        manager.check_trigger(TriggerType.CRACK_COUNT, value=2)
+        saved = manager.export_state()
+
+        restored = AchievementManager(list(manager.achievements.values()))
+        restored.import_state(saved)
+        assert restored.is_unlocked("c2")
+        assert restored.check_trigger(TriggerType.CRACK_COUNT, value=2) == []
+
+        restored.import_state({"unlocked": []})
+        assert [u.achievement_id for u in restored.check_trigger(TriggerType.CRACK_COUNT, value=2)] == ["c1", "c2"]
+
+    def test_large_pack(self):
+        pack = [make_achievement(f"xp_{i}", TriggerType.XP_EARNED, i * 10) for i in range(5000)]
+        manager = AchievementManager(pack)
+        assert len(manager.check_trigger(TriggerType.XP_EARNED, value=995)) == 100
+        assert len(manager.check_trigger(TriggerType.XP_EARNED, value=1005)) == 1
+        assert manager.get_progress_summary()["unlocked"] == 101
+
+
+class TestRuleConditions:
+    """Test compiled condition expressions."""
+
+    def test_condition_reads_value_and_context(self):
+        predicate = compile_condition("encounter_id == 'enc_speed_id' and value <= 15")
+        assert predicate(10, {"encounter_id": "enc_speed_id"})
+        assert not predicate(20, {"encounter_id": "enc_speed_id"})
+        assert not predicate(10, {"encounter_id": "enc_other"})
+        assert not predicate(None, {"encounter_id": "enc_speed_id"})
+
+    def test_condition_rejects_calls_and_attributes(self):
+        with pytest.raises(ValueError):
+            compile_condition("__import__('os')")
+        with pytest.raises(ValueError):
+            compile_condition("value.__class__")
+        with pytest.raises(ValueError):
+            compile_condition("value >=")
+
+
+class TestAchievementPacks:
+    """Test declarative YAML achievement packs."""
+
+    PACK = {
+        "id": "test_pack",
+        "type": "achievement_pack",
+        "campaign": "dread_citadel",
+        "achievements": [
+            {
+                "id": "lord_slayer",
+                "title": "Lord Slayer",
+                "description": "Defeat the lord",
+                "category": "crack_puns",
+                "trigger": "crack_count",
+                "condition": "encounter_id == 'enc_citadel_lord'",
+            },
+            {
+                "id": "ten_cracks",
+                "title": "Ten",
+                "description": "Crack ten",
+                "category": "progress_puns",
+                "trigger": "crack_count",
+                "condition": "value >= 10",
+            },
+        ],
+    }
+
+    def test_simple_threshold_folded(self):
+        pack = compile_pack(self.PACK, digest="x")
+        ten = next(a for a in pack.achievements if a.id == "ten_cracks")
+        assert ten.trigger_value == 10
+        assert ten.condition is None
+        assert set(pack.predicates) == {"lord_slayer"}
+
+    def test_pack_predicates_gate_unlocks(self):
+        pack = compile_pack(self.PACK, digest="x")
+        manager = AchievementManager(list(pack.achievements), pack.predicates)
+        unlocked = manager.check_trigger(
+            TriggerType.CRACK_COUNT, value=1, context={"encounter_id": "enc_gatekeeper"}
+        )
+        assert unlocked == []
+        unlocked = manager.check_trigger(
+            TriggerType.CRACK_COUNT, value=10, context={"encounter_id": "enc_citadel_lord"}
+        )
+        assert [u.achievement_id for u in unlocked] == ["lord_slayer", "ten_cracks"]
+
+    def test_invalid_condition_rejected(self):
+        data = {"achievements": [dict(self.PACK["achievements"][0], condition="open('x')")]}
+        with pytest.raises(ValueError):
+            compile_pack(data, digest="x")
+
+    def test_load_pack_reuses_compiled_pack(self, tmp_path):
+        import yaml
+
+        path = tmp_path / "achievements.yaml"
+        path.write_text(yaml.safe_dump(self.PACK))
+        assert load_pack(path) is load_pack(path)
+
+    def test_campaign_pack_merged_with_library(self, tmp_path):
+        import yaml
+
+        (tmp_path / "dread_citadel").mkdir()
+        (tmp_path / "dread_citadel" / "achievements.yaml").write_text(yaml.safe_dump(self.PACK))
+        achievements, predicates = build_campaign_achievements("dread_citadel", tmp_path)
+
+        ids = [a.id for a in achievements]
+        assert ids[: len(ACHIEVEMENT_LIBRARY)] == [a.id for a in ACHIEVEMENT_LIBRARY]
+        assert "lord_slayer" in ids
+        assert "lord_slayer" in predicates
+
+        other, _ = build_campaign_achievements("other_campaign", tmp_path)
+        assert len(other) == len(ACHIEVEMENT_LIBRARY)
+
+    def test_shipped_dread_citadel_pack(self):
+        manager = create_achievement_manager("dread_citadel")
+        assert "id_please" in manager.achievements
+        unlocked = manager.check_trigger(
+            TriggerType.SPEED_CRACK, value=12, context={"encounter_id": "enc_speed_id"}
+        )
+        assert "id_please" in [u.achievement_id for u in unlocked]
@@ -0,0 +1,143 @@
+"""Retroactive achievement backfill tests.
+
+Run with: pytest tests/test_backfill.py -v
+"""
+
+import pytest
+
+from spellengine.adventures.achievements import (
+    ACHIEVEMENT_LIBRARY,
+    Achievement,
+    AchievementCategory,
+    AchievementManager,
+    TriggerType,
+)
+from spellengine.adventures.backfill import BackfillReport, backfill_saves, find_save_files
+from spellengine.adventures.models import OutcomeType
+from spellengine.adventures.savefile import is_binary_save
+from spellengine.adventures.state import AdventureState
+
+
+def play_through(state: AdventureState, max_steps: int = 200) -> None:
+    """Walk the campaign taking correct choices until it completes."""
+    for _ in range(max_steps):
+        if state.current_encounter.choices:
+            correct = next(c for c in state.current_encounter.choices if c.is_correct)
+            state.make_choice(correct.id)
+            continue
+        result = state.record_outcome(OutcomeType.SUCCESS)
+        if result["action"] in ("complete", "game_over"):
+            return
+
+
+def make_save(campaign, path, complete: bool = True) -> AdventureState:
+    """Write a save made before any achievements existed."""
+    state = AdventureState(
+        campaign, save_path=path, achievement_manager=AchievementManager([])
+    )
+    if complete:
+        play_through(state)
+    else:
+        state.record_outcome(OutcomeType.SUCCESS)
+    state.save()
+    assert state.state.achievements == []
+    return state
+
+
+@pytest.fixture
+def save_dir(campaign, tmp_path):
+    """A directory of player saves: two finished, one just started."""
+    for name in ("alice", "bob"):
+        make_save(campaign, tmp_path / name / "dread_citadel_game.sav")
+    make_save(campaign, tmp_path / "carol" / "dread_citadel_game.json", complete=False)
+    return tmp_path
+
+
+class TestBackfill:
+    """Test replaying saves through the achievement rules."""
+
+    def test_report_matches_live_play(self, campaign, tmp_path):
+        make_save(campaign, tmp_path / "dread_citadel_game.sav")
+        live = AdventureState(campaign)
+        play_through(live)
+
+        [result] = backfill_saves(campaign, [tmp_path], workers=0)
+
+        assert result.error is None
+        assert not result.applied
+        # Everything earned live is recovered, except timing-based unlocks
+        speed = {a.id for a in ACHIEVEMENT_LIBRARY if a.trigger_type == TriggerType.SPEED_CRACK}
+        assert set(live.state.achievements) - speed <= set(result.unlocked)
+
+    def test_encounter_conditions(self, campaign, tmp_path):
+        state = make_save(campaign, tmp_path / "dread_citadel_game.sav", complete=False)
+        first = state.state.completed_encounters[0]
+        achievements = [
+            Achievement(
+                id="opener",
+                title="Opener",
+                description="test",
+                category=AchievementCategory.CRACK_PUNS,
+                trigger_type=TriggerType.CRACK_COUNT,
+                condition=f"encounter_id == '{first}'",
+            ),
+            Achievement(
+                id="never",
+                title="Never",
+                description="test",
+                category=AchievementCategory.CRACK_PUNS,
+                trigger_type=TriggerType.CRACK_COUNT,
+                condition="encounter_id == 'enc_citadel_lord'",
+            ),
+        ]
+
+        [result] = backfill_saves(campaign, [tmp_path], achievements=achievements, workers=0)
+
+        assert result.unlocked == ["opener"]
+
+    def test_apply_is_idempotent(self, campaign, save_dir):
+        report = BackfillReport()
+        for result in backfill_saves(campaign, [save_dir], apply=True, workers=0):
+            report.add(result)
+        assert report.saves == 3
+        assert report.applied == report.changed == 3
+        assert report.unlocks["md5_mayhem"] == 3
+
+        # Formats are preserved
+        assert is_binary_save((save_dir / "alice" / "dread_citadel_game.sav").read_bytes())
+        assert (save_dir / "carol" / "dread_citadel_game.json").read_text().startswith("{")
+
+        loaded = AdventureState.load(campaign, save_dir / "alice" / "dread_citadel_game.sav")
+        assert "md5_mayhem" in loaded.state.achievements
+
+        rerun = list(backfill_saves(campaign, [save_dir], apply=True, workers=0))
+        assert all(not r.unlocked and not r.applied for r in rerun)
+
+    def test_parallel_matches_serial(self, campaign, save_dir):
+        serial = list(backfill_saves(campaign, [save_dir], workers=0))
+        parallel = list(backfill_saves(campaign, [save_dir], workers=2, chunk_size=1))
+        assert [(r.path, r.unlocked) for r in parallel] == [(r.path, r.unlocked) for r in serial]
+
+    def test_bad_save_reported(self, campaign, save_dir):
+        (save_dir / "broken_game.sav").write_bytes(b"SPSV\x01garbage")
+        report = BackfillReport()
+        for result in backfill_saves(campaign, [save_dir], workers=0):
+            report.add(result)
+        assert report.saves == 4
+        assert [p.name for p, _ in report.errors] == ["broken_game.sav"]
+
+    def test_migrated_save_counted_once(self, campaign, save_dir):
+        legacy = save_dir / "alice" / "dread_citadel_game.json"
+        make_save(campaign, legacy, complete=False)
+        before = legacy.read_bytes()
+
+        assert sorted(p.relative_to(save_dir).as_posix() for p in find_save_files([save_dir])) == [
+            "alice/dread_citadel_game.sav",
+            "bob/dread_citadel_game.sav",
+            "carol/dread_citadel_game.json",
+        ]
+        report = BackfillReport()
+        for result in backfill_saves(campaign, [save_dir], apply=True, workers=0):
+            report.add(result)
+        assert report.saves == 3
+        assert legacy.read_bytes() == before
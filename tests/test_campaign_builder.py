@@ -0,0 +1,409 @@
+"""Campaign builder keyspace resolution tests.
+
+Run with: pytest tests/test_campaign_builder.py -v
+"""
+
+import sys
+import types
+
+import pytest
+import yaml
+
+from spellengine.adventures import loader
+from spellengine.adventures.keyspace import GenerationStrategy, KeyspaceDefinition
+from spellengine.adventures.loader import (
+    COMPILED_SCHEMA_VERSION,
+    compiled_path_for,
+    load_campaign,
+    read_compiled,
+)
+from spellengine.tools import campaign_builder
+from spellengine.tools.campaign_builder import BuildManifest, build_campaign, manifest_path_for
+from spellengine.tools.model_cache import ModelCache, model_cache_key
+from spellengine.tools.password_generator import SCARAB_PARAMS, KeyspacePasswordGenerator
+
+CORPUS = [
+    "dragon", "shadow", "wizard", "falcon", "Dragon1", "Shadow12", "Wizard99",
+    "Falcon77", "hunter", "knight", "Hunter2024", "Knight2023",
+]
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    """A small training corpus."""
+    path = tmp_path / "corpus.txt"
+    path.write_text("# test corpus\n" + "\n".join(CORPUS) + "\n")
+    return path
+
+
+@pytest.fixture
+def runs(monkeypatch):
+    """Record generation runs, returning the corpus words that fit."""
+    calls = []
+
+    def fake_run(self, strategy, min_length, max_length, budget):
+        calls.append((strategy, min_length, max_length, budget))
+        return [w for w in self._corpus if min_length <= len(w) <= max_length]
+
+    monkeypatch.setattr(KeyspacePasswordGenerator, "_run_entropysmith", fake_run)
+    return calls
+
+
+def keyspace(**fields) -> KeyspaceDefinition:
+    """A keyspace of six-character passwords unless overridden."""
+    return KeyspaceDefinition(**{"min_length": 6, "max_length": 6, **fields})
+
+
+class TestGenerateBatch:
+    """Test batched generation from shared candidate pools."""
+
+    def test_one_run_per_group(self, corpus, runs):
+        generator = KeyspacePasswordGenerator(corpus)
+        keyspaces = [keyspace() for _ in range(4)] + [
+            keyspace(min_length=8, max_length=10),
+            keyspace(strategy=GenerationStrategy.GRAMMAR),
+        ]
+        passwords = generator.generate_batch(keyspaces)
+
+        assert len(runs) == 3
+        assert (GenerationStrategy.MUTATIONS, 6, 6, 40) in runs
+        assert len(set(passwords[:4])) == 4
+        assert all(len(p) == 6 for p in passwords[:4])
+        assert 8 <= len(passwords[4]) <= 10
+
+    def test_avoids_used_passwords(self, corpus, runs):
+        generator = KeyspacePasswordGenerator(corpus)
+        used = {"dragon", "shadow", "wizard"}
+        passwords = generator.generate_batch([keyspace(), keyspace()], used)
+
+        assert not {"dragon", "shadow", "wizard"} & set(passwords)
+        assert set(passwords) <= used
+
+    def test_fallback_when_pool_empty(self, corpus, monkeypatch):
+        monkeypatch.setattr(
+            KeyspacePasswordGenerator, "_run_entropysmith", lambda self, *args, **kw: []
+        )
+        generator = KeyspacePasswordGenerator(corpus)
+        passwords = generator.generate_batch([keyspace(mask="?l?l?l?l?l?l")] * 3)
+
+        assert len(set(passwords)) == 3
+        assert all(p.islower() and len(p) == 6 for p in passwords)
+
+
+class TestBuildCampaign:
+    """Test that a build resolves every keyspace in one batch."""
+
+    def test_build(self, tmp_path, corpus, runs):
+        source = tmp_path / "source.yaml"
+        source.write_text(yaml.safe_dump({
+            "id": "test",
+            "title": "Test",
+            "chapters": [{
+                "id": "ch1",
+                "encounters": [
+                    {"id": "e1", "keyspace": {"min_length": 6, "max_length": 6}},
+                    {"id": "e2", "solution": "dragon"},
+                    {
+                        "id": "e3",
+                        "hash_type": "sha1",
+                        "keyspace": {"min_length": 6, "max_length": 6},
+                        "variants": {
+                            "heroic": {"keyspace": {"min_length": 8, "max_length": 10}},
+                        },
+                    },
+                ],
+            }],
+        }))
+        output = tmp_path / "built.yaml"
+        stats = build_campaign(source, output, corpus)
+
+        assert stats["keyspace_groups"] == 2
+        assert len(runs) == 2
+        encounters = yaml.safe_load(output.read_text())["chapters"][0]["encounters"]
+        e1, _, e3 = encounters
+        assert "keyspace" not in e1 and "keyspace" not in e3
+        assert e1["solution"] != "dragon" and e3["solution"] != "dragon"
+        assert e1["solution"] != e3["solution"]
+        assert e3["hash_type"] == "sha1"
+        assert len(e3["hash"]) == 40
+        assert 8 <= len(e3["variants"]["heroic"]["solution"]) <= 10
+
+
+SOURCE = {
+    "id": "test",
+    "title": "Test",
+    "chapters": [{
+        "id": "ch1",
+        "encounters": [
+            {"id": "e1", "keyspace": {"min_length": 6, "max_length": 6}},
+            {"id": "e2", "keyspace": {"min_length": 6, "max_length": 6}},
+            {
+                "id": "e3",
+                "keyspace": {"min_length": 8, "max_length": 10},
+                "variants": {"heroic": {"keyspace": {"min_length": 6, "max_length": 8}}},
+            },
+        ],
+    }],
+}
+
+
+def solutions(output) -> dict[str, str]:
+    """Solutions of a built campaign by site id."""
+    found = {}
+    for enc in yaml.safe_load(output.read_text())["chapters"][0]["encounters"]:
+        found[enc["id"]] = enc["solution"]
+        for name, variant in enc.get("variants", {}).items():
+            found[f"{enc['id']}:{name}"] = variant["solution"]
+    return found
+
+
+class TestIncrementalBuild:
+    """Test seeded builds and reuse of the build manifest."""
+
+    @pytest.fixture
+    def source(self, tmp_path):
+        path = tmp_path / "source.yaml"
+        path.write_text(yaml.safe_dump(SOURCE))
+        return path
+
+    def test_seeded_builds_repeat(self, tmp_path, source, corpus, runs):
+        first = tmp_path / "first.yaml"
+        second = tmp_path / "second.yaml"
+        build_campaign(source, first, corpus)
+        build_campaign(source, second, corpus)
+
+        assert solutions(first) == solutions(second)
+        assert len(set(solutions(first).values())) == 4
+
+    def test_seed_rerolls(self, tmp_path, source, corpus, runs):
+        outputs = []
+        for seed in range(5):
+            output = tmp_path / f"seed{seed}.yaml"
+            build_campaign(source, output, corpus, seed=seed, full_rebuild=True)
+            outputs.append(tuple(sorted(solutions(output).items())))
+        assert len(set(outputs)) > 1
+
+    def test_rebuild_reuses_manifest(self, tmp_path, source, corpus, runs):
+        output = tmp_path / "built.yaml"
+        stats = build_campaign(source, output, corpus)
+        assert stats["keyspaces_resolved"] == 4
+        before = solutions(output)
+
+        manifest = BuildManifest(manifest_path_for(output)).load()
+        assert set(manifest.entries) == set(before)
+        assert manifest.entries["e1"]["solution"] == before["e1"]
+
+        runs.clear()
+        stats = build_campaign(source, output, corpus)
+        assert stats["keyspaces_reused"] == 4
+        assert stats["keyspaces_resolved"] == 0
+        assert runs == []
+        assert solutions(output) == before
+
+    def test_only_changed_keyspace_resolved(self, tmp_path, source, corpus, runs):
+        output = tmp_path / "built.yaml"
+        build_campaign(source, output, corpus)
+        before = solutions(output)
+
+        edited = yaml.safe_load(source.read_text())
+        edited["chapters"][0]["encounters"][1]["keyspace"]["mask"] = "?l?l?l?l?l?l"
+        source.write_text(yaml.safe_dump(edited))
+        stats = build_campaign(source, output, corpus)
+
+        assert stats["keyspaces_reused"] == 3
+        assert stats["keyspaces_resolved"] == 1
+        after = solutions(output)
+        assert {k: v for k, v in after.items() if k != "e2"} == {
+            k: v for k, v in before.items() if k != "e2"
+        }
+        assert after["e2"].islower()
+
+    def test_corpus_change_resolves_all(self, tmp_path, source, corpus, runs):
+        output = tmp_path / "built.yaml"
+        build_campaign(source, output, corpus)
+
+        corpus.write_text(corpus.read_text() + "ranger\n")
+        stats = build_campaign(source, output, corpus)
+        assert stats["keyspaces_reused"] == 0
+        assert stats["keyspaces_resolved"] == 4
+
+    def test_full_rebuild(self, tmp_path, source, corpus, runs):
+        output = tmp_path / "built.yaml"
+        build_campaign(source, output, corpus)
+        stats = build_campaign(source, output, corpus, full_rebuild=True)
+        assert stats["keyspaces_reused"] == 0
+
+
+class TestParallelBuild:
+    """Test chapter fan-out and the duplicate-resolving merge."""
+
+    @pytest.fixture
+    def source(self, tmp_path):
+        lower = {"min_length": 6, "max_length": 6, "mask": "?l?l?l?l?l?l"}
+        path = tmp_path / "source.yaml"
+        path.write_text(yaml.safe_dump({
+            "id": "parallel",
+            "title": "Parallel",
+            "chapters": [
+                {
+                    "id": f"ch{c}",
+                    "encounters": [{"id": f"c{c}e{e}", "keyspace": lower} for e in range(2)],
+                }
+                for c in range(3)
+            ],
+        }))
+        return path
+
+    def built(self, output) -> list[str]:
+        return [
+            enc["solution"]
+            for chapter in yaml.safe_load(output.read_text())["chapters"]
+            for enc in chapter["encounters"]
+        ]
+
+    def test_merge_replaces_duplicates(self, tmp_path, source, corpus, runs):
+        output = tmp_path / "built.yaml"
+        stats = build_campaign(source, output, corpus, workers=1)
+
+        passwords = self.built(output)
+        assert len(set(passwords)) == 6
+        assert all(p.islower() and len(p) == 6 for p in passwords)
+        assert stats["keyspaces_resolved"] == 6
+
+    def test_pool_matches_in_process(self, tmp_path, source, corpus, monkeypatch):
+        monkeypatch.setattr(campaign_builder, "PARALLEL_BUILD_THRESHOLD", 0)
+        serial = tmp_path / "serial.yaml"
+        pooled = tmp_path / "pooled.yaml"
+        serial_stats = build_campaign(source, serial, corpus, workers=1)
+        pooled_stats = build_campaign(source, pooled, corpus, workers=2)
+
+        assert self.built(pooled) == self.built(serial)
+        assert pooled_stats["keyspaces_replaced"] == serial_stats["keyspaces_replaced"]
+
+
+class FakeAnalyzer:
+    """Stand-in SCARABAnalyzer that counts analyze() calls."""
+
+    calls = 0
+
+    def __init__(self, **params):
+        self.params = params
+
+    def analyze(self, **kwargs):
+        FakeAnalyzer.calls += 1
+        return {"params": self.params, "corpus": kwargs["corpus_path"].read_text()}
+
+
+@pytest.fixture
+def scarab(monkeypatch):
+    """Install a fake patternforge.engines.scarab module."""
+    module = types.ModuleType("patternforge.engines.scarab")
+    module.SCARABAnalyzer = FakeAnalyzer
+    for name in ("patternforge", "patternforge.engines"):
+        monkeypatch.setitem(sys.modules, name, types.ModuleType(name))
+    monkeypatch.setitem(sys.modules, "patternforge.engines.scarab", module)
+    FakeAnalyzer.calls = 0
+    return FakeAnalyzer
+
+
+class TestModelCache:
+    """Test the persisted SCARAB model bundle cache."""
+
+    def test_loaded_from_cache(self, tmp_path, corpus, scarab):
+        cache = ModelCache(tmp_path / "models")
+        first = KeyspacePasswordGenerator(corpus, model_cache=cache)._get_patternforge_model()
+        second = KeyspacePasswordGenerator(corpus, model_cache=cache)._get_patternforge_model()
+
+        assert scarab.calls == 1
+        assert second == first
+        assert len(list((tmp_path / "models").glob("scarab-*.pickle"))) == 1
+
+    def test_rebuild_model(self, tmp_path, corpus, scarab):
+        cache = ModelCache(tmp_path / "models")
+        KeyspacePasswordGenerator(corpus, model_cache=cache)._get_patternforge_model()
+        KeyspacePasswordGenerator(
+            corpus, model_cache=cache, rebuild_model=True
+        )._get_patternforge_model()
+        assert scarab.calls == 2
+
+    def test_key_tracks_corpus_and_params(self, corpus):
+        key = model_cache_key(corpus, SCARAB_PARAMS)
+        assert model_cache_key(corpus, {**SCARAB_PARAMS, "mask_limit": 100}) != key
+
+        corpus.write_text(corpus.read_text() + "newword\n")
+        assert model_cache_key(corpus, SCARAB_PARAMS) != key
+
+    def test_corrupt_entry_ignored(self, tmp_path, corpus, scarab):
+        cache = ModelCache(tmp_path / "models")
+        key = model_cache_key(corpus, SCARAB_PARAMS)
+        cache.directory.mkdir()
+        cache.path_for(key).write_bytes(b"not a pickle")
+
+        assert KeyspacePasswordGenerator(corpus, model_cache=cache)._get_patternforge_model()
+        assert scarab.calls == 1
+
+
+class TestCompiledArtifact:
+    """Test the compiled JSON artifact and the loader's fast path."""
+
+    @pytest.fixture
+    def built(self, tmp_path, corpus, runs):
+        source = tmp_path / "source.yaml"
+        chapter = SOURCE["chapters"][0]
+        encounters = [{**enc, "title": enc["id"]} for enc in chapter["encounters"]]
+        data = {**SOURCE, "chapters": [{**chapter, "title": "Chapter 1", "encounters": encounters}]}
+        source.write_text(yaml.safe_dump(data) + "created: 2024-01-01\n")
+        output = tmp_path / "built.yaml"
+        build_campaign(source, output, corpus, seed=3)
+        return output
+
+    @staticmethod
+    def no_yaml(monkeypatch):
+        def fail(*args, **kwargs):
+            raise AssertionError("YAML parsed")
+
+        monkeypatch.setattr(loader.yaml, "safe_load", fail)
+
+    def test_artifact_matches_yaml(self, built):
+        artifact = read_compiled(compiled_path_for(built))
+        assert artifact["schema_version"] == COMPILED_SCHEMA_VERSION
+        assert artifact["build_info"]["seed"] == 3
+        document = yaml.safe_load(built.read_text())
+        assert document.pop("_build_info") == artifact["build_info"]
+        # YAML dates are stored as strings
+        assert artifact["campaign"] == {**document, "created": "2024-01-01"}
+        assert manifest_path_for(built).exists()
+
+    def test_loader_reads_artifact(self, built, monkeypatch):
+        expected = solutions(built)["e1"]
+        self.no_yaml(monkeypatch)
+        campaign = load_campaign(built)
+        assert campaign.chapters[0].encounters[0].solution == expected
+        assert load_campaign(compiled_path_for(built)).id == "test"
+
+    def test_edited_yaml_wins(self, built):
+        built.write_text(built.read_text().replace("title: Test", "title: Edited"))
+        assert load_campaign(built).title == "Edited"
+
+    def test_bad_artifact_falls_back(self, built):
+        compiled_path_for(built).write_text("{not json")
+        assert load_campaign(built).title == "Test"
+        with pytest.raises(ValueError, match="Invalid compiled campaign"):
+            load_campaign(compiled_path_for(built))
+
+    def test_copied_build_uses_artifact(self, built, tmp_path, monkeypatch):
+        # A copy gets new mtimes; only the YAML's contents matter
+        copy = tmp_path / "release" / "campaign.yaml"
+        copy.parent.mkdir()
+        copy.write_bytes(built.read_bytes())
+        compiled_path_for(copy).write_bytes(compiled_path_for(built).read_bytes())
+        self.no_yaml(monkeypatch)
+        assert load_campaign(copy).id == "test"
+
+    def test_compile_existing_build(self, built, monkeypatch):
+        artifact = compiled_path_for(built)
+        expected = artifact.read_text()
+        artifact.unlink()
+        monkeypatch.setattr(sys, "argv", ["campaign_builder", "--compile", str(built)])
+        assert campaign_builder.main() == 0
+        assert artifact.read_text() == expected
@@ -0,0 +1,125 @@
+"""Candidate pipeline tests.
+
+Run with: pytest tests/test_candidate_pipeline.py -v
+"""
+
+import random
+from collections import Counter
+
+import pytest
+
+from spellengine.adventures.keyspace import ComplexityLevel, KeyspaceDefinition
+from spellengine.tools.candidate_pipeline import (
+    dedupe,
+    filter_chars,
+    keyspace_pipeline,
+    reservoir_sample,
+    rotated,
+    sample_candidates,
+)
+from spellengine.tools.password_generator import KeyspacePasswordGenerator
+
+
+class CountingSource:
+    """Iterable that records how many entries were pulled."""
+
+    def __init__(self, entries):
+        self.entries = entries
+        self.pulled = 0
+
+    def __iter__(self):
+        for entry in self.entries:
+            self.pulled += 1
+            yield entry
+
+
+class TestStages:
+    """Test the individual pipeline stages."""
+
+    def test_rotated_visits_everything_once(self):
+        entries = [str(i) for i in range(10)]
+        out = list(rotated(entries, random.Random(3)))
+        assert sorted(out) == sorted(entries)
+        start = entries.index(out[0])
+        assert out == entries[start:] + entries[:start]
+        assert list(rotated([], random.Random(3))) == []
+
+    def test_filter_chars(self):
+        words = ["dragon", "Dragon1", "drag0n", "wizard"]
+        assert list(filter_chars(words, required_chars="d")) == ["dragon", "drag0n", "wizard"]
+        assert list(filter_chars(words, banned_chars="0")) == ["dragon", "Dragon1", "wizard"]
+        assert list(filter_chars(words, banned_patterns=["rag"])) == ["wizard"]
+        assert list(filter_chars(words, required_chars="1")) == ["Dragon1"]
+
+    def test_dedupe(self):
+        assert list(dedupe(["a", "b", "a", "c", "b"])) == ["a", "b", "c"]
+
+    def test_keyspace_pipeline(self):
+        keyspace = KeyspaceDefinition(
+            min_length=6, max_length=7, mask="?l?l?l?l?l?l", banned_chars="z"
+        )
+        words = ["dragon", "wizard", "dragon", "Dragon", "drag", "shadow"]
+        assert list(keyspace_pipeline(words, keyspace)) == ["dragon", "shadow"]
+
+    def test_reservoir_is_uniform(self):
+        rng = random.Random(0)
+        counts = Counter()
+        for _ in range(4000):
+            counts.update(reservoir_sample(range(10), 2, rng))
+        assert len(counts) == 10
+        assert max(counts.values()) / min(counts.values()) < 1.3
+
+    def test_reservoir_short_stream(self):
+        assert sorted(reservoir_sample(["a", "b"], 5)) == ["a", "b"]
+
+
+class TestLaziness:
+    """Test that sampling stops pulling once its window is full."""
+
+    def test_stops_after_window(self):
+        source = CountingSource([f"word{i:06d}" for i in range(100_000)])
+        keyspace = KeyspaceDefinition(min_length=1, max_length=32)
+        sample = sample_candidates(keyspace_pipeline(source, keyspace), 3, 30, random.Random(1))
+
+        assert len(sample) == 3
+        assert source.pulled == 30
+
+    def test_rejected_candidates_dont_count(self):
+        entries = ["x"] * 50 + [f"word{i}" for i in range(100)]
+        source = CountingSource(entries)
+        keyspace = KeyspaceDefinition(min_length=4, max_length=32)
+        sample_candidates(keyspace_pipeline(source, keyspace), 1, 10, random.Random(1))
+        assert source.pulled == 60
+
+
+class TestFallback:
+    """Test the generator's streaming fallback."""
+
+    @pytest.fixture
+    def generator(self, tmp_path):
+        corpus = tmp_path / "corpus.txt"
+        corpus.write_text("\n".join(
+            ["dragon", "shadow", "wizard", "Dragon1", "Shadow12", "summer2024", "winter2023"]
+        ) + "\n")
+        return KeyspacePasswordGenerator(corpus, use_patternforge=False)
+
+    def test_respects_banned_chars(self, generator):
+        keyspace = KeyspaceDefinition(min_length=6, max_length=6, banned_chars="gz")
+        for seed in range(10):
+            assert generator.generate_for_keyspace(keyspace, 1, random.Random(seed)) == ["shadow"]
+
+    def test_prefers_complexity(self, generator):
+        keyspace = KeyspaceDefinition(
+            min_length=6, max_length=10, complexity=ComplexityLevel.COMPOUND
+        )
+        passwords = generator.generate_for_keyspace(keyspace, 10, random.Random(0))
+        assert sorted(passwords) == ["Dragon1", "Shadow12", "summer2024", "winter2023"]
+
+    def test_seeded(self, generator):
+        keyspace = KeyspaceDefinition(min_length=6, max_length=6)
+        first = generator.generate_for_keyspace(keyspace, 2, random.Random(7))
+        assert generator.generate_for_keyspace(keyspace, 2, random.Random(7)) == first
+
+    def test_batch_applies_char_filters(self, generator):
+        keyspace = KeyspaceDefinition(min_length=6, max_length=6, required_chars="w")
+        assert set(generator.generate_batch([keyspace, keyspace])) == {"shadow", "wizard"}
@@ -0,0 +1,106 @@
+"""Library-wide grading command tests.
+
+Run with: pytest tests/test_content_grading.py -v
+"""
+
+import csv
+import shutil
+
+import pytest
+
+from spellengine.adventures.experience_grading import grade_campaign
+from spellengine.content.cli import main
+from spellengine.content.grading import (
+    DIMENSIONS,
+    GRADE_COLUMNS,
+    GradeTableError,
+    grade_library,
+    read_grade_table,
+)
+from spellengine.content.indexer import ContentIndexer
+from tests.conftest import CAMPAIGN_PATH
+
+
+@pytest.fixture
+def content_root(tmp_path):
+    """A content root with two adventures built from the test campaign."""
+    for name in ("citadel_a", "citadel_b"):
+        item_dir = tmp_path / "adventures" / name
+        item_dir.mkdir(parents=True)
+        shutil.copy(CAMPAIGN_PATH, item_dir / "campaign.yaml")
+        (item_dir / "manifest.yaml").write_text(
+            f"id: {name}\ntype: adventure\ntitle: {name}\nversion: '1.0.0'\nengine: '>=1.0.0'\n"
+        )
+    ContentIndexer(tmp_path).rebuild()
+    return tmp_path
+
+
+def read_csv(path) -> list[list[str]]:
+    with open(path, newline="") as f:
+        return list(csv.reader(f))
+
+
+class TestGradeCommand:
+    """Test the spellengine-content grade command."""
+
+    def test_csv_rows_match_grader(self, campaign, content_root, tmp_path):
+        out = tmp_path / "grades.csv"
+        assert main(["--content-root", str(content_root), "grade", "-o", str(out), "-j", "0"]) == 0
+
+        header, *rows = read_csv(out)
+        assert tuple(header) == GRADE_COLUMNS
+
+        grades = [g for ch in grade_campaign(campaign).chapter_grades for g in ch.encounter_grades]
+        assert len(rows) == 2 * len(grades) * len(DIMENSIONS)
+        first = [r for r in rows if r[0] == "citadel_a"]
+        expected = [
+            (g.encounter_id, str(i), d, str(getattr(g, d)))
+            for i, g in enumerate(grades)
+            for d in DIMENSIONS
+        ]
+        assert [(r[2], r[3], r[4], r[5]) for r in first] == expected
+
+    def test_binary_matches_csv(self, content_root, tmp_path):
+        out, binary = tmp_path / "grades.csv", tmp_path / "grades.segt"
+        main([
+            "--content-root", str(content_root), "grade",
+            "-o", str(out), "--binary", str(binary), "-j", "0",
+        ])
+
+        decoded = [
+            [str(v) for v in row]
+            for scores in read_grade_table(binary.read_bytes())
+            for row in scores.rows()
+        ]
+        assert decoded == read_csv(out)[1:]
+        assert binary.stat().st_size < out.stat().st_size / 10
+
+    def test_only_selected_ids(self, content_root, tmp_path):
+        out = tmp_path / "grades.csv"
+        main(["--content-root", str(content_root), "grade", "-o", str(out), "--id", "citadel_b", "-j", "0"])
+        assert {r[0] for r in read_csv(out)[1:]} == {"citadel_b"}
+
+    def test_broken_adventure_reported(self, content_root, tmp_path, capsys):
+        (content_root / "adventures" / "citadel_a" / "campaign.yaml").unlink()
+        out = tmp_path / "grades.csv"
+
+        assert main(["--content-root", str(content_root), "grade", "-o", str(out), "-j", "0"]) == 1
+        assert "ERROR [citadel_a]" in capsys.readouterr().err
+        assert {r[0] for r in read_csv(out)[1:]} == {"citadel_b"}
+
+
+class TestGradeLibrary:
+    """Test parallel grading and the binary table."""
+
+    def test_parallel_matches_serial(self, content_root):
+        adventures = [
+            (name, content_root / "adventures" / name / "campaign.yaml")
+            for name in ("citadel_a", "citadel_b")
+        ]
+        serial = list(grade_library(adventures, workers=0))
+        parallel = list(grade_library(iter(adventures), workers=2))
+        assert parallel == serial
+
+    def test_rejects_other_files(self):
+        with pytest.raises(GradeTableError):
+            list(read_grade_table(b"SPSV\x01"))
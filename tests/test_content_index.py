@@ -0,0 +1,361 @@
+"""Content index tests.
+
+Run with: pytest tests/test_content_index.py -v
+"""
+
+import json
+import os
+
+import pytest
+
+from spellengine.content import backends as backends_module
+from spellengine.content import indexer as indexer_module
+from spellengine.content.indexer import ContentIndexer
+from spellengine.content.manifests import ManifestValidator
+
+
+def write_manifest(root, name: str, content_type: str = "adventures", **fields) -> None:
+    """Write a minimal manifest for one content item."""
+    item_dir = root / content_type / name
+    item_dir.mkdir(parents=True, exist_ok=True)
+    manifest = {
+        "id": name,
+        "type": content_type.rstrip("s"),
+        "title": name.replace("_", " ").title(),
+        "version": "1.0.0",
+        "engine": ">=1.0.0",
+        **fields,
+    }
+    (item_dir / "manifest.yaml").write_text(
+        "\n".join(f"{k}: {json.dumps(v)}" for k, v in manifest.items()) + "\n"
+    )
+
+
+@pytest.fixture
+def library(tmp_path):
+    """A small content library."""
+    for name in ("alpha", "bravo", "charlie"):
+        write_manifest(tmp_path, name, difficulty="beginner", tags=["md5"])
+    write_manifest(tmp_path, "delta", "trainings", difficulty="advanced")
+    return tmp_path
+
+
+@pytest.fixture
+def parses(monkeypatch):
+    """Record which manifests get parsed."""
+    seen = []
+    parse = indexer_module._parse_manifest
+
+    def counting(path, *args):
+        seen.append(os.path.basename(os.path.dirname(path)))
+        return parse(path, *args)
+
+    monkeypatch.setattr(indexer_module, "_parse_manifest", counting)
+    return seen
+
+
+class TestIncrementalRebuild:
+    """Test that rebuilds only re-parse changed manifests."""
+
+    def test_noop_rebuild_parses_nothing(self, library, parses):
+        first = ContentIndexer(library).rebuild(workers=0)
+        assert sorted(parses) == ["alpha", "bravo", "charlie", "delta"]
+        mtime = os.stat(library / "index.json").st_mtime_ns
+
+        parses.clear()
+        second = ContentIndexer(library).rebuild(workers=0)
+        assert parses == []
+        assert second == first
+        assert os.stat(library / "index.json").st_mtime_ns == mtime
+
+    def test_edit_reparses_only_changed(self, library, parses):
+        ContentIndexer(library).rebuild(workers=0)
+        write_manifest(library, "bravo", difficulty="expert", tags=["sha1"])
+
+        parses.clear()
+        index = ContentIndexer(library).rebuild(workers=0)
+        assert parses == ["bravo"]
+        bravo = ContentIndexer(library).get("bravo")
+        assert bravo["difficulty"] == "expert"
+        assert [item["id"] for item in index["adventures"]] == ["alpha", "bravo", "charlie"]
+
+    def test_touch_keeps_entry(self, library, parses):
+        first = ContentIndexer(library).rebuild(workers=0)
+        path = library / "adventures" / "alpha" / "manifest.yaml"
+        os.utime(path, ns=(1, 1))
+
+        parses.clear()
+        second = ContentIndexer(library).rebuild(workers=0)
+        assert parses == ["alpha"]
+        assert second["adventures"] == first["adventures"]
+        assert second["manifests"][os.path.join("adventures", "alpha")]["mtime_ns"] == 1
+
+    def test_added_and_deleted(self, library):
+        ContentIndexer(library).rebuild(workers=0)
+        (library / "adventures" / "charlie" / "manifest.yaml").unlink()
+        write_manifest(library, "echo")
+
+        index = ContentIndexer(library).rebuild(workers=0)
+        assert [item["id"] for item in index["adventures"]] == ["alpha", "bravo", "echo"]
+        assert os.path.join("adventures", "charlie") not in index["manifests"]
+
+    def test_broken_manifest_retried(self, library, parses, capsys):
+        path = library / "adventures" / "bravo" / "manifest.yaml"
+        path.write_text("id: [unclosed\n")
+        index = ContentIndexer(library).rebuild(workers=0)
+        assert "Failed to index bravo" in capsys.readouterr().out
+        assert [item["id"] for item in index["adventures"]] == ["alpha", "charlie"]
+
+        parses.clear()
+        ContentIndexer(library).rebuild(workers=0)
+        assert parses == ["bravo"]
+
+    def test_parallel_matches_serial(self, library, monkeypatch):
+        monkeypatch.setattr(indexer_module, "PARALLEL_PARSE_THRESHOLD", 0)
+        serial = ContentIndexer(library).rebuild(workers=0)
+        (library / "index.json").unlink()
+        parallel = ContentIndexer(library).rebuild(workers=2)
+        for key in ("adventures", "trainings", "manifests"):
+            assert parallel[key] == serial[key]
+
+
+def scan_find(index, content_type=None, difficulty=None, tags=None, hash_types=None,
+              max_duration=None, search=None):
+    """Reference linear-scan implementation of ContentIndexer.find."""
+    results = []
+    for ctype in [content_type] if content_type else ["adventures", "trainings"]:
+        for item in index.get(ctype, []):
+            if difficulty and item.get("difficulty") != difficulty:
+                continue
+            if tags and not set(tags) <= set(item.get("tags", [])):
+                continue
+            if hash_types and not set(hash_types) & set(item.get("hash_types", [])):
+                continue
+            duration = item.get("duration_minutes")
+            if max_duration and duration and duration > max_duration:
+                continue
+            text = (
+                (item.get("title") or "").lower() + " "
+                + (item.get("description") or "").lower() + " "
+                + " ".join(item.get("tags", []))
+            )
+            if search and search.lower() not in text:
+                continue
+            results.append(item)
+    return results
+
+
+@pytest.fixture
+def big_library(tmp_path):
+    """A library with varied discovery fields."""
+    difficulties = ["beginner", "intermediate", "advanced"]
+    tags = ["md5", "sha1", "rules", "masks", "hybrid"]
+    for n in range(60):
+        write_manifest(
+            tmp_path,
+            f"item_{n:02d}",
+            "adventures" if n % 4 else "trainings",
+            difficulty=difficulties[n % 3],
+            duration_minutes=(n * 7) % 90 or None,
+            tags=tags[n % 5:n % 5 + 2],
+            hash_types=["md5"] if n % 2 else ["sha1", "ntlm"],
+            description=f"Crack vault number {n} of the Citadel",
+        )
+    ContentIndexer(tmp_path).rebuild(workers=0)
+    return tmp_path
+
+
+class TestSearchIndex:
+    """Test indexed queries against a linear scan."""
+
+    QUERIES = [
+        {},
+        {"content_type": "trainings"},
+        {"difficulty": "advanced"},
+        {"tags": ["sha1"]},
+        {"tags": ["sha1", "rules"]},
+        {"hash_types": ["ntlm", "md5"]},
+        {"max_duration": 30},
+        {"search": "vault number 1"},
+        {"search": "ci"},
+        {"search": "CITADEL", "difficulty": "beginner", "max_duration": 60},
+        {"search": "no such text"},
+        {"tags": ["unknown"]},
+    ]
+
+    def test_matches_scan(self, big_library):
+        indexer = ContentIndexer(big_library)
+        for query in self.QUERIES:
+            assert indexer.find(**query) == scan_find(indexer.index, **query), query
+
+    def test_singular_content_type(self, big_library):
+        indexer = ContentIndexer(big_library)
+        assert indexer.find(content_type="training") == indexer.find(content_type="trainings")
+
+    def test_get(self, big_library):
+        indexer = ContentIndexer(big_library)
+        assert indexer.get("item_05")["id"] == "item_05"
+        assert indexer.get("missing") is None
+
+    def test_persisted_index_reused(self, big_library, monkeypatch):
+        assert (big_library / "search_index.json").exists()
+
+        def fail(*args):
+            raise AssertionError("search index rebuilt")
+
+        monkeypatch.setattr(backends_module.SearchIndex, "_build", staticmethod(fail))
+        indexer = ContentIndexer(big_library)
+        assert indexer.find(**self.QUERIES[9]) == scan_find(indexer.index, **self.QUERIES[9])
+
+    def test_stale_persisted_index_ignored(self, big_library):
+        write_manifest(big_library, "item_99", difficulty="expert")
+        search_path = big_library / "search_index.json"
+        saved = search_path.read_bytes()
+        ContentIndexer(big_library).rebuild(workers=0)
+        # Simulate an index.json written by something that left the old search index
+        search_path.write_bytes(saved)
+
+        indexer = ContentIndexer(big_library)
+        assert [i["id"] for i in indexer.find(difficulty="expert")] == ["item_99"]
+        assert search_path.read_bytes() != saved
+
+
+class TestSqliteBackend:
+    """Test the SQLite backend against the JSON backend."""
+
+    @pytest.fixture
+    def sqlite_indexer(self, big_library):
+        ContentIndexer(big_library, backend="sqlite").rebuild(workers=0)
+        indexer = ContentIndexer(big_library, backend="sqlite")
+
+        def fail():
+            raise AssertionError("index materialized")
+
+        # Queries must not load the whole index
+        indexer.backend.load = fail
+        return indexer
+
+    def test_find_matches_json(self, big_library, sqlite_indexer):
+        json_indexer = ContentIndexer(big_library)
+        for query in TestSearchIndex.QUERIES + [{"search": "_"}, {"search": "ART"}]:
+            assert sqlite_indexer.find(**query) == json_indexer.find(**query), query
+
+    def test_get_and_stats(self, big_library, sqlite_indexer):
+        json_indexer = ContentIndexer(big_library)
+        assert sqlite_indexer.get("item_05") == json_indexer.get("item_05")
+        assert sqlite_indexer.get("missing") is None
+        assert sqlite_indexer.stats() == json_indexer.stats()
+
+    def test_noop_rebuild_parses_nothing(self, big_library, parses):
+        first = ContentIndexer(big_library, backend="sqlite").rebuild(workers=0)
+        parses.clear()
+        second = ContentIndexer(big_library, backend="sqlite").rebuild(workers=0)
+        assert parses == []
+        assert second == first
+        assert second["adventures"] == ContentIndexer(big_library).index["adventures"]
+
+    def test_missing_database(self, tmp_path):
+        indexer = ContentIndexer(tmp_path, backend="sqlite")
+        assert indexer.find() == []
+        assert indexer.get("anything") is None
+        assert indexer.stats()["total"] == 0
+        assert not (tmp_path / "index.sqlite").exists()
+
+    def test_outdated_schema_rebuilt(self, library, monkeypatch):
+        ContentIndexer(library, backend="sqlite").rebuild(workers=0)
+        version = backends_module.SQLITE_SCHEMA_VERSION
+        monkeypatch.setattr(backends_module, "SQLITE_SCHEMA_VERSION", version + 1)
+        assert ContentIndexer(library, backend="sqlite").find() == []
+
+        ContentIndexer(library, backend="sqlite").rebuild(workers=0)
+        assert len(ContentIndexer(library, backend="sqlite").find()) == 4
+
+    def test_without_fts5(self, big_library, monkeypatch):
+        monkeypatch.setattr(
+            backends_module, "SQLITE_FTS_SCHEMA", "CREATE VIRTUAL TABLE x USING nope"
+        )
+        indexer = ContentIndexer(big_library, backend="sqlite")
+        indexer.rebuild(workers=0)
+        assert indexer.backend._fts is False
+        query = TestSearchIndex.QUERIES[9]
+        assert indexer.find(**query) == ContentIndexer(big_library).find(**query)
+
+    def test_unknown_backend(self, tmp_path):
+        with pytest.raises(ValueError, match="Unknown index backend"):
+            ContentIndexer(tmp_path, backend="xml")
+
+
+class TestValidate:
+    """Test single-pass validation and the parsed manifest cache."""
+
+    def test_schema_compiled(self):
+        validator = ManifestValidator.from_text(
+            "# Header\n\n# Required fields\nid: string\nkind: a | b\n\n"
+            "# Optional\ncount: integer\ntags: [string]\nratio:\n  x: float\n"
+        )
+        assert validator.required == ("id", "kind")
+        assert validator.validate({"id": "x", "kind": "a", "count": 3, "tags": ["t"]}) == []
+        assert [field for field, _ in validator.validate(
+            {"kind": "c", "count": True, "tags": [1], "ratio": {"x": "high"}}
+        )] == ["id", "kind", "count", "tags", "ratio"]
+
+    def test_issues(self, library):
+        write_manifest(library, "bravo", difficulty="legendary", duration_minutes="long")
+        write_manifest(library, "charlie", id="other", title=None)
+        (library / "adventures" / "empty").mkdir()
+        (library / "trainings" / "delta" / "manifest.yaml").write_text("id: [unclosed\n")
+
+        issues = {
+            (i["item"], i["severity"], i["message"])
+            for i in ContentIndexer(library).validate(workers=0)
+        }
+        assert ("empty", "error", "Missing manifest.yaml") in issues
+        assert ("bravo", "warning", "Invalid difficulty: legendary") in issues
+        assert ("bravo", "warning", "Field 'duration_minutes' should be integer, got str") in issues
+        assert ("charlie", "error", "Field 'title' should be string, got NoneType") in issues
+        assert ("charlie", "warning", "ID 'other' doesn't match directory name") in issues
+        assert any(i[:2] == ("delta", "error") and "Invalid YAML" in i[2] for i in issues)
+        assert not any(i[0] == "alpha" and i[1] != "info" for i in issues)
+
+    def test_validate_reuses_rebuild(self, library, parses):
+        write_manifest(library, "bravo", difficulty="legendary")
+        ContentIndexer(library).rebuild(workers=0)
+
+        parses.clear()
+        issues = ContentIndexer(library).validate(workers=0)
+        assert parses == []
+        assert any(i["message"] == "Invalid difficulty: legendary" for i in issues)
+
+    def test_validate_writes_nothing(self, library):
+        ContentIndexer(library).validate(workers=0)
+        assert not (library / "index.json").exists()
+        assert not (library / "manifest_cache.json").exists()
+
+    def test_manifests_from_cache(self, library, parses):
+        ContentIndexer(library).rebuild(workers=0)
+        index_mtime = os.stat(library / "index.json").st_mtime_ns
+
+        parses.clear()
+        manifests = ContentIndexer(library).manifests("adventures")
+        assert parses == []
+        assert [(path.name, m["id"]) for path, m in manifests] == [
+            ("alpha", "alpha"), ("bravo", "bravo"), ("charlie", "charlie"),
+        ]
+        assert manifests[0][1]["tags"] == ["md5"]
+
+        # Changed manifests are re-parsed in memory without touching the index
+        write_manifest(library, "bravo", difficulty="expert")
+        manifests = ContentIndexer(library).manifests("adventures")
+        assert parses == ["bravo"]
+        assert manifests[1][1]["difficulty"] == "expert"
+        assert os.stat(library / "index.json").st_mtime_ns == index_mtime
+
+    def test_manifests_without_cache_file(self, library):
+        ContentIndexer(library).rebuild(workers=0)
+        (library / "manifest_cache.json").unlink()
+        assert len(ContentIndexer(library).manifests("trainings")) == 1
+
+    def test_manifests_scans_one_type(self, library, parses):
+        assert len(ContentIndexer(library).manifests("adventures")) == 3
+        assert parses == ["alpha", "bravo", "charlie"]
+        assert not (library / "index.json").exists()
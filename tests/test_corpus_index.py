@@ -0,0 +1,111 @@
+"""Corpus index tests.
+
+Run with: pytest tests/test_corpus_index.py -v
+"""
+
+import re
+from pathlib import Path
+
+import pytest
+
+from spellengine.tools.corpus_index import (
+    CorpusIndex,
+    compile_mask,
+    compile_tokens,
+    mask_signature,
+    token_structure,
+)
+
+CORPUS_PATH = Path(__file__).parent.parent / "content" / "corpus" / "training_corpus.txt"
+
+SYMBOL_CLASS = r"[!@#$%^&*()_+\-=\[\]{}|;':\",./<>?\\`~]"
+
+
+def scan_mask(password: str, mask: str) -> bool:
+    """Reference mask matcher: walk the mask building a regex."""
+    parts = []
+    i = 0
+    while i < len(mask):
+        if mask[i] == "?" and i + 1 < len(mask):
+            parts.append({
+                "l": "[a-z]", "u": "[A-Z]", "d": "[0-9]", "s": SYMBOL_CLASS, "a": ".",
+            }.get(mask[i + 1], re.escape(mask[i + 1])))
+            i += 2
+        else:
+            parts.append(re.escape(mask[i]))
+            i += 1
+    return bool(re.match("^" + "".join(parts) + "$", password))
+
+
+def scan_tokens(password: str, tokens: list[str]) -> bool:
+    """Reference token matcher: build a regex per password."""
+    patterns = {
+        "WORD": r"[a-zA-Z]+",
+        "DIGIT": r"\d+",
+        "YEAR": r"(19|20)\d{2}",
+        "SYMBOL": SYMBOL_CLASS + "+",
+    }
+    pattern = "".join(patterns.get(t.upper(), re.escape(t)) for t in tokens)
+    return bool(re.match("^" + pattern + "$", password))
+
+
+@pytest.fixture(scope="module")
+def corpus():
+    """The shipped training corpus."""
+    lines = CORPUS_PATH.read_text(encoding="utf-8").splitlines()
+    return [line.strip() for line in lines if line.strip() and not line.startswith("#")]
+
+
+MASKS = [
+    "?u?l?l?l?l?l?d?d?d?d",
+    "?l?l?l?l?l?l",
+    "?d?d?d?d?d?d",
+    "?u?l?l?l?l?s?d?d?d?d",
+    "?a?a?a?a?a?a",
+    "P?l?l?l?l?l?l?d",
+    "?l?l?l?l?x",
+]
+
+TOKENS = [
+    ["WORD"],
+    ["WORD", "YEAR"],
+    ["word", "digit"],
+    ["WORD", "SYMBOL", "YEAR"],
+    ["WORD", "DIGIT", "SYMBOL"],
+    ["DIGIT"],
+    ["WORD", "WORD"],
+    ["DIGIT", "YEAR"],
+    ["WORD", "_", "DIGIT"],
+]
+
+
+class TestCorpusIndex:
+    """Test bucket lookups against a scan of the corpus."""
+
+    @pytest.mark.parametrize("mask", MASKS)
+    @pytest.mark.parametrize("lengths", [(1, 64), (6, 8)])
+    def test_mask_query(self, corpus, mask, lengths):
+        index = CorpusIndex(corpus)
+        expected = [
+            p for p in corpus
+            if lengths[0] <= len(p) <= lengths[1] and scan_mask(p, mask)
+        ]
+        assert index.query(*lengths, mask) == expected
+
+    def test_length_query(self, corpus):
+        index = CorpusIndex(corpus)
+        assert index.query(6, 8) == [p for p in corpus if 6 <= len(p) <= 8]
+
+    @pytest.mark.parametrize("tokens", TOKENS)
+    def test_token_matches(self, corpus, tokens):
+        index = CorpusIndex(corpus)
+        assert index.token_matches(tokens) == {p for p in corpus if scan_tokens(p, tokens)}
+
+    def test_compiled_matchers_cached(self):
+        assert compile_mask("?l?d") is compile_mask("?l?d")
+        assert compile_tokens(("WORD", "YEAR")) is compile_tokens(("WORD", "YEAR"))
+
+    def test_signatures(self):
+        assert mask_signature("Summer2024!") == "?u?l?l?l?l?l?d?d?d?d?s"
+        assert mask_signature("café") is None
+        assert token_structure("Summer2024!") == ("WORD", "DIGIT", "SYMBOL")
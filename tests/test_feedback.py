@@ -0,0 +1,181 @@
+"""Player feedback aggregation tests.
+
+Run with: pytest tests/test_feedback.py -v
+"""
+
+import random
+import statistics
+
+import pytest
+
+from spellengine.adventures.experience_grading import (
+    DifficultyRating,
+    FeedbackCollector,
+    FeedbackTiming,
+    PlayerFeedback,
+)
+
+
+def make_feedback(rng: random.Random, encounter_id: str | None, chapter_id: str | None) -> PlayerFeedback:
+    """Build a random feedback submission."""
+    return PlayerFeedback(
+        campaign_id="dread_citadel",
+        encounter_id=encounter_id,
+        chapter_id=chapter_id,
+        timing=FeedbackTiming.POST_ENCOUNTER,
+        timestamp="2026-01-01T00:00:00+00:00",
+        enjoyment=rng.choice([None, 1, 2, 3, 4, 5]),
+        clarity=rng.choice([None, 1, 3, 5]),
+        would_recommend=rng.choice([None, True, False]),
+        difficulty=rng.choice([None, *DifficultyRating]),
+    )
+
+
+def random_feedback(seed: int, count: int) -> list[PlayerFeedback]:
+    """Random feedback spread over a few encounters and chapters."""
+    rng = random.Random(seed)
+    items = []
+    for _ in range(count):
+        chapter = rng.choice(["ch1", "ch2", None])
+        encounter = rng.choice(["enc_a", "enc_b", "enc_c", None])
+        items.append(make_feedback(rng, encounter, chapter))
+    return items
+
+
+def low_enjoyment(encounter_id: str) -> PlayerFeedback:
+    """A one-star rating for an encounter."""
+    return PlayerFeedback(
+        campaign_id="c",
+        encounter_id=encounter_id,
+        timing=FeedbackTiming.POST_ENCOUNTER,
+        timestamp="2026-01-01T00:00:00+00:00",
+        enjoyment=1,
+    )
+
+
+class TestAggregates:
+    """Test running aggregates against direct recomputation."""
+
+    def test_summary_matches_recomputation(self):
+        items = random_feedback(7, 400)
+        collector = FeedbackCollector()
+        for feedback in items:
+            collector.submit_feedback(feedback)
+
+        relevant = [f for f in items if f.encounter_id == "enc_a"]
+        summary = collector.get_summary("enc_a")
+        assert summary.feedback_count == len(relevant)
+
+        enjoyment = [f.enjoyment for f in relevant if f.enjoyment is not None]
+        assert summary.average_enjoyment == sum(enjoyment) / len(enjoyment)
+        assert summary.enjoyment_variance == pytest.approx(statistics.pvariance(enjoyment))
+
+        recommend = [f.would_recommend for f in relevant if f.would_recommend is not None]
+        assert summary.recommendation_rate == sum(recommend) / len(recommend)
+
+        too_hard = sum(1 for f in relevant if f.difficulty == DifficultyRating.TOO_HARD)
+        assert summary.difficulty_distribution.get("too_hard", 0) == too_hard
+
+    def test_review_flag(self):
+        collector = FeedbackCollector()
+        for _ in range(5):
+            collector.submit_feedback(PlayerFeedback(
+                campaign_id="c",
+                encounter_id="enc_bad",
+                timing=FeedbackTiming.POST_ENCOUNTER,
+                timestamp="2026-01-01T00:00:00+00:00",
+                enjoyment=1,
+                difficulty=DifficultyRating.TOO_HARD,
+            ))
+        summary = collector.get_summary("enc_bad")
+        assert summary.needs_review
+        assert "Low enjoyment" in summary.review_reason
+        assert collector.get_flagged_encounters() == {"enc_bad"}
+
+
+class TestFeedbackLog:
+    """Test log-backed raw feedback storage."""
+
+    def test_log_replaces_memory(self, tmp_path):
+        log_path = tmp_path / "feedback.jsonl"
+        items = random_feedback(3, 50)
+        collector = FeedbackCollector(log_path)
+        for feedback in items:
+            collector.submit_feedback(feedback)
+
+        assert collector._feedback == []
+        assert len(log_path.read_text().splitlines()) == 50
+        expected = [f for f in items if f.encounter_id == "enc_b" or f.chapter_id == "enc_b"]
+        assert collector.get_all_feedback_for("enc_b") == expected
+
+        # A new collector over the same log picks up the aggregates
+        reopened = FeedbackCollector(log_path)
+        for target in ("enc_a", "enc_b", "enc_c"):
+            assert reopened.get_summary(target) == collector.get_summary(target)
+        reopened.submit_feedback(items[0])
+        target = items[0].encounter_id or items[0].chapter_id
+        if target:
+            assert reopened.get_summary(target).feedback_count == sum(
+                1 for f in items + [items[0]]
+                if (f.encounter_id if items[0].encounter_id else f.chapter_id) == target
+            )
+
+    def test_reopened_log_matches_live_state(self, tmp_path):
+        log_path = tmp_path / "feedback.jsonl"
+        collector = FeedbackCollector(log_path)
+        for feedback in random_feedback(5, 300):
+            collector.submit_feedback(feedback)
+        for _ in range(6):
+            collector.submit_feedback(low_enjoyment("e1").model_copy(update={"chapter_id": "ch9"}))
+
+        reopened = FeedbackCollector(log_path)
+        assert reopened.export_state() == collector.export_state()
+        assert reopened.get_flagged_encounters() == collector.get_flagged_encounters()
+        assert collector.get_summary("ch9").feedback_count == 6
+        assert {"e1", "ch9"} <= collector.get_flagged_encounters()
+
+    def test_flag_cleared_when_feedback_recovers(self):
+        collector = FeedbackCollector()
+        for _ in range(5):
+            collector.submit_feedback(low_enjoyment("e1"))
+        assert collector.get_flagged_encounters() == {"e1"}
+        for _ in range(10):
+            collector.submit_feedback(low_enjoyment("e1").model_copy(update={"enjoyment": 5}))
+        assert not collector.get_summary("e1").needs_review
+        assert collector.get_flagged_encounters() == set()
+
+    def test_reopened_log_keeps_flags(self, tmp_path):
+        log_path = tmp_path / "feedback.jsonl"
+        collector = FeedbackCollector(log_path)
+        for _ in range(6):
+            collector.submit_feedback(low_enjoyment("e1"))
+        assert collector.get_flagged_encounters() == {"e1"}
+
+        reopened = FeedbackCollector(log_path)
+        assert reopened.get_summary("e1") == collector.get_summary("e1")
+        assert reopened.get_summary("e1").needs_review
+        assert reopened.get_flagged_encounters() == {"e1"}
+
+    def test_import_feedback_only_rebuilds_summaries(self):
+        collector = FeedbackCollector()
+        for _ in range(6):
+            collector.submit_feedback(low_enjoyment("e1"))
+
+        fresh = FeedbackCollector()
+        fresh.submit_feedback(low_enjoyment("stale"))
+        fresh.import_state({"feedback": collector.export_state()["feedback"]})
+        assert fresh.get_summary("stale") is None
+        assert fresh.get_summary("e1") == collector.get_summary("e1")
+        assert fresh.get_flagged_encounters() == {"e1"}
+
+    def test_export_import_roundtrip(self, tmp_path):
+        collector = FeedbackCollector()
+        for feedback in random_feedback(11, 100):
+            collector.submit_feedback(feedback)
+        state = collector.export_state()
+
+        restored = FeedbackCollector(tmp_path / "feedback.jsonl")
+        restored.import_state(state)
+
+        assert restored.export_state() == state
+        assert restored.get_summary("enc_c") == collector.get_summary("enc_c")
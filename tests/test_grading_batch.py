@@ -0,0 +1,72 @@
+"""Batched contextual grading tests.
+
+Run with: pytest tests/test_grading_batch.py -v
+"""
+
+import pytest
+
+from spellengine.adventures import grading_batch
+from spellengine.adventures.experience_grading import (
+    GradeCache,
+    NarrativeLayer,
+    generate_contextual_grade_report,
+    grade_encounter_contextual,
+)
+from spellengine.adventures.grading_batch import ContextualGradeBatch
+
+
+def contextual_grades(campaign) -> dict:
+    """Grade every encounter one at a time, as the chapter grader sequences them."""
+    grades = {}
+    for chapter in campaign.chapters:
+        previous = None
+        for i, encounter in enumerate(chapter.encounters):
+            grades[encounter.id] = grade_encounter_contextual(
+                encounter, i, len(chapter.encounters), previous, chapter.description
+            )
+            previous = encounter
+    return grades
+
+
+@pytest.fixture(params=["numpy", "python"])
+def batch(request, campaign, monkeypatch):
+    """A batch over the test campaign, with and without NumPy."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(grading_batch, "np", None)
+    return ContextualGradeBatch.from_campaigns([campaign])
+
+
+class TestContextualGradeBatch:
+    """Test that the batch reproduces per-encounter contextual grading."""
+
+    def test_grades_match_per_encounter(self, campaign, batch):
+        expected = contextual_grades(campaign)
+        assert len(batch) == len(expected)
+        for grade in batch:
+            assert grade.model_dump() == expected[grade.encounter_id].model_dump()
+
+    def test_layer_scores_match(self, campaign, batch):
+        expected = contextual_grades(campaign)
+        for i, encounter in enumerate(batch.encounters):
+            for layer in NarrativeLayer:
+                assert batch.layer_score(i, layer) == expected[encounter.id].get_layer_score(layer)
+
+    def test_lookup_by_id(self, batch):
+        encounter = batch.encounters[-1]
+        assert batch.grade(encounter.id).encounter_title == encounter.title
+
+    def test_report_matches(self, campaign, batch):
+        assert batch.report() == generate_contextual_grade_report(contextual_grades(campaign))
+
+    def test_uses_grade_cache(self, campaign):
+        cache = GradeCache()
+        ContextualGradeBatch.from_campaigns([campaign], cache)
+        ContextualGradeBatch.from_campaigns([campaign], cache)
+        assert cache.hits == len(cache)
+
+    def test_empty(self):
+        batch = ContextualGradeBatch([], [])
+        assert len(batch) == 0
+        assert "CONTEXTUAL GRADING REPORT" in batch.report()
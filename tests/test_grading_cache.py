@@ -0,0 +1,168 @@
+"""Incremental campaign grading and feature extraction tests.
+
+Run with: pytest tests/test_grading_cache.py -v
+"""
+
+import json
+
+from spellengine.adventures import experience_grading
+from spellengine.adventures.experience_grading import (
+    EmotionalBeat,
+    GradeCache,
+    encounter_features,
+    grade_campaign,
+    grade_encounter,
+)
+
+
+def edit_intro(campaign, chapter_index: int, encounter_index: int, text: str):
+    """Return a copy of the campaign with one encounter's intro text changed."""
+    chapters = list(campaign.chapters)
+    chapter = chapters[chapter_index]
+    encounters = list(chapter.encounters)
+    encounters[encounter_index] = encounters[encounter_index].model_copy(
+        update={"intro_text": text}
+    )
+    chapters[chapter_index] = chapter.model_copy(update={"encounters": encounters})
+    return campaign.model_copy(update={"chapters": chapters})
+
+
+class TestIncrementalGrading:
+    """Test that only changed encounters are re-graded."""
+
+    def test_cached_grade_matches_fresh(self, campaign):
+        cache = GradeCache()
+        first = grade_campaign(campaign, cache=cache)
+        second = grade_campaign(campaign, cache=cache)
+
+        assert second.model_dump() == first.model_dump()
+        assert cache.hits == first.total_encounters
+
+    def test_edit_regrades_only_changed_encounter(self, campaign):
+        cache = GradeCache()
+        grade_campaign(campaign, cache=cache)
+        misses = cache.misses
+
+        edited = edit_intro(campaign, 0, 1, "A short intro.")
+        grade = grade_campaign(edited, cache=cache)
+
+        assert cache.misses == misses + 1
+        fresh = grade_campaign(edited, cache=GradeCache())
+        assert grade.model_dump() == fresh.model_dump()
+
+    def test_cached_grades_are_copies(self, campaign):
+        cache = GradeCache()
+        first = grade_campaign(campaign, cache=cache)
+        first.chapter_grades[0].encounter_grades[0].strengths.append("Reviewed")
+
+        second = grade_campaign(campaign, cache=cache)
+        assert "Reviewed" not in second.chapter_grades[0].encounter_grades[0].strengths
+
+    def test_parallel_chapters_match_serial(self, campaign, monkeypatch):
+        monkeypatch.setattr(experience_grading, "PARALLEL_GRADE_THRESHOLD", 0)
+        serial = grade_campaign(campaign, cache=GradeCache(), workers=1)
+        cache = GradeCache()
+        parallel = grade_campaign(campaign, cache=cache, workers=2)
+
+        assert parallel.model_dump() == serial.model_dump()
+        assert len(cache) == serial.total_encounters
+
+    def test_maxsize_evicts_least_recent(self, campaign):
+        encounter = campaign.chapters[0].encounters[0]
+        grade = grade_encounter(encounter, 0, 1)
+        cache = GradeCache(maxsize=2)
+        cache.put("a", grade)
+        cache.put("b", grade)
+        assert cache.get("a") is not None
+        cache.put("c", grade)
+
+        assert len(cache) == 2
+        assert "b" not in cache
+        assert "a" in cache and "c" in cache
+
+    def test_default_cache_bounded(self, campaign, monkeypatch):
+        default = GradeCache(maxsize=3)
+        monkeypatch.setattr(experience_grading, "_DEFAULT_GRADE_CACHE", default)
+        grade = grade_campaign(campaign)
+
+        assert grade.total_encounters > 3
+        assert len(default) == 3
+        assert grade_campaign(campaign).model_dump() == grade.model_dump()
+
+
+class TestPersistentCache:
+    """Test the on-disk grade cache."""
+
+    def test_roundtrip(self, campaign, tmp_path):
+        path = tmp_path / "grades.json"
+        cache = GradeCache(path)
+        first = grade_campaign(campaign, cache=cache)
+        cache.save()
+
+        reloaded = GradeCache(path)
+        second = grade_campaign(campaign, cache=reloaded)
+        assert reloaded.misses == 0
+        assert second.model_dump() == first.model_dump()
+
+    def test_grader_version_change_discards(self, campaign, tmp_path, monkeypatch):
+        path = tmp_path / "grades.json"
+        cache = GradeCache(path)
+        grade_campaign(campaign, cache=cache)
+        cache.save()
+
+        monkeypatch.setattr(experience_grading, "GRADER_VERSION", "test")
+        assert len(GradeCache(path)) == 0
+
+    def test_save_prunes_unused(self, campaign, tmp_path):
+        path = tmp_path / "grades.json"
+        cache = GradeCache(path)
+        grade_campaign(campaign, cache=cache)
+        cache.save()
+
+        reloaded = GradeCache(path)
+        grade_campaign(edit_intro(campaign, 0, 0, "Changed."), cache=reloaded)
+        reloaded.save()
+
+        saved = json.loads(path.read_text())["grades"]
+        total = sum(len(ch.encounters) for ch in campaign.chapters)
+        assert len(saved) == total
+
+    def test_maxsize_applies_on_load(self, campaign, tmp_path):
+        path = tmp_path / "grades.json"
+        cache = GradeCache(path)
+        grade_campaign(campaign, cache=cache)
+        cache.save()
+
+        assert len(GradeCache(path, maxsize=2)) == 2
+
+
+class TestEncounterFeatures:
+    """Test the shared text feature extraction pass."""
+
+    def test_features_cached_by_content(self, campaign):
+        encounter = campaign.chapters[0].encounters[0]
+        assert encounter_features(encounter) is encounter_features(encounter.model_copy())
+
+        edited = encounter.model_copy(update={"intro_text": encounter.intro_text + " More."})
+        assert encounter_features(edited) is not encounter_features(encounter)
+
+    def test_keywords_match_substrings(self, campaign):
+        encounter = campaign.chapters[0].encounters[0].model_copy(update={
+            "title": "The Gate Guardian",
+            "intro_text": "You LEARNED the Ancient rite. Then? Silence!",
+            "success_text": "Remember this.",
+        })
+        features = encounter_features(encounter)
+
+        assert {"learn", "ancient"} <= features.intro.keywords
+        assert features.success.keywords == {"remember"}
+        assert features.is_boss_title
+        assert features.beat_cue == EmotionalBeat.REVELATION
+        assert features.intro.length == len(encounter.intro_text)
+
+    def test_scores_follow_features(self, campaign):
+        encounter = campaign.chapters[0].encounters[0]
+        plain = encounter.model_copy(update={"intro_text": "x" * 50, "hint": None})
+        hooked = plain.model_copy(update={"intro_text": "A secret. " + "x" * 450})
+
+        assert grade_encounter(hooked, 0, 5).engagement > grade_encounter(plain, 0, 5).engagement
@@ -0,0 +1,178 @@
+"""Keyspace calculator tests.
+
+Run with: pytest tests/test_keyspace_calculator.py -v
+"""
+
+import pytest
+import yaml
+
+from spellengine.adventures.keyspace import DiscoveryMethod, KeyspaceDefinition
+from spellengine.adventures.loader import _parse_encounter
+from spellengine.adventures.models import EncounterType
+from spellengine.tools.campaign_builder import build_campaign
+from spellengine.tools.keyspace_calculator import (
+    HASH_GUESS_RATES,
+    RULE_SET_SIZE,
+    CrackEstimate,
+    KeyspaceCalculator,
+    check_tier,
+    mask_keyspace,
+    password_mask,
+)
+from spellengine.tools.password_generator import KeyspacePasswordGenerator
+
+CORPUS = ["dragon", "shadow", "Dragon1", "pokemon", "summer", "Summer2024!", "123456"]
+
+
+@pytest.fixture
+def calculator():
+    return KeyspaceCalculator(CORPUS)
+
+
+class TestMasks:
+    """Test exact mask sizing."""
+
+    @pytest.mark.parametrize("mask,size", [
+        ("?l?l?l?l", 26 ** 4),
+        ("?u?l?l?d?d", 26 ** 3 * 100),
+        ("?s", 33),
+        ("?a?a", 95 ** 2),
+        ("P?l?l", 26 ** 2),
+        ("", 1),
+    ])
+    def test_mask_keyspace(self, mask, size):
+        assert mask_keyspace(mask) == size
+
+    def test_password_mask(self):
+        assert password_mask("Ab1!") == "?u?l?d?s"
+        assert password_mask("café") == "?l?l?l?a"
+
+
+class TestEstimate:
+    """Test attack selection and crack-time conversion."""
+
+    def test_wordlist_hit(self, calculator):
+        keyspace = KeyspaceDefinition(discovery_method=DiscoveryMethod.WORDLIST)
+        estimate = calculator.estimate("shadow", keyspace, "md5")
+        assert estimate.attack == "wordlist"
+        assert estimate.keyspace == len(CORPUS)
+        assert estimate.seconds == len(CORPUS) / HASH_GUESS_RATES["md5"]
+
+    def test_rules_cover_case_leet_and_short_affix(self, calculator):
+        attacks = calculator.attacks("Dr@gon1", KeyspaceDefinition())
+        assert attacks["rules"] == len(CORPUS) * RULE_SET_SIZE
+        assert "wordlist" not in attacks
+
+    def test_hybrid_for_long_suffix(self, calculator):
+        attacks = calculator.attacks("P0k3mon#1999", KeyspaceDefinition())
+        assert "rules" not in attacks
+        assert attacks["hybrid"] == len(CORPUS) * RULE_SET_SIZE * 33 * 10 ** 4
+
+    def test_mask_uses_keyspace_mask(self, calculator):
+        keyspace = KeyspaceDefinition(mask="?l?l?l?l?d?d", discovery_method=DiscoveryMethod.MASK)
+        estimate = calculator.estimate("abcd12", keyspace, "sha1")
+        assert estimate.attack == "mask"
+        assert estimate.keyspace == 26 ** 4 * 100
+
+    def test_mask_falls_back_to_signature(self, calculator):
+        keyspace = KeyspaceDefinition(mask="?d?d")
+        assert calculator.attacks("zq", keyspace) == {"mask": 26 ** 2}
+
+    def test_fastest_attack_wins(self, calculator):
+        keyspace = KeyspaceDefinition(discovery_method=DiscoveryMethod.MASK)
+        assert calculator.estimate("Summer2024!", keyspace).attack == "wordlist"
+
+    def test_hash_speed(self, calculator):
+        keyspace = KeyspaceDefinition()
+        md5 = calculator.estimate("qwerty", keyspace, "md5")
+        sha512 = calculator.estimate("qwerty", keyspace, "sha512")
+        assert sha512.seconds > md5.seconds
+        with pytest.raises(ValueError):
+            calculator.estimate("qwerty", keyspace, "crc32")
+
+    def test_check_tier(self):
+        assert check_tier(CrackEstimate("mask", 1, 10.0), 0) is None
+        assert "at most" in check_tier(CrackEstimate("mask", 1, 1e6), 0)
+        assert CrackEstimate("wordlist", 1, 0.001).whole_seconds == 1
+
+
+class TestBuild:
+    """Test crack-time checks in campaign builds."""
+
+    @pytest.fixture
+    def generated(self, monkeypatch):
+        """Make every generated password come from a list (set it per test)."""
+        passwords = []
+        monkeypatch.setattr(
+            KeyspacePasswordGenerator,
+            "generate_batch",
+            lambda self, keyspaces, used=None, seeds=None: passwords[:len(keyspaces)],
+        )
+        return passwords
+
+    def build(self, tmp_path, encounter, **kwargs):
+        corpus = tmp_path / "corpus.txt"
+        corpus.write_text("\n".join(CORPUS) + "\n")
+        source = tmp_path / "source.yaml"
+        source.write_text(yaml.safe_dump({
+            "id": "calc", "title": "Calc", "chapters": [{"id": "ch1", "encounters": [encounter]}],
+        }))
+        output = tmp_path / "built.yaml"
+        build_campaign(source, output, corpus, workers=1, full_rebuild=True, **kwargs)
+        return yaml.safe_load(output.read_text())["chapters"][0]["encounters"][0]
+
+    def test_prediction_in_keyspace_meta(self, tmp_path, generated):
+        generated.append("qzxvjk42")
+        built = self.build(tmp_path, {
+            "id": "e1",
+            "hash_type": "sha512",
+            "keyspace": {
+                "min_length": 8, "max_length": 8, "mask": "?l?l?l?l?l?l?d?d", "tier": 2,
+            },
+        })
+        meta = built["keyspace_meta"]
+        assert meta["predicted_attack"] == "mask"
+        assert meta["predicted_crack_seconds"] == round(
+            26 ** 6 * 100 / HASH_GUESS_RATES["sha512"]
+        )
+        assert "expected_time" not in built
+
+    def test_source_expected_time_kept(self, tmp_path, generated):
+        generated.append("shadow")
+        built = self.build(tmp_path, {
+            "id": "e1", "expected_time": 90, "keyspace": {"min_length": 6, "max_length": 6},
+        })
+        assert built["expected_time"] == 90
+
+    def test_race_countdown_untouched(self, tmp_path, generated):
+        # A wordlist hit predicts about a second; the RACE timer must not become 1s
+        generated.append("shadow")
+        built = self.build(tmp_path, {
+            "id": "e1",
+            "title": "Race",
+            "type": "race",
+            "keyspace": {"min_length": 6, "max_length": 6},
+        })
+        assert "expected_time" not in built
+        assert built["keyspace_meta"]["predicted_crack_seconds"] == 1
+
+        encounter = _parse_encounter(built, tmp_path)
+        assert encounter.encounter_type == EncounterType.RACE
+        assert encounter.expected_time is None
+        assert encounter.keyspace_meta.predicted_attack == "wordlist"
+
+    def test_outside_tier_window_fails(self, tmp_path, generated):
+        # A random 12-character password at tier 0 takes far longer than a minute
+        generated.append("Zq9#xK2!pL7@")
+        encounter = {
+            "id": "e1",
+            "hash_type": "sha512",
+            "keyspace": {"min_length": 12, "max_length": 12},
+        }
+        with pytest.raises(ValueError, match="e1: mask attack takes"):
+            self.build(tmp_path, encounter)
+
+        built = self.build(tmp_path, encounter, check_crack_times=False)
+        assert built["solution"] == "Zq9#xK2!pL7@"
+        assert "expected_time" not in built
+        assert "predicted_crack_seconds" not in built["keyspace_meta"]
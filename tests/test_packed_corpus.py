@@ -0,0 +1,141 @@
+"""Packed corpus tests.
+
+Run with: pytest tests/test_packed_corpus.py -v
+"""
+
+import os
+import random
+import sys
+
+import pytest
+
+from spellengine.adventures.keyspace import KeyspaceDefinition
+from spellengine.tools import packed_corpus
+from spellengine.tools.corpus_index import CorpusIndex, read_corpus
+from spellengine.tools.packed_corpus import (
+    PackedCorpus,
+    convert,
+    is_packed,
+    open_corpus,
+    packed_path_for,
+)
+from spellengine.tools.password_generator import KeyspacePasswordGenerator
+
+ENTRIES = [
+    "dragon", "Dragon1", "sunshine", "p@ssw0rd", "Winter2024!", "123456",
+    "monkey99", "shadow", "MASTER", "café", "letmein", "qwerty7",
+]
+
+
+@pytest.fixture
+def text_corpus(tmp_path):
+    path = tmp_path / "training_corpus.txt"
+    path.write_text("# training corpus\n" + "\n".join(ENTRIES) + "\n\n", encoding="utf-8")
+    return path
+
+
+@pytest.fixture
+def packed(text_corpus):
+    return PackedCorpus(convert(text_corpus))
+
+
+class TestFormat:
+    """Test converting and reading packed corpora."""
+
+    def test_round_trip(self, text_corpus, packed):
+        assert packed.path == packed_path_for(text_corpus)
+        assert is_packed(packed.path)
+        assert not is_packed(text_corpus)
+        assert len(packed) == len(ENTRIES)
+        assert list(packed) == read_corpus(text_corpus)
+        assert packed[-1] == ENTRIES[-1]
+        assert packed[1:3] == ENTRIES[1:3]
+        with pytest.raises(IndexError):
+            packed[len(ENTRIES)]
+
+    def test_buckets_match_corpus_index(self, text_corpus, packed):
+        built = CorpusIndex(read_corpus(text_corpus))
+        index = packed.index()
+        assert {k: list(v) for k, v in index.by_length.items()} == built.by_length
+        assert {k: list(v) for k, v in index.by_mask.items()} == built.by_mask
+        assert {k: list(v) for k, v in index.by_structure.items()} == built.by_structure
+        assert index.query(6, 8, "?l?l?l?l?l?l") == built.query(6, 8, "?l?l?l?l?l?l")
+        assert index.token_matches(["WORD", "DIGIT"]) == built.token_matches(["WORD", "DIGIT"])
+
+    def test_bucket_keys_looked_up_lazily(self, packed):
+        built = CorpusIndex(ENTRIES)
+        assert packed.directory["buckets"] == {
+            "length": len(built.by_length),
+            "mask": len(built.by_mask),
+            "structure": len(built.by_structure),
+        }
+        masks = packed.buckets("mask")
+        assert list(masks) == sorted(masks)
+        assert list(masks["?l?l?l?l?l?l"]) == [0, 7]
+        assert masks.get("?d?d?d") is None
+        assert "?u?u?u?u?u?u" in masks
+        index = packed.index()
+        assert list(index.by_structure[("WORD", "DIGIT")]) == [1, 6, 11]
+        assert 99 not in index.by_length
+
+    def test_without_buckets(self, text_corpus, tmp_path):
+        corpus = PackedCorpus(convert(text_corpus, tmp_path / "bare.spc", buckets=False))
+        assert not corpus.has_buckets
+        assert corpus.index().by_length == CorpusIndex(ENTRIES).by_length
+
+    def test_latin1_lines(self, tmp_path):
+        source = tmp_path / "rockyou.txt"
+        source.write_bytes(b"#1\npass\xe9\nplain\n")
+        corpus = PackedCorpus(convert(source, skip_comments=False))
+        assert list(corpus) == ["#1", "passé", "plain"]
+
+    def test_rejects_other_files(self, text_corpus):
+        with pytest.raises(ValueError, match="Not a packed corpus"):
+            PackedCorpus(text_corpus)
+
+
+class TestOpenCorpus:
+    """Test picking between text and packed corpora."""
+
+    def test_text_only(self, text_corpus):
+        assert open_corpus(text_corpus) == read_corpus(text_corpus)
+
+    def test_uses_current_sibling(self, text_corpus, packed):
+        assert isinstance(open_corpus(text_corpus), PackedCorpus)
+        assert isinstance(open_corpus(packed.path), PackedCorpus)
+
+    def test_ignores_stale_sibling(self, text_corpus, packed):
+        text_corpus.write_text("\n".join(ENTRIES + ["newentry"]), encoding="utf-8")
+        stat = text_corpus.stat()
+        os.utime(text_corpus, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        corpus = open_corpus(text_corpus)
+        assert isinstance(corpus, list)
+        assert corpus[-1] == "newentry"
+
+
+class TestGenerator:
+    """Test generating passwords from a packed corpus."""
+
+    def test_matches_text_corpus(self, text_corpus):
+        keyspace = KeyspaceDefinition(min_length=6, max_length=8, mask="?l?l?l?l?l?l")
+        from_text = KeyspacePasswordGenerator(text_corpus, use_patternforge=False)
+        expected = from_text.generate_for_keyspace(keyspace, 2, random.Random(7))
+        words = from_text._words
+
+        convert(text_corpus)
+        from_packed = KeyspacePasswordGenerator(text_corpus, use_patternforge=False)
+        assert isinstance(from_packed._corpus, PackedCorpus)
+        assert from_packed.generate_for_keyspace(keyspace, 2, random.Random(7)) == expected
+        assert from_packed._words == words
+
+    def test_packed_path_disables_patternforge(self, packed):
+        generator = KeyspacePasswordGenerator(packed.path)
+        assert not generator.use_patternforge
+
+
+def test_main(text_corpus, tmp_path, monkeypatch, capsys):
+    output = tmp_path / "out.spc"
+    monkeypatch.setattr(sys, "argv", ["packed_corpus", str(text_corpus), "-o", str(output)])
+    assert packed_corpus.main() == 0
+    assert f"Packed {len(ENTRIES)} entries" in capsys.readouterr().out
+    assert list(PackedCorpus(output)) == ENTRIES
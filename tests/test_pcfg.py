@@ -0,0 +1,197 @@
+"""Local PCFG grammar engine tests.
+
+Run with: pytest tests/test_pcfg.py -v
+"""
+
+import hashlib
+import random
+import sys
+from itertools import product
+
+import pytest
+
+from spellengine.adventures.keyspace import GenerationStrategy, KeyspaceDefinition
+from spellengine.tools import pcfg
+from spellengine.tools.corpus_index import compile_mask
+from spellengine.tools.model_cache import ModelCache
+from spellengine.tools.password_generator import KeyspacePasswordGenerator
+from spellengine.tools.pcfg import Grammar, apply_case, attack, case_mask, load_grammar, segments
+
+CORPUS = [
+    "dragon", "Dragon1", "dragon1", "shadow", "Shadow99", "monkey", "monkey1",
+    "Summer2024!", "winter2024", "password", "password1", "123456", "letmein!",
+]
+
+
+@pytest.fixture
+def grammar():
+    return Grammar.train(CORPUS)
+
+
+def all_guesses(grammar):
+    """Every guess with its probability, by brute force over all expansions."""
+    found = {}
+    for structure, probability in grammar.structures:
+        slots = [grammar.terminals[slot] for slot in pcfg._slots(structure)]
+        for combination in product(*slots):
+            p = probability
+            for _, terminal_p in combination:
+                p *= terminal_p
+            found[pcfg._render(structure, [t for t, _ in combination])] = p
+    return found
+
+
+class TestTraining:
+    """Test learning structures and terminals."""
+
+    def test_segments(self):
+        assert segments("Summer2024!") == [("L6", "Summer"), ("D4", "2024"), ("S1", "!")]
+        assert case_mask("Summer") == "ULLLLL"
+        assert apply_case("summer", "ULLLLU") == "SummeR"
+
+    def test_probabilities(self, grammar):
+        assert sum(p for _, p in grammar.structures) == pytest.approx(1.0)
+        for terminals in grammar.terminals.values():
+            assert sum(p for _, p in terminals) == pytest.approx(1.0)
+        assert grammar.structures[0] == (("L6",), 3 / 13)
+        assert dict(grammar.terminals["C6"])["ULLLLL"] == pytest.approx(3 / 9)
+
+    def test_probability_matches_expansion(self, grammar):
+        for guess, p in all_guesses(grammar).items():
+            assert grammar.probability(guess) == pytest.approx(p)
+        assert grammar.probability("zz") == 0.0
+
+
+class TestGuesses:
+    """Test probability-ordered generation."""
+
+    def test_every_guess_once_in_order(self, grammar):
+        guesses = list(grammar.guesses())
+        probabilities = [p for _, p in guesses]
+        assert probabilities == sorted(probabilities, reverse=True)
+        assert len({guess for guess, _ in guesses}) == len(guesses)
+
+        expected = all_guesses(grammar)
+        assert {guess: pytest.approx(p) for guess, p in guesses} == expected
+
+    def test_generalizes(self, grammar):
+        guesses = {guess for guess, _ in grammar.guesses()}
+        assert "Monkey99" in guesses
+        assert "shadow1" in guesses
+
+    def test_length_range(self, grammar):
+        guesses = grammar.generate(1000, min_length=7, max_length=8)
+        assert guesses
+        assert all(7 <= len(guess) <= 8 for guess in guesses)
+
+    def test_mask(self, grammar):
+        mask = "?u?l?l?l?l?l?d?d"
+        guesses = grammar.generate(1000, mask=mask)
+        expected = [g for g, _ in grammar.guesses() if compile_mask(mask).fullmatch(g)]
+        assert guesses == expected
+        assert "Dragon99" in guesses
+
+    def test_lazy(self, grammar):
+        guesses = grammar.guesses()
+        assert next(guesses)[0] in CORPUS
+
+
+class TestCache:
+    """Test caching trained grammars."""
+
+    @pytest.fixture
+    def corpus(self, tmp_path):
+        path = tmp_path / "corpus.txt"
+        path.write_text("\n".join(CORPUS) + "\n")
+        return path
+
+    def test_loaded_from_cache(self, tmp_path, corpus, monkeypatch):
+        cache = ModelCache(tmp_path / "models", kind="pcfg")
+        trained = load_grammar(corpus, cache=cache)
+        assert list((tmp_path / "models").glob("pcfg-*.pickle"))
+
+        def no_training(cls, corpus):
+            raise AssertionError("retrained")
+
+        monkeypatch.setattr(Grammar, "train", classmethod(no_training))
+        loaded = load_grammar(corpus, cache=cache)
+        assert loaded.structures == trained.structures
+        with pytest.raises(AssertionError, match="retrained"):
+            load_grammar(corpus, cache=cache, rebuild=True)
+
+    def test_corpus_change_retrains(self, tmp_path, corpus):
+        cache = ModelCache(tmp_path / "models", kind="pcfg")
+        load_grammar(corpus, cache=cache)
+        corpus.write_text("\n".join(CORPUS + ["qwerty"]) + "\n")
+        terminals = load_grammar(corpus, cache=cache).terminals["L6"]
+        assert ("qwerty", pytest.approx(1 / 10)) in terminals
+
+
+class TestGenerator:
+    """Test GRAMMAR keyspaces without PatternForge."""
+
+    @pytest.fixture
+    def generator(self, tmp_path):
+        path = tmp_path / "corpus.txt"
+        path.write_text("\n".join(CORPUS) + "\n")
+        return KeyspacePasswordGenerator(path, use_patternforge=False)
+
+    def test_generate_for_keyspace(self, generator):
+        keyspace = KeyspaceDefinition(
+            min_length=8, max_length=8, mask="?u?l?l?l?l?l?d?d",
+            strategy=GenerationStrategy.GRAMMAR,
+        )
+        passwords = generator.generate_for_keyspace(keyspace, 3, random.Random(1))
+        assert len(passwords) == 3
+        assert set(passwords) <= set(generator._get_grammar().generate(30, 8, 8))
+        assert all(compile_mask(keyspace.mask).fullmatch(p) for p in passwords)
+
+    def test_batch_uses_grammar_pool(self, generator):
+        keyspaces = [
+            KeyspaceDefinition(min_length=7, max_length=7, strategy=GenerationStrategy.GRAMMAR)
+            for _ in range(4)
+        ]
+        passwords = generator.generate_batch(keyspaces, seeds=[1, 2, 3, 4])
+        pool = generator._get_grammar().generate(40, 7, 7)
+        assert len(set(passwords)) == 4
+        assert set(passwords) <= set(pool)
+        assert not set(passwords) <= set(CORPUS)
+
+        # Masked keyspaces draw from a grammar pool expanded for their mask
+        mask = "?u?l?l?l?l?l?d?d?d?d"
+        masked = [
+            KeyspaceDefinition(
+                min_length=6, max_length=12, mask=mask, strategy=GenerationStrategy.GRAMMAR
+            )
+            for _ in range(2)
+        ]
+        passwords = generator.generate_batch(masked, seeds=[1, 2])
+        assert set(passwords) <= set(generator._get_grammar().generate(20, 6, 12, mask))
+        assert all(compile_mask(mask).fullmatch(p) for p in passwords)
+
+
+class TestAttack:
+    """Test the probability-ordered attack."""
+
+    def test_cracks(self, grammar):
+        target = hashlib.md5(b"Monkey99").hexdigest()
+        password, number = attack(grammar, target)
+        assert password == "Monkey99"
+        assert [g for g, _ in grammar.guesses()].index("Monkey99") + 1 == number
+
+    def test_gives_up(self, grammar):
+        assert attack(grammar, hashlib.sha1(b"Monkey99").hexdigest(), "sha1", 3) is None
+
+    def test_main(self, tmp_path, monkeypatch, capsys):
+        corpus = tmp_path / "corpus.txt"
+        corpus.write_text("\n".join(CORPUS) + "\n")
+        monkeypatch.setattr(sys, "argv", ["pcfg", str(corpus), "-n", "5", "--no-model-cache"])
+        assert pcfg.main() == 0
+        assert capsys.readouterr().out.split() == Grammar.train(CORPUS).generate(5)
+
+        target = hashlib.sha256(b"Shadow1").hexdigest()
+        monkeypatch.setattr(sys, "argv", [
+            "pcfg", str(corpus), "--no-model-cache", "--hash", target, "--hash-type", "sha256",
+        ])
+        assert pcfg.main() == 0
+        assert "Cracked: Shadow1" in capsys.readouterr().out
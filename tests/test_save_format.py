@@ -0,0 +1,179 @@
+"""Binary save format tests.
+
+Round-trips PlayerState through the compact binary save format and checks
+the campaign graph ordinals it relies on.
+
+Run with: pytest tests/test_save_format.py -v
+"""
+
+import json
+
+import pytest
+
+from spellengine.adventures.graph import (
+    CampaignGraph,
+    compile_campaign_graph,
+    difficulties_from_bits,
+    difficulty_bits,
+)
+from spellengine.adventures.models import DifficultyLevel, OutcomeType, PlayerState
+from spellengine.adventures.savefile import (
+    SaveFormatError,
+    decode_player_state,
+    encode_player_state,
+    is_binary_save,
+)
+from spellengine.adventures.state import AdventureState
+
+
+def play_through(state: AdventureState, max_steps: int = 200) -> None:
+    """Walk the campaign taking correct choices until it completes."""
+    for _ in range(max_steps):
+        if state.current_encounter.choices:
+            correct = next(c for c in state.current_encounter.choices if c.is_correct)
+            state.make_choice(correct.id)
+            continue
+        result = state.record_outcome(OutcomeType.SUCCESS)
+        if result["action"] in ("complete", "game_over"):
+            return
+
+
+class TestCampaignGraph:
+    """Test ordinal assignment."""
+
+    def test_ordinals_follow_campaign_order(self, campaign):
+        graph = compile_campaign_graph(campaign)
+        expected = [enc.id for ch in campaign.chapters for enc in ch.encounters]
+        assert list(graph.encounter_ids) == expected
+        assert graph.encounter_ordinal(expected[3]) == 3
+        assert graph.encounter_ordinal("no_such_encounter") is None
+
+    def test_completion_bits_roundtrip(self, campaign):
+        graph = compile_campaign_graph(campaign)
+        ids = [graph.encounter_ids[i] for i in (0, 5, graph.encounter_count - 1)]
+        assert graph.completed_ids(graph.completion_bits(ids)) == ids
+        assert graph.completed_ids(0) == []
+
+    def test_layout_roundtrip(self, campaign):
+        graph = compile_campaign_graph(campaign)
+        rebuilt = CampaignGraph.from_layout(graph.to_layout())
+        assert rebuilt.encounter_ids == graph.encounter_ids
+        assert rebuilt.chapter_ids == graph.chapter_ids
+        assert rebuilt.digest == graph.digest
+
+    def test_difficulty_bits(self):
+        bits = difficulty_bits(["heroic", "normal"])
+        assert difficulties_from_bits(bits) == ["normal", "heroic"]
+
+
+class TestBinarySave:
+    """Test encoding and decoding PlayerState."""
+
+    def test_fresh_state_roundtrip(self, adventure_state):
+        data = encode_player_state(adventure_state.state, adventure_state.graph)
+        assert is_binary_save(data)
+        decoded = decode_player_state(data, adventure_state.graph)
+        assert decoded.model_dump() == adventure_state.state.model_dump()
+
+    def test_completed_campaign_roundtrip(self, adventure_state):
+        play_through(adventure_state)
+        adventure_state.state.chapter_hints_used = {adventure_state.campaign.chapters[0].id: 2}
+        adventure_state.state.artifacts = {"dread_citadel": ["skeleton_key_fragment_normal"]}
+
+        data = encode_player_state(adventure_state.state, adventure_state.graph)
+        decoded = decode_player_state(data, adventure_state.graph)
+
+        assert decoded.model_dump() == adventure_state.state.model_dump()
+        assert decoded.completed_difficulties == {"dread_citadel": ["normal"]}
+
+    def test_binary_smaller_than_json(self, adventure_state):
+        play_through(adventure_state)
+        as_json = json.dumps(adventure_state.state.model_dump(mode="json"), indent=2)
+        data = encode_player_state(adventure_state.state, adventure_state.graph)
+        assert len(data) * 2 < len(as_json.encode("utf-8"))
+
+    def test_unknown_ids_preserved(self, adventure_state):
+        state = adventure_state.state
+        state.completed_encounters.append("retired_encounter")
+        state.encounter_modes["retired_encounter"] = "speedrun"
+        state.choice_history["retired_fork"] = "left"
+
+        decoded = decode_player_state(
+            encode_player_state(state, adventure_state.graph), adventure_state.graph
+        )
+
+        assert "retired_encounter" in decoded.completed_encounters
+        assert decoded.encounter_modes["retired_encounter"] == "speedrun"
+        assert decoded.choice_history["retired_fork"] == "left"
+
+    def test_layout_change_uses_embedded_layout(self, campaign, adventure_state):
+        play_through(adventure_state)
+        data = encode_player_state(adventure_state.state, adventure_state.graph)
+
+        # Simulate a campaign update that reorders encounters
+        old = adventure_state.graph
+        reordered = CampaignGraph(
+            old.campaign_id, old.chapter_ids, tuple(reversed(old.encounter_ids))
+        )
+        decoded = decode_player_state(data, reordered)
+
+        assert set(decoded.completed_encounters) == set(adventure_state.state.completed_encounters)
+        assert decoded.encounter_modes == adventure_state.state.encounter_modes
+
+    def test_corrupt_save_raises(self, adventure_state):
+        data = encode_player_state(adventure_state.state, adventure_state.graph)
+        with pytest.raises(SaveFormatError):
+            decode_player_state(data[:-3], adventure_state.graph)
+        with pytest.raises(SaveFormatError):
+            decode_player_state(b"{}", adventure_state.graph)
+
+
+class TestSaveLoad:
+    """Test AdventureState save/load through both formats."""
+
+    def test_binary_save_and_load(self, campaign, tmp_path):
+        save_path = tmp_path / "dread_citadel_game.sav"
+        state = AdventureState(campaign, player_name="Saver", save_path=save_path)
+        play_through(state)
+        state.save()
+
+        assert is_binary_save(save_path.read_bytes())
+        loaded = AdventureState.load(campaign, save_path)
+        assert loaded.state.model_dump() == state.state.model_dump()
+
+    def test_legacy_json_save_loads(self, campaign, tmp_path):
+        legacy_path = tmp_path / "dread_citadel_game.json"
+        state = AdventureState(campaign, save_path=legacy_path)
+        state.record_outcome(OutcomeType.SUCCESS)
+        state.save()
+
+        assert legacy_path.read_text().startswith("{")
+        loaded = AdventureState.load(
+            campaign, tmp_path / "dread_citadel_game.sav", legacy_path=legacy_path
+        )
+        assert loaded.state.completed_encounters == state.state.completed_encounters
+
+
+class TestCompletionView:
+    """Test the set-backed completion membership on PlayerState."""
+
+    def test_mark_completed_is_idempotent(self):
+        state = PlayerState(campaign_id="c", chapter_id="ch", encounter_id="e1")
+        assert state.mark_completed("e1")
+        assert not state.mark_completed("e1")
+        assert state.completed_encounters == ["e1"]
+        assert state.is_completed("e1")
+
+    def test_view_tracks_direct_list_changes(self):
+        state = PlayerState(
+            campaign_id="c",
+            chapter_id="ch",
+            encounter_id="e1",
+            difficulty=DifficultyLevel.HEROIC,
+        )
+        assert not state.is_completed("e2")
+        state.completed_encounters.append("e2")
+        assert state.is_completed("e2")
+        state.completed_encounters = ["e3"]
+        assert not state.is_completed("e2")
+        assert state.is_completed("e3")
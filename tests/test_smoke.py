@@ -82,6 +82,53 @@ class TestModuleImports:
         assert widgets is not None
 
 
+class TestLazyExports:
+    """Verify the adventures package defers heavy imports and datasets."""
+
+    def test_package_import_is_lazy(self):
+        """Importing the package should not import its submodules."""
+        import subprocess
+
+        code = (
+            "import sys, spellengine.adventures as a; "
+            "print(sorted(m for m in sys.modules if m.startswith('spellengine.adventures.')))"
+        )
+        out = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        ).stdout
+        assert out.strip() == "[]"
+
+    def test_exports_resolve(self):
+        """Every name in __all__ should resolve to its submodule's object."""
+        import spellengine.adventures as adventures
+
+        for name in adventures.__all__:
+            assert getattr(adventures, name) is not None
+        assert adventures.load_campaign is adventures.loader.load_campaign
+
+    def test_datasets_load_on_access(self):
+        """Data-backed libraries should match their accessors."""
+        from spellengine.adventures import (
+            ACHIEVEMENT_LIBRARY,
+            ALL_TIERS,
+            DREAD_CITADEL_GRADES,
+            get_achievement_by_id,
+            get_all_hashes,
+            get_dread_citadel_grades,
+        )
+
+        assert get_achievement_by_id("md5_mayhem") in ACHIEVEMENT_LIBRARY
+        assert sum(len(h) for h in ALL_TIERS.values()) == len(get_all_hashes())
+        assert get_dread_citadel_grades() == DREAD_CITADEL_GRADES
+
+    def test_unknown_attribute(self):
+        """Unknown names should still raise AttributeError."""
+        import spellengine.adventures as adventures
+
+        with pytest.raises(AttributeError):
+            adventures.NOT_A_REAL_EXPORT
+
+
 class TestPygameInitialization:
     """Test pygame can initialize in headless mode.
 
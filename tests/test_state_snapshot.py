@@ -0,0 +1,98 @@
+"""Copy-on-write PlayerState snapshot tests.
+
+Run with: pytest tests/test_state_snapshot.py -v
+"""
+
+import threading
+
+import pytest
+
+from spellengine.adventures.models import OutcomeType
+from spellengine.adventures.savefile import decode_player_state, is_binary_save
+
+
+class TestSnapshot:
+    """Test snapshot isolation and versioning."""
+
+    def test_snapshot_is_cached_until_mutation(self, adventure_state):
+        snap = adventure_state.snapshot()
+        assert adventure_state.snapshot() is snap
+        assert snap.version == adventure_state.state_version
+
+        adventure_state.record_outcome(OutcomeType.SUCCESS)
+
+        assert snap.version != adventure_state.state_version
+        assert adventure_state.snapshot() is not snap
+
+    def test_snapshot_shares_until_write(self, adventure_state):
+        adventure_state.record_outcome(OutcomeType.SUCCESS)
+        snap = adventure_state.snapshot()
+        assert snap.completed_encounters is adventure_state.state.completed_encounters
+
+        adventure_state.record_outcome(OutcomeType.SUCCESS)
+
+        assert snap.completed_encounters is not adventure_state.state.completed_encounters
+        assert len(snap.completed_encounters) == 1
+        assert len(adventure_state.state.completed_encounters) == 2
+        assert len(snap.encounter_modes) == 1
+
+    def test_scalar_writes_bump_version(self, adventure_state):
+        snap = adventure_state.snapshot()
+        adventure_state.state.deaths += 1
+        assert snap.deaths == 0
+        assert snap.version != adventure_state.state_version
+
+    def test_nested_container_writes_do_not_leak(self, adventure_state):
+        adventure_state.state.writable("completed_difficulties")["dread_citadel"] = ["normal"]
+        snap = adventure_state.snapshot()
+
+        adventure_state.state.writable("completed_difficulties")["dread_citadel"].append("heroic")
+
+        assert snap.completed_difficulties == {"dread_citadel": ["normal"]}
+
+    def test_snapshot_is_read_only(self, adventure_state):
+        snap = adventure_state.snapshot()
+        assert snap.is_snapshot
+        with pytest.raises(TypeError):
+            snap.deaths = 5
+        with pytest.raises(TypeError):
+            snap.writable("achievements")
+
+
+class TestOffThreadReaders:
+    """Test saves and summaries produced from snapshots."""
+
+    def test_background_save_writes_snapshot(self, campaign, tmp_path):
+        from spellengine.adventures.state import AdventureState
+
+        state = AdventureState(campaign, save_path=tmp_path / "game.sav")
+        state.record_outcome(OutcomeType.SUCCESS)
+        expected = state.snapshot().model_dump()
+
+        thread = state.save_in_background()
+        state.record_outcome(OutcomeType.SUCCESS)
+        thread.join()
+
+        data = (tmp_path / "game.sav").read_bytes()
+        assert is_binary_save(data)
+        saved = decode_player_state(data, state.graph).model_dump()
+        # Either the snapshot or a newer one, never a torn mix
+        assert saved["completed_encounters"] in (
+            expected["completed_encounters"],
+            state.state.completed_encounters,
+        )
+
+    def test_summary_from_snapshot(self, adventure_state):
+        adventure_state.record_outcome(OutcomeType.SUCCESS)
+        snap = adventure_state.snapshot()
+        adventure_state.record_outcome(OutcomeType.SUCCESS)
+
+        results: list[dict] = []
+        reader = threading.Thread(
+            target=lambda: results.append(adventure_state.get_progress_summary(snap))
+        )
+        reader.start()
+        reader.join()
+
+        assert results[0]["progress"].startswith("1/")
+        assert adventure_state.get_progress_summary()["progress"].startswith("2/")